@@ -3,8 +3,14 @@ Geoextent - Extract geospatial extent (bounding boxes and temporal extents) from
 
 This package provides functionality for extracting spatial and temporal extents from
 geospatial data files and research repositories.
+
+The API functions and submodules are imported on first access, so importing
+the package (e.g. for ``geoextent --version``) does not load GDAL, pandas,
+the file handlers or the content providers.
 """
 
+import importlib
+
 name = "geoextent"
 
 try:
@@ -12,11 +18,14 @@ try:
 except ImportError:
     __version__ = "unknown"
 
-from .lib.extent import from_file, from_directory, from_remote
-from .lib.export import export_to_file, join_files
-
-# Import main modules for advanced usage
-from . import lib
+# Public name → module it is defined in
+_LAZY_ATTRIBUTES = {
+    "from_file": ".lib.extent",
+    "from_directory": ".lib.extent",
+    "from_remote": ".lib.extent",
+    "export_to_file": ".lib.export",
+    "join_files": ".lib.export",
+}
 
 __all__ = [
     "from_file",
@@ -27,3 +36,18 @@ __all__ = [
     "lib",
     "__version__",
 ]
+
+
+def __getattr__(attr):
+    if attr == "lib":
+        return importlib.import_module(".lib", __name__)
+    if attr in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[attr], __name__)
+        value = getattr(module, attr)
+        globals()[attr] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, attr))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
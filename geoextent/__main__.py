@@ -1,4 +1,5 @@
 import argparse
+import importlib.util
 import json
 import logging
 import os
@@ -6,10 +7,30 @@ import sys
 import warnings
 import webbrowser
 import zipfile
-from .lib import extent
-from .lib import helpfunctions as hf
 from .lib.exceptions import DownloadSizeExceeded
 
+
+def _lazy_import(name):
+    """Return module *name*, executed on first attribute access.
+
+    Keeps ``geoextent --version``, ``--help`` and argument parsing from
+    loading GDAL, pandas and the extraction code.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+extent = _lazy_import("geoextent.lib.extent")
+hf = _lazy_import("geoextent.lib.helpfunctions")
+http_cache = _lazy_import("geoextent.lib.http_cache")
+
 logging.basicConfig(
     level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
 )
@@ -90,8 +111,11 @@ class readable_file_or_dir(argparse.Action):
             if candidate == "-":
                 validated_files.append(candidate)
                 continue
-            # Check if it's a supported repository URL/DOI by testing against content providers
-            is_repository = self._is_supported_repository(candidate)
+            # Existing local paths are files; anything else is tested against
+            # the content providers as a repository URL/DOI
+            is_repository = not os.path.exists(
+                candidate
+            ) and self._is_supported_repository(candidate)
 
             if is_repository:
                 logger.debug(
@@ -118,10 +142,10 @@ class readable_file_or_dir(argparse.Action):
 
     def _is_supported_repository(self, candidate):
         """Check if the candidate is supported by any content provider"""
+        from .lib.content_providers import manifest
         from .lib.content_providers.providers import find_provider
-        from .lib.extent import _get_content_providers
 
-        provider = find_provider(candidate, _get_content_providers())
+        provider = find_provider(candidate, manifest.PROVIDERS)
         if provider is not None:
             return True
 
@@ -470,6 +494,26 @@ def get_arg_parser():
         help="disable automatic spaCy model download on first use",
     )
 
+    parser.add_argument(
+        "--ner-batch-size",
+        action="store",
+        type=int,
+        default=None,
+        metavar="N",
+        help="number of text files per spaCy nlp.pipe batch when extracting "
+        "from directories (default: the model's own batch size)",
+    )
+
+    parser.add_argument(
+        "--ner-processes",
+        action="store",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of spaCy processes for batched NER over directories "
+        "(default: 1)",
+    )
+
     parser.add_argument(
         "--period-gazetteer",
         choices=["bundled", "none"],
@@ -578,6 +622,16 @@ def get_arg_parser():
         help="maximum number of parallel downloads (default: 4, set to 1 to disable parallel downloads)",
     )
 
+    parser.add_argument(
+        "--remote-open",
+        action="store_true",
+        default=False,
+        help="read the extent of header-based formats (Cloud Optimized GeoTIFF, "
+        "FlatGeobuf, GeoPackage, NetCDF/HDF5, LAS/LAZ) from repositories with "
+        "HTTP range requests instead of downloading the files; files are only "
+        "downloaded when the remote read yields no extent",
+    )
+
     parser.add_argument(
         "--keep-files",
         action="store_true",
@@ -613,6 +667,64 @@ def get_arg_parser():
         "Default: sequential processing.",
     )
 
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="how -p/--parallel runs directory extraction: 'thread' (default) "
+        "uses a thread pool; 'process' uses a process pool that also "
+        "extracts subdirectories and archives in parallel, scaling better "
+        "for CPU-bound formats (CSV, vector, text NER)",
+    )
+
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=True,
+        default=None,
+        metavar="DB",
+        help="reuse per-file extraction results from a persistent cache so "
+        "unchanged files are not extracted again on later runs. Without a "
+        "value, uses extraction-cache.sqlite in the user cache directory "
+        "($GEOEXTENT_CACHE_DIR, or $XDG_CACHE_HOME/geoextent, or "
+        "~/.cache/geoextent)",
+    )
+
+    parser.add_argument(
+        "--http-cache",
+        nargs="?",
+        const=True,
+        default=None,
+        metavar="DB",
+        help="cache metadata responses of repository APIs (DOI resolution, "
+        "record JSON, landing pages) on disk and revalidate them with "
+        "ETag/Last-Modified, so repeated runs do not repeat identical "
+        "requests. Without a value, uses http-cache.sqlite in the user cache "
+        "directory",
+    )
+
+    parser.add_argument(
+        "--http-cache-ttl",
+        type=int,
+        default=None,
+        metavar="SECONDS",
+        help="seconds a cached response is reused before it is revalidated "
+        "(default: %(default)s; 0 always revalidates). Used with --http-cache",
+    )
+
+    parser.add_argument(
+        "--download-store",
+        nargs="?",
+        const=True,
+        default=None,
+        metavar="DIR",
+        help="keep repository files that have a published checksum (Zenodo, "
+        "InvenioRDM, Figshare, Dataverse) in a content-addressed store shared "
+        "across runs: files already stored are not downloaded again, partial "
+        "downloads resume, and checksums are verified. Without a value, uses "
+        "the downloads directory in the user cache directory",
+    )
+
     parser.add_argument(
         "--join",
         action="store_true",
@@ -635,6 +747,9 @@ def get_arg_parser():
 
 def print_help():
     print(help_description)
+    # Defaults of the extraction modules are only loaded to show them here;
+    # the options stay None for parsing, so those modules are not imported.
+    arg_parser.set_defaults(http_cache_ttl=http_cache.DEFAULT_TTL)
     arg_parser.print_help()
     print(help_epilog)
     print_supported_formats()
@@ -831,6 +946,17 @@ def main():
     # Resolve workers: 0 means auto-detect, pass through to API functions
     workers = args["parallel"]
 
+    remote_http_cache = None
+    if args["http_cache"]:
+        remote_http_cache = http_cache.HTTPCache(
+            None if args["http_cache"] is True else args["http_cache"],
+            ttl=(
+                http_cache.DEFAULT_TTL
+                if args["http_cache_ttl"] is None
+                else args["http_cache_ttl"]
+            ),
+        )
+
     # Validate text/NER inputs (issue #112). ``--text-method`` defaults to
     # ``"ner"``; ``"none"`` (or missing spaCy) disables the text handler.
     text_method = args.get("text_method")
@@ -874,6 +1000,13 @@ def main():
             "include_source_text": args.get("include_source_text", True),
             "place_geometry": args.get("place_geometry") or "auto",
         }
+    # Batched NER options only apply to directory extraction.
+    ner_dir_kwargs = {}
+    if text_method:
+        ner_dir_kwargs = {
+            "ner_batch_size": args.get("ner_batch_size"),
+            "ner_n_process": args.get("ner_processes") or 1,
+        }
 
     if files is None or (len(files) == 0 and not (inline_text or has_stdin_sentinel)):
         raise Exception("Invalid command, input file missing")
@@ -1032,7 +1165,10 @@ def main():
                     assume_wgs84=args["assume_wgs84"],
                     time_format=args["time_format"],
                     workers=workers,
+                    executor=args["executor"],
+                    extraction_cache=args["cache"],
                     **ner_kwargs,
+                    **ner_dir_kwargs,
                 )
             elif is_url or is_doi or is_repository:
                 output = _call_from_remote_with_size_prompt(
@@ -1065,6 +1201,10 @@ def main():
                         "follow": args["follow"],
                         "download_size_soft_limit": True,
                         "workers": workers,
+                        "extraction_cache": args["cache"],
+                        "http_cache": remote_http_cache,
+                        "download_store": args["download_store"],
+                        "remote_open": args["remote_open"],
                     }
                 )
         else:
@@ -1117,6 +1257,10 @@ def main():
                                 "follow": args["follow"],
                                 "download_size_soft_limit": True,
                                 "workers": workers,
+                                "extraction_cache": args["cache"],
+                                "http_cache": remote_http_cache,
+                                "download_store": args["download_store"],
+                                "remote_open": args["remote_open"],
                             }
                         )
                         if repo_output is not None:
@@ -1156,7 +1300,10 @@ def main():
                             assume_wgs84=args["assume_wgs84"],
                             time_format=args["time_format"],
                             workers=workers,
+                            executor=args["executor"],
+                            extraction_cache=args["cache"],
                             **ner_kwargs,
+                            **ner_dir_kwargs,
                         )
                         if dir_output is not None:
                             output["details"][file_path] = dir_output
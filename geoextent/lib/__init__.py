@@ -1,7 +1,23 @@
-from . import handle_csv
-from . import handle_vector
-from . import handle_raster
-from . import handle_pointcloud
-from . import helpfunctions
-from . import extent
-from . import content_providers
+import importlib
+
+__all__ = [
+    "handle_csv",
+    "handle_vector",
+    "handle_raster",
+    "handle_pointcloud",
+    "helpfunctions",
+    "extent",
+    "content_providers",
+]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access, so importing geoextent does
+    # not load the handlers, GDAL and pandas
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
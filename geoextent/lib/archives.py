@@ -0,0 +1,479 @@
+"""In-process reading of zip and tar archives for ``from_directory``.
+
+``hf.extract_archive`` runs patool, which starts an external ``unzip`` /
+``tar`` process and extracts every member into a folder next to the
+archive, before ``from_directory`` walks that folder. For zip and tar
+archives (``.tar``, ``.tar.gz``/``.tgz``, ``.tar.bz2``, ``.tar.xz``)
+:func:`open_archive` reads the member list in-process instead:
+
+* members in formats GDAL reads directly (GeoTIFF, GeoPackage, shapefile,
+  GeoJSON, NetCDF, ...) are not extracted. A small *member pointer*
+  (``<name>.geoextent-member``) is written in their place, and
+  :func:`extract_member_pointer` opens the member through GDAL's
+  ``/vsizip/`` or ``/vsitar/`` virtual file systems. Their sidecar files
+  (``.prj``, ``.dbf``, world files, ``.aux.xml``, ...) stay in the
+  archive, where GDAL finds them next to the member;
+* all other members (CSV, point clouds, text, nested archives, ``.gdb``
+  and ``.zarr`` stores, ...) are extracted as real files, with Python's
+  ``zipfile`` / ``tarfile``. Handlers that need a file path still get one;
+* a pointer whose member no handler can read through GDAL (e.g. an
+  unsupported compression method) is replaced by the extracted member.
+
+Before anything is read or extracted, :func:`select_members` drops the
+members that cannot yield an extent (images without a world file,
+office documents, source code, ...), using the same extension rules as
+the content providers' ``download_skip_nogeo`` filter and the text-file
+rules of :mod:`geoextent.lib.text_extraction.mime`. A cumulative member
+size limit is applied with ``hf.filter_files_by_size``.
+
+Other archive formats (rar, 7z, ...) are still extracted with patool.
+"""
+
+import functools
+import logging
+import os
+import shutil
+import tarfile
+import uuid
+import zipfile
+from pathlib import Path
+
+from . import helpfunctions as hf
+from . import pointers
+from .text_extraction.mime import EXCLUDE_EXTENSIONS, has_text_name
+
+logger = logging.getLogger("geoextent")
+
+#: Suffix of the pointer files written instead of extracting a member.
+POINTER_SUFFIX = pointers.SUFFIXES[pointers.MEMBER]
+
+#: Extensions of members read through GDAL's virtual file systems.
+VSI_EXTENSIONS = frozenset(
+    {
+        ".tif",
+        ".tiff",
+        ".jp2",
+        ".asc",
+        ".img",
+        ".nc",
+        ".nc4",
+        ".h5",
+        ".hdf",
+        ".hdf5",
+        ".he5",
+        ".gpkg",
+        ".fgb",
+        ".shp",
+        ".geojson",
+        ".kml",
+        ".gml",
+        ".gpx",
+    }
+)
+
+# Extensions excluded from text extraction that a handler may still read
+# (structured data, GeoTIFF, spreadsheets, nested archives)
+_HANDLED_EXTENSIONS = frozenset(
+    {
+        ".csv",
+        ".tsv",
+        ".json",
+        ".geojson",
+        ".xml",
+        ".tif",
+        ".tiff",
+        ".xls",
+        ".xlsx",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".7z",
+        ".xz",
+        ".rar",
+    }
+)
+
+#: Extensions of members that never yield an extent. PDFs are kept, GDAL's
+#: PDF driver reads the extent of GeoPDFs.
+SKIP_EXTENSIONS = (
+    (EXCLUDE_EXTENSIONS - _HANDLED_EXTENSIONS - hf.GEOSPATIAL_EXTENSIONS)
+    - VSI_EXTENSIONS
+    - {".pdf"}
+)
+
+# Files GDAL reads next to a data member: shapefile components, world
+# files, PAM metadata and overviews. A sidecar belongs to the member whose
+# name, with or without its extension, is the sidecar's name without these.
+_SIDECAR_SUFFIXES = (
+    ".aux.xml",
+    ".prj",
+    ".dbf",
+    ".shx",
+    ".cpg",
+    ".sbn",
+    ".sbx",
+    ".qix",
+    ".fix",
+    ".ovr",
+    ".msk",
+    ".wld",
+    ".tfw",
+    ".tifw",
+    ".tiffw",
+    ".jgw",
+    ".jpgw",
+    ".jpegw",
+    ".pgw",
+    ".pngw",
+    ".gfw",
+    ".gifw",
+    ".bpw",
+    ".bmpw",
+    ".j2w",
+)
+
+# Images are rasters when a world file or .aux.xml comes with them
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"})
+
+# Tar compressions GDAL's /vsitar/ can read; others are extracted.
+_VSITAR_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+
+# Directory stores handled as a whole by from_directory.
+_STORE_SUFFIXES = (".gdb", ".zarr")
+
+
+def _archive_kind(path):
+    if zipfile.is_zipfile(path):
+        return "zip"
+    try:
+        if tarfile.is_tarfile(path):
+            return "tar"
+    except OSError:
+        pass
+    return None
+
+
+def _new_extract_folder(filepath):
+    filepath = Path(filepath)
+    while True:
+        folder = filepath.parent / f"{filepath.name}_{uuid.uuid4()}"
+        if not folder.exists():
+            return folder
+
+
+def _member_target(folder, name):
+    """Return where member *name* is extracted below *folder*, or ``None``.
+
+    Absolute names and names climbing out of *folder* are rejected.
+    """
+    root = os.path.abspath(folder)
+    target = os.path.abspath(os.path.join(root, name.replace("\\", "/").lstrip("/")))
+    if os.path.commonpath([root, target]) != root or target == root:
+        return None
+    return target
+
+
+def _sidecar_owner(name):
+    """Return the key of the member sidecar *name* belongs to, or ``None``."""
+    lower = name.lower()
+    for suffix in _SIDECAR_SUFFIXES:
+        if lower.endswith(suffix) and os.path.basename(lower) != suffix:
+            return lower[: -len(suffix)]
+    return None
+
+
+def _sidecar_keys(name):
+    """Return the keys under which sidecars of member *name* are found."""
+    lower = name.lower()
+    return {lower, os.path.splitext(lower)[0]}
+
+
+def same_stem_files(filepath):
+    """Return the files next to *filepath* that share its stem, sorted.
+
+    These are its sidecars (``.prj``, ``.dbf``, world files, ``.aux.xml``,
+    ``.csvt``, ...), which can change the extent read from *filepath*.
+    """
+    directory, name = os.path.split(os.path.abspath(filepath))
+    keys = _sidecar_keys(name)
+    siblings = []
+    for sibling in _listdir(directory):
+        lower = sibling.lower()
+        if sibling != name and (
+            os.path.splitext(lower)[0] in keys or _sidecar_owner(lower) in keys
+        ):
+            path = os.path.join(directory, sibling)
+            if os.path.isfile(path):
+                siblings.append(path)
+    return sorted(siblings)
+
+
+def _listdir(directory):
+    try:
+        return _cached_listdir(directory, os.stat(directory).st_mtime_ns)
+    except OSError:
+        return ()
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_listdir(directory, mtime_ns):
+    # Keyed on the directory mtime, so added or removed files are seen
+    return tuple(os.listdir(directory))
+
+
+def list_members(path):
+    """Return ``[(name, size)]`` of the regular file members of archive *path*.
+
+    Reads only the zip central directory or the tar index. Returns ``None``
+    when *path* is not a zip or tar archive.
+    """
+    kind = _archive_kind(path)
+    if kind == "zip":
+        with zipfile.ZipFile(path) as zf:
+            return [(i.filename, i.file_size) for i in zf.infolist() if not i.is_dir()]
+    if kind == "tar":
+        with tarfile.open(path) as tf:
+            return [(m.name, m.size) for m in tf.getmembers() if m.isfile()]
+    return None
+
+
+def vsi_prefix(archive_path):
+    """Return the GDAL virtual file system path of archive *archive_path*.
+
+    Member paths are ``<prefix>/<member name>``. ``None`` when GDAL cannot
+    read members of the archive in place.
+    """
+    archive_path = os.path.abspath(archive_path)
+    if zipfile.is_zipfile(archive_path):
+        return "/vsizip/" + archive_path
+    if archive_path.lower().endswith(_VSITAR_SUFFIXES):
+        return "/vsitar/" + archive_path
+    return None
+
+
+def _is_store_member(name):
+    parts = name.replace("\\", "/").split("/")
+    return any(part.lower().endswith(_STORE_SUFFIXES) for part in parts[:-1])
+
+
+def _is_virtual_candidate(name):
+    if _is_store_member(name):
+        return False
+    return os.path.splitext(name)[1].lower() in VSI_EXTENSIONS
+
+
+def _can_yield_extent(name, sidecar_owners, text_method, skip_nogeo, extensions):
+    if _is_store_member(name):
+        return True
+    ext = os.path.splitext(name)[1].lower()
+    if ext in VSI_EXTENSIONS or hf.is_geospatial_filename(name, extensions):
+        return True
+    if has_text_name(name):
+        return text_method is not None
+    if skip_nogeo:
+        return False
+    if ext in _IMAGE_EXTENSIONS:
+        return not _sidecar_keys(name).isdisjoint(sidecar_owners)
+    return ext not in SKIP_EXTENSIONS
+
+
+def select_members(
+    members,
+    text_method=None,
+    skip_nogeo=False,
+    additional_extensions=None,
+    max_size=None,
+    method="ordered",
+    seed=hf.DEFAULT_DOWNLOAD_SAMPLE_SEED,
+):
+    """Return the members of *members* (``[(name, size)]``) worth reading.
+
+    Drops members that cannot yield an extent: images without a world
+    file, office documents, media, source code and configuration files,
+    and plain-text files unless *text_method* is set. PDFs are kept, they
+    may be GeoPDFs. With
+    *skip_nogeo* only members with a geospatial extension
+    (``hf.GEOSPATIAL_EXTENSIONS`` plus *additional_extensions*) and their
+    sidecar files are kept, like the content providers'
+    ``download_skip_nogeo`` option.
+    *max_size*, *method* and *seed* limit the cumulative member size as
+    ``hf.filter_files_by_size`` does; shapefile components stay together.
+    """
+    sidecar_owners = {_sidecar_owner(name) for name, _ in members} - {None}
+    keep = {
+        name
+        for name, _ in members
+        if _can_yield_extent(
+            name, sidecar_owners, text_method, skip_nogeo, additional_extensions
+        )
+    }
+    # Sidecars (world files, .aux.xml, .cpg, ...) of the kept members
+    kept_keys = set().union(*(_sidecar_keys(name) for name in keep))
+    selected = [
+        (name, size)
+        for name, size in members
+        if name in keep or _sidecar_owner(name) in kept_keys
+    ]
+    if len(selected) < len(members):
+        logger.info(
+            "Skipping {} of {} archive members that cannot yield an extent".format(
+                len(members) - len(selected), len(members)
+            )
+        )
+    if max_size is not None:
+        files_info = [{"name": name, "size": size} for name, size in selected]
+        files_info, _total, _skipped = hf.filter_files_by_size(
+            files_info, max_size, method=method, seed=seed
+        )
+        selected = [(f["name"], f["size"]) for f in files_info]
+    return selected
+
+
+def _extract_members(archive_path, kind, names, folder):
+    """Extract the members *names* of *archive_path* into *folder*."""
+    wanted = set(names)
+    if kind == "zip":
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                if info.filename not in wanted or info.is_dir():
+                    continue
+                target = _member_target(folder, info.filename)
+                if target is None:
+                    logger.warning(
+                        "Skipping unsafe archive member {}".format(info.filename)
+                    )
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+    else:
+        with tarfile.open(archive_path) as tf:
+            for member in tf.getmembers():
+                if member.name not in wanted or not member.isfile():
+                    continue
+                target = _member_target(folder, member.name)
+                if target is None:
+                    logger.warning(
+                        "Skipping unsafe archive member {}".format(member.name)
+                    )
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                src = tf.extractfile(member)
+                with src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def write_pointer(folder, archive_path, member, size, vsi):
+    """Write a pointer to *member* where it would be extracted below *folder*.
+
+    Returns the pointer path, or ``None`` for unsafe member names.
+    """
+    target = _member_target(folder, member)
+    if target is None:
+        logger.warning("Skipping unsafe archive member {}".format(member))
+        return None
+    return pointers.write_pointer(
+        target,
+        pointers.MEMBER,
+        {
+            "archive": os.path.abspath(archive_path),
+            "folder": os.path.abspath(folder),
+            "member": member,
+            "size": size,
+            "vsi": vsi,
+        },
+    )
+
+
+def read_pointer(pointer_path):
+    """Return the record of a member pointer file."""
+    return pointers.read_pointer(pointer_path)
+
+
+def open_archive(path, **selection):
+    """Make the content of archive *path* available in a new folder next to it.
+
+    Zip and tar archives are read in-process: the members chosen by
+    :func:`select_members` (called with *selection*) are made available,
+    GDAL-readable members as pointer files, all others extracted. Other
+    archives are extracted with ``hf.extract_archive``. Returns the folder.
+    """
+    try:
+        kind = _archive_kind(path)
+        members = list_members(path) if kind else None
+    except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+        logger.debug("Cannot read archive {} in-process: {}".format(path, e))
+        members = None
+    if members is None:
+        return hf.extract_archive(path)
+    members = select_members(members, **selection)
+
+    folder = _new_extract_folder(path)
+    folder.mkdir(parents=True)
+
+    prefix = vsi_prefix(path)
+    virtual = set()
+    if prefix is not None:
+        virtual = {name for name, _ in members if _is_virtual_candidate(name)}
+    # Sidecars of members read in place stay in the archive, where GDAL
+    # finds them next to the member
+    virtual_keys = set().union(*(_sidecar_keys(name) for name in virtual))
+
+    extract = []
+    pointers = 0
+    for name, size in members:
+        owner = _sidecar_owner(name)
+        if name in virtual:
+            if write_pointer(folder, path, name, size, prefix + "/" + name):
+                pointers += 1
+        elif owner not in virtual_keys:
+            extract.append(name)
+
+    try:
+        _extract_members(path, kind, extract, folder)
+    except (OSError, zipfile.BadZipFile, tarfile.TarError, RuntimeError) as e:
+        # Encrypted, truncated or otherwise unreadable: same as patool
+        logger.debug("Extracting {} failed: {}".format(path, e))
+
+    logger.debug(
+        "Archive {}: {} members read in place, {} extracted".format(
+            path, pointers, len(extract)
+        )
+    )
+    return folder
+
+
+def extract_member_pointer(pointer_path, extract, extract_local=None, **options):
+    """Extract the archive member behind *pointer_path*.
+
+    *extract* is called like ``from_file(path, **options)`` with the
+    member's ``/vsizip/`` or ``/vsitar/`` path. If that yields neither a
+    bounding box nor a temporal extent (no handler reads the member that
+    way, or the one that does finds no extent), the member is extracted
+    next to the pointer and extracted with *extract_local* (default:
+    *extract*).
+    """
+    record = read_pointer(pointer_path)
+    result = None
+    try:
+        result = extract(record["vsi"], **options)
+    except Exception as e:
+        logger.debug("Reading {} in place failed: {}".format(record["vsi"], e))
+
+    if pointers.has_extent(result):
+        result["file_size_bytes"] = record["size"]
+        return result
+
+    # Extract the member together with its sidecar files
+    archive_path = record["archive"]
+    keys = _sidecar_keys(record["member"])
+    group = [
+        name
+        for name, _ in list_members(archive_path)
+        if name == record["member"] or _sidecar_owner(name) in keys
+    ]
+    _extract_members(archive_path, _archive_kind(archive_path), group, record["folder"])
+    os.remove(pointer_path)
+    local_path = pointers.original_name(pointer_path)
+    return (extract_local or extract)(local_path, **options)
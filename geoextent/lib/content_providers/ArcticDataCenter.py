@@ -1,6 +1,4 @@
-import json
 import logging
-import os
 import re
 from urllib.parse import quote, urlparse, unquote
 
@@ -250,7 +248,8 @@ class ArcticDataCenter(DoiProvider):
         return files
 
     def _create_geojson_from_metadata(self, target_folder, spatial, temporal):
-        """Create a GeoJSON file from metadata for geoextent processing.
+        """Emit the extent from metadata for geoextent processing (see
+        ``_emit_metadata_extent``).
 
         Args:
             target_folder: Directory to create the GeoJSON file in
@@ -266,43 +265,35 @@ class ArcticDataCenter(DoiProvider):
             "title": self.metadata.get("title", "") if self.metadata else "",
         }
 
+        tbox = None
         if temporal and isinstance(temporal, list) and len(temporal) >= 2:
-            if temporal[0]:
-                properties["start_time"] = temporal[0]
-            if temporal[1]:
-                properties["end_time"] = temporal[1]
-
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [
-                            [
-                                [min_lon, min_lat],
-                                [max_lon, min_lat],
-                                [max_lon, max_lat],
-                                [min_lon, max_lat],
-                                [min_lon, min_lat],
-                            ]
-                        ],
-                    },
-                    "properties": properties,
-                }
+            tbox = temporal[:2]
+
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [min_lon, min_lat],
+                    [max_lon, min_lat],
+                    [max_lon, max_lat],
+                    [min_lon, max_lat],
+                    [min_lon, min_lat],
+                ]
             ],
         }
 
-        # Sanitize dataset_id for filename
         safe_id = re.sub(r"[^a-zA-Z0-9_.-]", "_", self.dataset_id)
-        geojson_file = os.path.join(target_folder, f"arcticdata_{safe_id}.geojson")
-        with open(geojson_file, "w") as f:
-            json.dump(geojson_data, f, indent=2)
+        self._emit_metadata_extent(
+            target_folder,
+            f"arcticdata_{safe_id}",
+            geometry=geometry,
+            tbox=tbox,
+            properties=properties,
+        )
 
         temporal_info = f" with temporal extent {temporal}" if temporal else ""
         logger.info(
-            f"Created GeoJSON metadata file for {self.name} dataset "
+            f"Metadata extent for {self.name} dataset "
             f"{self.dataset_id}{temporal_info}"
         )
 
@@ -13,7 +13,6 @@ Supported identifiers:
 Uses OWSLib for CSW access as recommended by OGC standards.
 """
 
-import json
 import logging
 import os
 import re
@@ -314,7 +313,7 @@ class BAW(DoiProvider):
         return files
 
     def _create_metadata_geojson(self, metadata, target_dir):
-        """Create a GeoJSON file from metadata.
+        """Emit the extent from metadata (see ``_emit_metadata_extent``).
 
         Args:
             metadata (dict): Extracted metadata
@@ -325,43 +324,35 @@ class BAW(DoiProvider):
             return
 
         minx, miny, maxx, maxy = metadata["bbox"]
-
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [
-                            [
-                                [minx, miny],
-                                [maxx, miny],
-                                [maxx, maxy],
-                                [minx, maxy],
-                                [minx, miny],
-                            ]
-                        ],
-                    },
-                    "properties": {
-                        "source": "BAW",
-                        "dataset_id": self.record_uuid,
-                        "title": metadata.get("title", ""),
-                    },
-                }
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [minx, miny],
+                    [maxx, miny],
+                    [maxx, maxy],
+                    [minx, maxy],
+                    [minx, miny],
+                ]
             ],
         }
 
-        if metadata.get("temporal_extent"):
-            geojson_data["features"][0]["properties"]["temporal_extent"] = metadata[
-                "temporal_extent"
-            ]
-
-        geojson_file = os.path.join(target_dir, f"baw_{self.record_uuid}.geojson")
-        with open(geojson_file, "w", encoding="utf-8") as f:
-            json.dump(geojson_data, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"Created BAW GeoJSON metadata file: {geojson_file}")
+        tbox = None
+        temporal_extent = metadata.get("temporal_extent")
+        if temporal_extent:
+            tbox = [temporal_extent.get("start"), temporal_extent.get("end")]
+
+        self._emit_metadata_extent(
+            target_dir,
+            f"baw_{self.record_uuid}",
+            geometry=geometry,
+            tbox=tbox,
+            properties={
+                "source": "BAW",
+                "dataset_id": self.record_uuid,
+                "title": metadata.get("title", ""),
+            },
+        )
 
     def download(
         self,
@@ -407,13 +398,14 @@ class BAW(DoiProvider):
 
         folder_name = f"baw_{self.record_uuid}"
         download_dir = os.path.join(folder, folder_name)
-        os.makedirs(download_dir, exist_ok=True)
 
         if not download_data:
-            logger.info("Creating BAW metadata-only GeoJSON file")
+            logger.info("Using BAW metadata-only extent")
             self._create_metadata_geojson(metadata, download_dir)
             return download_dir
 
+        os.makedirs(download_dir, exist_ok=True)
+
         # Download data files
         if metadata.get("distribution_urls"):
             logger.info(f"Found {len(metadata['distribution_urls'])} distribution URLs")
@@ -520,17 +520,18 @@ class BGR(DoiProvider):
 
             logger.debug(f"Extracted metadata: {metadata}")
 
-            # Create target directory
             folder_name = f"bgr_{self.dataset_id}"
             download_dir = os.path.join(folder, folder_name)
-            os.makedirs(download_dir, exist_ok=True)
 
             if not download_data:
-                # Create GeoJSON from metadata only
-                logger.info("Creating metadata-only GeoJSON file")
+                # Extent from metadata only
+                logger.info("Using metadata-only extent")
                 self._create_metadata_geojson(metadata, download_dir)
                 return download_dir
 
+            # Create target directory
+            os.makedirs(download_dir, exist_ok=True)
+
             # Download data files if available
             if metadata.get("distribution_urls"):
                 logger.info(
@@ -559,7 +560,7 @@ class BGR(DoiProvider):
             raise
 
     def _create_metadata_geojson(self, metadata, target_dir):
-        """Create a GeoJSON file from metadata
+        """Emit the extent from metadata (see ``_emit_metadata_extent``)
 
         Args:
             metadata (dict): Extracted metadata
@@ -567,57 +568,48 @@ class BGR(DoiProvider):
         """
         if not metadata.get("bbox"):
             logger.warning("No bounding box in metadata, cannot create GeoJSON")
-            # Create a basic JSON metadata file instead
-            metadata_file = os.path.join(
-                target_dir, f"bgr_{self.dataset_id}_metadata.json"
-            )
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-            logger.info(f"Created metadata JSON file: {metadata_file}")
+            if getattr(self, "_metadata_extents", None) is None:
+                # Create a basic JSON metadata file instead
+                os.makedirs(target_dir, exist_ok=True)
+                metadata_file = os.path.join(
+                    target_dir, f"bgr_{self.dataset_id}_metadata.json"
+                )
+                with open(metadata_file, "w", encoding="utf-8") as f:
+                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                logger.info(f"Created metadata JSON file: {metadata_file}")
             return
 
         minx, miny, maxx, maxy = metadata["bbox"]
-
-        # Create GeoJSON feature
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [
-                            [
-                                [minx, miny],
-                                [maxx, miny],
-                                [maxx, maxy],
-                                [minx, maxy],
-                                [minx, miny],
-                            ]
-                        ],
-                    },
-                    "properties": {
-                        "source": "BGR",
-                        "dataset_id": self.dataset_id,
-                        "title": metadata.get("title", ""),
-                        "abstract": metadata.get("abstract", ""),
-                    },
-                }
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [minx, miny],
+                    [maxx, miny],
+                    [maxx, maxy],
+                    [minx, maxy],
+                    [minx, miny],
+                ]
             ],
         }
 
-        # Add temporal extent if available
-        if metadata.get("temporal_extent"):
-            geojson_data["features"][0]["properties"]["temporal_extent"] = metadata[
-                "temporal_extent"
-            ]
-
-        # Write GeoJSON file
-        geojson_file = os.path.join(target_dir, f"bgr_{self.dataset_id}.geojson")
-        with open(geojson_file, "w", encoding="utf-8") as f:
-            json.dump(geojson_data, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"Created GeoJSON metadata file: {geojson_file}")
+        tbox = None
+        temporal_extent = metadata.get("temporal_extent")
+        if temporal_extent:
+            tbox = [temporal_extent.get("start"), temporal_extent.get("end")]
+
+        self._emit_metadata_extent(
+            target_dir,
+            f"bgr_{self.dataset_id}",
+            geometry=geometry,
+            tbox=tbox,
+            properties={
+                "source": "BGR",
+                "dataset_id": self.dataset_id,
+                "title": metadata.get("title", ""),
+                "abstract": metadata.get("abstract", ""),
+            },
+        )
 
     def _download_files(
         self,
@@ -455,7 +455,8 @@ class CKANProvider(DoiProvider):
 
     def _create_geojson_from_metadata(self, target_folder, spatial, temporal, metadata):
         """
-        Create a GeoJSON file from metadata for geoextent processing.
+        Emit the extent from metadata for geoextent processing (see
+        ``_emit_metadata_extent``).
 
         When the spatial metadata includes the original GeoJSON geometry (e.g.,
         a complex Polygon or MultiPolygon from the CKAN ``spatial`` field), that
@@ -469,9 +470,6 @@ class CKANProvider(DoiProvider):
             temporal: Temporal metadata list with [start_date, end_date] or None
             metadata: Full dataset metadata
         """
-        import json
-        import os
-
         # Build properties
         properties = {
             "source": self.name,
@@ -482,17 +480,12 @@ class CKANProvider(DoiProvider):
             ),
         }
 
-        # Add temporal extent to properties if available
+        tbox = None
         if temporal and isinstance(temporal, list):
             if len(temporal) >= 2:
-                start_date, end_date = temporal[0], temporal[1]
-                if start_date:
-                    properties["start_time"] = start_date
-                if end_date:
-                    properties["end_time"] = end_date
+                tbox = [temporal[0], temporal[1]]
             elif len(temporal) == 1:
-                properties["start_time"] = temporal[0]
-                properties["end_time"] = temporal[0]
+                tbox = [temporal[0], temporal[0]]
 
         # Use original geometry if available (preserves precision for convex hull),
         # otherwise create a rectangular polygon from the bounding box.
@@ -514,27 +507,19 @@ class CKANProvider(DoiProvider):
                 ],
             }
 
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": geometry,
-                    "properties": properties,
-                }
-            ],
-        }
-
         # Sanitise dataset_id for filename (replace / and other path-unsafe chars)
         safe_id = re.sub(r"[^\w\-.]", "_", self.dataset_id)
         # Sanitise provider name similarly
         safe_name = re.sub(r"[^\w\-.]", "_", self.name.lower())
-        geojson_file = os.path.join(target_folder, f"{safe_name}_{safe_id}.geojson")
-
-        with open(geojson_file, "w") as f:
-            json.dump(geojson_data, f, indent=2)
+        self._emit_metadata_extent(
+            target_folder,
+            f"{safe_name}_{safe_id}",
+            geometry=geometry,
+            tbox=tbox,
+            properties=properties,
+        )
 
         temporal_info = f" with temporal extent {temporal}" if temporal else ""
         self.log.info(
-            f"Created GeoJSON metadata file for {self.name} dataset {self.dataset_id}{temporal_info}"
+            f"Metadata extent for {self.name} dataset {self.dataset_id}{temporal_info}"
         )
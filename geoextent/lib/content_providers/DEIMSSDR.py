@@ -26,7 +26,12 @@ import requests
 from osgeo import ogr
 
 from geoextent.lib import helpfunctions as hf
-from geoextent.lib.content_providers.providers import ContentProvider
+from geoextent.lib.content_providers.providers import (
+    ContentProvider,
+    create_session,
+)
+
+hf.ogr_osr()  # enable GDAL exceptions
 
 logger = logging.getLogger("geoextent")
 
@@ -85,7 +90,7 @@ class DEIMSSDR(ContentProvider):
         self.reference = None
         self.resource_type = None  # "dataset" or "site"
         self.resource_uuid = None
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update(
             {"Accept": "application/json", "User-Agent": "nuest/geoextent"}
         )
@@ -343,7 +348,7 @@ class DEIMSSDR(ContentProvider):
             return None
 
     def _create_geojson(self, geom, data, temporal, folder):
-        """Create a GeoJSON file from extracted geometry and metadata.
+        """Emit the extracted geometry and metadata (see ``_emit_metadata_extent``).
 
         Args:
             geom (ogr.Geometry): The geometry to write
@@ -352,7 +357,7 @@ class DEIMSSDR(ContentProvider):
             folder (str): Target directory
 
         Returns:
-            str: Path to created GeoJSON file
+            str: Path to created GeoJSON file, None if the extent was collected
         """
         geojson_geom = json.loads(geom.ExportToJson())
         title = data.get("title", "")
@@ -365,28 +370,13 @@ class DEIMSSDR(ContentProvider):
             "url": self.reference,
         }
 
-        if temporal:
-            properties["start_time"] = temporal[0]
-            properties["end_time"] = temporal[1]
-
-        geojson = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": geojson_geom,
-                    "properties": properties,
-                }
-            ],
-        }
-
-        filename = f"deims_{self.resource_type}_{self.resource_uuid}.geojson"
-        filepath = os.path.join(folder, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
-
-        logger.debug(f"Created GeoJSON file: {filepath}")
-        return filepath
+        return self._emit_metadata_extent(
+            folder,
+            f"deims_{self.resource_type}_{self.resource_uuid}",
+            geometry=geojson_geom,
+            tbox=list(temporal) if temporal else None,
+            properties=properties,
+        )
 
     def download(
         self,
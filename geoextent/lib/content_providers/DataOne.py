@@ -1,10 +1,8 @@
-import json
 import logging
-import os
 import re
 from urllib.parse import quote, urlparse, unquote
 
-from .providers import ContentProvider
+from .providers import ContentProvider, create_session
 from .. import helpfunctions as hf
 
 logger = logging.getLogger("geoextent")
@@ -85,13 +83,7 @@ class DataOne(ContentProvider):
 
     def _get_session(self):
         if self._session is None:
-            import requests
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.retry import Retry
-
-            self._session = requests.Session()
-            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503])
-            self._session.mount("https://", HTTPAdapter(max_retries=retry))
+            self._session = create_session()
             self._session.headers["User-Agent"] = (
                 "geoextent (https://github.com/nuest/geoextent)"
             )
@@ -290,7 +282,7 @@ class DataOne(ContentProvider):
     # ------------------------------------------------------------------ #
 
     def _create_geojson_from_metadata(self, target_folder, spatial, temporal):
-        """Write a GeoJSON file encoding the extracted extent."""
+        """Emit the extracted extent (see ``_emit_metadata_extent``)."""
         bbox = spatial["bbox"]
         min_lon, min_lat, max_lon, max_lat = bbox
 
@@ -300,42 +292,35 @@ class DataOne(ContentProvider):
             "title": self.metadata.get("title", "") if self.metadata else "",
         }
 
+        tbox = None
         if temporal and isinstance(temporal, list) and len(temporal) >= 2:
-            if temporal[0]:
-                properties["start_time"] = temporal[0]
-            if temporal[1]:
-                properties["end_time"] = temporal[1]
-
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [
-                            [
-                                [min_lon, min_lat],
-                                [max_lon, min_lat],
-                                [max_lon, max_lat],
-                                [min_lon, max_lat],
-                                [min_lon, min_lat],
-                            ]
-                        ],
-                    },
-                    "properties": properties,
-                }
+            tbox = temporal[:2]
+
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [min_lon, min_lat],
+                    [max_lon, min_lat],
+                    [max_lon, max_lat],
+                    [min_lon, max_lat],
+                    [min_lon, min_lat],
+                ]
             ],
         }
 
         safe_id = re.sub(r"[^a-zA-Z0-9_.-]", "_", self.dataset_id)
-        geojson_file = os.path.join(target_folder, f"dataone_{safe_id}.geojson")
-        with open(geojson_file, "w") as f:
-            json.dump(geojson_data, f, indent=2)
+        self._emit_metadata_extent(
+            target_folder,
+            f"dataone_{safe_id}",
+            geometry=geometry,
+            tbox=tbox,
+            properties=properties,
+        )
 
         temporal_info = f" with temporal extent {temporal}" if temporal else ""
         logger.info(
-            "Created GeoJSON metadata file for DataONE dataset %s%s",
+            "Metadata extent for DataONE dataset %s%s",
             self.dataset_id,
             temporal_info,
         )
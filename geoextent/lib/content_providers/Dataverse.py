@@ -248,9 +248,9 @@ class Dataverse(DoiProvider):
             str: The discovered host, or None if not found
         """
         try:
-            # Follow DOI resolution
-            response = self._request(f"https://doi.org/{doi}", allow_redirects=True)
-            final_url = response.url
+            # Follow DOI resolution (shared with the other candidates
+            # during find_provider)
+            final_url = self._resolve_doi(doi)
 
             parsed = urlparse(final_url)
             host = parsed.netloc
@@ -466,7 +466,13 @@ class Dataverse(DoiProvider):
                 )
                 file_size = df.get("filesize", 0)
                 file_info_list.append(
-                    {"name": filename, "url": download_url, "size": file_size}
+                    {
+                        "name": filename,
+                        "url": download_url,
+                        "size": file_size,
+                        # {"type": "MD5", "value": ...}; older versions: "md5"
+                        "checksum": df.get("checksum") or df.get("md5"),
+                    }
                 )
 
             # Apply geospatial file filtering
@@ -8,6 +8,8 @@ from ..extent import *
 
 class Dryad(DoiProvider):
     doi_prefixes = ("10.5061/dryad",)
+    # Anonymous limit: 30 requests per minute
+    rate_limit = 30 / 60
 
     @classmethod
     def provider_info(cls):
@@ -195,19 +197,14 @@ class Dryad(DoiProvider):
                 ) as pbar:
                     pbar.set_postfix_str("Downloading dataset.zip (bulk)")
 
-                    resp = self._request(
+                    filename = "dataset.zip"
+                    filepath = os.path.join(folder, filename)
+                    self._download_file_optimized(
                         download_url,
+                        filepath,
                         throttle=self.throttle,
-                        stream=True,
+                        progress_hook=pbar.update,
                     )
-                    filename = "dataset.zip"
-                    filepath = os.path.join(folder, filename)
-
-                    with open(filepath, "wb") as dst:
-                        for chunk in resp.iter_content(chunk_size=8192):
-                            if chunk:
-                                dst.write(chunk)
-                                pbar.update(len(chunk))
 
                 self.log.info(f"Downloaded Dryad dataset {self.record_id} as ZIP file")
                 return
@@ -326,38 +323,15 @@ class Dryad(DoiProvider):
                 f"Starting download of {len(file_info)} files from Dryad dataset {self.record_id} ({total_size:,} bytes total)"
             )
 
-            # Download individual files with progress bar
-            with tqdm(
-                total=total_size,
-                desc=f"Downloading Dryad dataset {self.record_id}",
-                unit="B",
-                unit_scale=True,
-            ) as pbar:
-                for i, file_data in enumerate(file_info, 1):
-                    file_link = file_data["url"]
-                    file_path = file_data["path"]
-                    file_size = file_data.get("size", 0)
-                    file_name = file_data.get("name", Path(file_path).name)
-
-                    pbar.set_postfix_str(f"File {i}/{len(file_info)}: {file_name}")
-
-                    resp = self._request(
-                        file_link,
-                        throttle=self.throttle,
-                        stream=True,
-                    )
-                    filepath = Path(folder).joinpath(file_path)
-                    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-                    with open(filepath, "wb") as dst:
-                        for chunk in resp.iter_content(chunk_size=8192):
-                            if chunk:
-                                dst.write(chunk)
-                                pbar.update(len(chunk))
-
-                    self.log.debug(
-                        f"Downloaded Dryad file {i}/{len(file_info)}: {file_path}"
-                    )
+            # Download individual files, keeping the dataset's folder layout
+            self._download_files_batch(
+                [dict(f, target_path=f["path"]) for f in file_info],
+                folder,
+                show_progress=show_progress,
+                max_workers=max_download_workers,
+                progress_callback=progress_callback,
+                throttle=self.throttle,
+            )
 
             self.log.info(
                 f"Downloaded {len(file_info)} files from Dryad dataset {self.record_id} ({total_size} bytes total)"
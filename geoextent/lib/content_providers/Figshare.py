@@ -407,7 +407,12 @@ class Figshare(DoiProvider):
 
                     if file_url:
                         file_info.append(
-                            {"name": filename, "url": file_url, "size": file_size}
+                            {
+                                "name": filename,
+                                "url": file_url,
+                                "size": file_size,
+                                "checksum": file_data.get("computed_md5"),
+                            }
                         )
                         total_size += file_size
 
@@ -2,10 +2,9 @@ import json
 import logging
 import os
 import re
-import time
 from urllib.parse import urlparse
 
-from .providers import DoiProvider
+from .providers import DoiProvider, get_rate_limiter
 from .. import helpfunctions as hf
 from ..exceptions import DownloadSizeExceeded
 
@@ -418,7 +417,7 @@ class GBIF(DoiProvider):
 
         try:
             if throttle:
-                time.sleep(1)
+                get_rate_limiter().wait(dwca_url, self.rate_limit)
 
             logger.info(
                 "Downloading DwC-A from %s (%s)",
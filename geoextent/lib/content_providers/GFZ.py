@@ -439,7 +439,7 @@ class GFZ(DoiProvider):
 
         try:
             with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=self.download_chunk_size):
                     if chunk:
                         # If we have a size limit and the original file size was unknown, monitor download size
                         if max_size_bytes is not None and total_size == 0:
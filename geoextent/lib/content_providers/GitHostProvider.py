@@ -17,7 +17,6 @@ Subclasses implement four abstract methods:
 """
 
 import logging
-import os
 from abc import abstractmethod
 
 from geoextent.lib import helpfunctions as hf
@@ -172,24 +171,33 @@ class GitHostProvider(DoiProvider):
             total_size,
         )
 
-        downloaded_count = 0
+        downloads = []
         for file_info in file_list:
             file_path = file_info["name"]
-            url = self._get_raw_url(owner, repo, ref, file_path)
 
             # Build local path preserving directory structure
             relative_path = file_path
             if strip_prefix and relative_path.startswith(strip_prefix):
                 relative_path = relative_path[len(strip_prefix) :]
 
-            local_path = os.path.join(folder, relative_path)
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            downloads.append(
+                {
+                    "name": file_path,
+                    "url": self._get_raw_url(owner, repo, ref, file_path),
+                    "size": file_info.get("size", 0),
+                    "target_path": relative_path,
+                }
+            )
 
-            try:
-                self._download_file_optimized(url, local_path)
-                downloaded_count += 1
-            except Exception as e:
-                self.log.warning("Failed to download %s: %s", file_path, e)
+        results = self._download_files_batch(
+            downloads,
+            folder,
+            show_progress=show_progress,
+            max_workers=max_download_workers,
+            progress_callback=progress_callback,
+            throttle=throttle,
+        )
+        downloaded_count = sum(1 for r in results if r["success"])
 
         self.log.info(
             "Downloaded %d/%d files from %s/%s",
@@ -23,10 +23,12 @@ import logging
 import os
 import re
 
-import requests
 from bs4 import BeautifulSoup
 
-from geoextent.lib.content_providers.providers import ContentProvider
+from geoextent.lib.content_providers.providers import (
+    ContentProvider,
+    create_session,
+)
 
 logger = logging.getLogger("geoextent")
 
@@ -83,7 +85,7 @@ class HALODB(ContentProvider):
         self.name = "HALO DB"
         self.reference = None
         self.dataset_id = None
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({"User-Agent": "nuest/geoextent"})
 
     def validate_provider(self, reference):
@@ -256,7 +256,8 @@ class InvenioRDM(DoiProvider):
         - InvenioRDM standard: record["files"]["entries"] is a dict with links.content
         - Fallback: fetch /api/records/{id}/files separately
 
-        Returns list of dicts with 'url', 'name', 'size' keys.
+        Returns list of dicts with 'url', 'name', 'size' and 'checksum'
+        (``md5:<hex>``) keys.
         """
         file_info = []
 
@@ -271,7 +272,14 @@ class InvenioRDM(DoiProvider):
                 name = f.get("key", url.split("/")[-2] if url else "unknown")
                 size = f.get("size", 0)
                 if url:
-                    file_info.append({"url": url, "name": name, "size": size})
+                    file_info.append(
+                        {
+                            "url": url,
+                            "name": name,
+                            "size": size,
+                            "checksum": f.get("checksum"),
+                        }
+                    )
             return file_info
 
         # InvenioRDM standard: files is a dict with "entries" or "enabled"
@@ -283,7 +291,14 @@ class InvenioRDM(DoiProvider):
                     name = key
                     size = entry.get("size", 0)
                     if url:
-                        file_info.append({"url": url, "name": name, "size": size})
+                        file_info.append(
+                            {
+                                "url": url,
+                                "name": name,
+                                "size": size,
+                                "checksum": entry.get("checksum"),
+                            }
+                        )
                 return file_info
 
         # Fallback: fetch the files endpoint separately
@@ -303,7 +318,14 @@ class InvenioRDM(DoiProvider):
                         name = key
                         size = entry.get("size", 0)
                         if url:
-                            file_info.append({"url": url, "name": name, "size": size})
+                            file_info.append(
+                                {
+                                    "url": url,
+                                    "name": name,
+                                    "size": size,
+                                    "checksum": entry.get("checksum"),
+                                }
+                            )
                 elif isinstance(entries, list):
                     for entry in entries:
                         url = entry.get("links", {}).get("content") or entry.get(
@@ -312,7 +334,14 @@ class InvenioRDM(DoiProvider):
                         name = entry.get("key", "unknown")
                         size = entry.get("size", 0)
                         if url:
-                            file_info.append({"url": url, "name": name, "size": size})
+                            file_info.append(
+                                {
+                                    "url": url,
+                                    "name": name,
+                                    "size": size,
+                                    "checksum": entry.get("checksum"),
+                                }
+                            )
             except Exception as e:
                 self.log.warning(
                     "Failed to fetch files from /files endpoint: {}".format(e)
@@ -320,10 +349,8 @@ class InvenioRDM(DoiProvider):
 
         return file_info
 
-    def _download_file_optimized(
-        self, url, filepath, chunk_size=None, show_progress=False
-    ):
-        """Download a file handling InvenioRDM download patterns:
+    def _open_download(self, url, headers=None, throttle=False):
+        """Open a file download handling InvenioRDM download patterns:
 
         1. Zenodo: HTTP 302 redirect to S3 (requests follows automatically)
         2. CaltechDATA/Frei-Data/GKHub: HTTP 200 with S3 signed URL in text/plain body
@@ -331,61 +358,37 @@ class InvenioRDM(DoiProvider):
         4. TU Wien: HTTP 200 with binary content directly
 
         Detection: check text/plain Content-Type, Location header with S3 URL,
-        or peek at response body for small redirect URLs.
+        or peek at response body for small redirect URLs. A ``Range`` header
+        (resumed download) is sent to the final URL only.
         """
-        if chunk_size is None:
-            chunk_size = self.download_chunk_size
-
-        self.log.debug(
-            "Downloading {} to {} with {} byte chunks".format(url, filepath, chunk_size)
-        )
-
-        try:
-            resp = self.session.get(url, stream=True)
-            resp.raise_for_status()
-            content_type = resp.headers.get("content-type", "").lower()
-
-            redirect_url = None
-
-            # Pattern 2: explicit text/plain body containing S3 URL
-            if "text/plain" in content_type:
-                body = resp.text.strip()
+        resp = self._request(url, throttle=throttle, stream=True)
+        content_type = resp.headers.get("content-type", "").lower()
+
+        redirect_url = None
+
+        # Pattern 2: explicit text/plain body containing S3 URL
+        if "text/plain" in content_type:
+            body = resp.text.strip()
+            resp.close()
+            if body.startswith("http"):
+                redirect_url = body
+
+        # Pattern 3: Location header with S3 URL on 200 response (FDAT)
+        elif resp.status_code == 200 and "location" in resp.headers:
+            loc = resp.headers["location"]
+            if loc.startswith("http"):
                 resp.close()
-                if body.startswith("http"):
-                    redirect_url = body
-
-            # Pattern 3: Location header with S3 URL on 200 response (FDAT)
-            elif resp.status_code == 200 and "location" in resp.headers:
-                loc = resp.headers["location"]
-                if loc.startswith("http"):
-                    resp.close()
-                    redirect_url = loc
-
-            if redirect_url:
-                self.log.debug(
-                    "Following S3 redirect URL for {}".format(
-                        os.path.basename(filepath)
-                    )
-                )
-                resp = self.session.get(redirect_url, stream=True)
-                resp.raise_for_status()
-
-            # Stream binary to file
-            downloaded = 0
-            with open(filepath, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
+                redirect_url = loc
 
-            self.log.debug("Download completed: {} bytes".format(downloaded))
-            return downloaded
+        if redirect_url:
+            self.log.debug("Following S3 redirect URL for {}".format(url))
+            return self._request(redirect_url, stream=True, headers=headers)
 
-        except Exception as e:
-            self.log.error("Failed to download {}: {}".format(url, e))
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            raise
+        if headers:
+            # Pattern 1/4 resumed: ask the same URL again for the missing range
+            resp.close()
+            return self._request(url, stream=True, headers=headers)
+        return resp
 
     def _parse_locations(self, record):
         """Parse metadata.locations.features[] into a list of GeoJSON geometries.
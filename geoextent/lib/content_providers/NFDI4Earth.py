@@ -25,7 +25,12 @@ import requests
 from osgeo import ogr
 
 from geoextent.lib import helpfunctions as hf
-from geoextent.lib.content_providers.providers import ContentProvider
+from geoextent.lib.content_providers.providers import (
+    ContentProvider,
+    create_session,
+)
+
+hf.ogr_osr()  # enable GDAL exceptions
 
 logger = logging.getLogger("geoextent")
 
@@ -97,7 +102,7 @@ class NFDI4Earth(ContentProvider):
         self.reference = None
         self.cordra_id = None  # e.g. "n4e/dthb-82b6552d-..."
         self.cordra_iri = None  # full IRI for SPARQL
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({"User-Agent": "nuest/geoextent"})
 
     def validate_provider(self, reference):
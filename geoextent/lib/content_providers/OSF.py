@@ -113,7 +113,7 @@ class OSF(DoiProvider):
         self.log.debug(f"Fetching OSF metadata from {api_url}")
 
         try:
-            response = requests.get(api_url, timeout=60)
+            response = self.session.get(api_url, timeout=60)
             response.raise_for_status()
             data = response.json()
 
@@ -215,14 +215,14 @@ class OSF(DoiProvider):
         self.log.debug(f"Fetching file list from {files_url}")
 
         try:
-            response = requests.get(files_url, timeout=60)
+            response = self.session.get(files_url, timeout=60)
             response.raise_for_status()
             data = response.json()
 
             # Recursively collect all files with metadata
             def collect_files_recursive(url, path_prefix=""):
                 files = []
-                response = requests.get(url, timeout=60)
+                response = self.session.get(url, timeout=60)
                 response.raise_for_status()
                 data = response.json()
 
@@ -287,7 +287,12 @@ class OSF(DoiProvider):
             raise Exception(f"Failed to get file metadata via OSF API: {e}")
 
     def _get_files_via_api(
-        self, target_folder, show_progress=True, file_list=None, progress_callback=None
+        self,
+        target_folder,
+        show_progress=True,
+        file_list=None,
+        progress_callback=None,
+        max_workers=4,
     ):
         """Download files via OSF API with optional pre-filtered file list"""
         if file_list is None:
@@ -300,8 +305,6 @@ class OSF(DoiProvider):
             )
             return []
 
-        # Download files with progress tracking
-        downloaded_files = []
         total_size = sum(f["size"] for f in file_list)
 
         # Log download summary before starting
@@ -309,63 +312,15 @@ class OSF(DoiProvider):
             f"Starting download of {len(file_list)} files from OSF project {self.project_id} ({total_size:,} bytes total)"
         )
 
-        # Use the batch download method from parent class
-        if hasattr(self, "_download_files_batch"):
-            results = self._download_files_batch(
-                file_list,
-                target_folder,
-                show_progress=show_progress,
-                max_workers=4,
-                progress_callback=progress_callback,
-            )
-            downloaded_files = [
-                os.path.join(target_folder, f["name"]) for f in file_list
-            ]
-        else:
-            # Fallback to sequential download
-            from tqdm import tqdm
-
-            if show_progress:
-                pbar = tqdm(
-                    total=total_size,
-                    desc=f"Downloading OSF files from {self.project_id}",
-                    unit="B",
-                    unit_scale=True,
-                )
-
-            try:
-                for file_info in file_list:
-                    file_name = file_info["name"]
-                    download_url = file_info["url"]
-                    local_path = os.path.join(target_folder, file_name)
-
-                    # Create directories if needed
-                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
-
-                    if show_progress:
-                        pbar.set_postfix_str(
-                            f"Downloading {os.path.basename(file_name)}"
-                        )
-
-                    # Download file
-                    import requests
-
-                    file_response = requests.get(download_url, timeout=60, stream=True)
-                    file_response.raise_for_status()
-
-                    with open(local_path, "wb") as f:
-                        for chunk in file_response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                if show_progress:
-                                    pbar.update(len(chunk))
-
-                    downloaded_files.append(local_path)
-                    self.log.debug(f"Downloaded OSF file via API: {file_name}")
-
-            finally:
-                if show_progress:
-                    pbar.close()
+        # Keep the project's folder layout ("name" is the path within osfstorage)
+        results = self._download_files_batch(
+            [dict(f, target_path=f["name"]) for f in file_list],
+            target_folder,
+            show_progress=show_progress,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+        downloaded_files = [r["task"][1] for r in results if r["success"]]
 
         self.log.info(
             f"Downloaded {len(downloaded_files)} files from OSF project {self.project_id}"
@@ -503,6 +458,7 @@ class OSF(DoiProvider):
                     show_progress,
                     file_info,
                     progress_callback=progress_callback,
+                    max_workers=max_download_workers,
                 )
                 self.log.info(
                     f"OSF data downloaded via API for project {self.project_id}"
@@ -4,6 +4,7 @@ import tempfile
 from datetime import datetime
 from requests import HTTPError
 from .providers import DoiProvider
+from .. import handle_csv
 from .. import helpfunctions as hf
 
 
@@ -115,7 +116,7 @@ class Pangaea(DoiProvider):
         self.log.debug(f"Fetching web metadata from {url}")
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             html_content = response.text
 
@@ -566,13 +567,18 @@ class Pangaea(DoiProvider):
                     if has_data and data_size > 0:
                         pbar.set_postfix_str("Processing data")
 
-                        # Save data as CSV for GDAL processing
-                        csv_file = os.path.join(
-                            target_folder, f"pangaea_{self.dataset_id}.csv"
-                        )
-                        pbar.set_postfix_str(f"Saving CSV ({data_size} records)")
-                        dataset.data.to_csv(csv_file, index=False)
-                        self.log.debug(f"Saved dataset data to {csv_file}")
+                        if self._collect_data_extent(dataset.data, target_folder):
+                            pbar.set_postfix_str(
+                                f"Extent of {data_size} records computed"
+                            )
+                        else:
+                            # Save data as CSV for GDAL processing
+                            csv_file = os.path.join(
+                                target_folder, f"pangaea_{self.dataset_id}.csv"
+                            )
+                            pbar.set_postfix_str(f"Saving CSV ({data_size} records)")
+                            dataset.data.to_csv(csv_file, index=False)
+                            self.log.debug(f"Saved dataset data to {csv_file}")
                         pbar.update(1)
 
                         self.log.info(
@@ -620,6 +626,53 @@ class Pangaea(DoiProvider):
                 target_folder, progress_callback=progress_callback
             )
 
+    def _collect_data_extent(self, data, folder=None):
+        """Hand the extent of the dataset table to the extraction in memory.
+
+        The extent is computed on the columns of the pangaeapy DataFrame
+        (see ``handle_csv.dataframe_extent``) instead of writing the table to
+        a CSV file that is then parsed again. Returns False if there is no
+        extent collector (see ``ContentProvider._emit_metadata_extent``) or
+        no extent in the table, in which case the CSV file is written. The
+        extent is reported under *folder*, the directory of that CSV file.
+        """
+        collector = getattr(self, "_metadata_extents", None)
+        if collector is None:
+            return False
+        try:
+            extent = handle_csv.dataframe_extent(data)
+        except Exception as e:
+            self.log.debug(f"Extent of the Pangaea data table not computed: {e}")
+            return False
+        if extent is None:
+            return False
+
+        geometry = None
+        if extent.hull is not None:
+            vertices = extent.hull.tolist()
+            if len(vertices) == 1:
+                geometry = {"type": "Point", "coordinates": vertices[0]}
+            else:
+                geometry = {"type": "MultiPoint", "coordinates": vertices}
+        tbox = None
+        if extent.time_range is not None:
+            tbox = [t.isoformat() for t in extent.time_range]
+
+        collector.append(
+            {
+                "name": f"pangaea_{self.dataset_id}.csv",
+                "folder": folder,
+                "geometry": geometry,
+                "tbox": tbox,
+                "format": "csv",
+                "handler": "handle_csv",
+            }
+        )
+        self.log.debug(
+            f"Computed extent of Pangaea dataset {self.dataset_id} from its data table"
+        )
+        return True
+
     def _download_files_fallback(
         self,
         target_folder,
@@ -660,7 +713,7 @@ class Pangaea(DoiProvider):
             for i, url in enumerate(download_urls):
                 try:
                     # Get file info without downloading
-                    head_response = requests.head(url, timeout=30)
+                    head_response = self.session.head(url, timeout=30)
                     head_response.raise_for_status()
 
                     filename = self._get_filename_from_response(head_response, url)
@@ -737,7 +790,7 @@ class Pangaea(DoiProvider):
                             self.log.debug(f"Progress bar update error: {pbar_error}")
 
                     self.log.debug(f"Downloading from URL: {url}")
-                    response = requests.get(url, stream=True, timeout=300)
+                    response = self.session.get(url, stream=True, timeout=300)
                     response.raise_for_status()
 
                     filepath = os.path.join(target_folder, filename)
@@ -747,7 +800,9 @@ class Pangaea(DoiProvider):
                     size_exceeded = False
 
                     with open(filepath, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
+                        for chunk in response.iter_content(
+                            chunk_size=self.download_chunk_size
+                        ):
                             if chunk:
                                 # If we have a size limit and this file size is unknown, monitor download size
                                 if (
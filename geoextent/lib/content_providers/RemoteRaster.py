@@ -17,7 +17,6 @@ This provider is positioned **last** in the provider list — it acts as a
 catch-all for ``.tif`` / ``.tiff`` URLs that no other provider claims.
 """
 
-import json
 import logging
 import os
 import re
@@ -29,6 +28,8 @@ from geoextent.lib.content_providers.providers import ContentProvider
 from geoextent.lib import handle_raster
 from geoextent.lib import helpfunctions as hf
 
+hf.ogr_osr()  # enable GDAL exceptions
+
 logger = logging.getLogger("geoextent")
 
 # Match HTTP(S) URLs ending in .tif or .tiff (with optional query params)
@@ -236,7 +237,6 @@ class RemoteRaster(ContentProvider):
         logger.info("Extracting metadata from remote raster: %s", self.url)
 
         download_dir = os.path.join(folder, "remote_raster")
-        os.makedirs(download_dir, exist_ok=True)
 
         vsicurl_path = f"/vsicurl/{self.url}"
 
@@ -306,7 +306,7 @@ class RemoteRaster(ContentProvider):
             return None
 
     def _create_geojson(self, bbox, temporal, folder):
-        """Create a GeoJSON file from extracted metadata.
+        """Emit the extracted metadata (see ``_emit_metadata_extent``).
 
         Args:
             bbox (list or None): [minlon, minlat, maxlon, maxlat]
@@ -314,7 +314,7 @@ class RemoteRaster(ContentProvider):
             folder (str): Target directory
 
         Returns:
-            str: Path to created GeoJSON file
+            str: Path to created GeoJSON file, None if the extent was collected
         """
         properties = {
             "source": "RemoteRaster",
@@ -322,35 +322,19 @@ class RemoteRaster(ContentProvider):
             "format": "GeoTIFF",
         }
 
-        if temporal:
-            properties["start_time"] = temporal[0]
-            properties["end_time"] = temporal[1]
-
         geometry = None
         if bbox:
             # bbox is [minlon, minlat, maxlon, maxlat] — convert to
             # [west, south, east, north] for _bbox_to_polygon
             geometry = _bbox_to_polygon(bbox)
 
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": geometry,
-                    "properties": properties,
-                }
-            ],
-        }
-
         # Create safe filename from URL
         parsed = urlparse(self.url)
         safe_name = re.sub(r"[^\w\-.]", "_", parsed.path.split("/")[-1])
-        filename = f"remote_raster_{safe_name}.geojson"
-        filepath = os.path.join(folder, filename)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(geojson_data, f, indent=2, ensure_ascii=False)
-
-        logger.debug("Created remote raster GeoJSON file: %s", filepath)
-        return filepath
+        return self._emit_metadata_extent(
+            folder,
+            f"remote_raster_{safe_name}",
+            geometry=geometry,
+            tbox=list(temporal) if temporal else None,
+            properties=properties,
+        )
@@ -19,15 +19,16 @@ This is a metadata-only provider — STAC Collections already contain exactly
 the extent information geoextent needs, without downloading data files.
 """
 
-import json
 import logging
 import os
 import re
 from urllib.parse import urlparse
 
-import requests
 
-from geoextent.lib.content_providers.providers import ContentProvider
+from geoextent.lib.content_providers.providers import (
+    ContentProvider,
+    create_session,
+)
 
 logger = logging.getLogger("geoextent")
 
@@ -141,7 +142,7 @@ class STAC(ContentProvider):
         self.reference = None
         self.collection_url = None
         self.collection_id = None
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update(
             {
                 "User-Agent": "nuest/geoextent",
@@ -357,7 +358,7 @@ class STAC(ContentProvider):
         return None
 
     def _create_geojson(self, data, spatial, temporal, folder):
-        """Create a GeoJSON file from extracted STAC metadata.
+        """Emit the extracted STAC metadata (see ``_emit_metadata_extent``).
 
         Args:
             data (dict): Original STAC JSON
@@ -366,7 +367,8 @@ class STAC(ContentProvider):
             folder (str): Target directory
 
         Returns:
-            str or None: Path to created GeoJSON file, or None if no data
+            str or None: Path to created GeoJSON file, or None if no data or
+                the extent was collected
         """
         if spatial is None and temporal is None:
             logger.warning(
@@ -391,31 +393,14 @@ class STAC(ContentProvider):
         if data.get("stac_version"):
             properties["stac_version"] = data["stac_version"]
 
-        if temporal:
-            properties["start_time"] = temporal[0]
-            properties["end_time"] = temporal[1]
-
-        geometry = spatial["geometry"] if spatial else None
-
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": geometry,
-                    "properties": properties,
-                }
-            ],
-        }
-
         safe_id = re.sub(r"[^\w\-.]", "_", self.collection_id or "unknown")
-        filename = f"stac_{safe_id}.geojson"
-        filepath = os.path.join(folder, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(geojson_data, f, indent=2, ensure_ascii=False)
-
-        logger.debug("Created STAC GeoJSON file: %s", filepath)
-        return filepath
+        return self._emit_metadata_extent(
+            folder,
+            f"stac_{safe_id}",
+            geometry=spatial["geometry"] if spatial else None,
+            tbox=list(temporal) if temporal else None,
+            properties=properties,
+        )
 
     def download(
         self,
@@ -448,7 +433,6 @@ class STAC(ContentProvider):
 
         safe_id = re.sub(r"[^\w\-.]", "_", self.collection_id or "unknown")
         download_dir = os.path.join(folder, f"stac_{safe_id}")
-        os.makedirs(download_dir, exist_ok=True)
 
         # Fetch STAC JSON
         data = self._fetch_collection()
@@ -482,7 +466,6 @@ class STAC(ContentProvider):
         else:
             logger.info("STAC: no temporal extent found")
 
-        # Create GeoJSON file
         self._create_geojson(data, spatial, temporal, download_dir)
 
         return download_dir
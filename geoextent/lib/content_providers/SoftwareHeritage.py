@@ -82,6 +82,8 @@ class SoftwareHeritage(DoiProvider):
     """Software Heritage content provider."""
 
     doi_prefixes = ()
+    # Anonymous limit: 120 requests per hour (1200 with SWH_TOKEN)
+    rate_limit = 120 / 3600
 
     @property
     def supports_metadata_extraction(self):
@@ -99,6 +101,7 @@ class SoftwareHeritage(DoiProvider):
         token = os.environ.get("SWH_TOKEN")
         if token:
             self.session.headers["Authorization"] = f"Bearer {token}"
+            self.rate_limit = 1200 / 3600
             self.log.debug("Using SWH_TOKEN for authenticated API access")
 
     def _request(self, url, throttle=False, **kwargs):
@@ -129,6 +132,7 @@ class SoftwareHeritage(DoiProvider):
                     e.response.text.strip()[:200],
                 )
                 del self.session.headers["Authorization"]
+                self.rate_limit = type(self).rate_limit
                 return super()._request(url, throttle=throttle, **kwargs)
             raise
 
@@ -436,14 +440,11 @@ class SoftwareHeritage(DoiProvider):
     def _download_content_raw(self, url, filepath):
         """Download a content file with rate-limit awareness.
 
-        Unlike _download_file_optimized, this method uses _request (which
-        handles 429 throttling) to get the raw content, then writes it to disk.
+        Streams through the shared download engine with throttling enabled,
+        so 429 responses and the rate-limit headers are honoured.
         """
-        resp = self._request(url, throttle=True)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, "wb") as f:
-            f.write(resp.content)
-        self.log.debug("Downloaded %d bytes to %s", len(resp.content), filepath)
+        size = self._download_file_optimized(url, filepath, throttle=True)
+        self.log.debug("Downloaded %d bytes to %s", size, filepath)
 
     def _download_single_content(self, folder, sha, filename):
         """Download a single content object by sha1_git."""
@@ -558,19 +559,23 @@ class SoftwareHeritage(DoiProvider):
             total_size,
         )
 
-        downloaded_count = 0
-        for file_info in file_list:
-            sha = file_info["sha1_git"]
-            file_path = file_info["name"]
-            url = f"{SWH_API}/content/sha1_git:{sha}/raw/"
-
-            local_path = os.path.join(folder, file_path)
-
-            try:
-                self._download_content_raw(url, local_path)
-                downloaded_count += 1
-            except Exception as e:
-                self.log.warning("Failed to download %s: %s", file_path, e)
+        results = self._download_files_batch(
+            [
+                {
+                    "name": file_info["name"],
+                    "url": f"{SWH_API}/content/sha1_git:{file_info['sha1_git']}/raw/",
+                    "size": file_info.get("size", 0),
+                    "target_path": file_info["name"],
+                }
+                for file_info in file_list
+            ],
+            folder,
+            show_progress=show_progress,
+            max_workers=1,
+            progress_callback=progress_callback,
+            throttle=True,
+        )
+        downloaded_count = sum(1 for r in results if r["success"])
 
         self.log.info(
             "Downloaded %d/%d files from Software Heritage",
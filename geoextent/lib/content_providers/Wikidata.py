@@ -23,7 +23,10 @@ from urllib.parse import quote
 
 import requests
 
-from geoextent.lib.content_providers.providers import ContentProvider
+from geoextent.lib.content_providers.providers import (
+    ContentProvider,
+    create_session,
+)
 
 logger = logging.getLogger("geoextent")
 
@@ -84,7 +87,7 @@ class Wikidata(ContentProvider):
         self.name = "Wikidata"
         self.qid = None  # e.g. "Q64"
         self.reference = None
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({"User-Agent": _USER_AGENT})
 
     def validate_provider(self, reference):
@@ -13,6 +13,8 @@ class Zenodo(InvenioRDM):
     """
 
     doi_prefixes = ("10.5281/zenodo",)
+    # Guest limit: 60 requests per minute
+    rate_limit = 60 / 60
 
     @classmethod
     def provider_info(cls):
@@ -4,47 +4,11 @@ Content providers for geoextent.
 This package contains modules for extracting data from various research repositories.
 """
 
-# Import all content providers
-from . import providers
-from . import Zenodo
-from . import InvenioRDM
-from . import Figshare
-from . import Dryad
-from . import Pangaea
-from . import OSF
-from . import Dataverse
-from . import GFZ
-from . import journals
-from . import Opara
-from . import BGR
-from . import Senckenberg
-from . import MendeleyData
-from . import Wikidata
-from . import FourTU
-from . import RADAR
-from . import ArcticDataCenter
-from . import DataOne
-from . import DEIMSSDR
-from . import BAW
-from . import MDIDE
-from . import GDIDE
-from . import HALODB
-from . import GBIF
-from . import SEANOE
-from . import GeoScienceWorld
-from . import UKCEH
-from . import CKAN
-from . import NFDI4Earth
-from . import STAC
-from . import GitHostProvider
-from . import GitHub
-from . import GitLab
-from . import Forgejo
-from . import SoftwareHeritage
-from . import RemoteRaster
+import importlib
 
 __all__ = [
     "providers",
+    "manifest",
     "Zenodo",
     "InvenioRDM",
     "Figshare",
@@ -82,3 +46,15 @@ __all__ = [
     "SoftwareHeritage",
     "RemoteRaster",
 ]
+
+
+def __getattr__(name):
+    # Provider modules are imported on first access (see manifest), so
+    # importing the package does not load every provider and its dependencies
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -88,16 +88,13 @@ class Pensoft(JournalProvider):
         if match:
             # This is a Pensoft DOI, resolve it to get article URL
             doi = match.group(1)
-            try:
-                resp = self._request(f"https://doi.org/{doi}")
-                resolved_url = resp.url
-                # Check if it resolved to a Pensoft journal
-                if any([resolved_url.startswith(p) for p in self.host["hostname"]]):
-                    clean_url = resolved_url.rstrip("/")
-                    self.article_id = clean_url.rsplit("/", maxsplit=1)[1]
-                    return True
-            except HTTPError:
-                pass
+            # Shared with the other candidates during find_provider
+            resolved_url = self._resolve_doi(doi)
+            # Check if it resolved to a Pensoft journal
+            if any([resolved_url.startswith(p) for p in self.host["hostname"]]):
+                clean_url = resolved_url.rstrip("/")
+                self.article_id = clean_url.rsplit("/", maxsplit=1)[1]
+                return True
 
         return False
 
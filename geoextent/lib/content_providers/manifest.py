@@ -0,0 +1,191 @@
+"""Static manifest of the content providers.
+
+The providers are listed in priority order with the DOI prefixes and host
+names they claim (see :class:`~geoextent.lib.content_providers.providers.ProviderIndex`),
+so a reference is matched against the manifest without importing any
+provider module. A provider class is imported when it is first needed, i.e.
+when the index offers it as a candidate or a reference has to be validated
+by every provider.
+
+Keep an entry's ``doi_prefixes`` and ``hosts`` in sync with the class's
+``doi_prefixes`` and ``provider_info()["supported_identifiers"]``;
+``tests/test_provider_index.py`` checks this.
+"""
+
+import collections
+import importlib
+
+
+class ProviderEntry(
+    collections.namedtuple(
+        "ProviderEntry", ["module", "class_name", "doi_prefixes", "hosts"]
+    )
+):
+    """A content provider class that is imported on first use.
+
+    Attributes:
+        module: module of the class, relative to this package
+        class_name: name of the class in *module*
+        doi_prefixes: lower-case DOI prefixes the provider claims
+        hosts: lower-case host names the provider claims (subdomains match)
+    """
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return self.class_name
+
+    def load(self):
+        """Import and return the provider class."""
+        module = importlib.import_module(self.module, __package__)
+        return getattr(module, self.class_name)
+
+
+#: All content providers, in the order they are tried.
+PROVIDERS = (
+    # Wikidata first: Q-numbers won't match DOI providers
+    ProviderEntry(".Wikidata", "Wikidata", (), ("www.wikidata.org",)),
+    ProviderEntry(
+        ".Dryad", "Dryad", ("10.5061/dryad", "10.5061/dryad."), ("datadryad.org",)
+    ),
+    # Before Figshare: 4TU uses Djehuty with Figshare-compatible API
+    ProviderEntry(".FourTU", "FourTU", ("10.4121/",), ("data.4tu.nl",)),
+    ProviderEntry(
+        ".Figshare",
+        "Figshare",
+        ("10.6084/m9.figshare", "10.6084/m9.figshare."),
+        ("figshare.com",),
+    ),
+    ProviderEntry(
+        ".Zenodo", "Zenodo", ("10.5281/zenodo", "10.5281/zenodo."), ("zenodo.org",)
+    ),
+    # After Zenodo: catches other InvenioRDM instances
+    ProviderEntry(
+        ".InvenioRDM",
+        "InvenioRDM",
+        (
+            "10.18131",
+            "10.22002",
+            "10.23728/b2share",
+            "10.24435",
+            "10.3217",
+            "10.48436",
+            "10.57754",
+            "10.58153",
+            "10.60493",
+            "10.60534",
+            "10.60566",
+            "10.71775",
+        ),
+        (),
+    ),
+    ProviderEntry(".Pangaea", "Pangaea", ("10.1594/pangaea", "10.1594/pangaea."), ()),
+    ProviderEntry(".OSF", "OSF", ("10.17605/osf.io", "10.17605/osf.io/"), ("osf.io",)),
+    ProviderEntry(
+        ".Dataverse",
+        "Dataverse",
+        (
+            "10.11588/data",
+            "10.17617/",
+            "10.18710/",
+            "10.34894/",
+            "10.5064/",
+            "10.71830/",
+            "10.7910/dvn",
+        ),
+        (),
+    ),
+    ProviderEntry(
+        ".GFZ", "GFZ", ("10.5880/gfz", "10.5880/gfz."), ("dataservices.gfz-potsdam.de",)
+    ),
+    ProviderEntry(".RADAR", "RADAR", ("10.35097/",), ("www.radar-service.eu",)),
+    ProviderEntry(
+        ".ArcticDataCenter", "ArcticDataCenter", ("10.18739/",), ("arcticdata.io",)
+    ),
+    # After Arctic Data Center: generic DataONE CN covers KNB, PISCO, etc.
+    ProviderEntry(
+        ".DataOne",
+        "DataOne",
+        ("10.5063/", "10.6085/"),
+        ("cn.dataone.org", "dataone.org", "search.dataone.org"),
+    ),
+    # Before Pensoft: both may match 10.3897/ but GBIF excludes it
+    ProviderEntry(
+        ".GBIF",
+        "GBIF",
+        (
+            "10.15468/",
+            "10.15470/",
+            "10.15472/",
+            "10.25607/",
+            "10.71819/",
+            "10.82144/",
+        ),
+        ("www.gbif.org",),
+    ),
+    ProviderEntry(".journals", "Pensoft", ("10.3897/",), ()),
+    # BGR before Opara because both accept UUIDs
+    ProviderEntry(".BGR", "BGR", ("10.25928/",), ("geoportal.bgr.de",)),
+    # BAW after BGR: similar CSW-based provider
+    ProviderEntry(".BAW", "BAW", ("10.48437/",), ("datenrepository.baw.de",)),
+    # MDI-DE after BAW: similar CSW-based, no DOIs
+    ProviderEntry(".MDIDE", "MDIDE", (), ("nokis.mdi-de-dienste.org",)),
+    # GDI-DE after MDI-DE: similar CSW-based, no DOIs
+    ProviderEntry(".GDIDE", "GDIDE", (), ("gdk.gdi-de.org", "www.geoportal.de")),
+    ProviderEntry(
+        ".Opara",
+        "Opara",
+        ("10.25532/opara", "10.25532/opara-"),
+        ("opara.zih.tu-dresden.de",),
+    ),
+    ProviderEntry(
+        ".Senckenberg",
+        "Senckenberg",
+        ("10.12761/sgn", "10.12761/sgn."),
+        ("dataportal.senckenberg.de",),
+    ),
+    # Generic CKAN catch-all (after specific CKAN providers)
+    ProviderEntry(".CKAN", "CKAN", (), ()),
+    ProviderEntry(
+        ".MendeleyData", "MendeleyData", ("10.17632/",), ("data.mendeley.com",)
+    ),
+    ProviderEntry(".DEIMSSDR", "DEIMSSDR", (), ("deims.org",)),
+    # After DEIMS-SDR: URL-based, no DOIs, no collision risk
+    ProviderEntry(
+        ".NFDI4Earth",
+        "NFDI4Earth",
+        (),
+        ("cordra.knowledgehub.nfdi4earth.de", "onestop4all.nfdi4earth.de"),
+    ),
+    ProviderEntry(".HALODB", "HALODB", (), ("halo-db.pa.op.dlr.de",)),
+    ProviderEntry(".SEANOE", "SEANOE", ("10.17882/",), ("www.seanoe.org",)),
+    # After SEANOE: no DOI prefix, validates via URL
+    ProviderEntry(
+        ".GeoScienceWorld", "GeoScienceWorld", (), ("pubs.geoscienceworld.org",)
+    ),
+    # journals umbrella: HTML-sniffing journal-platform providers, after
+    # all DOI-prefix-shortcut providers so a publisher that owns a DOI
+    # prefix wins first. OJS goes before Janeway: its generator meta-tag
+    # fingerprint is unambiguous; Janeway's fingerprint is broader.
+    ProviderEntry(".journals", "OJS", (), ()),
+    ProviderEntry(".journals", "Janeway", (), ()),
+    ProviderEntry(".UKCEH", "UKCEH", ("10.5285/",), ("catalogue.ceh.ac.uk",)),
+    # Late: broad /collections/ URL pattern could false-match
+    ProviderEntry(".STAC", "STAC", (), ()),
+    # Very late: github.com URLs are unambiguous, no DOI collision
+    ProviderEntry(".GitHub", "GitHub", (), ("github.com",)),
+    # After GitHub: broad hostname matching, API probe fallback
+    ProviderEntry(".GitLab", "GitLab", (), ("gitlab.com",)),
+    # After GitLab: Gitea/Forgejo instances, API probe fallback
+    ProviderEntry(".Forgejo", "Forgejo", (), ("codeberg.org",)),
+    # Late: SWHIDs and archive.softwareheritage.org URLs
+    ProviderEntry(
+        ".SoftwareHeritage",
+        "SoftwareHeritage",
+        (),
+        ("archive.softwareheritage.org",),
+    ),
+    # Last: catch-all for direct .tif/.tiff URLs
+    ProviderEntry(".RemoteRaster", "RemoteRaster", (), ()),
+)
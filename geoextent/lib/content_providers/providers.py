@@ -1,77 +1,622 @@
 from requests import Session, HTTPError
-from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError, InvalidSchema
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from urllib3.util.retry import Retry
 from geoextent.lib import helpfunctions as hf
+from geoextent.lib.download_store import get_active_download_store, parse_checksum
+from geoextent.lib.http_cache import CachingHTTPAdapter, get_active_http_cache
+from geoextent.lib.exceptions import DownloadSizeExceeded
+import contextlib
+import json
 import logging
-import math
+import re
+import threading
 
 logger = logging.getLogger("geoextent")
 import time
 import os
-from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
+from urllib.parse import urlparse
 
+#: Connections kept per host by provider sessions; parallel downloads are
+#: capped at this so no worker waits for (or discards) a pooled connection.
+HTTP_POOL_MAXSIZE = 20
 
-def find_provider(reference, content_providers):
-    """Two-phase provider selection: fast DOI prefix match, then full validation.
 
-    Phase 1 checks each provider's ``doi_prefixes`` class attribute against the
-    reference string.  This is a pure string comparison — no network calls —
-    so it is instant even when the target service is unreachable.
+def _default_retry():
+    return Retry(
+        total=3,
+        # 429 is left to the RateLimiter (see ContentProvider._request)
+        status_forcelist=[500, 502, 503, 504],
+        backoff_factor=0.5,
+        raise_on_status=False,
+    )
 
-    Phase 2 falls back to calling ``validate_provider()`` on every provider,
-    which may trigger DOI resolution via doi.org.  Exceptions (e.g. from an
-    unreachable host) are caught and logged so that the next provider is tried.
 
-    Returns:
-        A provider instance whose ``validate_provider()`` returned True, or None.
+class _PooledAdapter(CachingHTTPAdapter):
+    """Caching adapter for one host that applies the registry's default timeout."""
+
+    def __init__(self, timeout=None, **kwargs):
+        self.default_timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, timeout=None, verify=True, **kwargs):
+        if timeout is None:
+            timeout = self.default_timeout
+        return super().send(
+            request, stream=stream, timeout=timeout, verify=verify, **kwargs
+        )
+
+
+class ProviderSession(Session):
+    """Session whose HTTP(S) requests go through the registry's shared pools.
+
+    Headers, cookies and authentication stay with the session, so providers
+    can set their own ``User-Agent`` or ``Authorization`` header; only the
+    connections are shared. Adapters mounted explicitly take precedence.
     """
-    # Phase 1 — fast offline DOI prefix matching
-    for provider_class in content_providers:
-        prefixes = getattr(provider_class, "doi_prefixes", ())
-        if prefixes and any(p in reference for p in prefixes):
-            provider = provider_class()
-            try:
-                if provider.validate_provider(reference):
-                    logger.debug(
-                        "Provider %s matched %s via DOI prefix (fast path)",
-                        provider_class.__name__,
-                        reference,
+
+    def __init__(self, registry):
+        super().__init__()
+        self.registry = registry
+        # Drop the per-session default adapters, the registry provides them
+        self.adapters.clear()
+
+    def get_adapter(self, url):
+        for prefix, adapter in self.adapters.items():
+            if url.lower().startswith(prefix.lower()):
+                return adapter
+        if not url.lower().startswith(("http://", "https://")):
+            raise InvalidSchema(
+                "No connection adapters were found for {!r}".format(url)
+            )
+        return self.registry.adapter(url)
+
+
+class SessionRegistry:
+    """Process-wide, thread-safe HTTP connection pools keyed by host.
+
+    Every provider session sends its requests through one adapter per
+    ``(scheme, host, port)``, so keep-alive connections (and their TLS
+    handshakes) are reused across provider instances, provider probes during
+    :func:`find_provider` and parallel download workers.
+
+    Args:
+        pool_maxsize: connections kept per host
+        max_retries: ``urllib3`` :class:`Retry` (or number of retries) for
+            every request; by default 3 retries with backoff on 429 and 5xx
+        timeout: default timeout in seconds for requests that do not set
+            one; ``None`` waits indefinitely
+    """
+
+    def __init__(self, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=None, timeout=None):
+        self._lock = threading.Lock()
+        self._adapters = {}
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = _default_retry() if max_retries is None else max_retries
+        self.timeout = timeout
+
+    def configure(self, pool_maxsize=None, max_retries=None, timeout=None):
+        """Change the settings and close the current pools.
+
+        Arguments left at ``None`` keep their value; existing sessions pick
+        up the new settings with their next request.
+        """
+        with self._lock:
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if max_retries is not None:
+                self.max_retries = max_retries
+            if timeout is not None:
+                self.timeout = timeout
+            adapters, self._adapters = self._adapters, {}
+        for adapter in adapters.values():
+            adapter.close()
+
+    def adapter(self, url):
+        """Return the shared adapter for the host of *url*."""
+        parsed = urlparse(url)
+        key = (parsed.scheme.lower(), parsed.hostname or "", parsed.port)
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            with self._lock:
+                adapter = self._adapters.get(key)
+                if adapter is None:
+                    adapter = _PooledAdapter(
+                        timeout=self.timeout,
+                        pool_connections=1,
+                        pool_maxsize=self.pool_maxsize,
+                        max_retries=self.max_retries,
                     )
-                    return provider
-            except Exception:
-                logger.debug(
-                    "Provider %s DOI prefix matched but validate_provider "
-                    "raised an exception, continuing",
-                    provider_class.__name__,
-                )
-            # Prefix matched this provider; no other provider should share it.
-            break
+                    self._adapters[key] = adapter
+        return adapter
 
-    # Phase 2 — full validation (may involve network calls)
-    for provider_class in content_providers:
-        provider = provider_class()
-        try:
-            if provider.validate_provider(reference):
-                logger.debug(
-                    "Provider %s matched %s (full validation)",
-                    provider_class.__name__,
-                    reference,
-                )
-                return provider
+    def hosts(self):
+        """Return the ``(scheme, host, port)`` keys of the open pools."""
+        with self._lock:
+            return list(self._adapters)
+
+    def session(self):
+        """Return a new :class:`ProviderSession` drawing from the shared pools."""
+        return ProviderSession(self)
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            adapters, self._adapters = self._adapters, {}
+        for adapter in adapters.values():
+            adapter.close()
+
+
+_session_registry = SessionRegistry()
+
+
+def get_session_registry():
+    """Return the process-wide :class:`SessionRegistry`."""
+    return _session_registry
+
+
+def create_session():
+    """Create a provider session with connection pooling, retries and HTTP caching.
+
+    The session is cheap: its connections come from the process-wide
+    :class:`SessionRegistry`. Metadata requests made through the session are
+    served from and stored in the active :mod:`geoextent.lib.http_cache`
+    cache, if any.
+    """
+    return _session_registry.session()
+
+
+#: Seconds a host is paused after a 429 without rate-limit headers.
+RATE_LIMIT_FALLBACK_WAIT = 60
+
+#: Requests a host may receive back to back before its rate applies, unless a
+#: burst is configured or the server reports its remaining quota.
+RATE_LIMIT_FALLBACK_BURST = 10
+
+# Remaining / reset headers, Zenodo (x-ratelimit-*) and Dryad (ratelimit-*)
+_RATE_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining", "x-ratelimit-reset"),
+    ("ratelimit-remaining", "ratelimit-reset"),
+)
+
+
+def _header_number(response, name):
+    try:
+        return float(response.headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_window(response):
+    """Return ``(remaining, seconds until reset)`` from the rate-limit headers.
+
+    The reset is an epoch timestamp (Zenodo) or a number of seconds (the
+    IETF ``RateLimit`` draft); ``None`` if the headers are missing.
+    """
+    for remaining_header, reset_header in _RATE_LIMIT_HEADERS:
+        remaining = _header_number(response, remaining_header)
+        reset = _header_number(response, reset_header)
+        if remaining is not None and reset is not None:
+            if reset > 10**9:
+                reset -= time.time()
+            return remaining, max(reset, 0.0)
+    return None
+
+
+def _retry_after(response):
+    """Return the seconds of a ``Retry-After`` header, or ``None``."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Request budget of one host, refilled at ``rate`` requests per second.
+
+    Callers :meth:`reserve` a token and sleep for the returned delay outside
+    the lock, so concurrent threads are spaced out instead of bursting
+    together. A ``rate`` of ``None`` does not limit requests, but the bucket
+    still honours pauses requested by the server (:meth:`pause`). The
+    ``burst`` defaults to :data:`RATE_LIMIT_FALLBACK_BURST`.
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self._lock = threading.Lock()
+        self.rate = rate
+        # Configured rate; the server's quota can only lower it
+        self.max_rate = rate
+        self.burst = (
+            burst
+            if burst is not None
+            else max(float(RATE_LIMIT_FALLBACK_BURST), rate or 1.0)
+        )
+        self._fixed_burst = burst is not None
+        self.tokens = self.burst
+        # Time the tokens were last refilled; in the future while paused
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        if now > self._updated:
+            if self.rate:
+                elapsed = now - self._updated
+                self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self):
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(self._updated - now, 0.0)
+            if self.rate:
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait += -self.tokens / self.rate
+            return wait
+
+    def refund(self):
+        """Return a reserved token that was not used (e.g. a cache hit)."""
+        with self._lock:
+            if self.rate:
+                self.tokens = min(self.burst, self.tokens + 1)
+
+    def pause(self, seconds):
+        """Hold back all requests for *seconds*, then let one through.
+
+        The first response after the pause reports the new quota.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._updated = max(self._updated, now + seconds)
+            self.tokens = min(1.0, self.burst)
+
+    def observe(self, remaining, reset):
+        """Follow the server's quota: *remaining* requests in the next *reset* s.
+
+        The remaining requests can be used right away; tokens spent by
+        requests whose responses are still outstanding are refilled at the
+        rate that spreads the quota over the window, or at the configured
+        rate if that is lower. An exhausted quota pauses the host until the
+        window resets.
+        """
+        if remaining < 1:
+            self.pause(reset)
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            rate = remaining / max(reset, 1.0)
+            self.rate = rate if self.max_rate is None else min(self.max_rate, rate)
+            if not self._fixed_burst:
+                self.burst = remaining
+            self.tokens = min(self.burst, remaining)
+
+
+class RateLimiter:
+    """Process-wide, thread-safe token buckets keyed by host.
+
+    A bucket starts at the configured rate of its host (see
+    :meth:`configure`) or the default rate of the provider that first
+    requests it, and slows down further when the ``x-ratelimit-*`` /
+    ``ratelimit-*`` headers of the responses report a smaller quota. All
+    provider instances and download workers therefore share one view of
+    each host's remaining quota.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._rates = {}
+
+    def configure(self, host, rate, burst=None):
+        """Set the rate (requests per second) and burst size for *host*."""
+        host = host.lower()
+        with self._lock:
+            self._rates[host] = (rate, burst)
+            self._buckets[host] = TokenBucket(rate, burst)
+
+    def bucket(self, url, default_rate=None):
+        """Return the bucket of the host of *url*."""
+        host = (urlparse(url).hostname or "").lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate, burst = self._rates.get(host, (default_rate, None))
+                    bucket = self._buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+    def wait(self, url, default_rate=None):
+        """Block until a request to *url* fits into its host's budget."""
+        delay = self.bucket(url, default_rate).reserve()
+        if delay > 0:
+            logger.info("Rate limited, sleeping %.1f s...", delay)
+            time.sleep(delay)
+
+    def update(self, url, response, default_rate=None):
+        """Feed the rate-limit headers and 429 status of *response* back."""
+        bucket = self.bucket(url, default_rate)
+        window = _rate_limit_window(response)
+        if window is not None:
+            bucket.observe(*window)
+        if response.status_code == 429:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                bucket.pause(retry_after)
+            elif window is None:
+                bucket.pause(RATE_LIMIT_FALLBACK_WAIT)
+
+    def reset(self):
+        """Forget all buckets (configured rates are kept)."""
+        with self._lock:
+            self._buckets = {}
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter():
+    """Return the process-wide :class:`RateLimiter`."""
+    return _rate_limiter
+
+
+#: Suffix of files that are still being downloaded.
+PARTIAL_SUFFIX = ".part"
+
+#: Attempts per file download; interrupted transfers resume where they stopped.
+DOWNLOAD_ATTEMPTS = 3
+
+# Guards the per-resource download size budgets of parallel downloads
+_download_size_lock = Lock()
+
+_DOI_START_RE = re.compile(r"10\.\d+/", re.IGNORECASE)
+
+# Trie node key holding the providers registered at that node
+_LEAF = "\0"
+
+
+def _provider_class(provider):
+    """Return the class of a provider class or manifest entry (importing it)."""
+    load = getattr(provider, "load", None)
+    return load() if load is not None else provider
+
+
+class ProviderIndex:
+    """Offline index of the DOI prefixes and host names providers claim.
+
+    Built from the :mod:`~geoextent.lib.content_providers.manifest` entries,
+    without importing the providers, or from provider classes (see
+    :meth:`claims`). DOI prefixes live in a character trie, host names in a
+    trie over their reversed labels so subdomains
+    (``springernature.figshare.com``) match their parent. Candidates are
+    returned as classes; a manifest entry's class is imported when it
+    becomes a candidate.
+    """
+
+    def __init__(self, content_providers):
+        self._order = {provider: i for i, provider in enumerate(content_providers)}
+        self._doi_trie = {}
+        self._host_trie = {}
+        for provider in content_providers:
+            if hasattr(provider, "load"):
+                doi_prefixes, hosts = provider.doi_prefixes, provider.hosts
             else:
-                logger.debug(
-                    "Provider %s did not match %s",
-                    provider_class.__name__,
-                    reference,
-                )
+                doi_prefixes, hosts = self.claims(provider)
+            for prefix in doi_prefixes:
+                self._insert(self._doi_trie, prefix, provider)
+            for host in hosts:
+                self._insert(self._host_trie, reversed(host.split(".")), provider)
+
+    @staticmethod
+    def claims(provider_class):
+        """Return the ``(doi_prefixes, hosts)`` a provider class claims.
+
+        Taken from the class's ``doi_prefixes`` and the identifier templates
+        in ``provider_info()["supported_identifiers"]``: DOI templates such
+        as ``10.5281/zenodo.{record_id}`` contribute their literal prefix,
+        URL templates such as ``https://zenodo.org/records/{record_id}``
+        their host name (``doi.org`` and templated hosts are skipped). Both
+        are lower-case, sorted tuples.
+        """
+        doi_prefixes = set()
+        hosts = set()
+
+        def add_doi_prefix(prefix):
+            prefix = prefix.strip().lower()
+            if prefix.startswith("10."):
+                doi_prefixes.add(prefix)
+
+        for prefix in getattr(provider_class, "doi_prefixes", ()) or ():
+            add_doi_prefix(prefix)
+        info = None
+        try:
+            info = provider_class.provider_info()
         except Exception:
+            logger.debug("provider_info() failed for %s", provider_class.__name__)
+        for template in (info or {}).get("supported_identifiers", ()):
+            literal = template.split("{", 1)[0].split("<", 1)[0]
+            doi_match = _DOI_START_RE.search(literal)
+            if doi_match:
+                add_doi_prefix(literal[doi_match.start() :])
+                continue
+            if "{" in template.split("//", 1)[-1].split("/", 1)[0]:
+                continue  # templated host, e.g. https://{ckan-host}/dataset/...
+            host = urlparse(template).hostname
+            if host and host not in ("doi.org", "dx.doi.org"):
+                hosts.add(host.lower())
+        return tuple(sorted(doi_prefixes)), tuple(sorted(hosts))
+
+    @staticmethod
+    def _insert(trie, keys, provider):
+        node = trie
+        for key in keys:
+            node = node.setdefault(key, {})
+        providers = node.setdefault(_LEAF, [])
+        if provider not in providers:
+            providers.append(provider)
+
+    def _sorted(self, providers):
+        return [
+            _provider_class(provider)
+            for provider in sorted(providers, key=self._order.__getitem__)
+        ]
+
+    def doi_candidates(self, reference):
+        """Provider classes whose DOI prefix occurs in *reference*, in priority order."""
+        match = _DOI_START_RE.search(reference)
+        if not match:
+            return []
+        found = []
+        node = self._doi_trie
+        for char in reference[match.start() :].lower():
+            node = node.get(char)
+            if node is None:
+                break
+            found.extend(node.get(_LEAF, ()))
+        return self._sorted(set(found))
+
+    def host_candidates(self, reference):
+        """Provider classes claiming the host name of URL *reference*, in priority order."""
+        if not hf.https_regexp.match(reference):
+            return []
+        try:
+            host = urlparse(reference).hostname
+        except ValueError:
+            return []
+        if not host:
+            return []
+        found = []
+        node = self._host_trie
+        for label in reversed(host.lower().split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found.extend(node.get(_LEAF, ()))
+        return self._sorted(set(found))
+
+
+_index_lock = Lock()
+_provider_indexes = {}
+
+
+def get_provider_index(content_providers):
+    """Return the (cached) :class:`ProviderIndex` for *content_providers*.
+
+    *content_providers* are provider classes or manifest entries.
+    """
+    key = tuple(content_providers)
+    with _index_lock:
+        index = _provider_indexes.get(key)
+        if index is None:
+            index = _provider_indexes[key] = ProviderIndex(key)
+        return index
+
+
+_doi_memo = threading.local()
+
+
+@contextlib.contextmanager
+def shared_doi_resolution():
+    """Share DOI resolutions between all providers probed within the block.
+
+    ``find_provider`` wraps provider validation in this, so a DOI unknown to
+    the :class:`ProviderIndex` is resolved via doi.org once instead of once
+    per candidate provider. Nested blocks reuse the outer memo.
+    """
+    if getattr(_doi_memo, "resolved", None) is not None:
+        yield _doi_memo.resolved
+        return
+    _doi_memo.resolved = {}
+    try:
+        yield _doi_memo.resolved
+    finally:
+        _doi_memo.resolved = None
+
+
+def _validate(provider_class, reference, phase):
+    provider = provider_class()
+    try:
+        if provider.validate_provider(reference):
             logger.debug(
-                "Provider %s raised an exception during validation, skipping",
+                "Provider %s matched %s (%s)",
                 provider_class.__name__,
+                reference,
+                phase,
             )
-            continue
+            return provider
+        logger.debug(
+            "Provider %s did not match %s",
+            provider_class.__name__,
+            reference,
+        )
+    except Exception:
+        logger.debug(
+            "Provider %s raised an exception during validation (%s), skipping",
+            provider_class.__name__,
+            phase,
+        )
+    return None
+
+
+def find_provider(reference, content_providers):
+    """Two-phase provider selection: offline index lookup, then full validation.
+
+    *content_providers* are provider classes or manifest entries (see
+    :mod:`~geoextent.lib.content_providers.manifest`), in priority order.
+
+    Phase 1 looks the reference up in the offline :class:`ProviderIndex`: a
+    DOI prefix match tries the first matching provider, a host name match
+    tries the providers claiming that host. Only those candidates are
+    imported and instantiated, and for URL references no network call is
+    needed at all.
+
+    Phase 2 falls back to calling ``validate_provider()`` on every other
+    provider, which may trigger DOI resolution via doi.org. The resolution
+    is shared by all candidates (see :func:`shared_doi_resolution`) and, with
+    an active HTTP cache, persisted across runs. Exceptions (e.g. from an
+    unreachable host) are caught and logged so that the next provider is tried.
+
+    Returns:
+        A provider instance whose ``validate_provider()`` returned True, or None.
+    """
+    index = get_provider_index(content_providers)
+    tried = set()
+    with shared_doi_resolution():
+        # Phase 1 — offline DOI prefix / host name index
+        doi_candidates = index.doi_candidates(reference)
+        if doi_candidates:
+            # Prefix matched this provider; no other provider should share it.
+            candidates = doi_candidates[:1]
+            phase = "DOI prefix fast path"
+        else:
+            candidates = index.host_candidates(reference)
+            phase = "host name fast path"
+        for provider_class in candidates:
+            tried.add(provider_class)
+            provider = _validate(provider_class, reference, phase)
+            if provider is not None:
+                return provider
+
+        # Phase 2 — full validation (may involve network calls)
+        for provider_class in map(_provider_class, content_providers):
+            if provider_class in tried:
+                continue
+            provider = _validate(provider_class, reference, "full validation")
+            if provider is not None:
+                return provider
 
     return None
 
@@ -90,90 +635,237 @@ class ContentProvider:
     def __init__(self):
         self.log = logging.getLogger("geoextent")
 
+    def _emit_metadata_extent(
+        self, folder, name, geometry=None, tbox=None, properties=None
+    ):
+        """Hand an extent taken from repository metadata to the extraction.
+
+        ``_process_remote_download`` collects these extents in memory (in
+        ``self._metadata_extents``) and merges them with the extents of the
+        downloaded files, without writing, probing and reading a file; the
+        extent is reported under *folder* in the ``details`` as if the file
+        existed. When no collector is set (e.g. with ``keep_files``), the
+        extent is written to ``<folder>/<name>.geojson`` instead, with the
+        start and end of *tbox* as ``start_time`` and ``end_time`` properties.
+
+        Args:
+            folder: directory for the GeoJSON file
+            name: name of the extent (the GeoJSON file name without suffix)
+            geometry: GeoJSON geometry in WGS84 [longitude, latitude] order, or None
+            tbox: [start, end] date strings, either may be None, or None
+            properties: further GeoJSON feature properties (file only)
+
+        Returns:
+            Path of the GeoJSON file, or None if the extent was collected
+        """
+        os.makedirs(folder, exist_ok=True)
+        collector = getattr(self, "_metadata_extents", None)
+        if collector is not None:
+            collector.append(
+                {
+                    "name": name + ".geojson",
+                    "folder": folder,
+                    "geometry": geometry,
+                    "tbox": tbox,
+                }
+            )
+            return None
+
+        properties = dict(properties or {})
+        if tbox:
+            if tbox[0]:
+                properties["start_time"] = tbox[0]
+            if len(tbox) > 1 and tbox[1]:
+                properties["end_time"] = tbox[1]
+        geojson_data = {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "geometry": geometry, "properties": properties}
+            ],
+        }
+        filepath = os.path.join(folder, name + ".geojson")
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(geojson_data, f, indent=2, ensure_ascii=False)
+        logger.debug("Created GeoJSON metadata file: %s", filepath)
+        return filepath
+
 
 class DoiProvider(ContentProvider):
     # Known DOI prefixes for this provider.  Used for fast offline matching
     # during provider selection — avoids slow DOI resolution via doi.org when
     # the target service is unreachable.  Override in subclasses.
     doi_prefixes = ()
+    # Requests per second allowed when throttling, used for a host until its
+    # responses carry rate-limit headers.  ``None`` means no limit.
+    rate_limit = 1.0
 
     def __init__(self):
         super().__init__()  # Initialize parent class (includes logging)
-        self.session = self._create_optimized_session()
+        # Created on first use: find_provider instantiates candidate
+        # providers that mostly never make a request.
+        self._session = None
         # Default chunk size for downloads (1MB)
         self.download_chunk_size = 1024 * 1024
         # Initialize parallel download manager (will be configured per provider)
         self.parallel_manager = None
 
+    @property
+    def session(self):
+        if getattr(self, "_session", None) is None:
+            self._session = self._create_optimized_session()
+        return self._session
+
+    @session.setter
+    def session(self, value):
+        self._session = value
+
     def _create_optimized_session(self):
         """Create an optimized session with connection pooling and retry strategy"""
-        session = Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=0.5,
-            raise_on_status=False,
-        )
+        return create_session()
 
-        # Configure HTTP adapter with connection pooling
-        adapter = HTTPAdapter(
-            pool_connections=10,  # Number of connection pools
-            pool_maxsize=20,  # Maximum number of connections in pool
-            max_retries=retry_strategy,
-        )
+    def _open_download(self, url, headers=None, throttle=False):
+        """Return a streamed response for *url*.
+
+        Goes through :meth:`_request`, so 429 handling and provider rate
+        limits apply to downloads as well. Providers whose file URLs need
+        special handling (e.g. signed redirect URLs in the response body)
+        override this instead of the download loop.
+        """
+        return self._request(url, throttle=throttle, stream=True, headers=headers)
+
+    def _reserve_download_size(self, url, size):
+        """Account *size* more bytes of *url* against the download size limit.
 
-        # Mount adapter for both HTTP and HTTPS
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        Called with the advertised size of a download once its response
+        headers are in, before any of the body is read. Raises
+        :class:`~geoextent.lib.exceptions.DownloadSizeExceeded` if the
+        files of this resource would exceed ``_max_download_bytes``.
+        """
+        limit = getattr(self, "_max_download_bytes", None)
+        if limit is None or size <= 0:
+            return
+        with _download_size_lock:
+            total = getattr(self, "_download_bytes", 0) + size
+            if total > limit:
+                exc = DownloadSizeExceeded(
+                    total, limit, getattr(self, "name", type(self).__name__)
+                )
+                self._download_size_exceeded = exc
+                self.log.warning(
+                    f"Skipping {url}: {size:,} bytes would exceed the download "
+                    f"size limit ({limit:,} bytes)"
+                )
+                raise exc
+            self._download_bytes = total
 
-        return session
+    def _release_download_size(self, size):
+        """Return *size* bytes of a failed download to the size budget."""
+        if size > 0 and getattr(self, "_max_download_bytes", None) is not None:
+            with _download_size_lock:
+                self._download_bytes = getattr(self, "_download_bytes", 0) - size
 
     def _download_file_optimized(
-        self, url, filepath, chunk_size=None, show_progress=False
+        self,
+        url,
+        filepath,
+        chunk_size=None,
+        show_progress=False,
+        throttle=False,
+        progress_hook=None,
+        keep_partial=False,
     ):
         """
-        Optimized file download with proper buffering and streaming.
+        Download *url* to *filepath*: the shared download engine of all providers.
+
+        The file is streamed in ``chunk_size`` blocks (default 1 MB) into
+        ``<filepath>.part``, which is renamed once complete. A connection
+        dropped mid-transfer is resumed from the partial file with an HTTP
+        ``Range`` request (or restarted if the server ignores it), up to
+        ``DOWNLOAD_ATTEMPTS`` times. With a download size limit set, the
+        advertised ``Content-Length`` is checked before the transfer starts
+        (see :meth:`_reserve_download_size`).
 
         Args:
             url: URL to download from
             filepath: Local file path to save to
             chunk_size: Size of chunks to download (default: 1MB)
             show_progress: Whether to show download progress
+            throttle: Apply the provider's rate limiting to the request
+            progress_hook: Optional callable receiving the size of each written chunk
+            keep_partial: Keep ``<filepath>.part`` when the download fails, so a
+                later call resumes it (used by the download store)
+
+        Returns:
+            int: number of bytes in the downloaded file
         """
         if chunk_size is None:
             chunk_size = self.download_chunk_size
 
         self.log.debug(f"Downloading {url} to {filepath} with {chunk_size} byte chunks")
 
-        try:
-            # Use streaming to avoid loading entire file into memory
-            with self.session.get(url, stream=True) as response:
-                response.raise_for_status()
-
-                # Get file size if available
-                total_size = int(response.headers.get("content-length", 0))
-
-                with open(filepath, "wb") as f:
-                    downloaded = 0
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:  # Filter out keep-alive chunks
-                            f.write(chunk)
-                            downloaded += len(chunk)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        part_path = filepath + PARTIAL_SUFFIX
+        reserved = 0
 
-                            if show_progress and total_size > 0:
-                                progress = (downloaded / total_size) * 100
-                                self.log.debug(f"Download progress: {progress:.1f}%")
+        try:
+            for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+                offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                headers = {"Range": f"bytes={offset}-"} if offset else None
+                try:
+                    with self._open_download(url, headers, throttle) as response:
+                        if offset and response.status_code != 206:
+                            # Server ignored the range request: start over
+                            offset = 0
+                        total_size = offset + int(
+                            response.headers.get("content-length", 0)
+                        )
+                        if total_size > reserved:
+                            self._reserve_download_size(url, total_size - reserved)
+                            reserved = total_size
+                        downloaded = offset
+                        with open(part_path, "ab" if offset else "wb") as f:
+                            for chunk in response.iter_content(chunk_size=chunk_size):
+                                if chunk:  # Filter out keep-alive chunks
+                                    f.write(chunk)
+                                    downloaded += len(chunk)
+                                    if progress_hook:
+                                        progress_hook(len(chunk))
+
+                                    if show_progress and total_size > 0:
+                                        progress = (downloaded / total_size) * 100
+                                        self.log.debug(
+                                            f"Download progress: {progress:.1f}%"
+                                        )
+                    break
+                except HTTPError as e:
+                    if not offset or e.response.status_code != 416:
+                        raise
+                    # Range not satisfiable: the partial file is stale
+                    os.remove(part_path)
+                    if attempt == DOWNLOAD_ATTEMPTS:
+                        raise
+                except (RequestsConnectionError, ChunkedEncodingError) as e:
+                    if attempt == DOWNLOAD_ATTEMPTS:
+                        raise
+                    self.log.debug(
+                        f"Download of {url} interrupted ({e}), resuming "
+                        f"(attempt {attempt + 1}/{DOWNLOAD_ATTEMPTS})"
+                    )
 
-                self.log.debug(f"Download completed: {downloaded} bytes")
-                return downloaded
+            os.replace(part_path, filepath)
+            self.log.debug(f"Download completed: {downloaded} bytes")
+            return downloaded
 
         except Exception as e:
-            self.log.error(f"Failed to download {url}: {e}")
+            if not isinstance(e, DownloadSizeExceeded):
+                self.log.error(f"Failed to download {url}: {e}")
+            self._release_download_size(reserved)
             # Clean up partial file
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            for path in (filepath,) if keep_partial else (part_path, filepath):
+                if os.path.exists(path):
+                    os.remove(path)
             raise
 
     def _is_geospatial_file(self, filename, additional_extensions=None):
@@ -181,7 +873,8 @@ class DoiProvider(ContentProvider):
         Check if a file is likely to contain geospatial data based on its extension.
 
         Based on officially documented supported formats in README.md and CLI help,
-        plus commonly encountered geospatial extensions.
+        plus commonly encountered geospatial extensions
+        (``helpfunctions.GEOSPATIAL_EXTENSIONS``).
 
         Args:
             filename: Name of the file to check
@@ -190,51 +883,7 @@ class DoiProvider(ContentProvider):
         Returns:
             bool: True if file extension suggests geospatial content
         """
-        # Single comprehensive list of geospatial file extensions
-        geospatial_extensions = {
-            # Core officially supported formats (documented in README.md and CLI)
-            ".geojson",  # GeoJSON
-            ".csv",  # Tabular data (potential coordinates)
-            ".txt",  # Tab-delimited text (e.g. Darwin Core Archive occurrence files)
-            ".shp",
-            ".shx",
-            ".dbf",
-            ".prj",  # Shapefile components
-            ".tif",
-            ".tiff",
-            ".geotiff",  # GeoTIFF
-            ".gpkg",  # GeoPackage
-            ".gpx",  # GPS Exchange Format
-            ".gml",  # Geography Markup Language
-            ".kml",
-            ".kmz",  # Keyhole Markup Language
-            ".fgb",  # FlatGeobuf
-            # Additional commonly encountered geospatial extensions
-            ".json",  # JSON files that might be GeoJSON
-            ".nc",
-            ".netcdf",  # NetCDF (often used for atmospheric/ocean data)
-            ".asc",  # ASCII Grid (raster format)
-            ".zip",
-            ".tar",
-            ".gz",
-            ".rar",  # Archives that might contain geospatial data
-            ".sqlite",
-            ".db",  # Spatial databases (might be GeoPackage or SpatiaLite)
-            ".las",
-            ".laz",  # Point cloud (LAS/LAZ)
-        }
-
-        # Add any additional extensions provided by user
-        if additional_extensions:
-            geospatial_extensions = geospatial_extensions.union(
-                {
-                    ext.lower() if ext.startswith(".") else f".{ext.lower()}"
-                    for ext in additional_extensions
-                }
-            )
-
-        file_ext = Path(filename).suffix.lower()
-        return file_ext in geospatial_extensions
+        return hf.is_geospatial_filename(filename, additional_extensions)
 
     def _filter_geospatial_files(
         self,
@@ -318,8 +967,13 @@ class DoiProvider(ContentProvider):
         )
         return filtered_files
 
-    def _setup_parallel_manager(self, max_workers=4):
-        """Set up the parallel download manager with provider-specific settings."""
+    def _setup_parallel_manager(self, max_workers=4, throttle=False, checksums=None):
+        """Set up the parallel download manager with provider-specific settings.
+
+        *checksums* maps target paths to normalised repository checksums;
+        those files are fetched through the active download store, if any.
+        """
+        store = get_active_download_store() if checksums else None
 
         class ProviderParallelManager(ParallelDownloadManager):
             def __init__(self, provider, max_workers, chunk_size):
@@ -329,14 +983,52 @@ class DoiProvider(ContentProvider):
             def _download_single_file(self, task):
                 """Use the provider's optimized download method."""
                 url, filepath, expected_size = task
+                # Only pass throttle when set, keeping the plain
+                # (url, filepath, chunk_size) call for overrides
+                extra = {"throttle": True} if throttle else {}
+
+                checksum = checksums.get(filepath) if store is not None else None
+                if checksum:
+                    # Partial files in the store are resumed by later runs
+                    return store.fetch(
+                        checksum,
+                        filepath,
+                        lambda path: self.provider._download_file_optimized(
+                            url, path, self.chunk_size, keep_partial=True, **extra
+                        ),
+                    )
                 return self.provider._download_file_optimized(
-                    url, filepath, self.chunk_size
+                    url, filepath, self.chunk_size, **extra
                 )
 
+        pool_maxsize = _session_registry.pool_maxsize
+        if max_workers > pool_maxsize:
+            self.log.debug(
+                f"Limiting parallel downloads to {pool_maxsize} (connection pool size)"
+            )
+            max_workers = pool_maxsize
+
         self.parallel_manager = ProviderParallelManager(
             self, max_workers, self.download_chunk_size
         )
 
+    def _announce_downloads(self, filepaths):
+        """Tell the download listener which files are about to be downloaded.
+
+        The listener (an :class:`~geoextent.lib.download_pipeline.ExtractionPipeline`
+        set by ``_process_remote_download``) uses this to keep multi-file
+        formats such as shapefiles together.
+        """
+        listener = getattr(self, "_download_listener", None)
+        if listener is not None:
+            listener.expect(filepaths)
+
+    def _download_finished(self, filepath, success=True):
+        """Tell the download listener that *filepath* is complete."""
+        listener = getattr(self, "_download_listener", None)
+        if listener is not None:
+            listener.finished(filepath, success)
+
     def _should_use_parallel_downloads(self, file_list, max_workers):
         """
         Determine if parallel downloads would be beneficial.
@@ -362,6 +1054,27 @@ class DoiProvider(ContentProvider):
         # Use parallel if total > 10MB or average file > 1MB
         return total_size > 10 * 1024 * 1024 or avg_size > 1024 * 1024
 
+    @staticmethod
+    def _batch_target_path(target_folder, name, target_path=None):
+        """Return where a batch download of *name* is saved.
+
+        Without *target_path* the file goes directly into *target_folder*,
+        with path separators in *name* replaced. *target_path* keeps the
+        repository's directory layout; ``None`` is returned if it would
+        escape *target_folder*.
+        """
+        if not target_path:
+            # Sanitize filename to avoid directory traversal issues
+            safe_name = name.replace("/", "_").replace("\\", "_")
+            return os.path.join(target_folder, safe_name)
+        root = os.path.abspath(target_folder)
+        filepath = os.path.abspath(
+            os.path.join(root, target_path.replace("\\", "/").lstrip("/"))
+        )
+        if os.path.commonpath([root, filepath]) != root or filepath == root:
+            return None
+        return filepath
+
     def _download_files_batch(
         self,
         file_list,
@@ -369,16 +1082,23 @@ class DoiProvider(ContentProvider):
         show_progress=True,
         max_workers=4,
         progress_callback=None,
+        throttle=False,
     ):
         """
         Download multiple files with automatic parallel/sequential selection.
 
         Args:
-            file_list: List of file dictionaries with 'url', 'name', 'size'
+            file_list: List of file dictionaries with 'url', 'name', 'size' and
+                optionally 'target_path', a path relative to ``target_folder``
+                to save the file at (default: the sanitized name), and
+                'checksum', the repository's checksum of the file (see
+                :func:`~geoextent.lib.download_store.parse_checksum`), which
+                lets the active download store serve and verify the file
             target_folder: Target directory
             show_progress: Whether to show progress bars
             max_workers: Maximum number of parallel workers
             progress_callback: Optional ProgressCallback for structured progress events
+            throttle: Apply the provider's rate limiting to every download
 
         Returns:
             Download statistics and results
@@ -386,11 +1106,9 @@ class DoiProvider(ContentProvider):
         if not file_list:
             return []
 
-        # Set up parallel manager
-        self._setup_parallel_manager(max_workers)
-
         # Prepare download tasks
         download_tasks = []
+        checksums = {}
         for file_info in file_list:
             # Different providers have different URL structures
             url = (
@@ -402,21 +1120,70 @@ class DoiProvider(ContentProvider):
             size = file_info.get("size", 0)
 
             if url and name:
-                # Sanitize filename to avoid directory traversal issues
-                safe_name = name.replace("/", "_").replace("\\", "_")
-                filepath = os.path.join(target_folder, safe_name)
+                filepath = self._batch_target_path(
+                    target_folder, name, file_info.get("target_path")
+                )
+                if filepath is None:
+                    self.log.warning(f"Skipping file outside download folder: {name}")
+                    continue
                 download_tasks.append((url, filepath, size))
+                checksum = parse_checksum(file_info.get("checksum"))
+                if checksum:
+                    checksums[filepath] = checksum
 
         if not download_tasks:
             self.log.warning("No valid download tasks found")
             return []
 
+        # Set up parallel manager
+        self._setup_parallel_manager(max_workers, throttle, checksums)
+
+        # Remote-open mode: files whose extent can be read with range
+        # requests get a pointer file instead of a download
+        if getattr(self, "_remote_open", False):
+            from geoextent.lib import remote_open
+
+            remote_tasks = [
+                task
+                for task in download_tasks
+                if remote_open.is_remote_candidate(task[1], task[2])
+            ]
+            # If a remote open fails, the file is downloaded like the others:
+            # throttled, through the download store, and with no more
+            # concurrent transfers than the parallel manager allows
+            manager = self.parallel_manager
+            slots = threading.BoundedSemaphore(manager.max_workers)
+
+            def _fallback(task):
+                with slots:
+                    return manager._download_single_file(task)
+
+            for task in remote_tasks:
+                url, filepath, size = task
+                pointer = remote_open.write_pointer(
+                    filepath, url, size, download=lambda task=task: _fallback(task)
+                )
+                self._download_finished(pointer)
+            if remote_tasks:
+                self.log.info(
+                    f"Opening {len(remote_tasks)} file(s) remotely instead of downloading them"
+                )
+                download_tasks = [t for t in download_tasks if t not in remote_tasks]
+            if not download_tasks:
+                return []
+
+        # Files are handed to the extraction pipeline (if any) as they complete
+        self._announce_downloads([task[1] for task in download_tasks])
+
+        def _finished_cb(task, result):
+            self._download_finished(task[1], result["success"])
+
         # Decide parallel vs sequential
         use_parallel = self._should_use_parallel_downloads(file_list, max_workers)
 
         if use_parallel:
             self.log.info(
-                f"Using parallel downloads with {max_workers} workers for {len(download_tasks)} files"
+                f"Using parallel downloads with {self.parallel_manager.max_workers} workers for {len(download_tasks)} files"
             )
         else:
             self.log.info(f"Using sequential downloads for {len(download_tasks)} files")
@@ -432,6 +1199,7 @@ class DoiProvider(ContentProvider):
 
             def _internal_progress_cb(task, result):
                 nonlocal completed_count, bytes_so_far
+                _finished_cb(task, result)
                 if result["success"]:
                     bytes_so_far += result["bytes_downloaded"]
                 completed_count += 1
@@ -464,6 +1232,7 @@ class DoiProvider(ContentProvider):
 
             def _tqdm_progress_cb(task, result):
                 nonlocal completed_count
+                _finished_cb(task, result)
                 if result["success"]:
                     progress_bar.update(result["bytes_downloaded"])
                 completed_count += 1
@@ -478,7 +1247,14 @@ class DoiProvider(ContentProvider):
             )
             progress_bar.close()
         else:
-            results = self.parallel_manager.download_files_parallel(download_tasks)
+            results = self.parallel_manager.download_files_parallel(
+                download_tasks, _finished_cb
+            )
+
+        # With the soft limit, an oversized file stops the whole resource
+        exceeded = getattr(self, "_download_size_exceeded", None)
+        if exceeded is not None and getattr(self, "_download_size_soft_limit", False):
+            raise exceeded
 
         # Log results
         successful = sum(1 for r in results if r["success"])
@@ -495,97 +1271,80 @@ class DoiProvider(ContentProvider):
         return results
 
     def _request(self, url, throttle=False, **kwargs):
+        """GET *url* through the provider session.
+
+        With *throttle*, the request waits for the host's budget in the
+        shared :class:`RateLimiter`; 429 responses pause the host for every
+        thread and are retried once the budget allows.
+        """
+        rate_limited = False
         while True:
-            try:
-                response = self.session.get(url, **kwargs)
+            if throttle or rate_limited:
+                _rate_limiter.wait(url, self.rate_limit)
+            response = self.session.get(url, **kwargs)
+            if getattr(response, "from_cache", False):
+                logger.debug("Served %s from HTTP cache", url)
+                # No request reached the server, nothing to throttle
+                if throttle or rate_limited:
+                    _rate_limiter.bucket(url, self.rate_limit).refund()
                 response.raise_for_status()
-                break  # break while loop
-            except HTTPError as e:
-                # http error
-                # dryad     dict_keys(['undefined', '404', '502', '503'])
-                # figshare  dict_keys(['404', '422'])
-                # zenodo    dict_keys(['410', '502', '404', '504'])
-                # https://developer.mozilla.org/en-US/docs/Web/HTTP/Reference/Status
-
-                if e.response.status_code == 429:
-                    self._throttle(e.response)
-                else:
-                    logger.debug("HTTP %s for %s", e.response.status_code, url)
-                    raise
+                return response
+            _rate_limiter.update(url, response, self.rate_limit)
+            if response.status_code != 429:
+                break
+            rate_limited = True
+            response.close()
 
-        if throttle:
-            self._throttle(response)
+        try:
+            response.raise_for_status()
+        except HTTPError as e:
+            logger.debug("HTTP %s for %s", e.response.status_code, url)
+            raise
 
         return response
 
-    def _throttle(self, response):
-        values = [
-            (response.headers.get("x-ratelimit-remaining")),  # Zenodo
-            (response.headers.get("x-ratelimit-reset")),  # Zenodo
-            (response.headers.get("ratelimit-remaining")),  # Dryad
-            (response.headers.get("ratelimit-reset")),  # Dryad
-        ]
-        http_error = response.status_code
-
-        wait_seconds = 1
-
-        match values:
-            case [None, None, None, None]:
-                if http_error == 429:
-                    wait_seconds = 60
-                else:
-                    wait_seconds = 1
-
-            case [_, _, None, None]:
-                remaining = int(values[0])
-                reset = int(values[1])
-
-                if remaining < 2 or http_error == 429:
-                    wait_seconds = math.ceil(reset - time.time())
-
-            case [None, None, _, _]:
-                remaining = int(values[2])
-                reset = int(values[3])
-
-                if remaining < 2 or http_error == 429:
-                    wait_seconds = math.ceil(reset - time.time())
-
-            case _:
-                if http_error == 429:
-                    wait_seconds = 60
-                else:
-                    wait_seconds = 1
-
-        logger.info("Rate limited, sleeping %d s...", wait_seconds)
-        time.sleep(wait_seconds)
-
-        return
-
     def _type_of_reference(self):
         if hf.doi_regexp.match(self.reference):
             return "DOI"
         elif hf.https_regexp.match(self.reference):
             return "Link"
 
-    @property
-    def get_url(self):
-
-        if self._type_of_reference() == "DOI":
-            doi = hf.doi_regexp.match(self.reference).group(2)
+    def _resolve_doi(self, doi):
+        """Resolve *doi* to its landing page URL via doi.org.
 
+        Looks in the find_provider memo and the persistent HTTP cache first.
+        Returns the raw DOI when resolution fails.
+        """
+        memo = getattr(_doi_memo, "resolved", None)
+        if memo is not None and doi in memo:
+            return memo[doi]
+        cache = get_active_http_cache()
+        url = cache.get_doi_url(doi) if cache is not None else None
+        if url is None:
+            url = doi
             try:
                 resp = self._request("https://doi.org/{}".format(doi))
                 resp.raise_for_status()
+                url = resp.url
+                if cache is not None:
+                    cache.put_doi_url(doi, url)
             except HTTPError:
-                return doi
+                pass
             except Exception:
                 # Network errors (ConnectionError, Timeout, etc.) during DOI
                 # resolution — return the raw DOI so callers can still attempt
                 # offline matching (prefix, hostname) without crashing.
                 logger.debug("DOI resolution failed for %s, returning raw DOI", doi)
-                return doi
+        if memo is not None:
+            memo[doi] = url
+        return url
+
+    @property
+    def get_url(self):
 
-            return resp.url
+        if self._type_of_reference() == "DOI":
+            doi = hf.doi_regexp.match(self.reference).group(2)
+            return self._resolve_doi(doi)
 
         else:
             return self.reference
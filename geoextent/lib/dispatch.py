@@ -0,0 +1,305 @@
+"""Handler dispatch for :func:`geoextent.lib.extent.from_file`.
+
+Before this module existed ``from_file`` probed every handler in
+``handle_modules`` order, and each probe (plus every later extraction call)
+opened the file again with ``gdal.OpenEx``. Dispatch now works in two steps:
+
+1. An extension / magic-byte index prunes handlers that are certain to
+   reject the file (e.g. the CSV and text handlers for a binary TIFF, the
+   point cloud handler for anything that is not ``.las``/``.laz``). The
+   remaining candidates keep their ``handle_modules`` priority, so the
+   selected handler is the same one the full probe loop would pick.
+2. A :class:`DatasetHandle` opens the file with GDAL at most once. The
+   raster and vector handlers borrow that handle for
+   ``check_file_supported``, ``get_bounding_box``, ``get_temporal_extent``
+   and ``get_convex_hull`` instead of reopening the file. Handlers that read
+   the file themselves (CSV) keep the result of their pass over the file
+   on the handle with :meth:`DatasetHandle.shared`.
+
+Handler modules are imported when they are first probed (see
+:class:`HandlerRegistry`), so pruned handlers and their dependencies are
+never loaded.
+"""
+
+import collections.abc
+import contextlib
+import importlib
+import logging
+import os
+import threading
+
+logger = logging.getLogger("geoextent")
+
+# Number of leading bytes read for magic-byte sniffing. Large enough for the
+# SQLite header string and the NUL-byte binary heuristic.
+_SNIFF_SIZE = 1024
+
+#: Magic-byte signatures → format label. Checked in order; first match wins.
+_MAGIC_SIGNATURES = (
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+    (b"II+\x00", "tiff"),  # BigTIFF
+    (b"MM\x00+", "tiff"),  # BigTIFF
+    (b"\x89HDF\r\n\x1a\n", "hdf5"),  # also NetCDF-4
+    (b"CDF\x01", "netcdf"),
+    (b"CDF\x02", "netcdf"),
+    (b"SQLite format 3\x00", "sqlite"),  # GeoPackage, SpatiaLite, MBTiles
+    (b"LASF", "las"),
+    (b"fgb\x03", "flatgeobuf"),
+    (b"\x00\x00\x00\x0cjP  \r\n\x87\n", "jpeg2000"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"%PDF", "pdf"),
+    (b"PK\x03\x04", "zip"),  # KMZ, zipped shapefiles
+    (b"\x1f\x8b", "gzip"),
+)
+
+#: Handlers that can plausibly claim a file with the given magic-byte format.
+#: Handlers missing from an entry are skipped without being probed.
+_MAGIC_INDEX = {
+    "tiff": frozenset({"raster"}),
+    "hdf5": frozenset({"raster", "vector"}),
+    "netcdf": frozenset({"raster", "vector"}),
+    "sqlite": frozenset({"raster", "vector"}),
+    "las": frozenset({"pointcloud"}),
+    "flatgeobuf": frozenset({"vector"}),
+    "jpeg2000": frozenset({"raster"}),
+    "png": frozenset({"raster"}),
+    "jpeg": frozenset({"raster"}),
+    "pdf": frozenset({"raster", "vector"}),  # GeoPDF
+    "zip": frozenset({"raster", "vector"}),
+    "gzip": frozenset({"raster", "vector"}),
+}
+
+#: Extensions the point cloud handler accepts (mirrors handle_pointcloud).
+_POINTCLOUD_EXTENSIONS = frozenset({".las", ".laz"})
+
+#: Extensions handle_csv rejects up front (mirrors handle_csv.check_file_supported).
+_CSV_REJECT_EXTENSIONS = frozenset(
+    {
+        ".kml",
+        ".gml",
+        ".gpx",
+        ".shp",
+        ".gpkg",
+        ".geojson",
+        ".json",
+        ".tif",
+        ".tiff",
+        ".asc",
+        ".jp2",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".las",
+        ".laz",
+    }
+)
+
+
+def sniff_format(filepath):
+    """Identify a file by its leading bytes.
+
+    Returns a format label from ``_MAGIC_SIGNATURES``, ``"binary"`` for
+    unrecognised content containing NUL bytes, or ``None`` for text-like
+    content, directories and unreadable files. Only labels listed in
+    ``_MAGIC_INDEX`` prune handlers; ``"binary"`` is informational.
+    """
+    if not os.path.isfile(filepath):
+        return None
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(_SNIFF_SIZE)
+    except OSError as e:
+        logger.debug("Could not sniff {}: {}".format(filepath, e))
+        return None
+
+    for signature, label in _MAGIC_SIGNATURES:
+        if head.startswith(signature):
+            return label
+    # UTF-16 text carries NUL bytes by design
+    if head[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return None
+    if b"\x00" in head:
+        return "binary"
+    return None
+
+
+class HandlerRegistry(collections.abc.Mapping):
+    """Handler name → handler module, importing each module on first access.
+
+    Args:
+        modules: dict of handler name → module name, in probe order
+        package: package for relative module names
+    """
+
+    def __init__(self, modules, package=None):
+        self._names = dict(modules)
+        self._package = package
+
+    def __getitem__(self, name):
+        return importlib.import_module(self._names[name], self._package)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+def _candidate_names(filepath, handle_modules):
+    extension = os.path.splitext(filepath)[1].lower()
+    magic = sniff_format(filepath)
+    plausible = _MAGIC_INDEX.get(magic) if magic is not None else None
+
+    candidates = []
+    for name in handle_modules:
+        if plausible is not None and name not in plausible:
+            continue
+        if name == "pointcloud" and extension not in _POINTCLOUD_EXTENSIONS:
+            continue
+        if name == "CSV" and extension in _CSV_REJECT_EXTENSIONS:
+            continue
+        candidates.append(name)
+
+    logger.debug(
+        "Dispatch candidates for {} (magic={}): {}".format(filepath, magic, candidates)
+    )
+    return candidates
+
+
+def candidate_handlers(filepath, handle_modules):
+    """Return the ``(name, module)`` pairs worth probing for *filepath*.
+
+    Order follows ``handle_modules``; handlers are only dropped when the
+    extension or magic-byte index shows they would reject the file anyway.
+    """
+    return [
+        (name, handle_modules[name])
+        for name in _candidate_names(filepath, handle_modules)
+    ]
+
+
+def select_handler(filepath, handle_modules, dataset_handle=None, **handler_kwargs):
+    """Return the first candidate handler whose ``check_file_supported`` accepts *filepath*.
+
+    *dataset_handle* is forwarded to the probes so GDAL-backed handlers share
+    one open dataset. Candidates are looked up in *handle_modules* one at a
+    time, so a :class:`HandlerRegistry` imports only the handlers probed.
+    Returns ``None`` when no handler claims the file.
+    """
+    for name in _candidate_names(filepath, handle_modules):
+        module = handle_modules[name]
+        if module.check_file_supported(
+            filepath, dataset_handle=dataset_handle, **handler_kwargs
+        ):
+            return module
+    return None
+
+
+class DatasetHandle:
+    """A GDAL dataset opened at most once and shared by handler calls.
+
+    The dataset is opened lazily with ``gdal.OpenEx`` (raster and vector
+    drivers) on first access. GDAL datasets must not be used from several
+    threads at once, so callers hold :attr:`lock` while using it —
+    :func:`borrow_dataset` does this for them.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.lock = threading.RLock()
+        self._dataset = None
+        self._opened = False
+        self._subdataset = None
+        self._subdataset_opened = False
+        self._shared_lock = threading.Lock()
+        self._shared = {}
+
+    @property
+    def dataset(self):
+        """The open GDAL dataset, or ``None`` if GDAL cannot open the file."""
+        with self.lock:
+            if not self._opened:
+                self._opened = True
+                from osgeo import gdal
+
+                try:
+                    self._dataset = gdal.OpenEx(self.filepath)
+                except Exception as e:
+                    logger.debug("GDAL cannot open {}: {}".format(self.filepath, e))
+                    self._dataset = None
+            return self._dataset
+
+    @property
+    def first_subdataset(self):
+        """The first subdataset (e.g. of a NetCDF file), opened at most once."""
+        with self.lock:
+            if not self._subdataset_opened:
+                self._subdataset_opened = True
+                ds = self.dataset
+                subdatasets = ds.GetSubDatasets() if ds is not None else None
+                if subdatasets:
+                    from osgeo import gdal
+
+                    try:
+                        self._subdataset = gdal.Open(subdatasets[0][0])
+                    except Exception as e:
+                        logger.debug(
+                            "GDAL cannot open subdataset {}: {}".format(
+                                subdatasets[0][0], e
+                            )
+                        )
+                        self._subdataset = None
+            return self._subdataset
+
+    def shared(self, key, factory):
+        """Return ``factory()``, computed at most once per handle and *key*.
+
+        The bbox and tbox threads of ``from_file`` use this to share one
+        pass over the file. A caller arriving while the value is computed
+        waits for it; an exception raised by *factory* is raised to every
+        caller.
+        """
+        with self._shared_lock:
+            if key not in self._shared:
+                try:
+                    self._shared[key] = (factory(), None)
+                except Exception as e:
+                    self._shared[key] = (None, e)
+            value, error = self._shared[key]
+        if error is not None:
+            raise error
+        return value
+
+    def close(self):
+        """Release the GDAL dataset(s) and shared values."""
+        with self.lock:
+            self._subdataset = None
+            self._dataset = None
+        with self._shared_lock:
+            self._shared.clear()
+
+
+@contextlib.contextmanager
+def borrow_dataset(filepath, dataset_handle=None, opener=None):
+    """Yield a GDAL dataset for *filepath*.
+
+    With a *dataset_handle* the shared dataset is yielded while holding the
+    handle's lock; otherwise ``opener(filepath)`` opens a private dataset
+    that is released on exit (the behaviour before shared handles existed).
+    """
+    if dataset_handle is not None:
+        with dataset_handle.lock:
+            yield dataset_handle.dataset
+        return
+
+    if opener is None:
+        from osgeo import gdal
+
+        opener = gdal.OpenEx
+    ds = opener(filepath)
+    try:
+        yield ds
+    finally:
+        ds = None
@@ -0,0 +1,150 @@
+"""Overlap file downloads with extraction.
+
+``_process_remote_download`` used to wait for ``repository.download()`` to
+finish before ``from_directory`` opened the first file. An
+:class:`ExtractionPipeline` is attached to the provider while it downloads
+(``provider._download_listener``): the provider announces the files it is
+about to fetch (:meth:`ExtractionPipeline.expect`) and reports each one as
+it completes (:meth:`ExtractionPipeline.finished`). Completed files are
+extracted right away by a pool of worker threads, so download time and
+extraction time overlap instead of adding up. ``from_directory`` then picks
+up the finished results (:meth:`ExtractionPipeline.results`) instead of
+extracting those files again.
+
+Files that only make sense together are released as a group once every
+member has arrived: shapefile components (grouped with
+:func:`~geoextent.lib.helpfunctions._group_shapefile_components`) and other
+files sharing a name stem, such as world files, ``.prj`` sidecars of CSV
+files and ``.aux.xml`` files.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import helpfunctions as hf
+
+logger = logging.getLogger("geoextent")
+
+
+def _stem(name):
+    name = name.lower()
+    if name.endswith(".aux.xml"):
+        name = name[: -len(".aux.xml")]
+    return os.path.splitext(name)[0]
+
+
+def group_files(paths):
+    """Split *paths* into groups of files that must be extracted together.
+
+    Returns a list of lists of paths; every path appears in exactly one group.
+    """
+    by_directory = {}
+    for path in paths:
+        by_directory.setdefault(os.path.dirname(path), []).append(path)
+
+    groups = []
+    for dir_paths in by_directory.values():
+        infos = [{"name": os.path.basename(p), "path": p} for p in dir_paths]
+        shapefile_groups, standalone = hf._group_shapefile_components(infos)
+        groups.extend([info["path"] for info in group] for group in shapefile_groups)
+
+        by_stem = {}
+        for info in standalone:
+            by_stem.setdefault(_stem(info["name"]), []).append(info["path"])
+        groups.extend(by_stem.values())
+    return groups
+
+
+class ExtractionPipeline:
+    """Extract downloaded files while the remaining files are still downloading.
+
+    Args:
+        extract: called as ``extract(path)`` in a worker thread for every
+            released file; its return value becomes the future's result
+        workers: number of extraction threads
+        accept: optional predicate; released files it rejects (archives,
+            auxiliary files, ...) are left to ``from_directory``
+    """
+
+    def __init__(self, extract, workers=1, accept=None):
+        self._extract = extract
+        self._accept = accept
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="geoextent-pipeline"
+        )
+        self._lock = threading.Lock()
+        self._group_of = {}  # path -> group id
+        self._pending = {}  # group id -> number of files still downloading
+        self._members = {}  # group id -> [(path, success)]
+        self._futures = {}  # path -> Future
+        self._next_group = 0
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    def expect(self, paths):
+        """Announce files about to be downloaded, so groups are released together."""
+        with self._lock:
+            for group in group_files([self._key(p) for p in paths]):
+                group = [p for p in group if p not in self._group_of]
+                if not group:
+                    continue
+                group_id = self._next_group
+                self._next_group += 1
+                self._pending[group_id] = len(group)
+                self._members[group_id] = []
+                for path in group:
+                    self._group_of[path] = group_id
+
+    def finished(self, path, success=True):
+        """Report that the download of *path* completed (or failed)."""
+        path = self._key(path)
+        with self._lock:
+            group_id = self._group_of.pop(path, None)
+            if group_id is None:
+                # Not announced: nothing to wait for
+                release = [(path, success)]
+            else:
+                self._members[group_id].append((path, success))
+                self._pending[group_id] -= 1
+                if self._pending[group_id] > 0:
+                    return
+                del self._pending[group_id]
+                release = self._members.pop(group_id)
+            for member, ok in release:
+                self._submit(member, ok)
+
+    def _submit(self, path, success):
+        if not success or self._closed or path in self._futures:
+            return
+        if not os.path.isfile(path):
+            return
+        if self._accept is not None and not self._accept(path):
+            return
+        logger.debug("Pipeline: extracting {} while downloads continue".format(path))
+        self._futures[path] = self._executor.submit(self._extract, path)
+
+    def results(self):
+        """Return a ``{absolute path: Future}`` mapping of the released files."""
+        with self._lock:
+            return dict(self._futures)
+
+    def close(self):
+        """Stop accepting files and shut the workers down.
+
+        Extractions that have not started yet (e.g. after a timeout) are
+        cancelled; running ones are waited for.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,292 @@
+"""Content-addressed store of downloaded repository files, shared across runs.
+
+Providers download into a temporary directory that is removed after each
+run, so re-running a harvest (or retrying one that was interrupted)
+fetches every file again. Most repositories publish a checksum for each
+file: Zenodo and other InvenioRDM instances (``md5:<hex>``), Figshare
+(``computed_md5``) and Dataverse (``checksum``). With a
+:class:`DownloadStore` active, :meth:`DoiProvider._download_files_batch`
+fetches files that carry a checksum through the store:
+
+* a file already in the store is copied into the download folder
+  without any network request — also when another record or another
+  repository references the same content. Copies (not hard links) keep
+  the stored object intact when an extracted file is modified in place;
+* otherwise it is downloaded into the store under a temporary name. The
+  partial file is kept there, so an interrupted download resumes with an
+  HTTP ``Range`` request on the next run;
+* the checksum is verified before the file is moved to its final name; a
+  mismatch discards the download and fails the file. Downloads of the
+  same object are serialised across threads and processes with a lock
+  file next to it.
+
+Objects live under ``<root>/<algorithm>/<xx>/<digest>``. The store is
+activated with :func:`use_download_store` (``from_remote(...,
+download_store=...)``, CLI: ``--download-store [DIR]``) or the
+``GEOEXTENT_DOWNLOAD_STORE`` environment variable (``1`` for the default
+location or a directory).
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+
+from . import helpfunctions as hf
+
+logger = logging.getLogger("geoextent")
+
+_DEFAULT_DIRNAME = "downloads"
+
+# Suffix of partial downloads (providers.PARTIAL_SUFFIX)
+_PARTIAL_SUFFIX = ".part"
+
+#: Checksum algorithms the store can verify.
+SUPPORTED_ALGORITHMS = ("md5", "sha1", "sha256", "sha512")
+
+_HEX_LENGTHS = {
+    hashlib.new(name).digest_size * 2: name for name in SUPPORTED_ALGORITHMS
+}
+
+
+class ChecksumMismatch(Exception):
+    """A downloaded file does not match the checksum published by the repository."""
+
+
+def default_store_path():
+    """Return the default location of the download store."""
+    return os.path.join(hf.get_cache_dir(), _DEFAULT_DIRNAME)
+
+
+def parse_checksum(value, algorithm=None):
+    """Normalise a repository checksum to ``"<algorithm>:<hex digest>"``.
+
+    Accepts ``"md5:<hex>"`` strings (InvenioRDM), bare hex digests (the
+    algorithm is taken from *algorithm* or guessed from the length) and
+    Dataverse ``{"type": "MD5", "value": "<hex>"}`` dicts. Returns ``None``
+    for missing, malformed or unsupported checksums.
+    """
+    if isinstance(value, dict):
+        algorithm = value.get("type") or algorithm
+        value = value.get("value")
+    if not value or not isinstance(value, str):
+        return None
+    if ":" in value:
+        algorithm, value = value.split(":", 1)
+    digest = value.strip().lower()
+    if not digest or any(c not in "0123456789abcdef" for c in digest):
+        return None
+    if algorithm:
+        algorithm = algorithm.strip().lower().replace("-", "")
+    else:
+        algorithm = _HEX_LENGTHS.get(len(digest))
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        return None
+    if hashlib.new(algorithm).digest_size * 2 != len(digest):
+        return None
+    return "{}:{}".format(algorithm, digest)
+
+
+def file_checksum(path, algorithm):
+    """Return the hex digest of *path* computed with *algorithm*."""
+    h = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _copy_object(source, target):
+    directory = os.path.dirname(target)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if os.path.lexists(target):
+        os.remove(target)
+    shutil.copyfile(source, target)
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on the file *path* (created if missing)."""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            while True:
+                try:
+                    # Blocks for up to 10 s, then raises
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class DownloadStore:
+    """Directory of downloaded files addressed by their checksum.
+
+    Safe to share between threads and processes: concurrent requests for
+    the same content wait for a single download.
+
+    Args:
+        path: store directory (default: :func:`default_store_path`)
+    """
+
+    def __init__(self, path=None):
+        self.path = path or default_store_path()
+        self._lock = threading.Lock()
+        self._object_locks = {}
+
+    def __repr__(self):
+        return "DownloadStore({!r})".format(self.path)
+
+    def object_path(self, checksum):
+        """Return the path of the stored object for a normalised *checksum*."""
+        algorithm, digest = checksum.split(":", 1)
+        return os.path.join(self.path, algorithm, digest[:2], digest)
+
+    def __contains__(self, checksum):
+        return os.path.isfile(self.object_path(checksum))
+
+    def _object_lock(self, checksum):
+        with self._lock:
+            return self._object_locks.setdefault(checksum, threading.Lock())
+
+    def fetch(self, checksum, target, download):
+        """Place the file with *checksum* at *target*, downloading it if needed.
+
+        *download* is called as ``download(path)`` to fetch the file to
+        *path* (a temporary name inside the store); it is expected to
+        resume from ``<path>.part`` when that exists. Returns the size of
+        the file. Raises :class:`ChecksumMismatch` if the download does
+        not match.
+        """
+        stored = self.object_path(checksum)
+        if not os.path.isfile(stored):
+            os.makedirs(os.path.dirname(stored), exist_ok=True)
+            with self._object_lock(checksum), _file_lock(stored + ".lock"):
+                # Another thread or process may have stored it meanwhile
+                if not os.path.isfile(stored):
+                    self._download(checksum, stored, target, download)
+        else:
+            logger.debug(
+                "Reusing {} from download store for {}".format(
+                    checksum, os.path.basename(target)
+                )
+            )
+        _copy_object(stored, target)
+        return os.path.getsize(target)
+
+    @staticmethod
+    def _download(checksum, stored, target, download):
+        # The object only appears at its final name once verified. The
+        # partial file keeps a fixed name between runs so it is resumed.
+        partial = stored + _PARTIAL_SUFFIX
+        temporary = "{}.{}".format(stored, uuid.uuid4().hex)
+        if os.path.exists(partial):
+            os.replace(partial, temporary + _PARTIAL_SUFFIX)
+        try:
+            download(temporary)
+        except BaseException:
+            if os.path.exists(temporary + _PARTIAL_SUFFIX):
+                os.replace(temporary + _PARTIAL_SUFFIX, partial)
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        algorithm, expected = checksum.split(":", 1)
+        actual = file_checksum(temporary, algorithm)
+        if actual != expected:
+            os.remove(temporary)
+            raise ChecksumMismatch(
+                "{} has {} checksum {}, expected {}".format(
+                    os.path.basename(target), algorithm, actual, expected
+                )
+            )
+        os.replace(temporary, stored)
+
+    def clear(self):
+        """Remove all stored files."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+_active_lock = threading.Lock()
+_active_store = None
+_env_store = None
+
+
+def get_active_download_store():
+    """Return the process-wide download store, or ``None`` when it is off.
+
+    A store installed with :func:`use_download_store` takes precedence over
+    the ``GEOEXTENT_DOWNLOAD_STORE`` environment variable.
+    """
+    global _env_store
+    if _active_store is not None:
+        return _active_store
+    setting = os.environ.get("GEOEXTENT_DOWNLOAD_STORE")
+    if not setting or setting.lower() in ("0", "false", "no"):
+        return None
+    with _active_lock:
+        path = None if setting.lower() in ("1", "true", "yes") else setting
+        if _env_store is None or _env_store.path != (path or default_store_path()):
+            _env_store = DownloadStore(path)
+        return _env_store
+
+
+def resolve_download_store(download_store):
+    """Normalise the ``download_store`` argument of the public API.
+
+    Accepts ``None``/``False`` (disabled), ``True`` (default location), a
+    directory path, or a :class:`DownloadStore`.
+    """
+    if download_store is None or download_store is False:
+        return None
+    if download_store is True:
+        return DownloadStore()
+    if isinstance(download_store, DownloadStore):
+        return download_store
+    if isinstance(download_store, (str, os.PathLike)):
+        return DownloadStore(os.fspath(download_store))
+    raise TypeError(
+        "download_store must be a bool, a path or a DownloadStore, got {}".format(
+            type(download_store).__name__
+        )
+    )
+
+
+@contextlib.contextmanager
+def use_download_store(download_store):
+    """Activate *download_store* for all provider downloads within the block.
+
+    *download_store* takes the values accepted by
+    :func:`resolve_download_store`; with ``None`` / ``False`` the current
+    setting is left unchanged.
+    """
+    global _active_store
+    store = resolve_download_store(download_store)
+    if store is None:
+        yield get_active_download_store()
+        return
+    with _active_lock:
+        previous = _active_store
+        _active_store = store
+    try:
+        yield store
+    finally:
+        with _active_lock:
+            _active_store = previous
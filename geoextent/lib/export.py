@@ -20,6 +20,8 @@ from osgeo import ogr, osr
 
 from . import helpfunctions as hf
 
+hf.ogr_osr()  # enable GDAL exceptions
+
 logger = logging.getLogger("geoextent")
 
 # ---------------------------------------------------------------------------
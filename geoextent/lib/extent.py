@@ -1,114 +1,56 @@
-import filesizelib
+import collections
+import contextlib
 import logging
 import os
-import patoolib
 import random
+import sys
 import threading
 import time
 import tempfile
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from concurrent.futures import TimeoutError as FuturesTimeoutError
-from .content_providers import Dryad
-from .content_providers import Figshare
-from .content_providers import Zenodo
-from .content_providers import InvenioRDM
-from .content_providers import Pangaea
-from .content_providers import OSF
-from .content_providers import Dataverse
-from .content_providers import GFZ
-from .content_providers.journals import OJS as _journals_OJS
-from .content_providers.journals import Janeway as _journals_Janeway
-from .content_providers.journals import Pensoft as _journals_Pensoft
-from .content_providers import Opara
-from .content_providers import Senckenberg
-from .content_providers import BGR
-from .content_providers import MendeleyData
-from .content_providers import Wikidata
-from .content_providers import FourTU
-from .content_providers import RADAR
-from .content_providers import ArcticDataCenter
-from .content_providers import DataOne
-from .content_providers import DEIMSSDR
-from .content_providers import BAW
-from .content_providers import MDIDE
-from .content_providers import GDIDE
-from .content_providers import HALODB
-from .content_providers import GBIF
-from .content_providers import SEANOE
-from .content_providers import GeoScienceWorld
-from .content_providers import UKCEH
-from .content_providers import CKAN
-from .content_providers import NFDI4Earth
-from .content_providers import STAC
-from .content_providers import GitHub
-from .content_providers import GitLab
-from .content_providers import Forgejo
-from .content_providers import SoftwareHeritage
-from .content_providers import RemoteRaster
-from . import handle_csv
-from . import handle_raster
-from . import handle_vector
-from . import handle_pointcloud
-from . import handle_text
+from urllib.parse import urlparse
+from . import dispatch
+from .content_providers import manifest
+from .extraction_cache import cached_extract, resolve_extraction_cache
+from .download_store import use_download_store
+from .http_cache import use_http_cache
+from . import archives as _archives
+from . import pointers as _pointers
+from . import remote_open as _remote_open
+from .download_pipeline import ExtractionPipeline
 from . import helpfunctions as hf
 from . import external_metadata
 
 logger = logging.getLogger("geoextent")
-handle_modules = {
-    "CSV": handle_csv,
-    "pointcloud": handle_pointcloud,
-    "raster": handle_raster,
-    "vector": handle_vector,
-    "text": handle_text,  # last: opt-in via text_method kwarg
-}
+# Handler modules are imported when they are first probed
+handle_modules = dispatch.HandlerRegistry(
+    {
+        "CSV": ".handle_csv",
+        "pointcloud": ".handle_pointcloud",
+        "raster": ".handle_raster",
+        "vector": ".handle_vector",
+        "text": ".handle_text",  # last: opt-in via text_method kwarg
+    },
+    __package__,
+)
 
 
 def _get_content_providers():
-    """Return the ordered list of content provider classes."""
-    return [
-        Wikidata.Wikidata,  # Wikidata first: Q-numbers won't match DOI providers
-        Dryad.Dryad,
-        FourTU.FourTU,  # Before Figshare: 4TU uses Djehuty with Figshare-compatible API
-        Figshare.Figshare,
-        Zenodo.Zenodo,
-        InvenioRDM.InvenioRDM,  # After Zenodo: catches other InvenioRDM instances
-        Pangaea.Pangaea,
-        OSF.OSF,
-        Dataverse.Dataverse,
-        GFZ.GFZ,
-        RADAR.RADAR,
-        ArcticDataCenter.ArcticDataCenter,
-        DataOne.DataOne,  # After Arctic Data Center: generic DataONE CN covers KNB, PISCO, etc.
-        GBIF.GBIF,  # Before Pensoft: both may match 10.3897/ but GBIF excludes it
-        _journals_Pensoft,
-        BGR.BGR,  # BGR before Opara because both accept UUIDs
-        BAW.BAW,  # BAW after BGR: similar CSW-based provider
-        MDIDE.MDIDE,  # MDI-DE after BAW: similar CSW-based, no DOIs
-        GDIDE.GDIDE,  # GDI-DE after MDI-DE: similar CSW-based, no DOIs
-        Opara.Opara,
-        Senckenberg.Senckenberg,
-        CKAN.CKAN,  # Generic CKAN catch-all (after specific CKAN providers)
-        MendeleyData.MendeleyData,
-        DEIMSSDR.DEIMSSDR,
-        NFDI4Earth.NFDI4Earth,  # After DEIMS-SDR: URL-based, no DOIs, no collision risk
-        HALODB.HALODB,
-        SEANOE.SEANOE,
-        GeoScienceWorld.GeoScienceWorld,  # After SEANOE: no DOI prefix, validates via URL
-        # journals umbrella: HTML-sniffing journal-platform providers, after
-        # all DOI-prefix-shortcut providers so a publisher that owns a DOI
-        # prefix wins first. OJS goes before Janeway: its generator meta-tag
-        # fingerprint is unambiguous; Janeway's fingerprint is broader.
-        _journals_OJS,
-        _journals_Janeway,
-        UKCEH.UKCEH,
-        STAC.STAC,  # Late: broad /collections/ URL pattern could false-match
-        GitHub.GitHub,  # Very late: github.com URLs are unambiguous, no DOI collision
-        GitLab.GitLab,  # After GitHub: broad hostname matching, API probe fallback
-        Forgejo.Forgejo,  # After GitLab: Gitea/Forgejo instances, API probe fallback
-        SoftwareHeritage.SoftwareHeritage,  # Late: SWHIDs and archive.softwareheritage.org URLs
-        RemoteRaster.RemoteRaster,  # Last: catch-all for direct .tif/.tiff URLs
-    ]
+    """Return the ordered list of content provider classes.
+
+    This imports every provider; to match a reference, pass
+    ``manifest.PROVIDERS`` to ``find_provider`` instead, which imports only
+    the candidates.
+    """
+    return [entry.load() for entry in manifest.PROVIDERS]
 
 
 def _attach_extracted_doi(metadata, repository):
@@ -146,6 +88,72 @@ def _identifier_for_enrichment(identifier, details_entry):
     return identifier
 
 
+def _identifier_host(identifier):
+    """Return the host an identifier's requests will (mostly) go to.
+
+    Used to bound concurrent requests per repository without resolving
+    anything: DOIs map to their registrant prefix (``10.5281`` is Zenodo,
+    ``10.1594`` PANGAEA, ...), URLs to their lowercased host name.
+    """
+    if not isinstance(identifier, str):
+        return None
+    doi_match = hf.doi_regexp.match(identifier.strip())
+    if doi_match:
+        return "doi:" + doi_match.group(2).split("/", 1)[0]
+    host = urlparse(identifier.strip()).hostname
+    return host.lower() if host else identifier.strip().lower()
+
+
+def _map_per_host(func, items, *, workers, max_per_host, host_of):
+    """Apply *func* to all *items* concurrently and return results in order.
+
+    At most *workers* calls run at the same time, and at most
+    *max_per_host* of them share a ``host_of(item)`` key. Items of a busy
+    host wait in a per-host queue without occupying a worker, so the
+    budget goes to other hosts meanwhile. Each result is ``(True, value)``
+    or ``(False, exception)``.
+    """
+    results = [None] * len(items)
+    queues = {}
+    for index, item in enumerate(items):
+        queues.setdefault(host_of(item), collections.deque()).append(index)
+    running = {host: 0 for host in queues}
+
+    def _call(index):
+        try:
+            return True, func(items[index])
+        except Exception as e:
+            return False, e
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+
+        def _fill():
+            # Round-robin over hosts with queued items and free slots
+            while len(pending) < workers:
+                submitted = False
+                for host, queue in queues.items():
+                    if len(pending) >= workers:
+                        break
+                    if queue and running[host] < max_per_host:
+                        index = queue.popleft()
+                        running[host] += 1
+                        pending[pool.submit(_call, index)] = (index, host)
+                        submitted = True
+                if not submitted:
+                    break
+
+        _fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, host = pending.pop(future)
+                running[host] -= 1
+                results[index] = future.result()
+            _fill()
+    return results
+
+
 def _swap_coordinate_order(metadata):
     """Swap coordinate order from internal [lon, lat] to EPSG:4326 native [lat, lon].
 
@@ -331,16 +339,10 @@ def compute_convex_hull_wgs84(module, path, assume_wgs84=False, handler_kwargs=N
                 "convex_hull_coords" in spatial_extent_origin
                 and spatial_extent_origin["convex_hull_coords"]
             ):
-                transformed_coords = []
-                for coord in spatial_extent_origin["convex_hull_coords"]:
-                    transformed_point = hf.transform_array_to_wgs84_from_wkt(
-                        crs_wkt,
-                        [coord[0], coord[1], coord[0], coord[1]],
-                    )
-                    transformed_coords.append(
-                        [transformed_point[0], transformed_point[1]]
-                    )
-                spatial_extent["convex_hull_coords"] = transformed_coords
+                # All hull vertices in one call with a cached transformation
+                spatial_extent["convex_hull_coords"] = hf.transform_points_to_wgs84(
+                    spatial_extent_origin["convex_hull_coords"], crs_wkt=crs_wkt
+                )
 
             if "convex_hull" in spatial_extent_origin:
                 spatial_extent["convex_hull"] = spatial_extent_origin["convex_hull"]
@@ -395,18 +397,11 @@ def compute_convex_hull_wgs84(module, path, assume_wgs84=False, handler_kwargs=N
                 "convex_hull_coords" in spatial_extent_origin
                 and spatial_extent_origin["convex_hull_coords"]
             ):
-                transformed_coords = []
-                for coord in spatial_extent_origin["convex_hull_coords"]:
-                    # Transform each coordinate point
-                    transformed_point = hf.transform_array_to_wgs84(
-                        spatial_extent_origin["crs"],
-                        [coord[0], coord[1], coord[0], coord[1]],
-                    )
-                    # Take the first two values (x, y)
-                    transformed_coords.append(
-                        [transformed_point[0], transformed_point[1]]
-                    )
-                spatial_extent["convex_hull_coords"] = transformed_coords
+                # All hull vertices in one call with a cached transformation
+                spatial_extent["convex_hull_coords"] = hf.transform_points_to_wgs84(
+                    spatial_extent_origin["convex_hull_coords"],
+                    crs=spatial_extent_origin["crs"],
+                )
 
             # Preserve convex hull flag and geometry
             if "convex_hull" in spatial_extent_origin:
@@ -466,18 +461,328 @@ def _is_auxiliary_file(filename: str) -> bool:
     return False
 
 
+def _gazetteer_failures():
+    """Return the gazetteer lookup failure count, 0 while it is not loaded."""
+    gazetteer = sys.modules.get(__package__ + ".gazetteer")
+    return gazetteer.lookup_failures() if gazetteer is not None else 0
+
+
+def _from_file_cached(filepath, extraction_cache=None, **kwargs):
+    """Run from_file, serving the result from *extraction_cache* if possible.
+
+    Remote-open pointer files are extracted from the remote file and
+    archive member pointers from the archive; only a full download or
+    extraction (the fallback) goes through the cache.
+    """
+    kind = _pointers.pointer_kind(filepath)
+    if kind == _pointers.MEMBER:
+        return _archives.extract_member_pointer(
+            filepath,
+            from_file,
+            lambda path, **kw: cached_extract(from_file, path, extraction_cache, **kw),
+            **kwargs,
+        )
+    if kind == _pointers.REMOTE:
+        return _remote_open.extract_pointer(
+            filepath,
+            from_file,
+            lambda path, **kw: cached_extract(from_file, path, extraction_cache, **kw),
+            **kwargs,
+        )
+    return cached_extract(from_file, filepath, extraction_cache, **kwargs)
+
+
+def _split_metadata_extents(extents, path):
+    """Split collected provider extents by the directory they belong to.
+
+    Returns the extents of *path* itself (including those without a
+    ``folder``) and a dict mapping each subdirectory name of *path* to the
+    extents below it, so that they end up in the same place of the
+    ``details`` as the GeoJSON file they stand for.
+    """
+    own, below = [], {}
+    for extent in extents or ():
+        folder = extent.get("folder")
+        relative = os.path.relpath(folder, path) if folder else os.curdir
+        if relative == os.curdir or relative.split(os.sep)[0] == os.pardir:
+            own.append(extent)
+        else:
+            below.setdefault(relative.split(os.sep)[0], []).append(extent)
+    return own, below
+
+
+def _metadata_extent_result(extent, bbox, tbox, convex_hull, time_format=None):
+    """Return the from_file-style result for an extent a provider collected.
+
+    *extent* is a dict with the ``name`` of the file it stands for, a GeoJSON
+    ``geometry`` in WGS84 and a ``tbox`` of date strings (either may be
+    None), and optionally the ``format`` and ``handler`` of the file
+    (default: a GeoJSON file read by handle_vector). The result is the one
+    from_file returns for that file, without the round trip through it.
+    """
+    result = {
+        "format": extent.get("format", "geojson"),
+        "geoextent_handler": extent.get("handler", "handle_vector"),
+    }
+
+    geometry = extent.get("geometry")
+    coords = []
+    if bbox and geometry:
+        stack = [geometry.get("coordinates")]
+        while stack:
+            item = stack.pop()
+            if (
+                isinstance(item, (list, tuple))
+                and len(item) >= 2
+                and all(isinstance(v, (int, float)) for v in item[:2])
+            ):
+                coords.append((float(item[0]), float(item[1])))
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+    if coords:
+        xs = [c[0] for c in coords]
+        ys = [c[1] for c in coords]
+        envelope = [min(xs), min(ys), max(xs), max(ys)]
+        if envelope != [0, 0, 0, 0]:
+            result["bbox"] = envelope
+            if convex_hull:
+                hull = hf.convex_hull_points(coords)
+                if len(hull) == 1:
+                    result["bbox"] = [hull[0].tolist()]
+                    result["convex_hull"] = True
+                elif len(hull) > 2:
+                    result["bbox"] = hf.convex_hull_ring(hull)
+                    result["convex_hull"] = True
+            result["crs"] = "4326"
+
+    if tbox and extent.get("tbox"):
+        envelope = hf.time_envelope([t for t in extent["tbox"] if t is not None])
+        if envelope is not None:
+            out_fmt = hf.resolve_time_format(time_format)
+            result["tbox"] = [
+                envelope[0].strftime(out_fmt),
+                envelope[1].strftime(out_fmt),
+            ]
+
+    return result
+
+
+def _directory_file_kwargs(
+    bbox,
+    tbox,
+    convex_hull,
+    show_progress=False,
+    include_geojsonio=False,
+    placename=None,
+    placename_escape=False,
+    assume_wgs84=False,
+    time_format=None,
+    text_method=None,
+    ner_model=None,
+    ner_labels=None,
+    ner_score_threshold=None,
+    ner_gazetteer=None,
+    ner_ambiguity=None,
+    ner_auto_download=True,
+    gazetteer_cache=None,
+    period_gazetteer=None,
+    period_ambiguity=None,
+    period_resolution=True,
+    period_cache=None,
+    include_source_text=True,
+    place_geometry="auto",
+):
+    """Return the from_file keyword arguments from_directory uses for its files."""
+    return dict(
+        bbox=bbox,
+        tbox=tbox,
+        convex_hull=convex_hull,
+        show_progress=show_progress,
+        include_geojsonio=include_geojsonio,
+        placename=placename,
+        placename_escape=placename_escape,
+        assume_wgs84=assume_wgs84,
+        time_format=time_format,
+        text_method=text_method,
+        ner_model=ner_model,
+        ner_labels=ner_labels,
+        ner_score_threshold=ner_score_threshold,
+        ner_gazetteer=ner_gazetteer,
+        ner_ambiguity=ner_ambiguity,
+        ner_auto_download=ner_auto_download,
+        gazetteer_cache=gazetteer_cache,
+        period_gazetteer=period_gazetteer,
+        period_ambiguity=period_ambiguity,
+        period_resolution=period_resolution,
+        period_cache=period_cache,
+        include_source_text=include_source_text,
+        place_geometry=place_geometry,
+        _internal=True,
+    )
+
+
 def _extract_file_worker(args_tuple):
     """Worker for parallel file extraction."""
-    filepath, kwargs = args_tuple
-    filename = os.path.basename(filepath)
+    filepath, kwargs, extraction_cache = args_tuple
+    filename = _pointers.original_name(os.path.basename(filepath))
     try:
-        result = from_file(filepath, **kwargs)
+        result = _from_file_cached(filepath, extraction_cache, **kwargs)
         return (filename, result)
     except Exception as e:
         logger.warning("Error extracting from %s: %s", filepath, e)
         return (filename, None)
 
 
+# Per-process state of executor="process" workers, set up once by
+# _init_extraction_worker and shared by every item the worker extracts.
+_WORKER_STATE = {}
+
+
+def _init_extraction_worker(text_config):
+    """Initialise a process-pool worker for from_directory(executor="process").
+
+    Runs once per worker process: registers the GDAL drivers, creates the
+    gazetteer caches shared by all items of this worker and, with text
+    extraction enabled, loads the spaCy model and period gazetteer.
+    """
+    from osgeo import gdal
+
+    gdal.AllRegister()
+    _WORKER_STATE["gazetteer_cache"] = {}
+    _WORKER_STATE["period_cache"] = {}
+    if text_config:
+        from . import handle_text
+
+        try:
+            handle_text.preload(**text_config)
+        except Exception as e:
+            logger.debug("Could not preload text extractor in worker: %s", e)
+
+
+def _extract_item_worker(args_tuple):
+    """Worker for process-pool extraction of one directory item.
+
+    ``item_type`` is ``"file"``, ``"gdb"`` or ``"zarr"`` (extracted with
+    from_file) or ``"archive"`` / ``"directory"`` (extracted with
+    from_directory). All arguments are picklable; gazetteer caches come
+    from the worker's own state instead of being copied with every task.
+    """
+    item_type, filepath, kwargs = args_tuple
+    kwargs = dict(kwargs)
+    for key in ("gazetteer_cache", "period_cache"):
+        if key in kwargs and kwargs[key] is None:
+            kwargs[key] = _WORKER_STATE.get(key)
+    try:
+        if item_type in ("archive", "directory"):
+            return from_directory(filepath, **kwargs)
+        return _from_file_cached(filepath, **kwargs)
+    except Exception as e:
+        logger.warning("Error extracting from %s: %s", filepath, e)
+        return None
+
+
+def _extract_items_in_process_pool(
+    regular_files,
+    other_items,
+    file_kwargs,
+    *,
+    workers,
+    timeout,
+    level,
+    recursive,
+    metadata_directory,
+    emit_progress,
+    dir_kwargs,
+    store_kwargs,
+):
+    """Extract all items of one directory level in a process pool.
+
+    Regular files, ``.gdb`` / ``.zarr`` stores, subdirectories and archives
+    are scheduled into the same pool; subdirectories and archives are
+    extracted sequentially inside their worker, with the remaining
+    *timeout*. Results are stored in *metadata_directory* under the item's
+    name. Returns True when *timeout* was reached before all items
+    finished; the workers still running are then terminated.
+    """
+    # Gazetteer caches are per worker process (see _init_extraction_worker)
+    file_kwargs = dict(file_kwargs, gazetteer_cache=None, period_cache=None)
+    dir_kwargs = dict(
+        dir_kwargs, timeout=timeout, gazetteer_cache=None, period_cache=None
+    )
+
+    tasks = [
+        (fname, ("file", abs_path, file_kwargs)) for fname, abs_path in regular_files
+    ]
+    for fname, abs_path, item_type in other_items:
+        if item_type in ("archive", "directory"):
+            if not recursive:
+                logger.info("Skipping {} {} (recursive=False)".format(item_type, fname))
+                emit_progress(fname)
+                continue
+            tasks.append((fname, (item_type, abs_path, dir_kwargs)))
+        else:
+            tasks.append((fname, (item_type, abs_path, store_kwargs)))
+
+    text_config = None
+    if file_kwargs.get("text_method") is not None:
+        text_config = {
+            key: file_kwargs.get(key)
+            for key in (
+                "text_method",
+                "ner_model",
+                "ner_labels",
+                "ner_score_threshold",
+                "ner_auto_download",
+                "period_gazetteer",
+                "period_resolution",
+            )
+        }
+
+    timeout_flag = False
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_extraction_worker,
+        initargs=(text_config,),
+    )
+    try:
+        future_to_filename = {
+            pool.submit(_extract_item_worker, task): fname for fname, task in tasks
+        }
+        try:
+            for future in as_completed(future_to_filename, timeout=timeout):
+                fname = future_to_filename[future]
+                try:
+                    metadata_directory[str(fname)] = future.result()
+                except Exception as e:
+                    logger.warning("Error extracting from %s: %s", fname, e)
+                emit_progress(fname)
+        except FuturesTimeoutError:
+            if level == 0:
+                logger.warning(
+                    f"Timeout reached after {timeout} seconds, returning partial results."
+                )
+            timeout_flag = True
+    finally:
+        if timeout_flag:
+            _terminate_process_pool(pool)
+        else:
+            pool.shutdown()
+    return timeout_flag
+
+
+def _terminate_process_pool(pool):
+    """Shut *pool* down without waiting for the tasks still running."""
+    terminate_workers = getattr(pool, "terminate_workers", None)
+    if terminate_workers is not None:  # Python >= 3.14
+        terminate_workers()
+        return
+    # shutdown() drops the process table, so take it first
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
 def from_directory(
     path: str,
     bbox: bool = False,
@@ -510,7 +815,14 @@ def from_directory(
     period_cache=None,
     include_source_text: bool = True,
     place_geometry: str = "auto",
+    ner_batch_size: int | None = None,
+    ner_n_process: int = 1,
+    executor: str = "thread",
+    extraction_cache=None,
     _internal: bool = False,
+    _prefetched=None,
+    _archive_selection=None,
+    _metadata_extents=None,
 ):
     """Extracts geoextent from a directory/archive
     Keyword arguments:
@@ -524,8 +836,17 @@ def from_directory(
     placename -- gazetteer to use for placename lookup (geonames, nominatim, photon) (default None)
     assume_wgs84 -- True to assume WGS84 for ungeoreferenced rasters (default False)
     workers -- number of parallel workers for file extraction (default 1 = sequential, 0 = auto-detect)
+    ner_batch_size -- spaCy nlp.pipe batch size for batched text NER (default None = model default)
+    ner_n_process -- number of spaCy processes for batched text NER (default 1)
+    executor -- "thread" (default) or "process"; with "process" and workers > 1, files,
+        subdirectories, archives, .gdb and .zarr items are all extracted in one process pool;
+        on timeout, workers still running are terminated
+    extraction_cache -- persistent cache of per-file results: True for the default
+        location, a database path or an ExtractionCache (default None = disabled)
     """
 
+    import patoolib
+
     from .progress import ProgressEvent, ProgressPhase, TqdmProgressCallback
 
     # Resolve progress callback for directory processing
@@ -552,6 +873,9 @@ def from_directory(
     metadata = {}
     # initialization of later output dict
     metadata_directory = {}
+    own_metadata_extents, nested_metadata_extents = _split_metadata_extents(
+        _metadata_extents, path
+    )
 
     timeout_flag = False
     start_time = time.time()
@@ -562,7 +886,9 @@ def from_directory(
 
     if is_archive:
         logger.info("Inspecting archive {}".format(path))
-        extract_folder = hf.extract_archive(path)
+        extract_folder = _archives.open_archive(
+            path, text_method=text_method, **(_archive_selection or {})
+        )
         logger.info("Extract_folder archive {}".format(extract_folder))
         path = extract_folder
 
@@ -571,13 +897,22 @@ def from_directory(
         random.seed(0)
         random.shuffle(files)
 
+    if executor not in ("thread", "process"):
+        raise ValueError(
+            "Invalid executor {!r}, use 'thread' or 'process'".format(executor)
+        )
+
     # Resolve workers=0 → auto-detect CPU count
     if workers == 0:
         workers = os.cpu_count() or 1
 
+    extraction_cache = resolve_extraction_cache(extraction_cache)
+
     # Phase 1: Categorize items
     regular_files = []  # (filename, absolute_path)
     other_items = []  # (filename, absolute_path, item_type)
+    # Files already extracted by the download pipeline: (filename, future)
+    prefetched_files = []
 
     for filename in files:
         if _is_auxiliary_file(filename):
@@ -595,10 +930,18 @@ def from_directory(
                 other_items.append((filename, absolute_path, "zarr"))
             else:
                 other_items.append((filename, absolute_path, "directory"))
+        elif _prefetched and os.path.abspath(absolute_path) in _prefetched:
+            prefetched_files.append(
+                (
+                    _pointers.original_name(filename),
+                    _prefetched[os.path.abspath(absolute_path)],
+                )
+            )
         else:
-            regular_files.append((filename, absolute_path))
+            # Pointers are reported under the remote file's or member's name
+            regular_files.append((_pointers.original_name(filename), absolute_path))
 
-    total_items = len(regular_files) + len(other_items)
+    total_items = len(regular_files) + len(other_items) + len(prefetched_files)
 
     # Directory-level progress: emit events via callback
     dir_name = os.path.basename(path) or "root"
@@ -620,6 +963,10 @@ def from_directory(
 
     # Phase 2: Process regular files (parallel or sequential)
     parallel_mode = workers > 1 and len(regular_files) > 1
+    # executor="process": Phases 2 and 3 share one process pool
+    process_mode = executor == "process" and workers > 1 and total_items > 1
+    if process_mode:
+        parallel_mode = True
     # When we have a callback, suppress show_progress for child from_file calls
     # to avoid nested tqdm bars; the callback handles progress instead.
     _child_show_progress = False if (_cb or parallel_mode) else show_progress
@@ -630,10 +977,10 @@ def from_directory(
     if period_cache is None and text_method is not None:
         period_cache = {}
 
-    file_kwargs = dict(
-        bbox=bbox,
-        tbox=tbox,
-        convex_hull=convex_hull,
+    file_kwargs = _directory_file_kwargs(
+        bbox,
+        tbox,
+        convex_hull,
         show_progress=_child_show_progress,
         include_geojsonio=include_geojsonio,
         placename=placename,
@@ -654,48 +1001,162 @@ def from_directory(
         period_cache=period_cache,
         include_source_text=include_source_text,
         place_geometry=place_geometry,
-        _internal=True,
     )
 
-    if parallel_mode:
-        remaining_time = timeout - (time.time() - start_time) if timeout else None
-        with ThreadPoolExecutor(max_workers=workers) as pool:
-            future_to_filename = {
-                pool.submit(_extract_file_worker, (abs_path, file_kwargs)): fname
-                for fname, abs_path in regular_files
-            }
-            try:
-                for future in as_completed(future_to_filename, timeout=remaining_time):
-                    fname = future_to_filename[future]
-                    try:
-                        result_name, result = future.result()
-                        metadata_directory[str(result_name)] = result
-                    except Exception as e:
-                        logger.warning("Error extracting from %s: %s", fname, e)
-                    _emit_dir_progress(fname)
-            except FuturesTimeoutError:
-                if level == 0:
-                    logger.warning(
-                        f"Timeout reached after {timeout} seconds, returning partial results."
-                    )
-                timeout_flag = True
-    else:
-        for filename, absolute_path in regular_files:
-            if timeout:
-                elapsed_time = time.time() - start_time
-                if elapsed_time > timeout:
+    # With text extraction enabled, run NER over all text files of this
+    # directory level in one batched spaCy pass; the from_file calls below
+    # then pick up their per-file results instead of running the pipeline
+    # one document at a time.
+    # Not used in process mode: the batch results live in this process.
+    text_batch = contextlib.nullcontext()
+    if text_method is not None and not process_mode:
+        from . import handle_text
+
+        text_files = [
+            abs_path
+            for _, abs_path in regular_files
+            if not _pointers.is_pointer(abs_path)
+            and handle_text.check_file_supported(abs_path, text_method=text_method)
+        ]
+        if len(text_files) > 1:
+            text_batch = handle_text.batch_extraction(
+                text_files,
+                batch_size=ner_batch_size,
+                n_process=ner_n_process,
+                text_method=text_method,
+                ner_model=ner_model,
+                ner_labels=ner_labels,
+                ner_score_threshold=ner_score_threshold,
+                ner_auto_download=ner_auto_download,
+                period_gazetteer=period_gazetteer,
+                period_resolution=period_resolution,
+            )
+
+    with text_batch:
+        if process_mode:
+            timeout_flag = _extract_items_in_process_pool(
+                regular_files,
+                other_items,
+                dict(file_kwargs, extraction_cache=extraction_cache),
+                workers=workers,
+                timeout=timeout - (time.time() - start_time) if timeout else None,
+                level=level,
+                recursive=recursive,
+                metadata_directory=metadata_directory,
+                emit_progress=_emit_dir_progress,
+                dir_kwargs=dict(
+                    bbox=bbox,
+                    tbox=tbox,
+                    convex_hull=convex_hull,
+                    details=True,
+                    level=level + 1,
+                    show_progress=False,
+                    recursive=recursive,
+                    include_geojsonio=include_geojsonio,
+                    placename=placename,
+                    placename_escape=placename_escape,
+                    assume_wgs84=assume_wgs84,
+                    time_format=time_format,
+                    workers=1,
+                    text_method=text_method,
+                    ner_model=ner_model,
+                    ner_labels=ner_labels,
+                    ner_score_threshold=ner_score_threshold,
+                    ner_gazetteer=ner_gazetteer,
+                    ner_ambiguity=ner_ambiguity,
+                    ner_auto_download=ner_auto_download,
+                    period_gazetteer=period_gazetteer,
+                    period_ambiguity=period_ambiguity,
+                    period_resolution=period_resolution,
+                    include_source_text=include_source_text,
+                    place_geometry=place_geometry,
+                    ner_batch_size=ner_batch_size,
+                    ner_n_process=ner_n_process,
+                    extraction_cache=extraction_cache,
+                    _internal=True,
+                    _archive_selection=_archive_selection,
+                ),
+                store_kwargs=dict(
+                    bbox=bbox,
+                    tbox=tbox,
+                    convex_hull=convex_hull,
+                    show_progress=False,
+                    include_geojsonio=include_geojsonio,
+                    placename=placename,
+                    placename_escape=placename_escape,
+                    assume_wgs84=assume_wgs84,
+                    time_format=time_format,
+                    _internal=True,
+                ),
+            )
+            # Phase 3 items were handled by the pool as well
+            other_items = []
+        elif parallel_mode:
+            remaining_time = timeout - (time.time() - start_time) if timeout else None
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                future_to_filename = {
+                    pool.submit(
+                        _extract_file_worker,
+                        (abs_path, file_kwargs, extraction_cache),
+                    ): fname
+                    for fname, abs_path in regular_files
+                }
+                try:
+                    for future in as_completed(
+                        future_to_filename, timeout=remaining_time
+                    ):
+                        fname = future_to_filename[future]
+                        try:
+                            result_name, result = future.result()
+                            metadata_directory[str(result_name)] = result
+                        except Exception as e:
+                            logger.warning("Error extracting from %s: %s", fname, e)
+                        _emit_dir_progress(fname)
+                except FuturesTimeoutError:
                     if level == 0:
                         logger.warning(
                             f"Timeout reached after {timeout} seconds, returning partial results."
                         )
                     timeout_flag = True
-                    break
+        else:
+            for filename, absolute_path in regular_files:
+                if timeout:
+                    elapsed_time = time.time() - start_time
+                    if elapsed_time > timeout:
+                        if level == 0:
+                            logger.warning(
+                                f"Timeout reached after {timeout} seconds, returning partial results."
+                            )
+                        timeout_flag = True
+                        break
 
-            logger.info("Processing file: {}".format(filename))
-            metadata_file = from_file(absolute_path, **file_kwargs)
-            metadata_directory[str(filename)] = metadata_file
+                logger.info("Processing file: {}".format(filename))
+                metadata_file = _from_file_cached(
+                    absolute_path, extraction_cache, **file_kwargs
+                )
+                metadata_directory[str(filename)] = metadata_file
 
-            _emit_dir_progress(filename)
+                _emit_dir_progress(filename)
+
+    # Results of files the download pipeline extracted while other files
+    # were still downloading
+    for filename, future in prefetched_files:
+        if timeout_flag:
+            break
+        remaining_time = timeout - (time.time() - start_time) if timeout else None
+        try:
+            metadata_directory[str(filename)] = future.result(timeout=remaining_time)
+        except FuturesTimeoutError:
+            if level == 0:
+                logger.warning(
+                    f"Timeout reached after {timeout} seconds, returning partial results."
+                )
+            timeout_flag = True
+            break
+        except Exception as e:
+            logger.warning("Error extracting from %s: %s", filename, e)
+            metadata_directory[str(filename)] = None
+        _emit_dir_progress(filename)
 
     # Phase 3: Process subdirectories and archives (always sequential, pass workers through)
     for filename, absolute_path, item_type in other_items:
@@ -746,7 +1207,11 @@ def from_directory(
                     period_cache=period_cache,
                     include_source_text=include_source_text,
                     place_geometry=place_geometry,
+                    ner_batch_size=ner_batch_size,
+                    ner_n_process=ner_n_process,
+                    extraction_cache=extraction_cache,
                     _internal=True,
+                    _archive_selection=_archive_selection,
                 )
             else:
                 logger.info("Skipping archive {} (recursive=False)".format(filename))
@@ -816,7 +1281,13 @@ def from_directory(
                     period_cache=period_cache,
                     include_source_text=include_source_text,
                     place_geometry=place_geometry,
+                    ner_batch_size=ner_batch_size,
+                    ner_n_process=ner_n_process,
+                    extraction_cache=extraction_cache,
                     _internal=True,
+                    _archive_selection=_archive_selection,
+                    _prefetched=_prefetched,
+                    _metadata_extents=nested_metadata_extents.get(filename),
                 )
             else:
                 logger.info(
@@ -839,6 +1310,11 @@ def from_directory(
     if _auto_tqdm_dir:
         _cb.close()
 
+    for extent in own_metadata_extents:
+        metadata_directory[extent["name"]] = _metadata_extent_result(
+            extent, bbox, tbox, convex_hull, time_format
+        )
+
     file_format = "archive" if is_archive else "folder"
     metadata["format"] = file_format
 
@@ -1020,6 +1496,7 @@ def from_file(
     include_source_text=True,
     place_geometry="auto",
     _internal=False,
+    _errors=None,
 ):
     """Extracts geoextent from a file
     Keyword arguments:
@@ -1089,21 +1566,27 @@ def from_file(
         "place_geometry": place_geometry,
     }
 
-    # get the module that will be called (depending on the format of the file)
+    # get the module that will be called (depending on the format of the file).
+    # The GDAL dataset is opened at most once and shared by the handler probes
+    # and the bbox/tbox threads below.
+    dataset_handle = dispatch.DatasetHandle(filepath)
+    handler_kwargs = dict(
+        text_handler_kwargs, dataset_handle=dataset_handle, num_sample=num_sample
+    )
 
-    for i in handle_modules:
-        valid = handle_modules[i].check_file_supported(filepath, **text_handler_kwargs)
-        if valid:
-            used_module = handle_modules[i]
-            logger.info(
-                "{} is being used to inspect {} file".format(
-                    used_module.get_handler_name(), filepath
-                )
+    used_module = dispatch.select_handler(
+        filepath, handle_modules, dataset_handle=dataset_handle, **text_handler_kwargs
+    )
+    if used_module:
+        logger.info(
+            "{} is being used to inspect {} file".format(
+                used_module.get_handler_name(), filepath
             )
-            break
+        )
 
     # If file format is not supported
     if not used_module:
+        dataset_handle.close()
         logger.info(
             "Did not find a compatible module for file format {} of file {}".format(
                 file_format, filepath
@@ -1134,14 +1617,14 @@ def from_file(
                                 used_module,
                                 filepath,
                                 assume_wgs84=assume_wgs84,
-                                handler_kwargs=text_handler_kwargs,
+                                handler_kwargs=handler_kwargs,
                             )
                         else:
                             spatial_extent = compute_bbox_wgs84(
                                 used_module,
                                 filepath,
                                 assume_wgs84=assume_wgs84,
-                                handler_kwargs=text_handler_kwargs,
+                                handler_kwargs=handler_kwargs,
                             )
 
                         if spatial_extent is not None:
@@ -1174,20 +1657,18 @@ def from_file(
             elif self.task == "tbox":
                 try:
                     if tbox:
-                        if used_module.get_handler_name() == "handle_csv":
-                            extract_tbox = used_module.get_temporal_extent(
-                                filepath, num_sample, time_format=time_format
-                            )
-                        else:
-                            if num_sample is not None:
-                                logger.warning(
-                                    "num_sample parameter is ignored, only applies to CSV files"
-                                )
-                            extract_tbox = used_module.get_temporal_extent(
-                                filepath,
-                                time_format=time_format,
-                                **text_handler_kwargs,
+                        if (
+                            used_module.get_handler_name() != "handle_csv"
+                            and num_sample is not None
+                        ):
+                            logger.warning(
+                                "num_sample parameter is ignored, only applies to CSV files"
                             )
+                        extract_tbox = used_module.get_temporal_extent(
+                            filepath,
+                            time_format=time_format,
+                            **handler_kwargs,
+                        )
                         if extract_tbox is not None:
                             metadata["tbox"] = extract_tbox
                 except Exception as e:
@@ -1200,6 +1681,7 @@ def from_file(
                 raise Exception("Unsupported thread task {}".format(self.task))
             logger.debug("Completed thread {} on file {}".format(self.task, filepath))
 
+    gazetteer_failures = _gazetteer_failures()
     thread_bbox_except = thread("bbox")
     thread_temp_except = thread("tbox")
 
@@ -1252,6 +1734,11 @@ def from_file(
                 )
             )
 
+    # Release the shared GDAL dataset once both threads are done with it
+    thread_bbox_except.join()
+    thread_temp_except.join()
+    dataset_handle.close()
+
     # Close auto-created tqdm bars
     if _auto_tqdm:
         _cb.close()
@@ -1260,6 +1747,8 @@ def from_file(
     for t in [thread_bbox_except, thread_temp_except]:
         if t.warning_msg:
             logger.warning(t.warning_msg)
+            if _errors is not None:
+                _errors.append(t.warning_msg)
 
     logger.debug("Extraction finished: {}".format(str(metadata)))
 
@@ -1314,6 +1803,11 @@ def from_file(
                 placename,
                 e,
             )
+            if _errors is not None:
+                _errors.append("placename: {}".format(e))
+
+    if _errors is not None and _gazetteer_failures() > gazetteer_failures:
+        _errors.append("gazetteer lookup failed")
 
     # Add geojson.io URL if requested and spatial extent is available
     if include_geojsonio and metadata.get("bbox"):
@@ -1360,6 +1854,8 @@ def from_text(
     if not text or not text.strip():
         return None
 
+    from . import handle_text
+
     res = handle_text.extract_from_text(
         text,
         text_method=text_method,
@@ -1463,6 +1959,12 @@ def from_remote(
     download_size_soft_limit: bool = False,
     workers: int = 1,
     progress_callback=None,
+    extraction_cache=None,
+    http_cache=None,
+    download_store=None,
+    remote_workers: int = 1,
+    max_per_host: int = 2,
+    remote_open: bool = False,
 ):
     """
     Extract geospatial and temporal extent from one or more remote resources.
@@ -1531,6 +2033,36 @@ def from_remote(
         When True, raise DownloadSizeExceeded instead of silently truncating
         files that exceed max_download_size. The CLI sets this to True so it
         can prompt the user for confirmation. (default: False)
+    extraction_cache : bool, str or ExtractionCache, optional
+        Persistent cache of per-file extraction results (True for the default
+        location or a database path). Downloaded files are identified by a hash
+        of their content, so unchanged files are not extracted again on later
+        runs. (default: None)
+    http_cache : bool, str or HTTPCache, optional
+        Persistent cache of provider metadata responses (True for the default
+        location or a database path). Responses are reused within the cache's
+        TTL and revalidated with ETag / Last-Modified afterwards. Can also be
+        enabled with the ``GEOEXTENT_HTTP_CACHE`` environment variable.
+        (default: None)
+    download_store : bool, str or DownloadStore, optional
+        Content-addressed store of downloaded files shared across runs (True
+        for the default location or a directory). Files for which the
+        repository publishes a checksum are served from the store when
+        present, resumed when partially downloaded, and verified. Can also be
+        enabled with the ``GEOEXTENT_DOWNLOAD_STORE`` environment variable.
+        (default: None)
+    remote_workers : int, optional
+        Number of resources of a list processed concurrently (default: 1 =
+        sequential). Output order and ``details`` do not depend on it.
+    max_per_host : int, optional
+        Maximum number of resources processed concurrently against the same
+        repository, identified by DOI prefix or URL host name, when
+        ``remote_workers > 1`` (default: 2)
+    remote_open : bool, optional
+        Read the extent of header-based formats (Cloud Optimized GeoTIFF,
+        FlatGeobuf, GeoPackage, NetCDF/HDF5, LAS/LAZ) from the repository with
+        HTTP range requests instead of downloading the files. Files are only
+        downloaded when the remote read yields no extent. (default: False)
 
     Returns
     -------
@@ -1574,6 +2106,9 @@ def from_remote(
     if len(remote_identifiers) == 0:
         raise ValueError("remote_identifier list cannot be empty")
 
+    if remote_workers < 1 or max_per_host < 1:
+        raise ValueError("remote_workers and max_per_host must be at least 1")
+
     # Validate mutual exclusion: metadata_first implies download_data=True
     if metadata_first and not download_data:
         raise ValueError(
@@ -1596,51 +2131,89 @@ def from_remote(
         },
     }
 
-    # Process each remote identifier
-    for identifier in remote_identifiers:
+    # Resources are processed concurrently when remote_workers > 1, with at
+    # most max_per_host of them talking to the same repository at a time.
+    concurrent = remote_workers > 1 and len(remote_identifiers) > 1
+
+    def _extract_one(identifier):
         logger.debug(f"Processing remote resource: {identifier}")
-        try:
-            # Call the actual extraction method directly
-            resource_output = _extract_from_remote(
-                identifier,
-                bbox=bbox,
-                tbox=tbox,
-                convex_hull=convex_hull,
-                details=details,
-                throttle=throttle,
-                timeout=timeout,
-                download_data=download_data,
-                show_progress=show_progress,
-                recursive=recursive,
-                include_geojsonio=include_geojsonio,
-                max_download_size=max_download_size,
-                max_download_method=max_download_method,
-                max_download_method_seed=max_download_method_seed,
-                placename=placename,
-                placename_escape=placename_escape,
-                download_skip_nogeo=download_skip_nogeo,
-                download_skip_nogeo_exts=download_skip_nogeo_exts,
-                max_download_workers=max_download_workers,
-                keep_files=keep_files,
-                assume_wgs84=assume_wgs84,
-                metadata_first=metadata_first,
-                metadata_fallback=metadata_fallback,
-                time_format=time_format,
-                follow=follow,
-                download_size_soft_limit=download_size_soft_limit,
-                workers=workers,
-                progress_callback=progress_callback,
+        return _extract_from_remote(
+            identifier,
+            bbox=bbox,
+            tbox=tbox,
+            convex_hull=convex_hull,
+            details=details,
+            throttle=throttle,
+            timeout=timeout,
+            download_data=download_data,
+            # Interleaved progress bars of concurrent resources are unreadable
+            show_progress=show_progress and not concurrent,
+            recursive=recursive,
+            include_geojsonio=include_geojsonio,
+            max_download_size=max_download_size,
+            max_download_method=max_download_method,
+            max_download_method_seed=max_download_method_seed,
+            placename=placename,
+            placename_escape=placename_escape,
+            download_skip_nogeo=download_skip_nogeo,
+            download_skip_nogeo_exts=download_skip_nogeo_exts,
+            max_download_workers=max_download_workers,
+            keep_files=keep_files,
+            assume_wgs84=assume_wgs84,
+            metadata_first=metadata_first,
+            metadata_fallback=metadata_fallback,
+            time_format=time_format,
+            follow=follow,
+            download_size_soft_limit=download_size_soft_limit,
+            workers=workers,
+            extraction_cache=extraction_cache,
+            remote_open=remote_open,
+            progress_callback=progress_callback,
+        )
+
+    # Process each remote identifier. Provider metadata requests go through
+    # the persistent HTTP cache and file downloads through the download
+    # store when one is given.
+    with use_http_cache(http_cache), use_download_store(download_store):
+        if concurrent:
+            logger.info(
+                f"Processing {len(remote_identifiers)} remote resources with "
+                f"{remote_workers} workers, at most {max_per_host} per host"
             )
-            if resource_output is not None:
-                resource_output["format"] = "remote"
-                output["details"][identifier] = resource_output
-                output["extraction_metadata"]["successful"] += 1
-        except Exception as e:
-            # Let DownloadSizeExceeded propagate so callers can prompt
-            from .exceptions import DownloadSizeExceeded
+            outcomes = _map_per_host(
+                _extract_one,
+                remote_identifiers,
+                workers=remote_workers,
+                max_per_host=max_per_host,
+                host_of=_identifier_host,
+            )
+        else:
+            outcomes = None
 
+        # Results are recorded in input order, so details are deterministic
+        # whatever order concurrent resources finish in.
+        from .exceptions import DownloadSizeExceeded
+
+        for index, identifier in enumerate(remote_identifiers):
+            if outcomes is not None:
+                ok, value = outcomes[index]
+            else:
+                try:
+                    ok, value = True, _extract_one(identifier)
+                except Exception as e:
+                    ok, value = False, e
+
+            if ok:
+                if value is not None:
+                    value["format"] = "remote"
+                    output["details"][identifier] = value
+                    output["extraction_metadata"]["successful"] += 1
+                continue
+
+            e = value
+            # Let DownloadSizeExceeded propagate so callers can prompt
             if isinstance(e, DownloadSizeExceeded):
-                raise
+                raise e
             logger.warning(f"Error processing {identifier}: {str(e)}")
             # Stash the original exception under an internal key so the
             # single-resource path can re-raise it with its true type
@@ -1649,7 +2222,6 @@ def from_remote(
             # multi-resource return so it never reaches JSON serialization.
             output["details"][identifier] = {"error": str(e), "_exception": e}
             output["extraction_metadata"]["failed"] += 1
-            continue
 
     # Merge spatial extents if bbox is requested
     if bbox:
@@ -1678,18 +2250,38 @@ def from_remote(
 
     # Retrieve external metadata for all resources if requested
     if ext_metadata:
-        for identifier in remote_identifiers:
-            if (
-                identifier in output["details"]
-                and "error" not in output["details"][identifier]
-            ):
-                details_entry = output["details"][identifier]
-                lookup_id = _identifier_for_enrichment(identifier, details_entry)
-                metadata = external_metadata.get_external_metadata(
-                    lookup_id, method=ext_metadata_method
-                )
-                # Always include external_metadata as an array (even if empty)
-                details_entry["external_metadata"] = metadata
+        enrich = [
+            identifier
+            for identifier in dict.fromkeys(remote_identifiers)
+            if identifier in output["details"]
+            and "error" not in output["details"][identifier]
+        ]
+
+        def _lookup(identifier):
+            lookup_id = _identifier_for_enrichment(
+                identifier, output["details"][identifier]
+            )
+            return external_metadata.get_external_metadata(
+                lookup_id, method=ext_metadata_method
+            )
+
+        if concurrent and len(enrich) > 1:
+            # All lookups go to CrossRef / DataCite: one host budget
+            lookups = _map_per_host(
+                _lookup,
+                enrich,
+                workers=remote_workers,
+                max_per_host=max_per_host,
+                host_of=lambda _identifier: "external_metadata",
+            )
+        else:
+            lookups = [(True, _lookup(identifier)) for identifier in enrich]
+
+        for identifier, (ok, metadata) in zip(enrich, lookups):
+            if not ok:
+                raise metadata
+            # Always include external_metadata as an array (even if empty)
+            output["details"][identifier]["external_metadata"] = metadata
 
     logger.info(
         f"Extraction complete: {output['extraction_metadata']['successful']} successful, "
@@ -1781,6 +2373,9 @@ def _process_remote_download(
     download_size_soft_limit=False,
     workers=1,
     progress_callback=None,
+    extraction_cache=None,
+    remote_open=False,
+    keep_files=False,
 ):
     """
     Shared logic for processing remote downloads and extracting metadata.
@@ -1797,6 +2392,11 @@ def _process_remote_download(
         metadata_fallback: If True and download_data is True, automatically fall back
             to metadata-only extraction when download yields no files and the provider
             supports metadata extraction. (default True)
+        remote_open: If True, files whose extent can be read with HTTP range
+            requests are opened remotely instead of being downloaded (default False)
+        keep_files: If True, extents providers take from repository metadata are
+            written to *tmp* as GeoJSON files instead of being collected in
+            memory, so that they are kept with the downloaded files (default False)
         (other parameters as documented in _extract_from_remote)
 
     Returns:
@@ -1844,6 +2444,11 @@ def _process_remote_download(
 
     # Set soft limit flag on provider so it can raise DownloadSizeExceeded
     repository._download_size_soft_limit = download_size_soft_limit
+    # The download engine checks advertised sizes against the limit
+    repository._max_download_bytes = max_size_bytes
+
+    # Header-only formats are read in place (see remote_open)
+    repository._remote_open = remote_open
 
     # Warn when size limit is set but provider is metadata-only (no data download)
     if (
@@ -1860,22 +2465,71 @@ def _process_remote_download(
     # Suppress show_progress for children when callback handles progress
     _child_show_progress = show_progress if progress_callback is None else False
 
-    # Download files from repository
-    repository.download(
-        tmp,
-        throttle,
-        download_data,
-        _child_show_progress,
-        max_size_bytes=max_size_bytes,
-        max_download_method=max_download_method,
-        max_download_method_seed=max_download_method_seed,
-        download_skip_nogeo=download_skip_nogeo,
-        download_skip_nogeo_exts=download_skip_nogeo_exts,
-        max_download_workers=max_download_workers,
-        progress_callback=progress_callback,
-        **_follow_kwargs,
+    # Downloads land in a fresh temporary directory on every run, so cached
+    # results are looked up by file content rather than path and mtime.
+    remote_cache = resolve_extraction_cache(extraction_cache, key_mode="content")
+
+    # Files are extracted as soon as their download completes, while the
+    # provider keeps downloading the rest; from_directory below picks up
+    # these results instead of extracting the files again.
+    pipeline_kwargs = _directory_file_kwargs(
+        bbox,
+        tbox,
+        convex_hull,
+        include_geojsonio=include_geojsonio,
+        placename=placename,
+        placename_escape=placename_escape,
+        assume_wgs84=assume_wgs84,
+        time_format=time_format,
     )
 
+    def _pipeline_accepts(path):
+        import patoolib
+
+        parents = os.path.relpath(os.path.dirname(path), tmp).split(os.sep)
+        if not recursive and parents != ["."]:
+            return False
+        if any(part.endswith((".gdb", ".zarr")) for part in parents):
+            return False
+        return not _is_auxiliary_file(
+            os.path.basename(path)
+        ) and not patoolib.is_archive(path)
+
+    pipeline = ExtractionPipeline(
+        lambda path: _from_file_cached(path, remote_cache, **pipeline_kwargs),
+        workers=workers or os.cpu_count() or 1,
+        accept=_pipeline_accepts,
+    )
+
+    # Download files from repository. Extents providers derive from their
+    # catalogue metadata are handed over in memory (see
+    # ContentProvider._emit_metadata_extent) instead of as GeoJSON files,
+    # unless the files are kept.
+    metadata_extents = None if keep_files else []
+    repository._download_listener = pipeline
+    repository._metadata_extents = metadata_extents
+    try:
+        repository.download(
+            tmp,
+            throttle,
+            download_data,
+            _child_show_progress,
+            max_size_bytes=max_size_bytes,
+            max_download_method=max_download_method,
+            max_download_method_seed=max_download_method_seed,
+            download_skip_nogeo=download_skip_nogeo,
+            download_skip_nogeo_exts=download_skip_nogeo_exts,
+            max_download_workers=max_download_workers,
+            progress_callback=progress_callback,
+            **_follow_kwargs,
+        )
+    except BaseException:
+        pipeline.close()
+        raise
+    finally:
+        repository._download_listener = None
+        repository._metadata_extents = None
+
     # Automatic metadata fallback: if data download yielded no files and the
     # provider supports metadata extraction, re-download with metadata only.
     if (
@@ -1883,6 +2537,7 @@ def _process_remote_download(
         and metadata_fallback
         and repository.supports_metadata_extraction
         and not os.listdir(tmp)
+        and not metadata_extents
     ):
         logger.warning(
             "No data files found after download from %s. "
@@ -1895,41 +2550,57 @@ def _process_remote_download(
         if hasattr(repository, "_try_follow_reference"):
             _fallback_follow_kwargs["follow"] = False
 
-        repository.download(
-            tmp,
-            throttle,
-            False,  # download_data=False
-            _child_show_progress,
-            max_size_bytes=max_size_bytes,
-            max_download_method=max_download_method,
-            max_download_method_seed=max_download_method_seed,
-            download_skip_nogeo=download_skip_nogeo,
-            download_skip_nogeo_exts=download_skip_nogeo_exts,
-            max_download_workers=max_download_workers,
-            progress_callback=progress_callback,
-            **_fallback_follow_kwargs,
-        )
+        repository._metadata_extents = metadata_extents
+        try:
+            repository.download(
+                tmp,
+                throttle,
+                False,  # download_data=False
+                _child_show_progress,
+                max_size_bytes=max_size_bytes,
+                max_download_method=max_download_method,
+                max_download_method_seed=max_download_method_seed,
+                download_skip_nogeo=download_skip_nogeo,
+                download_skip_nogeo_exts=download_skip_nogeo_exts,
+                max_download_workers=max_download_workers,
+                progress_callback=progress_callback,
+                **_fallback_follow_kwargs,
+            )
+        finally:
+            repository._metadata_extents = None
         _used_metadata_fallback = True
 
     # Extract metadata from downloaded files
-    metadata = from_directory(
-        tmp,
-        bbox,
-        tbox,
-        convex_hull,
-        details,
-        timeout,
-        show_progress=_child_show_progress,
-        recursive=recursive,
-        include_geojsonio=include_geojsonio,
-        placename=placename,
-        placename_escape=placename_escape,
-        assume_wgs84=assume_wgs84,
-        time_format=time_format,
-        workers=workers,
-        progress_callback=progress_callback,
-        _internal=True,
-    )
+    with pipeline:
+        metadata = from_directory(
+            tmp,
+            bbox,
+            tbox,
+            convex_hull,
+            details,
+            timeout,
+            show_progress=_child_show_progress,
+            recursive=recursive,
+            include_geojsonio=include_geojsonio,
+            placename=placename,
+            placename_escape=placename_escape,
+            assume_wgs84=assume_wgs84,
+            time_format=time_format,
+            workers=workers,
+            extraction_cache=remote_cache,
+            progress_callback=progress_callback,
+            _internal=True,
+            _prefetched=pipeline.results(),
+            _metadata_extents=metadata_extents,
+            # Downloaded archives get the same file selection as the download
+            _archive_selection=dict(
+                skip_nogeo=download_skip_nogeo,
+                additional_extensions=download_skip_nogeo_exts,
+                max_size=max_size_bytes,
+                method=max_download_method,
+                seed=max_download_method_seed,
+            ),
+        )
 
     # Second metadata fallback: files were downloaded but yielded no extent.
     # This happens when data files exist but lack geospatial content (e.g.,
@@ -1958,25 +2629,31 @@ def _process_remote_download(
                 shutil.rmtree(item_path)
             else:
                 os.remove(item_path)
+        if metadata_extents is not None:
+            del metadata_extents[:]
 
         _fallback_follow_kwargs = {}
         if hasattr(repository, "_try_follow_reference"):
             _fallback_follow_kwargs["follow"] = False
 
-        repository.download(
-            tmp,
-            throttle,
-            False,  # download_data=False
-            _child_show_progress,
-            max_size_bytes=max_size_bytes,
-            max_download_method=max_download_method,
-            max_download_method_seed=max_download_method_seed,
-            download_skip_nogeo=download_skip_nogeo,
-            download_skip_nogeo_exts=download_skip_nogeo_exts,
-            max_download_workers=max_download_workers,
-            progress_callback=progress_callback,
-            **_fallback_follow_kwargs,
-        )
+        repository._metadata_extents = metadata_extents
+        try:
+            repository.download(
+                tmp,
+                throttle,
+                False,  # download_data=False
+                _child_show_progress,
+                max_size_bytes=max_size_bytes,
+                max_download_method=max_download_method,
+                max_download_method_seed=max_download_method_seed,
+                download_skip_nogeo=download_skip_nogeo,
+                download_skip_nogeo_exts=download_skip_nogeo_exts,
+                max_download_workers=max_download_workers,
+                progress_callback=progress_callback,
+                **_fallback_follow_kwargs,
+            )
+        finally:
+            repository._metadata_extents = None
         _used_metadata_fallback = True
 
         metadata = from_directory(
@@ -1994,8 +2671,10 @@ def _process_remote_download(
             assume_wgs84=assume_wgs84,
             time_format=time_format,
             workers=workers,
+            extraction_cache=remote_cache,
             progress_callback=progress_callback,
             _internal=True,
+            _metadata_extents=metadata_extents,
         )
 
     if _used_metadata_fallback:
@@ -2046,6 +2725,8 @@ def _metadata_first_extract(
     download_size_soft_limit=False,
     workers=1,
     progress_callback=None,
+    extraction_cache=None,
+    remote_open=False,
 ):
     """Try metadata-only extraction first, fall back to data download if needed.
 
@@ -2082,6 +2763,8 @@ def _metadata_first_extract(
         follow=follow,
         download_size_soft_limit=download_size_soft_limit,
         workers=workers,
+        extraction_cache=extraction_cache,
+        remote_open=remote_open,
         progress_callback=progress_callback,
     )
 
@@ -2151,7 +2834,7 @@ def _metadata_first_extract(
         logger.info(f"Created persistent directory (will NOT be cleaned up): {tmp}")
         try:
             metadata = _process_remote_download(
-                tmp=tmp, download_data=True, **_common_kwargs
+                tmp=tmp, download_data=True, keep_files=True, **_common_kwargs
             )
             metadata["extraction_method"] = "download"
             logger.info(f"Files kept in: {tmp}")
@@ -2194,6 +2877,8 @@ def _extract_from_remote(
     download_size_soft_limit=False,
     workers=1,
     progress_callback=None,
+    extraction_cache=None,
+    remote_open=False,
 ):
     """
     Internal method to extract extent from a single remote identifier.
@@ -2213,7 +2898,7 @@ def _extract_from_remote(
 
     from .content_providers.providers import find_provider
 
-    repository = find_provider(remote_identifier, _get_content_providers())
+    repository = find_provider(remote_identifier, manifest.PROVIDERS)
     supported_by_geoextent = repository is not None
 
     if supported_by_geoextent:
@@ -2261,6 +2946,8 @@ def _extract_from_remote(
                 follow=follow,
                 download_size_soft_limit=download_size_soft_limit,
                 workers=workers,
+                extraction_cache=extraction_cache,
+                remote_open=remote_open,
                 progress_callback=progress_callback,
             )
             return metadata
@@ -2300,6 +2987,8 @@ def _extract_from_remote(
                         follow=follow,
                         download_size_soft_limit=download_size_soft_limit,
                         workers=workers,
+                        extraction_cache=extraction_cache,
+                        remote_open=remote_open,
                         progress_callback=progress_callback,
                     )
 
@@ -2350,7 +3039,10 @@ def _extract_from_remote(
                     follow=follow,
                     download_size_soft_limit=download_size_soft_limit,
                     workers=workers,
+                    extraction_cache=extraction_cache,
+                    remote_open=remote_open,
                     progress_callback=progress_callback,
+                    keep_files=True,
                 )
 
                 logger.info(f"Files kept in: {tmp}")
@@ -0,0 +1,283 @@
+"""Persistent on-disk cache of per-file extraction results.
+
+Re-running geoextent over a mostly unchanged directory or repository used to
+extract every file from scratch. An :class:`ExtractionCache` stores the
+result of :func:`geoextent.lib.extent.from_file` in a SQLite database and
+returns it on later runs as long as the file and the extraction options are
+unchanged.
+
+Entries are keyed on
+
+* the file identity — ``(absolute path, size, mtime)`` with
+  ``key_mode="stat"``, or the SHA-256 of the file content with
+  ``key_mode="content"`` (needed for downloads, which land in a fresh
+  temporary directory on every run), together with the name and identity
+  of every sidecar next to it (``.prj``, ``.dbf``, world files, ...),
+* the handler version — the geoextent and GDAL versions, since either can
+  change extraction results, and
+* the extraction options (``bbox``, ``tbox``, ``convex_hull``,
+  ``time_format``, ``assume_wgs84``, text extraction settings, ...).
+
+The cache is opt-in: ``from_directory(..., extraction_cache=True)`` (CLI:
+``--cache``) uses the default location, see :func:`default_cache_path`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from . import archives
+from . import helpfunctions as hf
+
+logger = logging.getLogger("geoextent")
+
+#: Bump when the stored result format changes.
+CACHE_SCHEMA_VERSION = 1
+
+_DEFAULT_FILENAME = "extraction-cache.sqlite"
+
+#: from_file keyword arguments that do not influence the extraction result
+#: (progress display, in-memory caches shared between files).
+_IGNORED_OPTIONS = frozenset(
+    {
+        "show_progress",
+        "progress_callback",
+        "gazetteer_cache",
+        "period_cache",
+    }
+)
+
+# Read files in 1 MiB blocks when hashing content.
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def default_cache_path():
+    """Return the default location of the extraction cache database."""
+    return os.path.join(hf.get_cache_dir(), _DEFAULT_FILENAME)
+
+
+def _handler_version():
+    try:
+        from geoextent import __version__ as geoextent_version
+    except ImportError:
+        geoextent_version = "unknown"
+    try:
+        from osgeo import gdal
+
+        gdal_version = gdal.__version__
+    except ImportError:
+        gdal_version = "unknown"
+    return "{}|gdal-{}|schema-{}".format(
+        geoextent_version, gdal_version, CACHE_SCHEMA_VERSION
+    )
+
+
+def _file_sha256(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """SQLite-backed cache of ``from_file`` results.
+
+    Safe to share between threads (each thread uses its own connection) and
+    between processes (SQLite locking); instances are picklable so they can
+    be handed to process-pool workers.
+
+    Args:
+        path: database file (default: :func:`default_cache_path`)
+        key_mode: ``"stat"`` to identify files by path, size and mtime, or
+            ``"content"`` to identify them by a SHA-256 of their content
+    """
+
+    def __init__(self, path=None, key_mode="stat"):
+        if key_mode not in ("stat", "content"):
+            raise ValueError(
+                "Invalid key_mode {!r}, use 'stat' or 'content'".format(key_mode)
+            )
+        self.path = path or default_cache_path()
+        self.key_mode = key_mode
+        self._local = threading.local()
+        self._handler_version = _handler_version()
+
+    def __getstate__(self):
+        return {"path": self.path, "key_mode": self.key_mode}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["key_mode"])
+
+    def __repr__(self):
+        return "ExtractionCache({!r}, key_mode={!r})".format(self.path, self.key_mode)
+
+    def with_key_mode(self, key_mode):
+        """Return a cache on the same database using *key_mode*."""
+        if key_mode == self.key_mode:
+            return self
+        return ExtractionCache(self.path, key_mode=key_mode)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                " key TEXT PRIMARY KEY,"
+                " file_id TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " created REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _file_id(self, filepath):
+        if self.key_mode == "content":
+            return "sha256:" + _file_sha256(filepath)
+        stat = os.stat(filepath)
+        return "stat:{}|{}|{}".format(
+            os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns
+        )
+
+    def key_for(self, filepath, options):
+        """Return the cache key for *filepath* extracted with *options*.
+
+        Returns ``None`` when the file cannot be identified (e.g. it is a
+        directory such as a ``.gdb`` or ``.zarr`` store, or unreadable).
+        """
+        if not os.path.isfile(filepath):
+            return None
+        try:
+            file_id = self._file_id(filepath)
+            # Sidecars (.prj, .dbf, world files, ...) change the extent too
+            sidecars = [
+                "{}={}".format(os.path.basename(sidecar), self._file_id(sidecar))
+                for sidecar in archives.same_stem_files(filepath)
+            ]
+            if sidecars:
+                file_id += "|sidecars:" + ",".join(sidecars)
+        except OSError as e:
+            logger.debug("Cannot build cache key for {}: {}".format(filepath, e))
+            return None
+
+        relevant = {
+            k: v for k, v in sorted(options.items()) if k not in _IGNORED_OPTIONS
+        }
+        # The file name still matters with content keys: it selects format
+        # and handler (e.g. .csv vs .txt with identical bytes).
+        relevant["_name"] = os.path.basename(filepath)
+        payload = json.dumps(
+            [file_id, self._handler_version, relevant], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest(), file_id
+
+    def get(self, key):
+        """Return ``(True, result)`` on a hit, ``(False, None)`` on a miss."""
+        if key is None:
+            return False, None
+        try:
+            row = (
+                self._connection()
+                .execute("SELECT result FROM extractions WHERE key = ?", (key[0],))
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.debug("Extraction cache lookup failed: {}".format(e))
+            return False, None
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def put(self, key, result):
+        """Store *result* (a JSON-serialisable ``from_file`` result or None)."""
+        if key is None:
+            return
+        try:
+            payload = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            logger.debug("Not caching non-serialisable result: {}".format(e))
+            return
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO extractions (key, file_id, result, created)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key[0], key[1], payload, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.debug("Extraction cache write failed: {}".format(e))
+
+    def clear(self):
+        """Remove all cached entries."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM extractions")
+
+    def close(self):
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def resolve_extraction_cache(extraction_cache, key_mode=None):
+    """Normalise the ``extraction_cache`` argument of the public API.
+
+    Accepts ``None``/``False`` (disabled), ``True`` (default location), a
+    database path, or an :class:`ExtractionCache`. With *key_mode* the
+    returned cache uses that key mode.
+    """
+    if extraction_cache is None or extraction_cache is False:
+        return None
+    if extraction_cache is True:
+        cache = ExtractionCache()
+    elif isinstance(extraction_cache, ExtractionCache):
+        cache = extraction_cache
+    elif isinstance(extraction_cache, (str, os.PathLike)):
+        cache = ExtractionCache(os.fspath(extraction_cache))
+    else:
+        raise TypeError(
+            "extraction_cache must be a bool, a path or an ExtractionCache, "
+            "got {}".format(type(extraction_cache).__name__)
+        )
+    if key_mode is not None:
+        cache = cache.with_key_mode(key_mode)
+    return cache
+
+
+def cached_extract(extract, filepath, extraction_cache, **options):
+    """Call ``extract(filepath, **options)`` through *extraction_cache*.
+
+    Without a cache this is a plain call. Results (including ``None`` for
+    unsupported files) are stored; exceptions are not, and neither are
+    results of an extraction that reported a swallowed error through its
+    ``_errors`` list (e.g. a gazetteer or network failure), so a transient
+    failure is retried by the next run.
+    """
+    if extraction_cache is None:
+        return extract(filepath, **options)
+    key = extraction_cache.key_for(filepath, options)
+    hit, result = extraction_cache.get(key)
+    if hit:
+        logger.debug("Extraction cache hit for {}".format(filepath))
+        return result
+    errors = []
+    result = extract(filepath, _errors=errors, **options)
+    if errors:
+        logger.debug(
+            "Not caching the result for {} after errors: {}".format(filepath, errors)
+        )
+    else:
+        extraction_cache.put(key, result)
+    return result
@@ -251,9 +251,8 @@ def validate_remote_identifier(identifier: str) -> Dict[str, Any]:
     """
     Validate a remote identifier and determine which provider supports it.
 
-    Delegates to ``find_provider()`` using the canonical provider list from
-    ``_get_content_providers()``, eliminating the need for a duplicate
-    hardcoded provider list.
+    Delegates to ``find_provider()`` using the provider manifest, eliminating
+    the need for a duplicate hardcoded provider list.
 
     Args:
         identifier: URL, DOI, or other identifier to validate
@@ -264,11 +263,10 @@ def validate_remote_identifier(identifier: str) -> Dict[str, Any]:
             - provider: str or None, name of the supporting provider
             - message: str, description of the result
     """
-    from .extent import _get_content_providers
+    from .content_providers import manifest
     from .content_providers.providers import find_provider
 
-    providers = _get_content_providers()
-    provider = find_provider(identifier, providers)
+    provider = find_provider(identifier, manifest.PROVIDERS)
 
     if provider is not None:
         return {
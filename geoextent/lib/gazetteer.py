@@ -7,6 +7,7 @@ converting geographic coordinates to place names.
 
 import logging
 import os
+import threading
 from typing import Optional, Tuple, Dict, Any, List
 from geopy.geocoders import GeoNames, Nominatim, Photon
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
@@ -17,6 +18,22 @@ logger = logging.getLogger("geoextent")
 # Load environment variables from .env file
 load_dotenv()
 
+# Number of lookups whose service error was swallowed (logged and answered
+# with no result); callers compare it before/after to spot transient failures.
+_lookup_failures = 0
+_lookup_failures_lock = threading.Lock()
+
+
+def _record_lookup_failure():
+    global _lookup_failures
+    with _lookup_failures_lock:
+        _lookup_failures += 1
+
+
+def lookup_failures() -> int:
+    """Return the number of gazetteer lookups that failed in this process."""
+    return _lookup_failures
+
 
 class GazetteerService:
     """Base class for gazetteer services."""
@@ -123,6 +140,7 @@ class GeoNamesService(GazetteerService):
             if location:
                 return location.address
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            _record_lookup_failure()
             logger.warning(
                 "GeoNames reverse-geocoding via api.geonames.org failed for "
                 "(%s, %s): %s",
@@ -131,6 +149,7 @@ class GeoNamesService(GazetteerService):
                 e,
             )
         except Exception as e:
+            _record_lookup_failure()
             logger.error(
                 "Unexpected error in GeoNames reverse-geocoding via "
                 "api.geonames.org for (%s, %s): %s",
@@ -144,6 +163,7 @@ class GeoNamesService(GazetteerService):
         try:
             results = self.geocoder.geocode(query, exactly_one=False, timeout=10)
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            _record_lookup_failure()
             logger.warning(
                 "GeoNames forward geocoding via api.geonames.org failed " "for %r: %s",
                 query,
@@ -151,6 +171,7 @@ class GeoNamesService(GazetteerService):
             )
             return []
         except Exception as e:
+            _record_lookup_failure()
             logger.error(
                 "Unexpected error in GeoNames forward geocoding via "
                 "api.geonames.org for %r: %s",
@@ -199,6 +220,7 @@ class NominatimService(GazetteerService):
             if location:
                 return location.address
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            _record_lookup_failure()
             logger.warning(
                 "Nominatim reverse-geocoding via nominatim.openstreetmap.org "
                 "failed for (%s, %s): %s",
@@ -207,6 +229,7 @@ class NominatimService(GazetteerService):
                 e,
             )
         except Exception as e:
+            _record_lookup_failure()
             logger.error(
                 "Unexpected error in Nominatim reverse-geocoding via "
                 "nominatim.openstreetmap.org for (%s, %s): %s",
@@ -230,6 +253,7 @@ class NominatimService(GazetteerService):
                 geometry="geojson",
             )
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            _record_lookup_failure()
             logger.warning(
                 "Nominatim forward geocoding via nominatim.openstreetmap.org "
                 "failed for %r: %s",
@@ -238,6 +262,7 @@ class NominatimService(GazetteerService):
             )
             return []
         except Exception as e:
+            _record_lookup_failure()
             logger.error(
                 "Unexpected error in Nominatim forward geocoding via "
                 "nominatim.openstreetmap.org for %r: %s",
@@ -300,6 +325,7 @@ class PhotonService(GazetteerService):
             if location:
                 return location.address
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            _record_lookup_failure()
             logger.warning(
                 "Photon reverse-geocoding via %s failed for (%s, %s): %s",
                 self.geocoder.domain,
@@ -308,6 +334,7 @@ class PhotonService(GazetteerService):
                 e,
             )
         except Exception as e:
+            _record_lookup_failure()
             logger.error(
                 "Unexpected error in Photon reverse-geocoding via %s for "
                 "(%s, %s): %s",
@@ -324,6 +351,7 @@ class PhotonService(GazetteerService):
                 query, exactly_one=False, timeout=10, limit=limit
             )
         except (GeocoderTimedOut, GeocoderServiceError) as e:
+            _record_lookup_failure()
             logger.warning(
                 "Photon forward geocoding via %s failed for %r: %s",
                 self.geocoder.domain,
@@ -332,6 +360,7 @@ class PhotonService(GazetteerService):
             )
             return []
         except Exception as e:
+            _record_lookup_failure()
             logger.error(
                 "Unexpected error in Photon forward geocoding via %s for " "%r: %s",
                 self.geocoder.domain,
@@ -555,6 +584,7 @@ def get_placename_for_geometry(
         return placename
 
     except Exception as e:
+        _record_lookup_failure()
         logger.error(
             "Error extracting placename via %s reverse-geocoding: %s",
             service_name,
@@ -629,8 +659,11 @@ def forward_geocode_names(
         if key in cache:
             hits = cache[key]
         else:
+            failures = lookup_failures()
             hits = service.geocode(name, limit=limit)
-            cache[key] = hits
+            # Keep failed lookups out of the cache so they are retried.
+            if lookup_failures() == failures:
+                cache[key] = hits
 
         if not hits:
             out.append((name, None, hits))
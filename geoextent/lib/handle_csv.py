@@ -1,11 +1,20 @@
+import collections
 import csv
+import functools
+import io
 import logging
 import os
 import re
 import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
 from osgeo import gdal, ogr, osr
 from . import helpfunctions as hf
 
+hf.ogr_osr()  # enable GDAL exceptions
+
 logger = logging.getLogger("geoextent")
 
 # Column name patterns for GDAL CSV open options.
@@ -49,6 +58,9 @@ search = {
     "time": ["(.)*timestamp(.)*", "(.)*datetime(.)*", "(.)*time(.)*", "date$", "^date"],
 }
 
+# Column name patterns of CRS columns (values like "4326")
+_CRS_PATTERNS = ["crs", "srsID", "EPSG"]
+
 
 def _strip_geocsv_headers(filepath):
     """Strip EarthScope GeoCSV ``#``-prefixed header lines from a CSV file.
@@ -331,169 +343,432 @@ def _extract_bbox_via_gdal(filepath):
         return None
 
 
-def _extract_bbox_from_geometry_column(file_path, chunk_size=50000):
-    """
-    Extract bounding box from geometry column containing WKT data.
-    input "file_path": type string, file path to csv file
-    returns spatialExtent: type dict, contains bbox and crs
+class HeaderRoles(
+    collections.namedtuple(
+        "HeaderRoles", ["geometry", "latitude", "longitude", "crs", "time"]
+    )
+):
+    """Columns of a CSV header used for extent extraction.
+
+    Attributes:
+        geometry: index of the WKT/WKB geometry column, or ``None``
+        latitude, longitude: sorted indices of the coordinate columns
+        crs, time: ``(name, indices)`` groups in pattern priority order; a
+            group holds all columns whose name contains the matched name,
+            like ``hf.search_for_parameters`` (which repeats a group for
+            every pattern the name matches)
     """
 
-    with open(file_path) as csv_file:
-        delimiter = hf.get_delimiter(csv_file)
-        data = csv.reader(csv_file, delimiter=delimiter)
+    @property
+    def columns(self):
+        """Sorted indices of all columns with a role."""
+        used = set(self.latitude) | set(self.longitude)
+        for _, indices in self.crs + self.time:
+            used.update(indices)
+        if self.geometry is not None:
+            used.add(self.geometry)
+        return sorted(used)
 
-        header = next(data)
-        chunk = [header]
 
-        # Find geometry column index - prioritize best match
-        # Check all columns and find the one with the most specific pattern match
-        geometry_col_idx = None
-        best_pattern_priority = len(
-            search["geometry"]
-        )  # Lower number = higher priority
+class ColumnClassifier:
+    """Assigns CSV header columns to extent roles by the ``search`` patterns.
+
+    The patterns are compiled once; each distinct header is classified once
+    and cached, so the bbox, CRS and time extraction and files sharing a
+    header (e.g. the tiles of one dataset) reuse the result.
 
+    Args:
+        patterns: dict of role → regular expressions, like ``search``
+        crs_patterns: regular expressions of CRS column names
+    """
+
+    def __init__(self, patterns, crs_patterns, cache_size=256):
+        self._patterns = {
+            role: [re.compile(p, re.IGNORECASE) for p in role_patterns]
+            for role, role_patterns in patterns.items()
+        }
+        self._patterns["crs"] = [re.compile(p, re.IGNORECASE) for p in crs_patterns]
+        self._classify = functools.lru_cache(maxsize=cache_size)(self._classify_header)
+
+    def classify(self, header):
+        """Return the :class:`HeaderRoles` of *header* (a sequence of column names)."""
+        return self._classify(tuple(header))
+
+    def _groups(self, header, role):
+        groups = {}
+        for p in self._patterns[role]:
+            for name in header:
+                if name not in groups and p.search(name) is not None:
+                    groups[name] = [
+                        idx for idx, other in enumerate(header) if name in other
+                    ]
+        return list(groups.items())
+
+    def _geometry_column(self, header):
+        # The column matching the earliest (most specific) pattern wins;
+        # ties go to the leftmost column
+        best_idx, best_priority = None, len(self._patterns["geometry"])
         for idx, col_name in enumerate(header):
-            for pattern_priority, pattern in enumerate(search["geometry"]):
-                p = re.compile(pattern, re.IGNORECASE)
+            for priority, p in enumerate(self._patterns["geometry"][:best_priority]):
                 if p.search(col_name) is not None:
-                    # Found a match - keep it if it's better (lower priority number) than current best
-                    if pattern_priority < best_pattern_priority:
-                        geometry_col_idx = idx
-                        best_pattern_priority = pattern_priority
-                        logger.debug(
-                            f"Found geometry column candidate: '{col_name}' (index {idx}) matching pattern '{pattern}' (priority {pattern_priority})"
-                        )
-                    break  # Stop checking patterns for this column, move to next column
+                    best_idx, best_priority = idx, priority
+                    logger.debug(
+                        f"Found geometry column candidate: '{col_name}' (index {idx}) matching pattern '{p.pattern}' (priority {priority})"
+                    )
+                    break
+        return best_idx
+
+    def _classify_header(self, header):
+        def indices(role):
+            return sorted({i for _, cols in self._groups(header, role) for i in cols})
+
+        return HeaderRoles(
+            geometry=self._geometry_column(header),
+            latitude=indices("latitude"),
+            longitude=indices("longitude"),
+            crs=self._groups(header, "crs"),
+            time=self._groups(header, "time"),
+        )
 
-        if geometry_col_idx is None:
-            return None
 
-        min_x, min_y, max_x, max_y = (
-            float("inf"),
-            float("inf"),
-            float("-inf"),
-            float("-inf"),
+#: Classifier for the column names in ``search`` (shared by all files).
+column_classifier = ColumnClassifier(search, _CRS_PATTERNS)
+
+
+class _CsvScan:
+    """Extent information collected by one pass over a CSV file.
+
+    Attributes:
+        geometry_bbox: ``[minx, miny, maxx, maxy]`` of the geometry column,
+            or ``None``
+        lon_range, lat_range: ``[min, max]`` of the longitude / latitude
+            columns, or ``None`` when the file has no such values
+        crs_values: values of the ``crs`` / ``srsID`` / ``EPSG`` columns
+        has_time_columns: True if the header has time columns with
+            recognisable dates
+        time_range: ``[min, max]`` timestamps of the time columns, or ``None``
+    """
+
+    def __init__(self):
+        self.geometry_bbox = None
+        self.lon_range = None
+        self.lat_range = None
+        self.crs_values = set()
+        self.has_time_columns = False
+        self.time_range = None
+
+
+def _update_range(current, values):
+    if len(values) == 0:
+        return current
+    low, high = values.min(), values.max()
+    if current is None:
+        return [low, high]
+    return [min(current[0], low), max(current[1], high)]
+
+
+def _numeric_values(numeric, columns):
+    """Return the non-zero values of *columns* in the *numeric* column dict."""
+    if not columns:
+        return pd.Series(dtype=float)
+    values = pd.concat([numeric[idx] for idx in columns], ignore_index=True)
+    # Zero counts as missing, as in hf.get_all_row_elements
+    return values[values.notna() & (values != 0)]
+
+
+def _group_values(chunk, groups):
+    """Return the values of the column *groups* in *chunk*, as hf.get_all_row_elements does.
+
+    Spaces are removed; cells equal to the matched column name are dropped.
+    """
+    values = [
+        column[column != name]
+        for name, indices in groups
+        for column in (chunk[idx].str.replace(" ", "", regex=False) for idx in indices)
+    ]
+    if not values:
+        return pd.Series(dtype=str)
+    return pd.concat(values, ignore_index=True)
+
+
+def _geometry_envelope(values):
+    """Return ``[minx, miny, maxx, maxy]`` of the WKT/WKB *values*, or ``None``."""
+    min_x, min_y, max_x, max_y = (
+        float("inf"),
+        float("inf"),
+        float("-inf"),
+        float("-inf"),
+    )
+    for value in values:
+        geom = _parse_geometry_from_value(value)
+        if geom:
+            envelope = geom.GetEnvelope()  # (minX, maxX, minY, maxY)
+            min_x = min(min_x, envelope[0])
+            max_x = max(max_x, envelope[1])
+            min_y = min(min_y, envelope[2])
+            max_y = max(max_y, envelope[3])
+    if min_x == float("inf") or min_y == float("inf"):
+        return None
+    return [min_x, min_y, max_x, max_y]
+
+
+def _non_empty(values):
+    # Empty cells parse as NaT with any format and would "match" the first
+    return values[values != ""].tolist()
+
+
+def _detect_time_columns(chunk, groups, num_sample):
+    """Return the time column groups of *groups* and their format.
+
+    Like ``hf.search_for_parameters(..., exp_data="time")`` followed by
+    ``hf.date_parser``, on the values of *chunk*: a group is kept if
+    ``hf.get_time_format`` recognises its values, the format is then
+    inferred from the values of all kept groups. Formats are cached by
+    column signature (``hf.get_time_format`` with *column*), so files
+    sharing a layout skip the inference. Empty cells are ignored. Returns
+    ``([], None)`` when no format is found.
+    """
+    kept = []
+    for group in groups:
+        values = _non_empty(_group_values(chunk, [group]))
+        if values and hf.get_time_format(values, 30, column=group[0]) is not None:
+            kept.append(group)
+    values = _non_empty(_group_values(chunk, kept))
+    time_format = (
+        hf.get_time_format(values, num_sample, column=tuple(n for n, _ in kept))
+        if values
+        else None
+    )
+    if time_format is None:
+        return [], None
+    return kept, time_format
+
+
+def _scan_csv(filepath, num_sample=None, chunk_size=50000):
+    """Read *filepath* once and collect everything the extent functions need.
+
+    Only the coordinate, geometry, CRS and time columns are parsed, with the
+    pandas C parser in chunks of *chunk_size* rows; running minima and
+    maxima are kept instead of the values. EarthScope GeoCSV ``#`` header
+    lines are skipped. The time format is inferred from the first chunk
+    with recognisable dates (``hf.get_time_format`` with *num_sample*
+    values) and used for it and all later chunks. Returns a
+    :class:`_CsvScan`.
+    """
+    scan = _CsvScan()
+    with open(filepath) as csv_file:
+        skip = 0
+        line = csv_file.readline()
+        while line.startswith("#"):
+            skip += 1
+            line = csv_file.readline()
+    if not line.strip():
+        raise Exception("The csv file from " + filepath + " has no header")
+
+    delimiter = hf.get_delimiter(io.StringIO(line))
+    header = next(csv.reader([line], delimiter=delimiter))
+
+    roles = column_classifier.classify(header)
+    geometry_col = roles.geometry
+    crs_groups = roles.crs
+    # Candidate time columns until a chunk yields a format
+    time_candidates = roles.time
+    time_groups = []
+    if not roles.columns:
+        return scan
+
+    time_format = None
+    geometry_bbox = None
+    with warnings.catch_warnings():
+        # Rows longer than the header are truncated, like csv.reader rows
+        # indexed by header position
+        warnings.simplefilter("ignore", pd.errors.ParserWarning)
+        reader = pd.read_csv(
+            filepath,
+            sep=delimiter,
+            header=None,
+            names=list(range(len(header))),
+            skiprows=skip + 1,
+            usecols=roles.columns,
+            dtype=str,
+            na_filter=False,
+            index_col=False,
+            on_bad_lines="skip",
+            chunksize=chunk_size,
         )
+        for chunk in reader:
+            if geometry_col is not None:
+                envelope = _geometry_envelope(chunk[geometry_col].tolist())
+                if envelope is not None:
+                    if geometry_bbox is None:
+                        geometry_bbox = envelope
+                    else:
+                        geometry_bbox = [
+                            min(geometry_bbox[0], envelope[0]),
+                            min(geometry_bbox[1], envelope[1]),
+                            max(geometry_bbox[2], envelope[2]),
+                            max(geometry_bbox[3], envelope[3]),
+                        ]
+
+            numeric = {
+                idx: pd.to_numeric(
+                    chunk[idx].str.replace(" ", "", regex=False), errors="coerce"
+                )
+                for idx in set(roles.latitude) | set(roles.longitude)
+            }
+            scan.lat_range = _update_range(
+                scan.lat_range, _numeric_values(numeric, roles.latitude)
+            )
+            scan.lon_range = _update_range(
+                scan.lon_range, _numeric_values(numeric, roles.longitude)
+            )
 
-        for row in data:
-            chunk.append(row)
-            if len(chunk) >= chunk_size:
-                # Process chunk
-                for data_row in chunk[1:]:  # Skip header
-                    if len(data_row) > geometry_col_idx:
-                        geometry_wkt = data_row[geometry_col_idx]
-                        if geometry_wkt and geometry_wkt.strip():
-                            try:
-                                geom = None
-                                # Try parsing as WKT first
-                                if (
-                                    geometry_wkt.strip()
-                                    .upper()
-                                    .startswith(
-                                        (
-                                            "POINT",
-                                            "LINESTRING",
-                                            "POLYGON",
-                                            "MULTIPOINT",
-                                            "MULTILINESTRING",
-                                            "MULTIPOLYGON",
-                                            "GEOMETRYCOLLECTION",
-                                        )
-                                    )
-                                ):
-                                    geom = ogr.CreateGeometryFromWkt(geometry_wkt)
-                                else:
-                                    # Try parsing as WKB (hex-encoded)
-                                    try:
-                                        geom = ogr.CreateGeometryFromWkb(
-                                            bytes.fromhex(geometry_wkt)
-                                        )
-                                    except (ValueError, TypeError):
-                                        # If not hex, might be binary WKB
-                                        try:
-                                            geom = ogr.CreateGeometryFromWkb(
-                                                geometry_wkt.encode()
-                                            )
-                                        except:
-                                            # Last resort: try as WKT anyway
-                                            geom = ogr.CreateGeometryFromWkt(
-                                                geometry_wkt
-                                            )
-
-                                if geom:
-                                    envelope = geom.GetEnvelope()
-                                    # envelope returns (minX, maxX, minY, maxY)
-                                    min_x = min(min_x, envelope[0])
-                                    max_x = max(max_x, envelope[1])
-                                    min_y = min(min_y, envelope[2])
-                                    max_y = max(max_y, envelope[3])
-                            except Exception as e:
-                                logger.debug(
-                                    f"Failed to parse geometry: {geometry_wkt}, error: {e}"
-                                )
-                                continue
-
-                chunk = [header]
-
-        # Process remaining chunk
-        if len(chunk) > 1:
-            for data_row in chunk[1:]:  # Skip header
-                if len(data_row) > geometry_col_idx:
-                    geometry_wkt = data_row[geometry_col_idx]
-                    if geometry_wkt and geometry_wkt.strip():
-                        try:
-                            geom = None
-                            # Try parsing as WKT first
-                            if (
-                                geometry_wkt.strip()
-                                .upper()
-                                .startswith(
-                                    (
-                                        "POINT",
-                                        "LINESTRING",
-                                        "POLYGON",
-                                        "MULTIPOINT",
-                                        "MULTILINESTRING",
-                                        "MULTIPOLYGON",
-                                        "GEOMETRYCOLLECTION",
-                                    )
-                                )
-                            ):
-                                geom = ogr.CreateGeometryFromWkt(geometry_wkt)
-                            else:
-                                # Try parsing as WKB (hex-encoded)
-                                try:
-                                    geom = ogr.CreateGeometryFromWkb(
-                                        bytes.fromhex(geometry_wkt)
-                                    )
-                                except (ValueError, TypeError):
-                                    # If not hex, might be binary WKB
-                                    try:
-                                        geom = ogr.CreateGeometryFromWkb(
-                                            geometry_wkt.encode()
-                                        )
-                                    except:
-                                        # Last resort: try as WKT anyway
-                                        geom = ogr.CreateGeometryFromWkt(geometry_wkt)
-
-                            if geom:
-                                envelope = geom.GetEnvelope()
-                                min_x = min(min_x, envelope[0])
-                                max_x = max(max_x, envelope[1])
-                                min_y = min(min_y, envelope[2])
-                                max_y = max(max_y, envelope[3])
-                        except Exception as e:
-                            logger.debug(
-                                f"Failed to parse geometry: {geometry_wkt}, error: {e}"
-                            )
-                            continue
+            if crs_groups:
+                scan.crs_values.update(_group_values(chunk, crs_groups).unique())
 
-        if min_x != float("inf") and min_y != float("inf"):
-            bbox = [min_x, min_y, max_x, max_y]
-            logger.debug("Extracted Bounding box from geometry column: {}".format(bbox))
-            return {"bbox": bbox, "crs": "4326"}  # Assume WGS84 for WKT data
-        else:
+            if time_candidates and time_format is None:
+                # Leading rows may have empty dates: retry on later chunks
+                time_groups, time_format = _detect_time_columns(
+                    chunk, time_candidates, num_sample
+                )
+                scan.has_time_columns = bool(time_groups)
+            if time_groups:
+                parsed = hf.parse_datetimes(
+                    _group_values(chunk, time_groups), time_format
+                )
+                scan.time_range = hf.merge_time_envelopes(
+                    scan.time_range, hf.datetime_envelope(parsed)
+                )
+
+    scan.geometry_bbox = geometry_bbox
+    return scan
+
+
+def _shared_scan(filepath, num_sample=None, chunk_size=50000, dataset_handle=None):
+    """Return the :class:`_CsvScan` of *filepath*.
+
+    With the *dataset_handle* of a ``from_file`` call the scan runs once and
+    is shared by the bbox and tbox extraction.
+    """
+    if dataset_handle is None:
+        return _scan_csv(filepath, num_sample, chunk_size)
+    return dataset_handle.shared(
+        ("csv_scan", num_sample, chunk_size),
+        lambda: _scan_csv(filepath, num_sample, chunk_size),
+    )
+
+
+class FrameExtent(collections.namedtuple("FrameExtent", ["hull", "time_range"])):
+    """Extent of an in-memory table, see :func:`dataframe_extent`.
+
+    Attributes:
+        hull: ``(n, 2)`` array of the convex hull vertices of the
+            coordinates (see ``hf.convex_hull_points``), or ``None``
+        time_range: ``[min, max]`` timestamps of the time columns, or ``None``
+    """
+
+
+def _frame_hull(frame, roles):
+    lon = [
+        pd.to_numeric(frame.iloc[:, idx], errors="coerce") for idx in roles.longitude
+    ]
+    lat = [pd.to_numeric(frame.iloc[:, idx], errors="coerce") for idx in roles.latitude]
+    if not lon or not lat:
+        return None
+    if len(lon) == 1 and len(lat) == 1:
+        # One coordinate pair per row, like the points of the GDAL CSV driver
+        points = np.column_stack(
+            [lon[0].to_numpy(dtype=float), lat[0].to_numpy(dtype=float)]
+        )
+        points = points[~np.isnan(points).any(axis=1)]
+    else:
+        # Several coordinate columns: the ranges of all of them, as for files
+        lon = _numeric_values(dict(enumerate(lon)), range(len(lon)))
+        lat = _numeric_values(dict(enumerate(lat)), range(len(lat)))
+        if len(lon) == 0 or len(lat) == 0:
             return None
+        points = [
+            [lon.min(), lat.min()],
+            [lon.max(), lat.min()],
+            [lon.max(), lat.max()],
+            [lon.min(), lat.max()],
+        ]
+    if len(points) == 0:
+        return None
+    return hf.convex_hull_points(points)
+
+
+def _frame_time_range(frame, roles, num_sample):
+    columns = {idx for _, indices in roles.time for idx in indices}
+    if not columns:
+        return None
+    if all(pd.api.types.is_datetime64_any_dtype(frame.iloc[:, idx]) for idx in columns):
+        # Typed date-time columns need no format inference or parsing
+        return hf.datetime_envelope(
+            pd.concat([frame.iloc[:, idx] for idx in columns], ignore_index=True)
+        )
+    strings = {idx: frame.iloc[:, idx].dropna().astype(str) for idx in columns}
+    groups, time_format = _detect_time_columns(strings, roles.time, num_sample)
+    if not groups:
+        return None
+    return hf.datetime_envelope(
+        hf.parse_datetimes(_group_values(strings, groups), time_format)
+    )
+
+
+def dataframe_extent(frame, num_sample=None):
+    """Return the :class:`FrameExtent` of a pandas DataFrame, or ``None``.
+
+    The in-memory counterpart of extracting a CSV file written from *frame*:
+    the columns are assigned roles by ``column_classifier`` and reduced with
+    vectorised pandas/NumPy operations, so large tables skip writing,
+    sniffing and parsing a file. Coordinates are taken as WGS84; typed
+    ``datetime64`` time columns are used without parsing.
+    """
+    roles = column_classifier.classify([str(name) for name in frame.columns])
+    hull = _frame_hull(frame, roles)
+    time_range = _frame_time_range(frame, roles, num_sample)
+    if hull is None and time_range is None:
+        return None
+    return FrameExtent(hull, time_range)
+
+
+def _crs_from_values(crs_values, filepath):
+    """Return the single CRS of *crs_values*, ``"4326"`` if there is none.
+
+    Empty cells (e.g. of short rows) are ignored.
+    """
+    crs_values = {value for value in crs_values if value and str(value).strip()}
+    if not crs_values:
+        logger.debug(
+            "{} : There is no identifiable coordinate reference system. We will try to use EPSG: 4326".format(
+                filepath
+            )
+        )
+        return "4326"
+    if len(crs_values) > 1:
+        logger.debug(
+            "{} : Coordinate reference system of the file is ambiguous. Extraction is not possible.".format(
+                filepath
+            )
+        )
+        raise Exception("The csv file from " + filepath + " has no CRS")
+    return str(next(iter(crs_values)))
+
+
+def _extract_bbox_from_geometry_column(file_path, chunk_size=50000, scan=None):
+    """
+    Extract bounding box from geometry column containing WKT data.
+    input "file_path": type string, file path to csv file
+    returns spatialExtent: type dict, contains bbox and crs
+    """
+    if scan is None:
+        scan = _scan_csv(file_path, chunk_size=chunk_size)
+    if scan.geometry_bbox is None:
+        return None
+    bbox = list(scan.geometry_bbox)
+    logger.debug("Extracted Bounding box from geometry column: {}".format(bbox))
+    return {"bbox": bbox, "crs": "4326"}  # Assume WGS84 for WKT data
 
 
 def get_bounding_box(file_path, chunk_size=50000, **_kwargs):
@@ -503,98 +778,61 @@ def get_bounding_box(file_path, chunk_size=50000, **_kwargs):
     returns spatialExtent: type list, length = 4 , type = float, schema = [min(longs), min(lats), max(longs), max(lats)]
     """
 
-    # Strip EarthScope GeoCSV #-header lines
+    def scan():
+        return _shared_scan(
+            file_path,
+            _kwargs.get("num_sample"),
+            chunk_size,
+            _kwargs.get("dataset_handle"),
+        )
+
+    # Strip EarthScope GeoCSV #-header lines for GDAL
     _original_path = file_path
-    file_path, _meta = _strip_geocsv_headers(file_path)
+    gdal_path, _meta = _strip_geocsv_headers(file_path)
     try:
-        return _get_bounding_box_impl(file_path, chunk_size)
+        return _get_bounding_box_impl(_original_path, gdal_path, scan)
     finally:
-        if file_path != _original_path:
-            os.unlink(file_path)
+        if gdal_path != _original_path:
+            os.unlink(gdal_path)
+
 
+def _get_bounding_box_impl(file_path, gdal_path, scan):
+    """Internal implementation of get_bounding_box.
 
-def _get_bounding_box_impl(file_path, chunk_size=50000):
-    """Internal implementation of get_bounding_box (after GeoCSV preprocessing)."""
+    *gdal_path* is *file_path* after GeoCSV preprocessing, *scan* returns
+    the :class:`_CsvScan` of *file_path*.
+    """
 
     # 1. Try GDAL CSV driver with open options (handles CSVT sidecars, GDAL column
     #    name conventions like X/Y/Easting/Northing, and GEOM_POSSIBLE_NAMES for WKT)
-    gdal_extent = _extract_bbox_via_gdal(file_path)
+    gdal_extent = _extract_bbox_via_gdal(gdal_path)
     if gdal_extent:
         return gdal_extent
 
     # 2. Try extracting from geometry column via manual WKT/WKB parsing
-    geometry_extent = _extract_bbox_from_geometry_column(file_path, chunk_size)
+    csv_scan = scan()
+    geometry_extent = _extract_bbox_from_geometry_column(file_path, scan=csv_scan)
     if geometry_extent:
         return geometry_extent
 
     # 3. Fall back to traditional regex-based coordinate column extraction
-    with open(file_path) as csv_file:
-        delimiter = hf.get_delimiter(csv_file)
-        data = csv.reader(csv_file, delimiter=delimiter)
-
-        header = next(data)
-        chunk = [header]
-
-        spatial_extent = {
-            "min_lat": [],
-            "max_lat": [],
-            "min_lon": [],
-            "max_lon": [],
-        }
-
-        for x in data:
-            chunk.append(x)
-            if len(chunk) >= chunk_size:
-                spatial_lat_extent = hf.search_for_parameters(
-                    chunk, search["latitude"], exp_data="numeric"
-                )
-                spatial_lon_extent = hf.search_for_parameters(
-                    chunk, search["longitude"], exp_data="numeric"
-                )
-
-                if not spatial_lat_extent and not spatial_lon_extent:
-                    raise Exception(
-                        "The csv file from " + file_path + " has no BoundingBox"
-                    )
-                else:
-                    spatial_extent["min_lat"].append(min(spatial_lat_extent))
-                    spatial_extent["max_lat"].append(max(spatial_lat_extent))
-                    spatial_extent["min_lon"].append(min(spatial_lon_extent))
-                    spatial_extent["max_lon"].append(max(spatial_lon_extent))
-
-                chunk = [header]
-
-        if len(chunk) > 1:
-            spatial_lat_extent = hf.search_for_parameters(
-                chunk, search["latitude"], exp_data="numeric"
-            )
-            spatial_lon_extent = hf.search_for_parameters(
-                chunk, search["longitude"], exp_data="numeric"
-            )
-
-            if not spatial_lat_extent and not spatial_lon_extent:
-                raise Exception(
-                    "The csv file from " + file_path + " has no BoundingBox"
-                )
-            else:
-                spatial_extent["min_lat"].append(min(spatial_lat_extent))
-                spatial_extent["max_lat"].append(max(spatial_lat_extent))
-                spatial_extent["min_lon"].append(min(spatial_lon_extent))
-                spatial_extent["max_lon"].append(max(spatial_lon_extent))
-
-        bbox = [
-            min(spatial_extent["min_lon"]),
-            min(spatial_extent["min_lat"]),
-            max(spatial_extent["max_lon"]),
-            max(spatial_extent["max_lat"]),
-        ]
-
-        logger.debug("Extracted Bounding box (without projection): {}".format(bbox))
-        crs = get_crs(file_path, chunk_size)
-        logger.debug("Extracted CRS: {}".format(crs))
-        spatialExtent = {"bbox": bbox, "crs": crs}
-        if not bbox or not crs:
-            raise Exception("Bounding box could not be extracted")
+    if csv_scan.lat_range is None or csv_scan.lon_range is None:
+        raise Exception("The csv file from " + file_path + " has no BoundingBox")
+
+    bbox = [
+        csv_scan.lon_range[0],
+        csv_scan.lat_range[0],
+        csv_scan.lon_range[1],
+        csv_scan.lat_range[1],
+    ]
+    bbox = [float(v) for v in bbox]
+
+    logger.debug("Extracted Bounding box (without projection): {}".format(bbox))
+    crs = _crs_from_values(csv_scan.crs_values, file_path)
+    logger.debug("Extracted CRS: {}".format(crs))
+    spatialExtent = {"bbox": bbox, "crs": crs}
+    if not bbox or not crs:
+        raise Exception("Bounding box could not be extracted")
 
     return spatialExtent
 
@@ -656,19 +894,7 @@ def _extract_convex_hull_from_geometry_column(file_path):
 
         header = next(data)
 
-        # Find geometry column index (same logic as _extract_bbox_from_geometry_column)
-        geometry_col_idx = None
-        best_pattern_priority = len(search["geometry"])
-
-        for idx, col_name in enumerate(header):
-            for pattern_priority, pattern in enumerate(search["geometry"]):
-                p = re.compile(pattern, re.IGNORECASE)
-                if p.search(col_name) is not None:
-                    if pattern_priority < best_pattern_priority:
-                        geometry_col_idx = idx
-                        best_pattern_priority = pattern_priority
-                    break
-
+        geometry_col_idx = column_classifier.classify(header).geometry
         if geometry_col_idx is None:
             return None
 
@@ -857,53 +1083,27 @@ def _get_convex_hull_impl(filepath):
     return None
 
 
-def get_temporal_extent(filepath, num_sample, time_format=None, **_kwargs):
+def get_temporal_extent(filepath, num_sample=None, time_format=None, **_kwargs):
     """extract time extent from csv string \n
     input "file_path": type string, file path to csv File \n
     returns temporal extent of the file: type list, length = 2, both entries have the type str, temporalExtent[0] <= temporalExtent[1]
     """
-
-    # Strip EarthScope GeoCSV #-header lines
-    _original_path = filepath
-    filepath, _meta = _strip_geocsv_headers(filepath)
-    try:
-        return _get_temporal_extent_impl(filepath, num_sample, time_format)
-    finally:
-        if filepath != _original_path:
-            os.unlink(filepath)
-
-
-def _get_temporal_extent_impl(filepath, num_sample, time_format=None):
-    """Internal implementation of get_temporal_extent (after GeoCSV preprocessing)."""
-
-    with open(filepath) as csv_file:
-        delimiter = hf.get_delimiter(csv_file)
-        data = csv.reader(csv_file, delimiter=delimiter)
-
-        elements = []
-        for x in data:
-            elements.append(x)
-
-        all_temporal_extent = hf.search_for_parameters(
-            elements, search["time"], exp_data="time"
+    csv_scan = _shared_scan(
+        filepath, num_sample, dataset_handle=_kwargs.get("dataset_handle")
+    )
+
+    if not csv_scan.has_time_columns:
+        raise Exception("The csv file from " + filepath + " has no TemporalExtent")
+    if csv_scan.time_range is None:
+        raise Exception(
+            "The csv file from " + filepath + " has no recognizable TemporalExtent"
         )
-        if all_temporal_extent is None:
-            raise Exception("The csv file from " + filepath + " has no TemporalExtent")
-        else:
-            tbox = []
-            parsed_time = hf.date_parser(all_temporal_extent, num_sample=num_sample)
 
-            if parsed_time is not None:
-                out_fmt = hf.resolve_time_format(time_format)
-                tbox.append(min(parsed_time).strftime(out_fmt))
-                tbox.append(max(parsed_time).strftime(out_fmt))
-            else:
-                raise Exception(
-                    "The csv file from "
-                    + filepath
-                    + " has no recognizable TemporalExtent"
-                )
-            return tbox
+    out_fmt = hf.resolve_time_format(time_format)
+    return [
+        csv_scan.time_range[0].strftime(out_fmt),
+        csv_scan.time_range[1].strftime(out_fmt),
+    ]
 
 
 def get_crs(filepath, chunk_size=50000):
@@ -911,45 +1111,6 @@ def get_crs(filepath, chunk_size=50000):
     input "filepath": type string, file path to csv file \n
     returns the epsg code of the used coordinate reference system, type list, contains extracted coordinate system of content from csv file
     """
-
-    with open(filepath) as csv_file:
-        delimiter = hf.get_delimiter(csv_file)
-        data = csv.reader(csv_file, delimiter=delimiter)
-
-        header = next(data)
-        chunk = [header]
-
-        crs = []
-
-        for x in data:
-            chunk.append(x)
-            if len(chunk) >= chunk_size:
-                param = hf.search_for_parameters(chunk, ["crs", "srsID", "EPSG"])
-                if param:
-                    crs.extend(param)
-
-                chunk = [header]
-
-        if len(chunk) > 1:
-            param = hf.search_for_parameters(chunk, ["crs", "srsID", "EPSG"])
-            if param:
-                crs.extend(param)
-
-        if not crs:
-            logger.debug(
-                "{} : There is no identifiable coordinate reference system. We will try to use EPSG: 4326".format(
-                    filepath
-                )
-            )
-            crs = "4326"
-        elif len(list(set(crs))) > 1:
-            logger.debug(
-                "{} : Coordinate reference system of the file is ambiguous. Extraction is not possible.".format(
-                    filepath
-                )
-            )
-            raise Exception("The csv file from " + filepath + " has no CRS")
-        else:
-            crs = str(list(set(crs))[0])
-
-        return crs
+    return _crs_from_values(
+        _scan_csv(filepath, chunk_size=chunk_size).crs_values, filepath
+    )
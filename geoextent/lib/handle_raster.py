@@ -7,6 +7,9 @@ from osgeo import gdal
 from osgeo import osr
 import logging
 from . import helpfunctions as hf
+from .dispatch import borrow_dataset
+
+hf.ogr_osr()  # enable GDAL exceptions
 
 logger = logging.getLogger("geoextent")
 
@@ -20,15 +23,26 @@ def get_handler_display_name():
     return "Raster data"
 
 
-def check_file_supported(filepath, **_kwargs):
+def check_file_supported(filepath, dataset_handle=None, **_kwargs):
     """Checks whether it is valid raster file or not. \n
     input "path": type string, path to file which shall be extracted \n
+    input "dataset_handle": optional shared dispatch.DatasetHandle for the file \n
     raise exception if not valid
     """
 
     logger.info(filepath)
     try:
-        file = gdal.OpenEx(filepath)
+        with borrow_dataset(filepath, dataset_handle) as file:
+            return _check_dataset_supported(filepath, file)
+    except:
+        logger.debug(
+            "File {} is NOT supported by handle_raster module".format(filepath)
+        )
+        return False
+
+
+def _check_dataset_supported(filepath, file):
+    try:
         driver = file.GetDriver().ShortName
     except:
         logger.debug(
@@ -53,26 +67,33 @@ def check_file_supported(filepath, **_kwargs):
         return False
 
 
-def get_bounding_box(filepath, assume_wgs84=False, **_kwargs):
+def get_bounding_box(filepath, assume_wgs84=False, dataset_handle=None, **_kwargs):
     """extracts bounding box from raster \n
     input "filepath": type string, file path to raster file \n
     input "assume_wgs84": type bool, if True assume WGS84 for ungeoreferenced rasters (default False) \n
+    input "dataset_handle": optional shared dispatch.DatasetHandle for the file \n
     returns bounding box of the file: type list, length = 4 , type = float, schema = [min(longs), min(lats), max(longs), max(lats)]
     """
     # Enable exceptions
-
-    crs_output = hf.WGS84_EPSG_ID
     gdal.UseExceptions()
 
-    geotiffContent = gdal.Open(filepath)
+    with borrow_dataset(filepath, dataset_handle, gdal.Open) as geotiffContent:
+        # Handle files with subdatasets (e.g., NetCDF) — open first subdataset
+        if geotiffContent.RasterCount == 0:
+            subdatasets = geotiffContent.GetSubDatasets()
+            if not subdatasets:
+                return None
+            if dataset_handle is not None:
+                geotiffContent = dataset_handle.first_subdataset
+            else:
+                geotiffContent = gdal.Open(subdatasets[0][0])
+
+        return _get_dataset_bounding_box(filepath, geotiffContent, assume_wgs84)
 
-    # Handle files with subdatasets (e.g., NetCDF) — open first subdataset
-    if geotiffContent.RasterCount == 0:
-        subdatasets = geotiffContent.GetSubDatasets()
-        if subdatasets:
-            geotiffContent = gdal.Open(subdatasets[0][0])
-        else:
-            return None
+
+def _get_dataset_bounding_box(filepath, geotiffContent, assume_wgs84=False):
+    """Internal implementation of get_bounding_box on an open dataset."""
+    crs_output = hf.WGS84_EPSG_ID
 
     # get the existing coordinate system
     projection_ref = geotiffContent.GetProjectionRef()
@@ -341,7 +362,7 @@ def _parse_imagery_acquisition_time(ds, time_format=None):
     return [min_date.strftime(out_fmt), max_date.strftime(out_fmt)]
 
 
-def get_temporal_extent(filepath, time_format=None, **_kwargs):
+def get_temporal_extent(filepath, time_format=None, dataset_handle=None, **_kwargs):
     """Extract temporal extent from raster files.
 
     Tries metadata sources in this order, returning the first non-None result:
@@ -351,10 +372,17 @@ def get_temporal_extent(filepath, time_format=None, **_kwargs):
     3. GeoTIFF ``TIFFTAG_DATETIME``
     4. Band-level ``ACQUISITIONDATETIME`` (IMAGERY domain)
 
+    Reuses *dataset_handle* (a shared dispatch.DatasetHandle) when given.
+
     Returns [min_date_str, max_date_str] or None.
     """
     gdal.UseExceptions()
-    ds = gdal.Open(filepath)
+    with borrow_dataset(filepath, dataset_handle, gdal.Open) as ds:
+        return _get_dataset_temporal_extent(filepath, ds, time_format, dataset_handle)
+
+
+def _get_dataset_temporal_extent(filepath, ds, time_format=None, dataset_handle=None):
+    """Internal implementation of get_temporal_extent on an open dataset."""
     if ds is None:
         return None
 
@@ -362,7 +390,10 @@ def get_temporal_extent(filepath, time_format=None, **_kwargs):
     if ds.RasterCount == 0:
         subdatasets = ds.GetSubDatasets()
         if subdatasets:
-            subds = gdal.Open(subdatasets[0][0])
+            if dataset_handle is not None:
+                subds = dataset_handle.first_subdataset
+            else:
+                subds = gdal.Open(subdatasets[0][0])
             if subds is not None:
                 result = _parse_netcdf_time(subds, time_format)
                 if result:
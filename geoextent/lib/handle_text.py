@@ -9,10 +9,13 @@ The handler is opt-in: it only claims a file when the dispatch is given
 files fall through unsupported, preserving current behavior.
 """
 
+import contextlib
 import importlib.util
 import logging
 import os
+import threading
 import unicodedata
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
@@ -86,8 +89,20 @@ def _read_text(filepath: str) -> str:
         return f.read()
 
 
-def _extract_places(
-    text: str,
+def _normalise_text(text: str) -> str:
+    """NFC-normalise *text* and strip a leading BOM.
+
+    Character offsets of all mentions index into the normalised string, so
+    they are stable regardless of how the caller composed accented
+    characters (München can arrive as either U+00FC or U+0075 U+0308).
+    """
+    text = unicodedata.normalize("NFC", text or "")
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    return text
+
+
+def _get_text_extractor(
     *,
     text_method: str,
     ner_model: Optional[str],
@@ -107,10 +122,278 @@ def _extract_places(
     config["auto_download"] = ner_auto_download
     config["period_gazetteer"] = period_gazetteer
     config["period_resolution"] = period_resolution
-    extractor = get_extractor(text_method, **config)
+    return get_extractor(text_method, **config)
+
+
+def preload(
+    *,
+    text_method: str,
+    ner_model: Optional[str] = None,
+    ner_labels=None,
+    ner_score_threshold: Optional[float] = None,
+    ner_auto_download: bool = True,
+    period_gazetteer: Optional[str] = None,
+    period_resolution: bool = True,
+    **_kwargs,
+):
+    """Load the NER model and period gazetteer for *text_method* up front.
+
+    Used to initialise worker processes once, so the first file a worker
+    handles does not pay for loading spaCy.
+    """
+    period_gaz_obj = (
+        period_gaz.get_period_gazetteer(period_gazetteer or "bundled")
+        if period_resolution
+        else None
+    )
+    extractor = _get_text_extractor(
+        text_method=text_method,
+        ner_model=ner_model,
+        ner_labels=ner_labels,
+        ner_score_threshold=ner_score_threshold,
+        ner_auto_download=ner_auto_download,
+        period_gazetteer=period_gaz_obj,
+        period_resolution=period_resolution,
+    )
+    extractor.load()
+
+
+def _extract_places(
+    text: str,
+    *,
+    text_method: str,
+    ner_model: Optional[str],
+    ner_labels,
+    ner_score_threshold,
+    ner_auto_download: bool,
+    period_gazetteer=None,
+    period_resolution: bool = True,
+):
+    extractor = _get_text_extractor(
+        text_method=text_method,
+        ner_model=ner_model,
+        ner_labels=ner_labels,
+        ner_score_threshold=ner_score_threshold,
+        ner_auto_download=ner_auto_download,
+        period_gazetteer=period_gazetteer,
+        period_resolution=period_resolution,
+    )
     return extractor, extractor.extract(text)
 
 
+# from_file runs get_bounding_box (or get_convex_hull) and
+# get_temporal_extent on two threads. Both need the same NER pass over the
+# same file, so the ExtractionResult is memoised per file and configuration;
+# the second thread waits for the first instead of running spaCy again.
+_EXTRACTION_MEMO_SIZE = 32
+_EXTRACTION_MEMO = OrderedDict()
+_EXTRACTION_MEMO_LOCK = threading.Lock()
+# Results of batch_extraction(), held outside the LRU until the batch ends.
+_EXTRACTION_PINNED = {}
+
+
+class _MemoEntry:
+    __slots__ = ("lock", "value")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.value = None
+
+
+def _clear_extraction_memo():
+    with _EXTRACTION_MEMO_LOCK:
+        _EXTRACTION_MEMO.clear()
+        _EXTRACTION_PINNED.clear()
+
+
+def _extraction_key(
+    filepath: str,
+    *,
+    text_method: str,
+    ner_model: Optional[str],
+    ner_labels,
+    ner_score_threshold,
+    ner_auto_download: bool,
+    period_gazetteer: Optional[str],
+    period_resolution: bool,
+):
+    stat = os.stat(filepath)
+    return (
+        os.path.abspath(filepath),
+        stat.st_size,
+        stat.st_mtime_ns,
+        text_method,
+        ner_model,
+        tuple(ner_labels) if ner_labels else None,
+        ner_score_threshold,
+        bool(ner_auto_download),
+        period_gazetteer,
+        bool(period_resolution),
+    )
+
+
+def _extract_file(
+    filepath: str,
+    *,
+    text_method: str,
+    ner_model: Optional[str],
+    ner_labels,
+    ner_score_threshold,
+    ner_auto_download: bool,
+    period_gazetteer: Optional[str],
+    period_resolution: bool,
+):
+    """Read, normalise and run NER on *filepath*, at most once per file version.
+
+    Returns ``(text, extractor, extraction, period_gazetteer_obj)``. Results
+    are keyed by path, size, modification time and extractor configuration,
+    so an edited file or a different model is extracted afresh.
+    """
+    key = _extraction_key(
+        filepath,
+        text_method=text_method,
+        ner_model=ner_model,
+        ner_labels=ner_labels,
+        ner_score_threshold=ner_score_threshold,
+        ner_auto_download=ner_auto_download,
+        period_gazetteer=period_gazetteer,
+        period_resolution=period_resolution,
+    )
+    with _EXTRACTION_MEMO_LOCK:
+        entry = _EXTRACTION_PINNED.get(key)
+        if entry is None:
+            entry = _EXTRACTION_MEMO.get(key)
+            if entry is None:
+                entry = _MemoEntry()
+                _EXTRACTION_MEMO[key] = entry
+                while len(_EXTRACTION_MEMO) > _EXTRACTION_MEMO_SIZE:
+                    _EXTRACTION_MEMO.popitem(last=False)
+            else:
+                _EXTRACTION_MEMO.move_to_end(key)
+
+    with entry.lock:
+        if entry.value is not None:
+            logger.debug("Reusing NER extraction for %s", filepath)
+            text, extractor, extraction, period_gaz_obj = entry.value
+            if text is None:
+                # Batch results do not hold the text; read it again
+                text = _normalise_text(_read_text(filepath))
+            return text, extractor, extraction, period_gaz_obj
+        text = _normalise_text(_read_text(filepath))
+        period_gaz_obj = (
+            period_gaz.get_period_gazetteer(period_gazetteer)
+            if period_resolution
+            else None
+        )
+        extractor, extraction = _extract_places(
+            text,
+            text_method=text_method,
+            ner_model=ner_model,
+            ner_labels=ner_labels,
+            ner_score_threshold=ner_score_threshold,
+            ner_auto_download=ner_auto_download,
+            period_gazetteer=period_gaz_obj,
+            period_resolution=period_resolution,
+        )
+        entry.value = (text, extractor, extraction, period_gaz_obj)
+        return entry.value
+
+
+@contextlib.contextmanager
+def batch_extraction(
+    filepaths,
+    *,
+    batch_size: Optional[int] = None,
+    n_process: int = 1,
+    text_method: str,
+    ner_model: Optional[str] = None,
+    ner_labels=None,
+    ner_score_threshold: Optional[float] = None,
+    ner_auto_download: bool = True,
+    period_gazetteer: Optional[str] = None,
+    period_resolution: bool = True,
+    **_kwargs,
+):
+    """Run NER over several text files in one batched pass.
+
+    The files are read one at a time and streamed through the extractor's
+    ``extract_many`` (spaCy ``nlp.pipe`` with *batch_size* and *n_process*),
+    so only the texts of the batch being processed are held in memory.
+    Inside the ``with`` block the per-file results are served to
+    :func:`get_bounding_box`, :func:`get_convex_hull` and
+    :func:`get_temporal_extent`, so a ``from_file`` call per file fans them
+    back into per-file metadata without running the pipeline again. Yields
+    the number of files that were extracted; failures fall back to per-file
+    extraction.
+    """
+    config = dict(
+        text_method=text_method,
+        ner_model=ner_model,
+        ner_labels=ner_labels,
+        ner_score_threshold=ner_score_threshold,
+        ner_auto_download=ner_auto_download,
+        period_gazetteer=period_gazetteer or "bundled",
+        period_resolution=period_resolution,
+    )
+    # Keys of the texts handed to the extractor, in order
+    keys = []
+
+    def _texts():
+        for filepath in filepaths:
+            try:
+                key = _extraction_key(filepath, **config)
+                text = _normalise_text(_read_text(filepath))
+            except OSError as e:
+                logger.debug("Skipping %s in batched NER: %s", filepath, e)
+                continue
+            keys.append(key)
+            yield text
+
+    pinned = []
+    if filepaths:
+        try:
+            period_gaz_obj = (
+                period_gaz.get_period_gazetteer(config["period_gazetteer"])
+                if period_resolution
+                else None
+            )
+            extractor = _get_text_extractor(
+                text_method=text_method,
+                ner_model=ner_model,
+                ner_labels=ner_labels,
+                ner_score_threshold=ner_score_threshold,
+                ner_auto_download=ner_auto_download,
+                period_gazetteer=period_gaz_obj,
+                period_resolution=period_resolution,
+            )
+            logger.debug(
+                "Running batched NER over %d text files (batch_size=%s, n_process=%s)",
+                len(filepaths),
+                batch_size,
+                n_process,
+            )
+            extractions = extractor.extract_many(
+                _texts(), batch_size=batch_size, n_process=n_process
+            )
+            for i, extraction in enumerate(extractions):
+                entry = _MemoEntry()
+                entry.value = (None, extractor, extraction, period_gaz_obj)
+                with _EXTRACTION_MEMO_LOCK:
+                    _EXTRACTION_PINNED[keys[i]] = entry
+                pinned.append(keys[i])
+        except Exception as e:
+            logger.warning(
+                "Batched NER failed, falling back to per-file extraction: %s", e
+            )
+
+    try:
+        yield len(pinned)
+    finally:
+        with _EXTRACTION_MEMO_LOCK:
+            for key in pinned:
+                _EXTRACTION_PINNED.pop(key, None)
+
+
 def _resolve_places(mentions, ner_gazetteer, ner_ambiguity, gaz_cache):
     names = [m.name for m in mentions]
     resolved = gaz.forward_geocode_names(
@@ -325,14 +608,9 @@ def extract_from_text(
       ``extraction_method``, ``ner_model``, ``ner_gazetteer``,
       ``period_gazetteer``: config echo.
     """
-    # Normalise to NFC so character offsets are stable regardless of how the
-    # caller composed accented characters (München can arrive as either U+00FC
-    # or U+0075 U+0308). All downstream char_start/char_end values index into
-    # this normalised string. Stripping a leading BOM is already done at
-    # file-read time (_read_text), but we repeat it here for inline strings.
-    text = unicodedata.normalize("NFC", text or "")
-    if text.startswith("﻿"):
-        text = text[1:]
+    # All downstream char_start/char_end values index into the normalised
+    # string (see _normalise_text).
+    text = _normalise_text(text)
 
     period_gaz_obj = (
         period_gaz.get_period_gazetteer(period_gazetteer) if period_resolution else None
@@ -348,6 +626,38 @@ def extract_from_text(
         period_gazetteer=period_gaz_obj,
         period_resolution=period_resolution,
     )
+    return _summarise_extraction(
+        text,
+        extractor,
+        extraction,
+        period_gaz_obj,
+        text_method=text_method,
+        ner_gazetteer=ner_gazetteer,
+        ner_ambiguity=ner_ambiguity,
+        gazetteer_cache=gazetteer_cache,
+        period_ambiguity=period_ambiguity,
+        period_cache=period_cache,
+        include_source_text=include_source_text,
+        place_geometry=place_geometry,
+    )
+
+
+def _summarise_extraction(
+    text: str,
+    extractor,
+    extraction,
+    period_gaz_obj,
+    *,
+    text_method: str,
+    ner_gazetteer: str,
+    ner_ambiguity: str,
+    gazetteer_cache,
+    period_ambiguity: str,
+    period_cache,
+    include_source_text: bool,
+    place_geometry: str,
+):
+    """Resolve an ExtractionResult into the extract_from_text result dict."""
     if gazetteer_cache is None:
         gazetteer_cache = {}
     resolved = _resolve_places(
@@ -411,20 +721,26 @@ def get_bounding_box(
 ):
     if not _is_active(text_method):
         return None
-    text = _read_text(filepath)
-    res = extract_from_text(
-        text,
+    text, extractor, extraction, period_gaz_obj = _extract_file(
+        filepath,
         text_method=text_method,
         ner_model=ner_model,
         ner_labels=ner_labels,
         ner_score_threshold=ner_score_threshold,
+        ner_auto_download=ner_auto_download,
+        period_gazetteer=period_gazetteer or "bundled",
+        period_resolution=period_resolution,
+    )
+    res = _summarise_extraction(
+        text,
+        extractor,
+        extraction,
+        period_gaz_obj,
+        text_method=text_method,
         ner_gazetteer=ner_gazetteer or "nominatim",
         ner_ambiguity=ner_ambiguity or "drop",
-        ner_auto_download=ner_auto_download,
         gazetteer_cache=gazetteer_cache,
-        period_gazetteer=period_gazetteer or "bundled",
         period_ambiguity=period_ambiguity or "drop",
-        period_resolution=period_resolution,
         period_cache=period_cache,
         include_source_text=include_source_text,
         place_geometry=place_geometry or "auto",
@@ -465,20 +781,26 @@ def get_convex_hull(
 ):
     if not _is_active(text_method):
         return None
-    text = _read_text(filepath)
-    res = extract_from_text(
-        text,
+    text, extractor, extraction, period_gaz_obj = _extract_file(
+        filepath,
         text_method=text_method,
         ner_model=ner_model,
         ner_labels=ner_labels,
         ner_score_threshold=ner_score_threshold,
+        ner_auto_download=ner_auto_download,
+        period_gazetteer=period_gazetteer or "bundled",
+        period_resolution=period_resolution,
+    )
+    res = _summarise_extraction(
+        text,
+        extractor,
+        extraction,
+        period_gaz_obj,
+        text_method=text_method,
         ner_gazetteer=ner_gazetteer or "nominatim",
         ner_ambiguity=ner_ambiguity or "drop",
-        ner_auto_download=ner_auto_download,
         gazetteer_cache=gazetteer_cache,
-        period_gazetteer=period_gazetteer or "bundled",
         period_ambiguity=period_ambiguity or "drop",
-        period_resolution=period_resolution,
         period_cache=period_cache,
         include_source_text=include_source_text,
         place_geometry=place_geometry or "auto",
@@ -596,6 +918,7 @@ def get_temporal_extent(
     text_method=None,
     ner_model=None,
     ner_labels=None,
+    ner_score_threshold=None,
     ner_auto_download=True,
     ner_gazetteer=None,
     ner_ambiguity=None,
@@ -608,20 +931,16 @@ def get_temporal_extent(
 ):
     if not _is_active(text_method):
         return None
-    text = _read_text(filepath)
-    gazetteer = (
-        period_gaz.get_period_gazetteer(period_gazetteer or "bundled")
-        if period_resolution
-        else None
-    )
-    _extractor, extraction = _extract_places(
-        text,
+    # Shares the NER pass with get_bounding_box / get_convex_hull running
+    # on the other from_file thread (see _extract_file).
+    _text, _extractor, extraction, gazetteer = _extract_file(
+        filepath,
         text_method=text_method,
         ner_model=ner_model,
         ner_labels=ner_labels,
-        ner_score_threshold=None,
+        ner_score_threshold=ner_score_threshold,
         ner_auto_download=ner_auto_download,
-        period_gazetteer=gazetteer,
+        period_gazetteer=period_gazetteer or "bundled",
         period_resolution=period_resolution,
     )
     _records, envelope = _resolve_temporal_mentions(
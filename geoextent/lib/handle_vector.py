@@ -1,10 +1,14 @@
 import logging
+import numpy as np
 import osgeo
 from osgeo import ogr
 from osgeo import gdal
 from . import helpfunctions as hf
+from .dispatch import borrow_dataset
 import re
 
+hf.ogr_osr()  # enable GDAL exceptions
+
 null_island = [0] * 4
 search = {
     "time": [
@@ -28,6 +32,12 @@ def get_handler_display_name():
     return "Vector data"
 
 
+def _iter_layers(datasource):
+    """Yield the layers of an OGR data source or GDAL vector dataset by index."""
+    for i in range(datasource.GetLayerCount()):
+        yield datasource.GetLayer(i)
+
+
 def _extract_crs_from_layer(layer, layer_name, operation="extraction"):
     """Extract CRS information from a layer, with fallback to WKT if EPSG unavailable.
 
@@ -84,14 +94,25 @@ def _extract_crs_from_layer(layer, layer_name, operation="extraction"):
     return crs, crs_wkt
 
 
-def check_file_supported(filepath, **_kwargs):
+def check_file_supported(filepath, dataset_handle=None, **_kwargs):
     """Checks whether it is valid vector file or not. \n
     input "path": type string, path to file which shall be extracted \n
+    input "dataset_handle": optional shared dispatch.DatasetHandle for the file \n
     """
 
     logger.debug(filepath)
     try:
-        file = gdal.OpenEx(filepath)
+        with borrow_dataset(filepath, dataset_handle) as file:
+            return _check_dataset_supported(filepath, file)
+    except:
+        logger.debug(
+            "File {} is NOT supported by handle_vector module".format(filepath)
+        )
+        return False
+
+
+def _check_dataset_supported(filepath, file):
+    try:
         driver = file.GetDriver().ShortName
     except:
         logger.debug(
@@ -104,24 +125,27 @@ def check_file_supported(filepath, **_kwargs):
             logger.debug(
                 "File {} is supported by handle_vector module".format(filepath)
             )
-            file = None
             return True
     logger.debug("File {} is NOT supported by handle_vector module".format(filepath))
-    file = None
     return False
 
 
-def get_temporal_extent(filepath, time_format=None, **_kwargs):
+def get_temporal_extent(filepath, time_format=None, dataset_handle=None, **_kwargs):
     """extracts temporal extent of the vector file \n
-    input "path": type string, file path to vector file
+    input "path": type string, file path to vector file \n
+    input "dataset_handle": optional shared dispatch.DatasetHandle for the file
     """
 
-    datasource = ogr.Open(filepath)
+    with borrow_dataset(filepath, dataset_handle, ogr.Open) as datasource:
+        return _get_datasource_temporal_extent(filepath, datasource, time_format)
+
+
+def _get_datasource_temporal_extent(filepath, datasource, time_format=None):
     layer_count = datasource.GetLayerCount()
     logger.debug("{} contains {} layers".format(filepath, layer_count))
-    datetime_list = []
+    time_envelope = None
 
-    for layer in datasource:
+    for layer in _iter_layers(datasource):
 
         logger.debug(
             "{} : Extracting temporal extent from layer {} ".format(filepath, layer)
@@ -143,7 +167,7 @@ def get_temporal_extent(filepath, time_format=None, **_kwargs):
             term = re.compile(x, re.IGNORECASE)
             for j in field_names:
                 match = term.search(j)
-                if match is not None:
+                if match is not None and j not in match_list:
                     match_list.append(j)
 
         logger.debug("Features name match: {}".format(match_list))
@@ -156,19 +180,14 @@ def get_temporal_extent(filepath, time_format=None, **_kwargs):
             )
             pass
         else:
-            datetime_list = []
-            for time_feature in match_list:
-                time_list = []
-                for feat in layer:
-                    time = feat.GetField(time_feature)
-                    if time is not None:
-                        time_list.append(time)
-                layer.ResetReading()
-
+            time_envelope = None
+            for time_feature, time_list in _read_field_values(
+                layer, match_list
+            ).items():
                 if len(time_list) != 0:
-                    parsed_time = hf.date_parser(time_list)
-                    if parsed_time is not None:
-                        datetime_list.extend(parsed_time)
+                    envelope = hf.time_envelope(time_list, column=time_feature)
+                    if envelope is not None:
+                        time_envelope = hf.merge_time_envelopes(time_envelope, envelope)
                     else:
                         logger.debug(
                             "File {} / Layer {}  \n"
@@ -186,9 +205,7 @@ def get_temporal_extent(filepath, time_format=None, **_kwargs):
                     )
                     pass
 
-    datasource = None
-
-    if len(datetime_list) == 0:
+    if time_envelope is None:
         logger.debug(
             "File {} do not have recognizable temporal extent".format(filepath)
         )
@@ -196,22 +213,116 @@ def get_temporal_extent(filepath, time_format=None, **_kwargs):
     else:
         out_fmt = hf.resolve_time_format(time_format)
         tbox = [
-            min(datetime_list).strftime(out_fmt),
-            max(datetime_list).strftime(out_fmt),
+            time_envelope[0].strftime(out_fmt),
+            time_envelope[1].strftime(out_fmt),
         ]
 
     return tbox
 
 
-def get_bounding_box(filepath, **_kwargs):
+# Features per batch of the Arrow stream used to read time fields
+ARROW_BATCH_SIZE = 65536
+
+
+def _read_field_values(layer, field_names):
+    """Return the non-null values of *field_names*, read in one pass over *layer*.
+
+    Only these fields are read: the geometry and all other fields are
+    ignored. With GDAL >= 3.6 the layer is read as columnar batches through
+    its Arrow stream (values are numpy arrays; date and date-time fields are
+    ``datetime64``), otherwise feature by feature (values are lists).
+    """
+    defn = layer.GetLayerDefn()
+    ignored = [
+        defn.GetFieldDefn(i).GetName()
+        for i in range(defn.GetFieldCount())
+        if defn.GetFieldDefn(i).GetName() not in field_names
+    ]
+    layer.SetIgnoredFields(ignored + ["OGR_GEOMETRY", "OGR_STYLE"])
+    try:
+        if hasattr(layer, "GetArrowStreamAsNumPy"):
+            try:
+                return _read_field_arrays(layer, field_names)
+            except Exception as e:
+                logger.debug(
+                    "Arrow stream of layer {} not readable, reading features: {}".format(
+                        layer.GetName(), e
+                    )
+                )
+        return _read_field_lists(layer, field_names)
+    finally:
+        layer.SetIgnoredFields([])
+        layer.ResetReading()
+
+
+def _read_field_arrays(layer, field_names):
+    batches = {name: [] for name in field_names}
+    layer.ResetReading()
+    stream = layer.GetArrowStreamAsNumPy(
+        options=[
+            "INCLUDE_FID=NO",
+            "MAX_FEATURES_IN_BATCH={}".format(ARROW_BATCH_SIZE),
+        ]
+    )
+    for batch in stream:
+        for name in field_names:
+            column = batch[name]
+            if isinstance(column, np.ma.MaskedArray):
+                column = column.compressed()
+            if column.dtype.kind == "S":
+                column = np.char.decode(column, "utf-8", "replace")
+            elif column.dtype == object:
+                column = np.array(
+                    [
+                        v.decode("utf-8", "replace") if isinstance(v, bytes) else v
+                        for v in column
+                        if v is not None
+                    ],
+                    dtype=object,
+                )
+            batches[name].append(column)
+    return {
+        name: np.concatenate(arrays) if arrays else np.array([], dtype=object)
+        for name, arrays in batches.items()
+    }
+
+
+def _read_field_lists(layer, field_names):
+    indices = [layer.GetLayerDefn().GetFieldIndex(name) for name in field_names]
+    values = {name: [] for name in field_names}
+    columns = [values[name] for name in field_names]
+    layer.ResetReading()
+    for feat in layer:
+        for idx, column in zip(indices, columns):
+            if feat.IsFieldSetAndNotNull(idx):
+                column.append(feat.GetField(idx))
+    return values
+
+
+def get_bounding_box(filepath, dataset_handle=None, **_kwargs):
     """extracts bounding box from vector file \n
     input "filepath": type string, file path to vector \n
+    input "dataset_handle": optional shared dispatch.DatasetHandle for the file \n
     returns bounding box of the file: type list, length = 4
     """
-    datasource = ogr.Open(filepath)
+    with borrow_dataset(filepath, dataset_handle, ogr.Open) as datasource:
+        geo_dict = _collect_layer_bboxes(filepath, datasource)
+
+    bbox_merge = hf.bbox_merge(geo_dict, filepath)
+
+    spatial_extent = None
+
+    if bbox_merge is not None:
+        if len(bbox_merge) != 0:
+            spatial_extent = bbox_merge
+
+    return spatial_extent
+
+
+def _collect_layer_bboxes(filepath, datasource):
     geo_dict = {}
 
-    for layer in datasource:
+    for layer in _iter_layers(datasource):
         layer_name = layer.GetDescription()
         ext = layer.GetExtent()
         bbox = [ext[0], ext[2], ext[1], ext[3]]
@@ -241,63 +352,99 @@ def get_bounding_box(filepath, **_kwargs):
                 )
             )
 
-    datasource = None
+    return geo_dict
 
-    bbox_merge = hf.bbox_merge(geo_dict, filepath)
 
-    spatial_extent = None
-
-    if bbox_merge is not None:
-        if len(bbox_merge) != 0:
-            spatial_extent = bbox_merge
-
-    return spatial_extent
-
-
-def get_convex_hull(filepath, **_kwargs):
+def get_convex_hull(filepath, dataset_handle=None, **_kwargs):
     """extracts convex hull from vector file \n
     input "filepath": type string, file path to vector \n
+    input "dataset_handle": optional shared dispatch.DatasetHandle for the file \n
     returns convex hull as a bounding box: type dict with keys 'bbox' and 'crs'
     """
-    datasource = ogr.Open(filepath)
-    geo_dict = {}
+    with borrow_dataset(filepath, dataset_handle, ogr.Open) as datasource:
+        geo_dict = _collect_layer_convex_hulls(filepath, datasource)
+
+    return _merge_layer_convex_hulls(filepath, geo_dict)
+
+
+# Geometry vertices buffered before they are merged into the running hull
+HULL_BATCH_SIZE = 65536
 
-    for layer in datasource:
-        layer_name = layer.GetDescription()
 
-        # Collect all geometries from the layer
-        geometries = []
+def _geometry_hull_points(geom):
+    """Return the (x, y) vertices of the convex hull of *geom*."""
+    if ogr.GT_Flatten(geom.GetGeometryType()) == ogr.wkbPoint:
+        return [] if geom.IsEmpty() else [geom.GetPoint_2D()]
+    hull = geom.ConvexHull()
+    if hull is None or hull.IsEmpty():
+        return []
+    if ogr.GT_Flatten(hull.GetGeometryType()) == ogr.wkbPolygon:
+        hull = hull.GetGeometryRef(0)
+    if hull.GetPointCount() == 0:
+        return []
+    return [point[:2] for point in hull.GetPoints()]
+
+
+def _stream_layer_hull(layer):
+    """Return the convex hull vertices of all geometries of *layer*, or ``None``.
+
+    Features are read one at a time with their attributes ignored. Each
+    geometry is reduced to the vertices of its own convex hull, which are
+    merged into a running hull every ``HULL_BATCH_SIZE`` vertices, so memory
+    is bounded by the batch and hull size rather than the layer size.
+    """
+    defn = layer.GetLayerDefn()
+    layer.SetIgnoredFields(
+        [defn.GetFieldDefn(i).GetName() for i in range(defn.GetFieldCount())]
+        + ["OGR_STYLE"]
+    )
+    hull = None
+    batch = []
+    try:
+        layer.ResetReading()
         for feature in layer:
             geom = feature.GetGeometryRef()
             if geom is not None:
-                geometries.append(geom.Clone())
+                batch.extend(_geometry_hull_points(geom))
+            if len(batch) >= HULL_BATCH_SIZE:
+                hull = _merge_hull(hull, batch)
+                batch = []
+    finally:
+        layer.SetIgnoredFields([])
+        layer.ResetReading()
+    if batch:
+        hull = _merge_hull(hull, batch)
+    return hull
 
-        if not geometries:
-            logger.debug(
-                "Layer {} does not contain any geometries for convex hull calculation".format(
-                    layer_name
-                )
-            )
-            continue
 
-        # Create a geometry collection
-        geom_collection = ogr.Geometry(ogr.wkbGeometryCollection)
-        for geom in geometries:
-            geom_collection.AddGeometry(geom)
+def _merge_hull(hull, points):
+    if hull is not None:
+        points = np.vstack([hull, np.asarray(points, dtype=float).reshape(-1, 2)])
+    return hf.convex_hull_points(points)
+
+
+def _collect_layer_convex_hulls(filepath, datasource):
+    geo_dict = {}
+
+    for layer in _iter_layers(datasource):
+        layer_name = layer.GetDescription()
 
-        # Calculate convex hull
         try:
-            # Check if we have enough distinct points for a meaningful convex hull
-            # Get the envelope to check if we have a degenerate geometry
-            envelope = geom_collection.GetEnvelope()
-            # OGR envelope format: (min_x, max_x, min_y, max_y)
-            min_x, max_x, min_y, max_y = envelope
+            hull = _stream_layer_hull(layer)
 
-            # Check if this is a degenerate geometry (point or line)
-            is_point = min_x == max_x and min_y == max_y
-            is_line = min_x == max_x or min_y == max_y
+            if hull is None or len(hull) == 0:
+                logger.debug(
+                    "Layer {} does not contain any geometries for convex hull calculation".format(
+                        layer_name
+                    )
+                )
+                continue
 
-            if is_point:
+            min_x, min_y = hull.min(axis=0).tolist()
+            max_x, max_y = hull.max(axis=0).tolist()
+            bbox = [min_x, min_y, max_x, max_y]
+
+            if len(hull) == 1:
                 logger.debug(
                     "Layer {} contains only a single point, using point as convex hull".format(
                         layer_name
@@ -305,44 +452,23 @@ def get_convex_hull(filepath, **_kwargs):
                 )
                 # For point data, create a minimal convex hull as the point itself
                 convex_hull_coords = [[min_x, min_y]]
-                bbox = [min_x, min_y, max_x, max_y]
                 convex_hull = None  # No geometry object for point data
-            else:
-                # Try to calculate actual convex hull
-                convex_hull = geom_collection.ConvexHull()
-                if convex_hull is None:
-                    logger.debug(
-                        "Could not calculate convex hull for layer {}, falling back to bounding box".format(
-                            layer_name
-                        )
+            elif len(hull) == 2:
+                # Collinear geometries: the hull is a line, keep its bounding box
+                logger.debug(
+                    "Convex hull of layer {} is a line, using its bounding box".format(
+                        layer_name
                     )
-                    # Fall back to regular bounding box
-                    envelope = geom_collection.GetEnvelope()
-                    bbox = [envelope[0], envelope[2], envelope[1], envelope[3]]
-                    convex_hull_coords = [
-                        [envelope[0], envelope[2]],  # min_x, min_y
-                        [envelope[1], envelope[2]],  # max_x, min_y
-                        [envelope[1], envelope[3]],  # max_x, max_y
-                        [envelope[0], envelope[3]],  # min_x, max_y
-                        [envelope[0], envelope[2]],  # close the ring
-                    ]
-                else:
-                    # Convert convex hull geometry to coordinate points
-                    convex_hull_coords = []
-                    if convex_hull.GetGeometryType() == ogr.wkbPolygon:
-                        # Get the exterior ring
-                        ring = convex_hull.GetGeometryRef(0)
-                        if ring is not None:
-                            point_count = ring.GetPointCount()
-                            for i in range(point_count):
-                                x, y, z = ring.GetPoint(i)
-                                convex_hull_coords.append([x, y])
-
-                    # For compatibility with existing transformation logic, we still need a bbox
-                    # But we'll store the convex hull coordinates separately
-                    envelope = convex_hull.GetEnvelope()
-                    # OGR envelope format: (min_x, max_x, min_y, max_y)
-                    bbox = [envelope[0], envelope[2], envelope[1], envelope[3]]
+                )
+                convex_hull_coords = []
+                convex_hull = None
+            else:
+                convex_hull_coords = hf.convex_hull_ring(hull)
+                ring = ogr.Geometry(ogr.wkbLinearRing)
+                for x, y in convex_hull_coords:
+                    ring.AddPoint_2D(x, y)
+                convex_hull = ogr.Geometry(ogr.wkbPolygon)
+                convex_hull.AddGeometry(ring)
 
             # Extract CRS information using shared function
             crs, crs_wkt = _extract_crs_from_layer(
@@ -374,8 +500,10 @@ def get_convex_hull(filepath, **_kwargs):
             )
             continue
 
-    datasource = None
+    return geo_dict
+
 
+def _merge_layer_convex_hulls(filepath, geo_dict):
     # For convex hull with single file, we don't need to merge - just return the first result
     if len(geo_dict) == 1:
         # Single layer case - return the convex hull directly
@@ -402,19 +530,9 @@ def get_convex_hull(filepath, **_kwargs):
                     bbox = merged["bbox"]
                     # Also transform convex hull coords
                     if convex_hull_coords:
-                        from osgeo import osr
-
-                        source = osr.SpatialReference()
-                        source.ImportFromEPSG(int(layer_data["crs"]))
-                        source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        dest = osr.SpatialReference()
-                        dest.ImportFromEPSG(4326)
-                        dest.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        transform = osr.CoordinateTransformation(source, dest)
-                        convex_hull_coords = [
-                            list(transform.TransformPoint(x, y)[:2])
-                            for x, y in convex_hull_coords
-                        ]
+                        convex_hull_coords = hf.transform_points_to_wgs84(
+                            convex_hull_coords, crs=layer_data["crs"]
+                        )
             elif "crs_wkt" in layer_data:
                 # Has WKT, use bbox_merge to transform
                 temp_dict = {layer_name: layer_data}
@@ -423,19 +541,9 @@ def get_convex_hull(filepath, **_kwargs):
                     bbox = merged["bbox"]
                     # Also transform convex hull coords
                     if convex_hull_coords:
-                        from osgeo import osr
-
-                        source = osr.SpatialReference()
-                        source.ImportFromWkt(layer_data["crs_wkt"])
-                        source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        dest = osr.SpatialReference()
-                        dest.ImportFromEPSG(4326)
-                        dest.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        transform = osr.CoordinateTransformation(source, dest)
-                        convex_hull_coords = [
-                            list(transform.TransformPoint(x, y)[:2])
-                            for x, y in convex_hull_coords
-                        ]
+                        convex_hull_coords = hf.transform_points_to_wgs84(
+                            convex_hull_coords, crs_wkt=layer_data["crs_wkt"]
+                        )
 
             spatial_extent = {
                 "bbox": bbox,
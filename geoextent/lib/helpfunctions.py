@@ -1,29 +1,43 @@
+import collections
 import csv
 import datetime
+import functools
+import hashlib
 import itertools
 import json
 import logging
+import math
 import os
-import patoolib
 import random
 import re
+import threading
 import uuid
 import warnings
-import pandas as pd
-from osgeo import ogr
-from osgeo import osr
+import numpy as np
 from pathlib import Path
 
-import geojsonio
-import humanfriendly
 import filesizelib
 
 # Default seed for reproducible random sampling
 DEFAULT_DOWNLOAD_SAMPLE_SEED = 42
 
-# to suppress warning "FutureWarning: Neither gdal.UseExceptions() nor gdal.DontUseExceptions() has been explicitly called. In GDAL 4.0, exceptions will be enabled by default."
-ogr.UseExceptions()
-osr.UseExceptions()
+
+@functools.lru_cache(maxsize=None)
+def ogr_osr():
+    """Import GDAL's ``ogr`` and ``osr`` modules on first use and return them.
+
+    pandas, GDAL and the other heavy dependencies of this module are imported
+    by the functions that use them, so that importing geoextent stays fast.
+    Modules importing osgeo themselves call this once at import time, so that
+    GDAL exceptions are enabled for them as well.
+    """
+    from osgeo import ogr
+    from osgeo import osr
+
+    # to suppress warning "FutureWarning: Neither gdal.UseExceptions() nor gdal.DontUseExceptions() has been explicitly called. In GDAL 4.0, exceptions will be enabled by default."
+    ogr.UseExceptions()
+    osr.UseExceptions()
+    return ogr, osr
 
 
 #: Default strftime format for temporal extent output.
@@ -188,7 +202,7 @@ def get_all_row_elements(row_name, elements, exp_data=None):
                     pass
 
     if exp_data == "time":
-        if get_time_format(values, 30) is not None:
+        if get_time_format(values, 30, column=row_name) is not None:
             return values
 
     elif exp_data == "numeric":
@@ -222,8 +236,8 @@ def search_for_parameters(elements, param_array, exp_data=None):
     """
     matching_elements = []
     for x in param_array:
+        p = re.compile(x, re.IGNORECASE)
         for row in elements[0]:
-            p = re.compile(x, re.IGNORECASE)
             if p.search(row) is not None:
                 row_to_extract = get_all_row_elements(row, elements, exp_data)
                 if row_to_extract is not None:
@@ -236,24 +250,55 @@ def search_for_parameters(elements, param_array, exp_data=None):
     return matching_elements
 
 
-def transform_to_wgs84(crs, coordinate):
+# Building an osr.CoordinateTransformation (two SpatialReference lookups plus
+# PROJ pipeline selection) costs far more than transforming a few points with
+# it. Transformations are cached per source CRS; GDAL transformation objects
+# must not be shared across threads, so every thread keeps its own LRU.
+_WGS84_TRANSFORM_CACHE_SIZE = 32
+_wgs84_transforms = threading.local()
+
+
+def _wgs84_transform_cache():
+    cache = getattr(_wgs84_transforms, "cache", None)
+    if cache is None:
+        cache = _wgs84_transforms.cache = collections.OrderedDict()
+    return cache
+
+
+def get_wgs84_transformation(crs=None, crs_wkt=None):
     """
-    Transform coordinates from any CRS to WGS84 (EPSG:4326).
+    Return a cached coordinate transformation from a source CRS to WGS84 (EPSG:4326).
 
-    Uses traditional GIS axis order (longitude/easting, latitude/northing) for both
-    source and target CRS, regardless of GDAL version, to ensure consistent [lon, lat]
-    order per GeoJSON spec.
+    Both source and target use traditional GIS axis order (x/lon/easting first),
+    regardless of GDAL version, to ensure consistent [lon, lat] output order
+    per GeoJSON spec.
 
     Args:
         crs: Source EPSG code as string or int
-        coordinate: [x, y] coordinate pair in source CRS (always in traditional GIS order: X/lon/easting first)
+        crs_wkt: Source CRS as OGC WKT string (used when ``crs`` is None)
 
     Returns:
-        [longitude, latitude] in WGS84 (EPSG:4326)
+        osr.CoordinateTransformation, cached per thread by EPSG code or WKT hash
     """
-    # TODO: check whether current src is 4326
+    ogr, osr = ogr_osr()
+    if crs is not None:
+        key = ("epsg", int(crs))
+    elif crs_wkt:
+        key = ("wkt", hashlib.sha1(crs_wkt.encode("utf-8")).hexdigest())
+    else:
+        raise ValueError("Either crs or crs_wkt is required")
+
+    cache = _wgs84_transform_cache()
+    transform = cache.get(key)
+    if transform is not None:
+        cache.move_to_end(key)
+        return transform
+
     source = osr.SpatialReference()
-    source.ImportFromEPSG(int(crs))
+    if key[0] == "epsg":
+        source.ImportFromEPSG(key[1])
+    else:
+        source.ImportFromWkt(crs_wkt)
     # Set traditional GIS axis order for source CRS (x/lon/easting, y/lat/northing)
     source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
 
@@ -264,34 +309,66 @@ def transform_to_wgs84(crs, coordinate):
     target.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
 
     transform = osr.CoordinateTransformation(source, target)
+    cache[key] = transform
+    while len(cache) > _WGS84_TRANSFORM_CACHE_SIZE:
+        cache.popitem(last=False)
+    return transform
 
-    point = ogr.Geometry(ogr.wkbPoint)
-    point.AddPoint(float(coordinate[0]), float(coordinate[1]))
-    point = point.ExportToWkt()
-    point = ogr.CreateGeometryFromWkt(point)
 
-    point.Transform(transform)
+def transform_points_to_wgs84(points, crs=None, crs_wkt=None):
+    """
+    Transform many coordinates to WGS84 (EPSG:4326) in a single call.
 
-    return [point.GetX(), point.GetY()]
+    Args:
+        points: sequence of [x, y] pairs in the source CRS (traditional GIS order)
+        crs: Source EPSG code as string or int
+        crs_wkt: Source CRS as OGC WKT string (used when ``crs`` is None)
 
+    Returns:
+        list of [longitude, latitude] pairs in WGS84
+    """
+    if len(points) == 0:
+        return []
+    transform = get_wgs84_transformation(crs=crs, crs_wkt=crs_wkt)
+    transformed = transform.TransformPoints(
+        [(float(p[0]), float(p[1])) for p in points]
+    )
+    result = []
+    for point in transformed:
+        if not (math.isfinite(point[0]) and math.isfinite(point[1])):
+            raise ValueError(
+                "Coordinate transformation to EPSG:{} failed".format(WGS84_EPSG_ID)
+            )
+        result.append([point[0], point[1]])
+    return result
 
-def transform_array_to_wgs84(crs, point_array):
+
+def transform_to_wgs84(crs, coordinate):
     """
-    Function purpose: transforming SRS into WGS84 (EPSG 4326) from an array
-    Input: crs, point_array \n
-    Output: array array
+    Transform coordinates from any CRS to WGS84 (EPSG:4326).
+
+    Uses traditional GIS axis order (longitude/easting, latitude/northing) for both
+    source and target CRS, regardless of GDAL version, to ensure consistent [lon, lat]
+    order per GeoJSON spec.
+
+    Args:
+        crs: Source EPSG code as string or int
+        coordinate: [x, y] coordinate pair in source CRS (always in traditional GIS order: X/lon/easting first)
+
+    Returns:
+        [longitude, latitude] in WGS84 (EPSG:4326)
     """
-    # print("----<>", point_array)#
-    array = []
+    return transform_points_to_wgs84([coordinate], crs=crs)[0]
+
+
+def _transform_point_array(point_array, crs=None, crs_wkt=None):
     # vector_rep
     if type(point_array[0]) == list:
-        for x in point_array:
-            array.append(transform_to_wgs84(crs, x))
-        return array
+        return transform_points_to_wgs84(point_array, crs=crs, crs_wkt=crs_wkt)
     # bbox
     elif len(point_array) == 4:
-        bbox = [[point_array[0], point_array[1]], [point_array[2], point_array[3]]]
-        transf_bbox = transform_array_to_wgs84(crs, bbox)
+        corners = [[point_array[0], point_array[1]], [point_array[2], point_array[3]]]
+        transf_bbox = transform_points_to_wgs84(corners, crs=crs, crs_wkt=crs_wkt)
         return [
             transf_bbox[0][0],
             transf_bbox[0][1],
@@ -300,6 +377,15 @@ def transform_array_to_wgs84(crs, point_array):
         ]
 
 
+def transform_array_to_wgs84(crs, point_array):
+    """
+    Function purpose: transforming SRS into WGS84 (EPSG 4326) from an array
+    Input: crs, point_array (list of [x, y] pairs or bbox [minx, miny, maxx, maxy]) \n
+    Output: array array
+    """
+    return _transform_point_array(point_array, crs=crs)
+
+
 def transform_to_wgs84_from_wkt(crs_wkt, coordinate):
     """
     Transform coordinates from a WKT-defined CRS to WGS84 (EPSG:4326).
@@ -314,24 +400,7 @@ def transform_to_wgs84_from_wkt(crs_wkt, coordinate):
     Returns:
         [longitude, latitude] in WGS84 (EPSG:4326)
     """
-    source = osr.SpatialReference()
-    source.ImportFromWkt(crs_wkt)
-    source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-
-    target = osr.SpatialReference()
-    target.ImportFromEPSG(WGS84_EPSG_ID)
-    target.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-
-    transform = osr.CoordinateTransformation(source, target)
-
-    point = ogr.Geometry(ogr.wkbPoint)
-    point.AddPoint(float(coordinate[0]), float(coordinate[1]))
-    point = point.ExportToWkt()
-    point = ogr.CreateGeometryFromWkt(point)
-
-    point.Transform(transform)
-
-    return [point.GetX(), point.GetY()]
+    return transform_points_to_wgs84([coordinate], crs_wkt=crs_wkt)[0]
 
 
 def transform_array_to_wgs84_from_wkt(crs_wkt, point_array):
@@ -345,22 +414,7 @@ def transform_array_to_wgs84_from_wkt(crs_wkt, point_array):
     Returns:
         Transformed array in WGS84
     """
-    array = []
-    # vector_rep
-    if type(point_array[0]) == list:
-        for x in point_array:
-            array.append(transform_to_wgs84_from_wkt(crs_wkt, x))
-        return array
-    # bbox
-    elif len(point_array) == 4:
-        bbox = [[point_array[0], point_array[1]], [point_array[2], point_array[3]]]
-        transf_bbox = transform_array_to_wgs84_from_wkt(crs_wkt, bbox)
-        return [
-            transf_bbox[0][0],
-            transf_bbox[0][1],
-            transf_bbox[1][0],
-            transf_bbox[1][1],
-        ]
+    return _transform_point_array(point_array, crs_wkt=crs_wkt)
 
 
 def validate_bbox_wgs84(bbox):
@@ -398,16 +452,69 @@ def get_delimiter(csv_file):
     return dialect.delimiter
 
 
-def get_time_format(time_list, num_sample):
-    """
-    Function purpose: 'Guess' time format of a list of 'strings' by taking a representative sample
-    time_list:  list of strings \n
-    num_sample: size of the sample to determine time format \n
-    Output: time format in string format (e.g '%Y.%M.d')
-    """
-
-    date_time_format = None
-
+# Inferring a time format tries flexible parsing and then up to two dozen
+# explicit formats on a sample. Columns with the same name and value layout
+# (the per-file tables of a directory, the layers of a dataset) share their
+# format, so inferred formats are cached per column signature for the process.
+# A cached format is checked on the current sample first: values of the same
+# layout may still use another order or separator.
+_TIME_FORMAT_CACHE_SIZE = 1024
+_CACHED_FORMAT_MIN_PARSE_RATE = 0.9
+_time_formats = collections.OrderedDict()
+_time_formats_lock = threading.Lock()
+_VALUE_SHAPE = str.maketrans(
+    "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "9" * 10 + "a" * 52,
+)
+_COMMON_TIME_FORMATS = [
+    "%Y/%m/%d %H:%M:%S",  # 2023/03/23 23:23:23
+    "%Y-%m-%d %H:%M:%S",  # 2023-03-23 23:23:23
+    "%Y/%m/%d",  # 2023/03/23
+    "%Y-%m-%d",  # 2023-03-23
+    "%d/%m/%Y",  # 23/03/2023
+    "%d-%m-%Y",  # 23-03-2023
+    "%m/%d/%Y",  # 03/23/2023
+    "%m-%d-%Y",  # 03-23-2023
+    "%Y%m%d",  # 20230323
+    "%d.%m.%Y",  # 23.03.2023
+    "%Y.%m.%d",  # 2023.03.23
+    "%Y-%m-%dT%H:%M:%S",  # 2023-03-23T23:23:23 (ISO 8601)
+    "%Y-%m-%dT%H:%M:%S.%f",  # 2023-03-23T23:23:23.123456 (ISO with fractional)
+    "%Y-%m-%dT%H:%M:%S%z",  # 2023-03-23T23:23:23+0200 (ISO with timezone offset)
+    "%Y-%m-%d %H:%M:%S.%f",  # 2023-03-23 23:23:23.123456 (space sep with fractional)
+    "%d %B %Y",  # 23 March 2023 (verbose month)
+    "%d %b %Y",  # 23 Mar 2023 (abbrev month)
+    "%a, %d %b %Y %H:%M:%S %z",  # Thu, 23 Mar 2023 23:23:23 +0200 (RFC 2822/email)
+    "%H:%M:%S",  # 23:23:23 (time only)
+    "%H:%M:%S.%f",  # 23:23:23.123 (time with fractional seconds)
+    "%Y-%m",  # 2023-03 (year-month)
+    "%Y",  # 2023 (year only)
+    "%Y-%j",  # 2023-082 (ordinal day of year)
+    "%d/%m/%y",  # 23/03/23 (two-digit year)
+    "%m/%d/%y",  # 03/23/23 (US two-digit year)
+    "%Y.%m.%d %H:%M:%S",  # 2023.03.23 23:23:23 (dotted date with time)
+]
+
+
+def time_column_signature(column, time_sample):
+    """
+    Function purpose: key of the time format cache for a sampled column
+    column: column or field name \n
+    time_sample: sampled values of the column \n
+    Output: tuple of the column name and the layouts of the sampled values,
+    digits and letters masked (e.g. '2017-04-08' -> '9999-99-99')
+    """
+    shapes = frozenset(str(value).translate(_VALUE_SHAPE) for value in time_sample)
+    return (column, shapes)
+
+
+def clear_time_format_cache():
+    """Forget all time formats inferred with a column name."""
+    with _time_formats_lock:
+        _time_formats.clear()
+
+
+def _sample_time_values(time_list, num_sample):
     if num_sample is None:
         num_sample = PREFERRED_SAMPLE_SIZE
         logger.info(
@@ -423,135 +530,193 @@ def get_time_format(time_list, num_sample):
         )
 
     if len(time_list) < num_sample:
-        time_sample = time_list
         logger.info(
             "num_sample is greater than the length of the list. num_sample modified to length of list {}".format(
                 len(time_list)
             )
         )
-    else:
-        # Selects first and last element
-        time_sample = [
-            [time_list[1], time_list[-1]],
-            random.sample(time_list[1:-1], num_sample - 2),
-        ]
-        # Selects num_sample-2 elements
-        time_sample = sum(time_sample, [])
+        return list(time_list)
+    # Selects first and last element
+    time_sample = [time_list[1], time_list[-1]]
+    # Selects num_sample-2 elements (by position, the same as sampling the
+    # values, without copying the list)
+    time_sample.extend(
+        time_list[i]
+        for i in random.sample(range(1, len(time_list) - 1), num_sample - 2)
+    )
+    return time_sample
 
-    # Primary method: pandas format detection (fallback approach without numpy)
-    format_list = []
-    for i in range(0, len(time_sample)):
-        try:
-            # Try to use pandas to infer format directly instead of _guess_datetime_format_for_array
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", UserWarning)
-                sample_series = pd.to_datetime([time_sample[i]])
-            if not sample_series.isna().all():
-                # If pandas can parse it, we'll use 'flexible' as indicator
-                format_list.append("flexible")
-            else:
-                format_list.append(None)
-        except Exception:
-            format_list.append(None)
-    unique_formats = list(set([f for f in format_list if f is not None]))
 
-    logger.info("UNIQUE_FORMATS {}".format(unique_formats))
-    if unique_formats is not None:
-        for tf in unique_formats:
-            try:
-                pd.to_datetime(time_sample, format=tf)
-                date_time_format = tf
-                break
-            except:
-                pass
+def _infer_time_format(time_sample):
+    import pandas as pd
+
+    # Primary method: pandas flexible parsing of the whole sample
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            parsed_sample = pd.to_datetime(time_sample, errors="coerce")
+        if not parsed_sample.isna().all():
+            # If parsing succeeds, return a special indicator for flexible parsing
+            logger.debug("Flexible parsing successful")
+            return "flexible"
+    except Exception:
+        pass
 
-    # Fallback 1: Try pandas flexible parsing without explicit format
-    if date_time_format is None:
-        logger.debug("Primary format detection failed, trying flexible parsing")
+    # Fallback: Try common datetime format patterns
+    logger.debug("Flexible parsing failed, trying common format patterns")
+    for fmt in _COMMON_TIME_FORMATS:
         try:
-            # Test if pandas can parse the sample without explicit format
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", UserWarning)
-                parsed_sample = pd.to_datetime(time_sample, errors="coerce")
-            if not parsed_sample.isna().all():
-                # If parsing succeeds, return a special indicator for flexible parsing
-                date_time_format = "flexible"
-                logger.debug("Flexible parsing successful")
+            pd.to_datetime(time_sample, format=fmt, errors="raise")
+            logger.debug("Found matching format: {}".format(fmt))
+            return fmt
         except Exception:
-            pass
-
-    # Fallback 2: Try common datetime format patterns
-    if date_time_format is None:
-        logger.debug("Flexible parsing failed, trying common format patterns")
-        common_formats = [
-            "%Y/%m/%d %H:%M:%S",  # 2023/03/23 23:23:23
-            "%Y-%m-%d %H:%M:%S",  # 2023-03-23 23:23:23
-            "%Y/%m/%d",  # 2023/03/23
-            "%Y-%m-%d",  # 2023-03-23
-            "%d/%m/%Y",  # 23/03/2023
-            "%d-%m-%Y",  # 23-03-2023
-            "%m/%d/%Y",  # 03/23/2023
-            "%m-%d-%Y",  # 03-23-2023
-            "%Y%m%d",  # 20230323
-            "%d.%m.%Y",  # 23.03.2023
-            "%Y.%m.%d",  # 2023.03.23
-            "%Y-%m-%dT%H:%M:%S",  # 2023-03-23T23:23:23 (ISO 8601)
-            "%Y-%m-%dT%H:%M:%S.%f",  # 2023-03-23T23:23:23.123456 (ISO with fractional)
-            "%Y-%m-%dT%H:%M:%S%z",  # 2023-03-23T23:23:23+0200 (ISO with timezone offset)
-            "%Y-%m-%d %H:%M:%S.%f",  # 2023-03-23 23:23:23.123456 (space sep with fractional)
-            "%d %B %Y",  # 23 March 2023 (verbose month)
-            "%d %b %Y",  # 23 Mar 2023 (abbrev month)
-            "%a, %d %b %Y %H:%M:%S %z",  # Thu, 23 Mar 2023 23:23:23 +0200 (RFC 2822/email)
-            "%H:%M:%S",  # 23:23:23 (time only)
-            "%H:%M:%S.%f",  # 23:23:23.123 (time with fractional seconds)
-            "%Y-%m",  # 2023-03 (year-month)
-            "%Y",  # 2023 (year only)
-            "%Y-%j",  # 2023-082 (ordinal day of year)
-            "%d/%m/%y",  # 23/03/23 (two-digit year)
-            "%m/%d/%y",  # 03/23/23 (US two-digit year)
-            "%Y.%m.%d %H:%M:%S",  # 2023.03.23 23:23:23 (dotted date with time)
-        ]
+            continue
+    return None
 
-        for fmt in common_formats:
-            try:
-                pd.to_datetime(time_sample, format=fmt, errors="raise")
-                date_time_format = fmt
-                logger.debug("Found matching format: {}".format(fmt))
-                break
-            except Exception:
-                continue
 
+def _parse_rate(time_sample, datetime_format):
+    """Share of the non-empty values of *time_sample* parsed with *datetime_format*."""
+    values = [value for value in time_sample if value not in ("", None)]
+    if not values:
+        return 1.0
+    return parse_datetimes(values, datetime_format).notna().mean()
+
+
+def get_time_format(time_list, num_sample, column=None):
+    """
+    Function purpose: 'Guess' time format of a list of 'strings' by taking a representative sample
+    time_list:  list of strings \n
+    num_sample: size of the sample to determine time format \n
+    column: optional column name; formats are then cached per column signature
+    (see time_column_signature) and reused for columns of other files when
+    they parse the current sample \n
+    Output: time format in string format (e.g '%Y.%M.d')
+    """
+    time_sample = _sample_time_values(time_list, num_sample)
+    if column is None:
+        return _infer_time_format(time_sample)
+
+    key = time_column_signature(column, time_sample)
+    with _time_formats_lock:
+        cached = key in _time_formats
+        if cached:
+            _time_formats.move_to_end(key)
+            date_time_format = _time_formats[key]
+    if cached:
+        if (
+            date_time_format is None
+            or _parse_rate(time_sample, date_time_format)
+            >= _CACHED_FORMAT_MIN_PARSE_RATE
+        ):
+            return date_time_format
+        logger.debug(
+            "Cached time format {} does not fit the values of {}, inferring "
+            "it again".format(date_time_format, column)
+        )
+
+    date_time_format = _infer_time_format(time_sample)
+    with _time_formats_lock:
+        _time_formats[key] = date_time_format
+        if len(_time_formats) > _TIME_FORMAT_CACHE_SIZE:
+            _time_formats.popitem(last=False)
     return date_time_format
 
 
-def date_parser(datetime_list, num_sample=None):
+def date_parser(datetime_list, num_sample=None, column=None):
     """
     Function purpose: transform list of strings into date-time format
     datetime_list: list of date-times (strings) \n
+    column: optional column name for the time format cache \n
     Output: list of DatetimeIndex
     """
 
-    datetime_format = get_time_format(datetime_list, num_sample)
+    datetime_format = get_time_format(datetime_list, num_sample, column=column)
 
-    if datetime_format is not None:
-        if datetime_format == "flexible":
-            # Use pandas flexible parsing without explicit format
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", UserWarning)
-                parse_time_input_format = pd.to_datetime(datetime_list, errors="coerce")
-        else:
-            # Use explicit format
-            parse_time_input_format = pd.to_datetime(
-                datetime_list, format=datetime_format, errors="coerce"
-            )
+    if datetime_format is None:
+        return None
+    return parse_datetimes(datetime_list, datetime_format)
 
-        parse_time = pd.to_datetime(
-            parse_time_input_format, format=output_time_format, errors="coerce"
-        )
-    else:
-        parse_time = None
 
-    return parse_time
+def parse_datetimes(datetime_list, datetime_format):
+    """
+    Function purpose: parse a list of strings with a format found by get_time_format
+    datetime_list: list of date-times (strings) \n
+    datetime_format: strftime format or "flexible" \n
+    Output: DatetimeIndex, unparseable values are NaT
+    """
+    import pandas as pd
+
+    if datetime_format == "flexible":
+        # Use pandas flexible parsing without explicit format
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            return pd.to_datetime(datetime_list, errors="coerce")
+    # Use explicit format
+    return pd.to_datetime(datetime_list, format=datetime_format, errors="coerce")
+
+
+def datetime_envelope(datetimes):
+    """
+    Function purpose: earliest and latest date-time of parsed values
+    datetimes: DatetimeIndex or datetime Series, NaT is ignored \n
+    Output: [min, max] as pandas Timestamps, or None if there is no value
+    """
+    import pandas as pd
+
+    earliest = datetimes.min()
+    if pd.isna(earliest):
+        return None
+    return [earliest, datetimes.max()]
+
+
+def time_envelope(datetime_list, num_sample=None, column=None):
+    """
+    Function purpose: temporal extent of a list of date-times (strings), parsed
+    once as a column with the (cached) inferred format \n
+    datetime_list: list of date-times (strings), or an array of numpy
+    datetime64 values, which is used without parsing \n
+    num_sample: size of the sample to determine time format \n
+    column: optional column name for the time format cache \n
+    Output: [min, max] as pandas Timestamps, or None
+    """
+    import pandas as pd
+
+    if len(datetime_list) == 0:
+        return None
+    # Reduced to min/max on a Series, no DatetimeIndex is built
+    values = pd.Series(datetime_list, copy=False)
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return datetime_envelope(values)
+    datetime_format = get_time_format(datetime_list, num_sample, column=column)
+    if datetime_format is None:
+        return None
+    return datetime_envelope(parse_datetimes(values, datetime_format))
+
+
+def merge_time_envelopes(current, envelope):
+    """
+    Function purpose: combine two [min, max] time envelopes, either may be None
+    """
+    if envelope is None:
+        return current
+    if current is None:
+        return list(envelope)
+    return [min(current[0], envelope[0]), max(current[1], envelope[1])]
+
+
+def get_cache_dir():
+    """Return geoextent's per-user cache directory (not created).
+
+    ``GEOEXTENT_CACHE_DIR`` takes precedence, then ``$XDG_CACHE_HOME/geoextent``,
+    then ``~/.cache/geoextent``.
+    """
+    override = os.environ.get("GEOEXTENT_CACHE_DIR")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "geoextent")
 
 
 def extract_archive(filepath) -> Path:
@@ -559,6 +724,7 @@ def extract_archive(filepath) -> Path:
     Function purpose: extract archive (always inside a new folder)
     filepath: filepath to archive
     """
+    import patoolib
 
     filepath = Path(filepath)
 
@@ -604,6 +770,7 @@ def bbox_merge(metadata, origin):
 
     Note: All coordinates are expected to be in [longitude, latitude] order (GeoJSON standard)
     """
+    ogr, osr = ogr_osr()
     logger.debug("metadata {}".format(metadata))
     boxes_extent = []
     metadata_merge = {}
@@ -668,16 +835,10 @@ def bbox_merge(metadata, origin):
                     needs_transform = True
 
                 if needs_transform:
-                    source = osr.SpatialReference()
-
                     if crs_type == "epsg":
-                        source.ImportFromEPSG(int(crs_value))
-                    elif crs_type == "wkt":
-                        source.ImportFromWkt(crs_value)
-
-                    # Set traditional GIS axis order for source CRS (x/lon/easting, y/lat/northing)
-                    source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                    transform = osr.CoordinateTransformation(source, des_crs)
+                        transform = get_wgs84_transformation(crs=crs_value)
+                    else:
+                        transform = get_wgs84_transformation(crs_wkt=crs_value)
                     box.Transform(transform)
 
                 polygon = ogr.Geometry(ogr.wkbPolygon)
@@ -731,6 +892,7 @@ def convex_hull_merge(metadata, origin):
 
     Note: All coordinates are expected to be in [longitude, latitude] order (GeoJSON standard)
     """
+    ogr, osr = ogr_osr()
     logger.debug("convex hull metadata {}".format(metadata))
     geometries = []
     metadata_merge = {}
@@ -878,16 +1040,7 @@ def convex_hull_merge(metadata, origin):
 
                     # Transform to WGS84 if necessary
                     if crs != str(WGS84_EPSG_ID):
-                        source = osr.SpatialReference()
-                        source.ImportFromEPSG(int(crs))
-                        # Set traditional GIS axis order for source CRS (x/lon/easting, y/lat/northing)
-                        source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        des_crs = osr.SpatialReference()
-                        des_crs.ImportFromEPSG(WGS84_EPSG_ID)
-                        # Set traditional GIS axis order (lon, lat) for consistency with GeoJSON
-                        des_crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        transform = osr.CoordinateTransformation(source, des_crs)
-                        polygon.Transform(transform)
+                        polygon.Transform(get_wgs84_transformation(crs=crs))
 
                     geometries.append(polygon)
                 elif "bbox" in y and "crs" in y:
@@ -908,16 +1061,7 @@ def convex_hull_merge(metadata, origin):
 
                     # Transform to WGS84 if necessary
                     if crs != str(WGS84_EPSG_ID):
-                        source = osr.SpatialReference()
-                        source.ImportFromEPSG(int(crs))
-                        # Set traditional GIS axis order for source CRS (x/lon/easting, y/lat/northing)
-                        source.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        des_crs = osr.SpatialReference()
-                        des_crs.ImportFromEPSG(WGS84_EPSG_ID)
-                        # Set traditional GIS axis order (lon, lat) for consistency with GeoJSON
-                        des_crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-                        transform = osr.CoordinateTransformation(source, des_crs)
-                        polygon.Transform(transform)
+                        polygon.Transform(get_wgs84_transformation(crs=crs))
 
                     geometries.append(polygon)
             except Exception as e:
@@ -1113,6 +1257,7 @@ def transform_bbox(x):
     Function purpose: Transform bounding box (str) into geometry
     x: bounding box (str)
     """
+    ogr, osr = ogr_osr()
 
     try:
         ring = ogr.Geometry(ogr.wkbLinearRing)
@@ -1152,6 +1297,7 @@ def extract_details(details):
     details: dictionary with geoextent extraction
     Output: dataframe organized by filename, file format, handler, bbox, tbox and crs by file.
     """
+    import pandas as pd
 
     filename = []
     file_format = []
@@ -1223,6 +1369,8 @@ def extract_output(result, files, current_version):
     current_version: Current geoextent version
     Output: Dataframe with geoextent of all files AND final output (merge) of user request
     """
+    import pandas as pd
+
     filename = files
     file_format = result.get("format")
     handler = "geoextent:" + current_version
@@ -1271,6 +1419,7 @@ def create_geopackage(df, filename):
     df: dataframe from extract_output result
     filename: Name for the Geopackage file
     """
+    ogr, osr = ogr_osr()
     sr4326 = osr.SpatialReference()
     sr4326.ImportFromEPSG(WGS84_EPSG_ID)
 
@@ -1417,6 +1566,8 @@ def create_extraction_metadata(inputs, version, output_data=None):
     Returns:
         Dict containing extraction metadata
     """
+    import humanfriendly
+
     metadata = {
         "version": version,
         "inputs": inputs if isinstance(inputs, list) else [inputs],
@@ -1717,6 +1868,7 @@ def bbox_to_wkb(bbox):
     Returns:
         String containing hexadecimal WKB representation
     """
+    ogr, osr = ogr_osr()
     if not bbox or len(bbox) != 4:
         return None
 
@@ -1812,6 +1964,93 @@ def create_spatial_extent(geometry, crs="4326", extent_type="bounding_box"):
     return {"geometry": geometry, "bbox": bbox, "crs": crs, "extent_type": extent_type}
 
 
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _discard_interior_points(points):
+    # Akl-Toussaint heuristic: points strictly inside the polygon of the
+    # extreme points in eight directions (counter-clockwise from the
+    # leftmost) are not hull vertices
+    x, y = points[:, 0], points[:, 1]
+    extremes = [
+        x.argmin(),
+        (x + y).argmin(),
+        y.argmin(),
+        (x - y).argmax(),
+        x.argmax(),
+        (x + y).argmax(),
+        y.argmax(),
+        (x - y).argmin(),
+    ]
+    corners = [i for k, i in enumerate(extremes) if i != extremes[k - 1]]
+    if len(corners) < 3:
+        return points
+    corners = points[corners]
+    inside = np.ones(len(points), dtype=bool)
+    for a, b in zip(corners, np.roll(corners, -1, axis=0)):
+        inside &= (b[0] - a[0]) * (y - a[1]) - (b[1] - a[1]) * (x - a[0]) > 0
+    return points[~inside]
+
+
+def convex_hull_points(points):
+    """
+    Convex hull of 2D points (Andrew's monotone chain)
+
+    Points strictly inside the polygon of the extreme points are
+    discarded first, vectorised, so large batches of points cost little more
+    than sorting their candidates. To compute the hull of more points than fit
+    in memory, merge batches into a running hull:
+    ``hull = convex_hull_points(np.vstack([hull, batch]))``.
+
+    Args:
+        points: array-like of [x, y] coordinate pairs
+
+    Returns:
+        numpy array of the hull vertices in counter-clockwise order, starting
+        at the leftmost (then lowest) vertex, without repeating the first one.
+        Fewer than 3 rows if the points are collinear.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) > 2:
+        points = _discard_interior_points(points)
+    # np.unique sorts by x, then y, as the monotone chain requires
+    candidates = np.unique(points, axis=0)
+    if len(candidates) <= 2:
+        return candidates
+    candidates = candidates.tolist()
+
+    lower = []
+    for p in candidates:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper = []
+    for p in reversed(candidates):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return np.array(lower[:-1] + upper[:-1], dtype=float)
+
+
+def convex_hull_ring(hull):
+    """
+    Closed ring of convex hull vertices, oriented like GEOS builds it
+
+    Args:
+        hull: hull vertices in counter-clockwise order, as returned by
+            convex_hull_points
+
+    Returns:
+        List of [x, y] pairs running clockwise from the lowest (then
+        leftmost) vertex, with the first vertex repeated at the end
+    """
+    ring = np.asarray(hull)[::-1].tolist()
+    start = min(range(len(ring)), key=lambda i: (ring[i][1], ring[i][0]))
+    ring = ring[start:] + ring[:start]
+    return ring + [ring[0]]
+
+
 def coords_to_geojson_polygon(coords):
     """
     Convert coordinate array to GeoJSON Polygon
@@ -1869,6 +2108,7 @@ def convex_hull_coords_to_wkb(coords):
     Returns:
         String containing hexadecimal WKB representation
     """
+    ogr, osr = ogr_osr()
     if not coords or len(coords) < 3:
         return None
 
@@ -1927,6 +2167,8 @@ def parse_download_size(size_string):
     Returns:
         int: Size in bytes, or None if parsing fails
     """
+    import humanfriendly
+
     if size_string is None:
         return None
 
@@ -1946,6 +2188,67 @@ def parse_download_size(size_string):
         return None
 
 
+#: File extensions that suggest geospatial content. Used to skip other
+#: files before downloading them (``download_skip_nogeo``) and when
+#: selecting the members of an archive.
+GEOSPATIAL_EXTENSIONS = frozenset(
+    {
+        # Core officially supported formats (documented in README.md and CLI)
+        ".geojson",  # GeoJSON
+        ".csv",  # Tabular data (potential coordinates)
+        ".txt",  # Tab-delimited text (e.g. Darwin Core Archive occurrence files)
+        ".shp",
+        ".shx",
+        ".dbf",
+        ".prj",  # Shapefile components
+        ".tif",
+        ".tiff",
+        ".geotiff",  # GeoTIFF
+        ".gpkg",  # GeoPackage
+        ".gpx",  # GPS Exchange Format
+        ".gml",  # Geography Markup Language
+        ".kml",
+        ".kmz",  # Keyhole Markup Language
+        ".fgb",  # FlatGeobuf
+        # Additional commonly encountered geospatial extensions
+        ".json",  # JSON files that might be GeoJSON
+        ".nc",
+        ".netcdf",  # NetCDF (often used for atmospheric/ocean data)
+        ".asc",  # ASCII Grid (raster format)
+        ".zip",
+        ".tar",
+        ".gz",
+        ".rar",  # Archives that might contain geospatial data
+        ".sqlite",
+        ".db",  # Spatial databases (might be GeoPackage or SpatiaLite)
+        ".las",
+        ".laz",  # Point cloud (LAS/LAZ)
+    }
+)
+
+
+def is_geospatial_filename(filename, additional_extensions=None):
+    """
+    Check if a file is likely to contain geospatial data based on its extension.
+
+    Args:
+        filename: Name of the file to check
+        additional_extensions: Set of additional file extensions to consider geospatial
+
+    Returns:
+        bool: True if file extension suggests geospatial content
+    """
+    extensions = GEOSPATIAL_EXTENSIONS
+    if additional_extensions:
+        extensions = extensions.union(
+            {
+                ext.lower() if ext.startswith(".") else f".{ext.lower()}"
+                for ext in additional_extensions
+            }
+        )
+    return Path(filename).suffix.lower() in extensions
+
+
 def _group_shapefile_components(files_info):
     """
     Group shapefile components together so they stay together during selection.
@@ -2037,6 +2340,8 @@ def filter_files_by_size(
     Raises:
         DownloadSizeExceeded: When provider_name is set and files would be skipped
     """
+    import humanfriendly
+
     if not files_info or max_download_size is None:
         return files_info, sum(f.get("size", 0) for f in files_info), []
 
@@ -2157,17 +2462,19 @@ class GeojsonioUrlError(Exception):
     behaviour so existing internal callers don't need to change."""
 
 
-# Threshold above which the ``geojsonio`` library switches from URL-fragment
-# encoding to anonymous-gist upload. Mirrors ``geojsonio.MAX_URL_LEN`` (150e3
-# bytes of GeoJSON content). geojson.io itself doesn't publish a maximum
-# payload size — this is purely the wrapper library's choice. Read from the
-# library at import time so the threshold stays in sync if it's ever bumped.
-try:
-    from geojsonio.geojsonio import MAX_URL_LEN as _GEOJSONIO_URL_FRAGMENT_LIMIT
+@functools.lru_cache(maxsize=None)
+def _geojsonio_url_fragment_limit():
+    """Threshold above which the ``geojsonio`` library switches from URL-fragment
+    encoding to anonymous-gist upload. Mirrors ``geojsonio.MAX_URL_LEN`` (150e3
+    bytes of GeoJSON content). geojson.io itself doesn't publish a maximum
+    payload size — this is purely the wrapper library's choice. Read from the
+    library on first use so the threshold stays in sync if it's ever bumped."""
+    try:
+        from geojsonio.geojsonio import MAX_URL_LEN
 
-    _GEOJSONIO_URL_FRAGMENT_LIMIT = int(_GEOJSONIO_URL_FRAGMENT_LIMIT)
-except Exception:  # pragma: no cover - library API hasn't changed in years
-    _GEOJSONIO_URL_FRAGMENT_LIMIT = 150_000
+        return int(MAX_URL_LEN)
+    except Exception:  # pragma: no cover - library API hasn't changed in years
+        return 150_000
 
 
 def generate_geojsonio_url(
@@ -2191,6 +2498,7 @@ def generate_geojsonio_url(
         available (or if the URL service call failed and
         ``raise_on_error=False``).
     """
+    import geojsonio
 
     if not extent_output or not extent_output.get("bbox"):
         return None
@@ -2226,7 +2534,7 @@ def generate_geojsonio_url(
             return url
         except Exception as e:
             logger = logging.getLogger("geoextent")
-            too_big = payload_size > _GEOJSONIO_URL_FRAGMENT_LIMIT
+            too_big = payload_size > _geojsonio_url_fragment_limit()
             endpoint = (
                 "geojsonio.make_url → GitHub Gist API "
                 "(anonymous gist fallback for GeoJSON > ~150 KB)"
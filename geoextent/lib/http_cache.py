@@ -0,0 +1,378 @@
+"""Persistent HTTP response cache for content-provider metadata requests.
+
+Content providers fetch the same metadata on every run: DOI resolution via
+doi.org, Zenodo records, Figshare articles, Dataverse dataset JSON, PANGAEA
+landing pages, ... For batch runs over many DOIs this repeats thousands of
+identical requests and runs into rate limits. :class:`HTTPCache` stores
+small ``GET`` responses in a SQLite database shared by all providers:
+
+* a stored response younger than the cache's ``ttl`` is served without
+  contacting the server;
+* an older one is revalidated with ``If-None-Match`` / ``If-Modified-Since``
+  when the server sent an ``ETag`` / ``Last-Modified`` header, and a
+  ``304 Not Modified`` answer refreshes the stored copy;
+* redirects are cached too, and DOI → landing page URL resolutions are
+  kept in a table of their own, so provider selection needs no doi.org
+  request for a DOI seen before;
+* streamed requests (file downloads), non-``GET`` requests, large bodies
+  and responses marked ``Cache-Control: no-store`` are never stored.
+
+The cache is plugged into requests through :class:`CachingHTTPAdapter`,
+which :meth:`DoiProvider._create_optimized_session` mounts on every
+provider session. The adapter passes requests straight through unless a
+cache is active — see :func:`use_http_cache` and the ``GEOEXTENT_HTTP_CACHE``
+environment variable (``1`` for the default location or a database path).
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from . import helpfunctions as hf
+
+logger = logging.getLogger("geoextent")
+
+#: Default time (seconds) a stored response is served without revalidation.
+DEFAULT_TTL = 24 * 60 * 60
+
+#: Responses with larger bodies are not stored (metadata, not data files).
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+_DEFAULT_FILENAME = "http-cache.sqlite"
+
+_CACHEABLE_STATUS = frozenset({200, 203, 300, 301, 302, 303, 307, 308})
+
+# Request headers that select a different representation of the same URL.
+_VARY_HEADERS = ("Accept", "Accept-Language", "Authorization")
+
+
+def default_cache_path():
+    """Return the default location of the HTTP cache database."""
+    return os.path.join(hf.get_cache_dir(), _DEFAULT_FILENAME)
+
+
+def _cache_control(headers):
+    directives = set()
+    for part in headers.get("Cache-Control", "").split(","):
+        part = part.strip().lower()
+        if part:
+            directives.add(part.split("=", 1)[0])
+    return directives
+
+
+class HTTPCache:
+    """SQLite-backed store of HTTP responses.
+
+    Safe to share between threads (each thread uses its own connection).
+
+    Args:
+        path: database file (default: :func:`default_cache_path`)
+        ttl: seconds a stored response is used without revalidation; ``0``
+            revalidates on every request
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self._local = threading.local()
+
+    def __repr__(self):
+        return "HTTPCache({!r}, ttl={!r})".format(self.path, self.ttl)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS doi_urls ("
+                " doi TEXT PRIMARY KEY,"
+                " url TEXT NOT NULL,"
+                " stored REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " url TEXT NOT NULL,"
+                " status INTEGER NOT NULL,"
+                " reason TEXT,"
+                " headers TEXT NOT NULL,"
+                " body BLOB NOT NULL,"
+                " stored REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def key_for(request):
+        """Return the cache key of a prepared *request*."""
+        parts = [request.method, request.url]
+        for name in _VARY_HEADERS:
+            parts.append("{}={}".format(name, request.headers.get(name, "")))
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the stored entry for *key* as a dict, or ``None``."""
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT url, status, reason, headers, body, stored"
+                    " FROM responses WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.debug("HTTP cache lookup failed: {}".format(e))
+            return None
+        if row is None:
+            return None
+        url, status, reason, headers, body, stored = row
+        return {
+            "url": url,
+            "status": status,
+            "reason": reason,
+            "headers": CaseInsensitiveDict(json.loads(headers)),
+            "body": bytes(body),
+            "stored": stored,
+        }
+
+    def put(self, key, response):
+        """Store a fully read *response* under *key*."""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses"
+                    " (key, url, status, reason, headers, body, stored)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response.url,
+                        response.status_code,
+                        response.reason,
+                        json.dumps(dict(response.headers)),
+                        sqlite3.Binary(response.content),
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.debug("HTTP cache write failed: {}".format(e))
+
+    def touch(self, key, headers=None):
+        """Mark the entry for *key* as fresh again after a 304 revalidation."""
+        try:
+            conn = self._connection()
+            with conn:
+                if headers is None:
+                    conn.execute(
+                        "UPDATE responses SET stored = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE responses SET stored = ?, headers = ? WHERE key = ?",
+                        (time.time(), json.dumps(dict(headers)), key),
+                    )
+        except sqlite3.Error as e:
+            logger.debug("HTTP cache update failed: {}".format(e))
+
+    def get_doi_url(self, doi):
+        """Return the stored landing page URL of *doi* if younger than ``ttl``."""
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT url, stored FROM doi_urls WHERE doi = ?", (doi.lower(),)
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.debug("HTTP cache lookup failed: {}".format(e))
+            return None
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return row[0]
+
+    def put_doi_url(self, doi, url):
+        """Store the landing page URL *doi* resolved to."""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO doi_urls (doi, url, stored) VALUES (?, ?, ?)",
+                    (doi.lower(), url, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.debug("HTTP cache write failed: {}".format(e))
+
+    def is_fresh(self, entry):
+        """True if *entry* can be served without contacting the server."""
+        if "no-cache" in _cache_control(entry["headers"]):
+            return False
+        return time.time() - entry["stored"] < self.ttl
+
+    def clear(self):
+        """Remove all stored responses."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_active_lock = threading.Lock()
+_active_cache = None
+_env_cache = None
+
+
+def get_active_http_cache():
+    """Return the process-wide HTTP cache, or ``None`` when caching is off.
+
+    A cache installed with :func:`use_http_cache` takes precedence over the
+    ``GEOEXTENT_HTTP_CACHE`` environment variable.
+    """
+    global _env_cache
+    if _active_cache is not None:
+        return _active_cache
+    setting = os.environ.get("GEOEXTENT_HTTP_CACHE")
+    if not setting or setting.lower() in ("0", "false", "no"):
+        return None
+    with _active_lock:
+        path = None if setting.lower() in ("1", "true", "yes") else setting
+        if _env_cache is None or _env_cache.path != (path or default_cache_path()):
+            _env_cache = HTTPCache(path)
+        return _env_cache
+
+
+def resolve_http_cache(http_cache):
+    """Normalise the ``http_cache`` argument of the public API.
+
+    Accepts ``None``/``False`` (disabled), ``True`` (default location), a
+    database path, or an :class:`HTTPCache`.
+    """
+    if http_cache is None or http_cache is False:
+        return None
+    if http_cache is True:
+        return HTTPCache()
+    if isinstance(http_cache, HTTPCache):
+        return http_cache
+    if isinstance(http_cache, (str, os.PathLike)):
+        return HTTPCache(os.fspath(http_cache))
+    raise TypeError(
+        "http_cache must be a bool, a path or an HTTPCache, got {}".format(
+            type(http_cache).__name__
+        )
+    )
+
+
+@contextlib.contextmanager
+def use_http_cache(http_cache):
+    """Activate *http_cache* for all provider sessions within the block.
+
+    *http_cache* takes the values accepted by :func:`resolve_http_cache`;
+    with ``None`` / ``False`` the current setting is left unchanged.
+    """
+    global _active_cache
+    cache = resolve_http_cache(http_cache)
+    if cache is None:
+        yield get_active_http_cache()
+        return
+    with _active_lock:
+        previous = _active_cache
+        _active_cache = cache
+    try:
+        yield cache
+    finally:
+        with _active_lock:
+            _active_cache = previous
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that serves and stores responses via the active cache.
+
+    Without an active :class:`HTTPCache` it behaves exactly like
+    ``HTTPAdapter``. Responses served from the cache carry
+    ``response.from_cache = True``.
+    """
+
+    def send(self, request, stream=False, timeout=None, verify=True, **kwargs):
+        cache = get_active_http_cache()
+        if cache is None or request.method != "GET" or stream:
+            return super().send(
+                request, stream=stream, timeout=timeout, verify=verify, **kwargs
+            )
+
+        key = cache.key_for(request)
+        entry = cache.get(key)
+        if entry is not None:
+            if cache.is_fresh(entry):
+                logger.debug("HTTP cache hit for %s", request.url)
+                return self._build_cached_response(request, entry)
+            etag = entry["headers"].get("ETag")
+            modified = entry["headers"].get("Last-Modified")
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if modified:
+                request.headers["If-Modified-Since"] = modified
+
+        response = super().send(
+            request, stream=False, timeout=timeout, verify=verify, **kwargs
+        )
+
+        if entry is not None and response.status_code == 304:
+            logger.debug("HTTP cache revalidated %s", request.url)
+            headers = entry["headers"].copy()
+            headers.update(response.headers)
+            cache.touch(key, headers)
+            entry["headers"] = headers
+            return self._build_cached_response(request, entry)
+
+        if self._is_cacheable(response):
+            cache.put(key, response)
+        response.from_cache = False
+        return response
+
+    @staticmethod
+    def _is_cacheable(response):
+        if response.status_code not in _CACHEABLE_STATUS:
+            return False
+        if "no-store" in _cache_control(response.headers):
+            return False
+        length = response.headers.get("Content-Length")
+        if length is not None and length.isdigit() and int(length) > MAX_BODY_SIZE:
+            return False
+        return len(response.content) <= MAX_BODY_SIZE
+
+    def _build_cached_response(self, request, entry):
+        response = Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = entry["headers"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = entry["body"]
+        response._content_consumed = True
+        response.from_cache = True
+        return response
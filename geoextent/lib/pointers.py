@@ -0,0 +1,77 @@
+"""Pointer files: small JSON records written in place of a file.
+
+``from_directory`` does not always materialise the files it extracts:
+
+* remote-open mode (:mod:`geoextent.lib.remote_open`) writes a
+  ``<name>.geoextent-remote`` pointer with the file URL instead of
+  downloading the file;
+* in-process archive reading (:mod:`geoextent.lib.archives`) writes a
+  ``<name>.geoextent-member`` pointer with the archive and member name
+  instead of extracting the member.
+
+Both kinds share the format handled here: a JSON record in a file named
+after the original file plus a suffix per kind. The modules above decide
+what goes into the record and how a pointer is extracted.
+"""
+
+import json
+import os
+
+#: Pointer kinds.
+REMOTE = "remote"
+MEMBER = "member"
+
+#: Suffix of the pointer files of each kind.
+SUFFIXES = {
+    REMOTE: ".geoextent-remote",
+    MEMBER: ".geoextent-member",
+}
+
+
+def pointer_kind(path):
+    """Return the kind of pointer *path* names, or ``None`` for other files."""
+    for kind, suffix in SUFFIXES.items():
+        if path.endswith(suffix):
+            return kind
+    return None
+
+
+def is_pointer(path):
+    """True if *path* names a pointer file of any kind."""
+    return pointer_kind(path) is not None
+
+
+def original_name(filename):
+    """Return the name of the file a pointer *filename* stands for."""
+    kind = pointer_kind(filename)
+    if kind is None:
+        return filename
+    return filename[: -len(SUFFIXES[kind])]
+
+
+def write_pointer(filepath, kind, record):
+    """Write *record* as a *kind* pointer for the file at *filepath*.
+
+    Returns the pointer path.
+    """
+    pointer_path = filepath + SUFFIXES[kind]
+    os.makedirs(os.path.dirname(os.path.abspath(pointer_path)), exist_ok=True)
+    with open(pointer_path, "w", encoding="utf-8") as f:
+        json.dump(record, f)
+    return pointer_path
+
+
+def read_pointer(pointer_path):
+    """Return the record of a pointer file."""
+    with open(pointer_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def has_extent(result):
+    """True if the extraction *result* has a bounding box or a temporal extent.
+
+    A pointer whose file yields neither is extracted again from a local copy.
+    """
+    return bool(result) and (
+        result.get("bbox") is not None or result.get("tbox") is not None
+    )
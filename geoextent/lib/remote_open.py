@@ -0,0 +1,309 @@
+"""Remote-open extraction: read extents of remote files without downloading them.
+
+For many formats the spatial and temporal extent lives in a small header:
+Cloud Optimized GeoTIFFs, FlatGeobuf, GeoPackage, NetCDF/HDF5 and LAS/LAZ
+point clouds. With remote-open mode (``from_remote(..., remote_open=True)``,
+CLI: ``--remote-open``) providers that download through
+:meth:`DoiProvider._download_files_batch` do not fetch such files. They
+write a small *pointer file* (``<name>.geoextent-remote``, a JSON document
+with the file URL and size) into the download folder instead, and
+:func:`geoextent.lib.extent.from_directory` extracts the pointer with
+:func:`extract_pointer`:
+
+* GDAL formats are opened through ``/vsicurl/``, which reads only the byte
+  ranges GDAL needs (typically a few KB for a COG header);
+* LAS/LAZ headers, variable length records, the LAZ chunk table and LAS 1.4
+  extended variable length records are fetched with HTTP range requests
+  and written into a sparse local copy of the file, which laspy reads as
+  if it were complete;
+* if the remote open yields neither a bounding box nor a temporal extent
+  (server without range support, GDAL built without network access,
+  unsupported layout, ...), the file is downloaded and extracted as before,
+  through the download function the provider registered with the pointer
+  (its throttled, slot-limited download path) where there is one.
+
+Files smaller than :data:`MIN_REMOTE_SIZE` are always downloaded, they are
+cheaper to fetch than to probe with range requests.
+"""
+
+import contextlib
+import logging
+import os
+import struct
+import threading
+
+from . import pointers
+
+logger = logging.getLogger("geoextent")
+
+#: Suffix of the pointer files written instead of downloading a file.
+POINTER_SUFFIX = pointers.SUFFIXES[pointers.REMOTE]
+
+#: Extensions of formats whose extent can be read through GDAL ``/vsicurl/``.
+VSICURL_EXTENSIONS = frozenset(
+    {".tif", ".tiff", ".fgb", ".gpkg", ".nc", ".nc4", ".h5", ".hdf5", ".he5"}
+)
+
+#: Extensions of point clouds whose headers are read with HTTP range requests.
+RANGE_HEADER_EXTENSIONS = frozenset({".las", ".laz"})
+
+#: Files with a known size below this are downloaded (bytes).
+MIN_REMOTE_SIZE = 2 * 1024 * 1024
+
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# GDAL configuration for header-only access. Options are process-wide, so
+# they are set while at least one remote open is in progress.
+_VSICURL_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "GDAL_INGESTED_BYTES_AT_OPEN": "32768",
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": "5000000",
+    "GDAL_HTTP_TIMEOUT": "30",
+    "GDAL_HTTP_MAX_RETRY": "3",
+    "GDAL_HTTP_RETRY_DELAY": "2",
+}
+
+# Fallback downloads registered by providers, keyed by absolute pointer path
+_fallback_downloads = {}
+_fallback_lock = threading.Lock()
+
+_config_lock = threading.Lock()
+_config_users = 0
+_config_previous = {}
+
+# LAS public header block: fixed offsets (LAS 1.0 – 1.4)
+_LAS_HEADER_SIZE = 375
+_LAS_VERSION_OFFSET = 24
+_LAS_OFFSET_TO_POINTS = 96
+_LAS_FIRST_EVLR_OFFSET = 235
+
+
+class RangeNotSupported(Exception):
+    """The server ignored an HTTP ``Range`` request."""
+
+
+def is_remote_candidate(name, size=0):
+    """True if the file *name* (of *size* bytes, 0 = unknown) should be opened remotely."""
+    extension = os.path.splitext(name)[1].lower()
+    if extension not in VSICURL_EXTENSIONS and extension not in RANGE_HEADER_EXTENSIONS:
+        return False
+    return not size or size >= MIN_REMOTE_SIZE
+
+
+def write_pointer(filepath, url, size=0, download=None):
+    """Write a pointer to *url* for the file that would be saved at *filepath*.
+
+    *download*, a callable without arguments that saves the file at
+    *filepath*, replaces the plain download of :func:`extract_pointer`'s
+    fallback in this process.
+    """
+    pointer_path = pointers.write_pointer(
+        filepath, pointers.REMOTE, {"url": url, "size": size or 0}
+    )
+    if download is not None:
+        with _fallback_lock:
+            _fallback_downloads[os.path.abspath(pointer_path)] = download
+    return pointer_path
+
+
+def read_pointer(pointer_path):
+    """Return the ``{"url": ..., "size": ...}`` record of a pointer file."""
+    return pointers.read_pointer(pointer_path)
+
+
+def vsicurl_path(url):
+    """Return the GDAL virtual file system path for *url*."""
+    return "/vsicurl/" + url
+
+
+@contextlib.contextmanager
+def vsicurl_config():
+    """Apply the ``/vsicurl/`` GDAL options while the block runs.
+
+    Re-entrant and thread-safe: the options are set by the first user and
+    the previous values restored when the last one leaves.
+    """
+    global _config_users
+    from osgeo import gdal
+
+    with _config_lock:
+        if _config_users == 0:
+            for key, value in _VSICURL_OPTIONS.items():
+                _config_previous[key] = gdal.GetConfigOption(key)
+                gdal.SetConfigOption(key, value)
+        _config_users += 1
+    try:
+        yield
+    finally:
+        with _config_lock:
+            _config_users -= 1
+            if _config_users == 0:
+                for key in _VSICURL_OPTIONS:
+                    gdal.SetConfigOption(key, _config_previous.pop(key, None))
+
+
+def _session():
+    from .content_providers.providers import create_session
+
+    return create_session()
+
+
+def fetch_range(session, url, start, end):
+    """Return ``(data, total_size)`` for bytes *start* – *end* (inclusive) of *url*.
+
+    ``total_size`` is taken from the ``Content-Range`` header (``None`` if the
+    server does not report it). Raises :class:`RangeNotSupported` when the
+    server answers with the full body instead of a partial response.
+    """
+    headers = {"Range": "bytes={}-{}".format(start, end)}
+    with session.get(url, headers=headers, stream=True, timeout=30) as response:
+        if response.status_code != 206:
+            response.raise_for_status()
+            raise RangeNotSupported(
+                "{} answered a range request with HTTP {}".format(
+                    url, response.status_code
+                )
+            )
+        data = response.raw.read(end - start + 1, decode_content=False)
+        total = None
+        content_range = response.headers.get("Content-Range", "")
+        if "/" in content_range:
+            total_str = content_range.rsplit("/", 1)[1].strip()
+            if total_str.isdigit():
+                total = int(total_str)
+    return data, total
+
+
+def fetch_las_header(url, filepath, session=None):
+    """Write a sparse copy of the LAS/LAZ file at *url* holding only its metadata.
+
+    The public header block, the variable length records, the LAZ chunk
+    table and the LAS 1.4 extended variable length records are written at
+    their original offsets; point records are left as holes. Returns the
+    number of bytes transferred.
+    """
+    session = session or _session()
+    header, total = fetch_range(session, url, 0, _LAS_HEADER_SIZE - 1)
+    if len(header) < 227 or not header.startswith(b"LASF"):
+        raise ValueError("{} is not a LAS/LAZ file".format(url))
+
+    major, minor = struct.unpack_from("<BB", header, _LAS_VERSION_OFFSET)
+    (offset_to_points,) = struct.unpack_from("<I", header, _LAS_OFFSET_TO_POINTS)
+
+    # (offset, bytes) blocks to place in the sparse copy
+    blocks = [(0, header)]
+    if offset_to_points > len(header):
+        vlrs, _ = fetch_range(session, url, len(header), offset_to_points - 1)
+        blocks.append((len(header), vlrs))
+    transferred = sum(len(data) for _, data in blocks)
+
+    first_evlr = None
+    if (major, minor) >= (1, 4) and len(header) >= _LAS_FIRST_EVLR_OFFSET + 12:
+        first_evlr, number_of_evlrs = struct.unpack_from(
+            "<QI", header, _LAS_FIRST_EVLR_OFFSET
+        )
+        if not number_of_evlrs or not first_evlr:
+            first_evlr = None
+
+    if os.path.splitext(filepath)[1].lower() == ".laz":
+        # LAZ: the first 8 point-data bytes hold the chunk table offset
+        data, _ = fetch_range(session, url, offset_to_points, offset_to_points + 7)
+        blocks.append((offset_to_points, data))
+        transferred += len(data)
+        if len(data) == 8:
+            (chunk_table,) = struct.unpack("<q", data)
+            if chunk_table > offset_to_points:
+                end = (first_evlr or total or chunk_table + 65536) - 1
+                data, _ = fetch_range(session, url, chunk_table, end)
+                blocks.append((chunk_table, data))
+                transferred += len(data)
+
+    if first_evlr is not None:
+        end = (total or first_evlr + 65536) - 1
+        data, _ = fetch_range(session, url, first_evlr, end)
+        blocks.append((first_evlr, data))
+        transferred += len(data)
+
+    with open(filepath, "wb") as f:
+        for offset, data in blocks:
+            f.seek(offset)
+            f.write(data)
+        if total:
+            f.truncate(total)
+    logger.debug(
+        "Fetched {} metadata bytes of {} ({} bytes total)".format(
+            transferred, url, total
+        )
+    )
+    return transferred
+
+
+def download(url, filepath, session=None):
+    """Download *url* to *filepath*. Returns the number of bytes written."""
+    session = session or _session()
+    written = 0
+    try:
+        with session.get(url, stream=True) as response:
+            response.raise_for_status()
+            with open(filepath, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        written += len(chunk)
+    except Exception:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        raise
+    return written
+
+
+def extract_pointer(pointer_path, extract, download_extract=None, **options):
+    """Extract the remote file behind *pointer_path*.
+
+    *extract* is called like ``from_file(path, **options)`` on the remote
+    file (``/vsicurl/`` path or sparse header copy). If that yields no
+    extent, the file is downloaded next to the pointer and extracted with
+    *download_extract* (default: *extract*). The download goes through
+    the function registered with :func:`write_pointer`, if any.
+    """
+    record = read_pointer(pointer_path)
+    url = record["url"]
+    with _fallback_lock:
+        fallback = _fallback_downloads.pop(os.path.abspath(pointer_path), None)
+    local_path = pointers.original_name(pointer_path)
+    name = os.path.basename(local_path)
+    extension = os.path.splitext(name)[1].lower()
+
+    result = None
+    try:
+        if extension in RANGE_HEADER_EXTENSIONS:
+            fetch_las_header(url, local_path)
+            result = extract(local_path, **options)
+        else:
+            with vsicurl_config():
+                result = extract(vsicurl_path(url), **options)
+    except Exception as e:
+        logger.debug("Remote open of {} failed: {}".format(url, e))
+        result = None
+
+    if pointers.has_extent(result):
+        logger.info("Extracted {} remotely without downloading it".format(name))
+        result["format"] = extension[1:]
+        result["remote_open"] = True
+        if record.get("size"):
+            result["file_size_bytes"] = record["size"]
+        else:
+            result.pop("file_size_bytes", None)
+        return result
+
+    logger.info(
+        "Remote open of {} yielded no extent, downloading the file".format(name)
+    )
+    if fallback is not None:
+        fallback()
+    else:
+        download(url, local_path)
+    os.remove(pointer_path)
+    return (download_extract or extract)(local_path, **options)
@@ -1,7 +1,7 @@
 """Abstract interface for text extractors."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 
 @dataclass
@@ -37,9 +37,27 @@ class ExtractionResult:
 class TextExtractor:
     """Abstract base class for text extractors."""
 
+    def load(self) -> None:
+        """Load models or other resources up front (default: nothing to load)."""
+
     def extract(self, text: str) -> ExtractionResult:
         raise NotImplementedError
 
+    def extract_many(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+    ) -> Iterator[ExtractionResult]:
+        """Extract mentions from several documents, yielding them in input order.
+
+        *texts* is consumed lazily, so a generator keeps only the documents
+        being processed in memory. Backends that support batched inference
+        override this; the default calls :meth:`extract` once per document.
+        """
+        for text in texts:
+            yield self.extract(text)
+
     @property
     def model_name(self) -> str:
         return ""
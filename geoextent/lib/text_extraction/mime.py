@@ -27,7 +27,7 @@ TEXT_EXTENSIONS = frozenset({".txt", ".md", ".markdown", ".rst", ".text"})
 #: short-circuits both the ``mimetypes`` and content-sniff paths so we
 #: don't accidentally claim e.g. a ``.py`` file (which ``mimetypes`` does
 #: label ``text/x-python``).
-_EXCLUDE_EXTENSIONS = frozenset(
+EXCLUDE_EXTENSIONS = frozenset(
     {
         # Structured data — own handlers (vector, raster) or handle_csv
         ".csv",
@@ -123,7 +123,7 @@ _EXCLUDE_EXTENSIONS = frozenset(
 #: matched case-insensitively. The actual basename may have a suffix
 #: like ``LICENSE.txt`` — that case is already handled by the ``.txt``
 #: fast-path so we only need the bare names here.
-_TEXT_BASENAMES = frozenset(
+TEXT_BASENAMES = frozenset(
     {
         "README",
         "LICENSE",
@@ -145,16 +145,29 @@ _TEXT_BASENAMES = frozenset(
 )
 
 
+def has_text_name(filename: str) -> bool:
+    """Return True if *filename* names a plain-text file by itself.
+
+    Checks ``TEXT_EXTENSIONS`` and the extensionless ``TEXT_BASENAMES``
+    only, without touching the file (e.g. for archive members).
+    """
+    base = os.path.basename(filename)
+    ext = os.path.splitext(base)[1].lower()
+    if ext:
+        return ext in TEXT_EXTENSIONS
+    return base.upper() in TEXT_BASENAMES
+
+
 def is_text_file(filepath: str) -> bool:
     """Return True if *filepath* should be treated as a plain-text file.
 
     Decision order:
 
-    1. ``_EXCLUDE_EXTENSIONS`` → False (cheap reject for code, configs,
+    1. ``EXCLUDE_EXTENSIONS`` → False (cheap reject for code, configs,
        binary media, and structured-data extensions handled by other
        geoextent modules).
     2. ``TEXT_EXTENSIONS`` → True (the curated explicit yes list).
-    3. ``_TEXT_BASENAMES`` (e.g. ``README``, ``LICENSE``) → True.
+    3. ``TEXT_BASENAMES`` (e.g. ``README``, ``LICENSE``) → True.
     4. ``mimetypes.guess_type`` returning ``text/*`` → True (confirming-
        only hint; we never trust ``mimetypes`` for a "no" answer because
        its table is sparse and platform-dependent).
@@ -164,18 +177,16 @@ def is_text_file(filepath: str) -> bool:
     base = os.path.basename(filepath)
     ext = os.path.splitext(base)[1].lower()
 
-    if ext in _EXCLUDE_EXTENSIONS:
+    if ext in EXCLUDE_EXTENSIONS:
         return False
-    if ext in TEXT_EXTENSIONS:
-        return True
-    if not ext and base.upper() in _TEXT_BASENAMES:
+    if has_text_name(base):
         return True
 
     mime, _ = mimetypes.guess_type(filepath)
     if mime is not None and mime.startswith("text/"):
         # Trust mimetypes only for the text/* → True direction.
         # ``text/x-python`` etc. are already filtered above by the
-        # _EXCLUDE_EXTENSIONS fast-path, so anything reaching here is a
+        # EXCLUDE_EXTENSIONS fast-path, so anything reaching here is a
         # legitimate text/* hit (e.g. ``text/x-tex`` for ``.tex``,
         # ``text/x-bibtex`` for ``.bib``, ``text/calendar`` for ``.ics``).
         return True
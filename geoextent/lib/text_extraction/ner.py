@@ -1,7 +1,8 @@
 """spaCy-based named entity recognition for place and date mentions."""
 
+import collections
 import logging
-from typing import Iterable, Optional, Set
+from typing import Iterable, Iterator, Optional, Set
 
 from .base import DateMention, ExtractionResult, PlaceMention, TextExtractor
 
@@ -99,13 +100,59 @@ class NerExtractor(TextExtractor):
             )
         return self._phrase_matcher
 
+    def load(self) -> None:
+        """Load the spaCy model (and the period matcher) without extracting."""
+        self._ensure_loaded()
+        self._ensure_matcher()
+
     def extract(self, text: str) -> ExtractionResult:
-        result = ExtractionResult()
         if not text or not text.strip():
-            return result
+            return ExtractionResult()
+
+        nlp = self._ensure_loaded()
+        return self._result_from_doc(nlp(text))
+
+    def extract_many(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+    ) -> Iterator[ExtractionResult]:
+        """Run the spaCy pipeline over *texts* with ``nlp.pipe``.
+
+        Batching (and, with ``n_process > 1``, spaCy's multiprocessing) is
+        considerably faster than one ``nlp(text)`` call per document. *texts*
+        is streamed into the pipeline and the results are yielded in input
+        order as each batch finishes. Empty documents are skipped and yield
+        an empty result, as in :meth:`extract`.
+        """
+        # Indices of the skipped empty documents not yet yielded
+        empty = collections.deque()
+
+        def _documents():
+            for i, text in enumerate(texts):
+                if text and text.strip():
+                    yield text, i
+                else:
+                    empty.append(i)
 
         nlp = self._ensure_loaded()
-        doc = nlp(text)
+        docs = nlp.pipe(
+            _documents(),
+            as_tuples=True,
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+        for doc, i in docs:
+            while empty and empty[0] < i:
+                empty.popleft()
+                yield ExtractionResult()
+            yield self._result_from_doc(doc)
+        for _ in empty:
+            yield ExtractionResult()
+
+    def _result_from_doc(self, doc) -> ExtractionResult:
+        result = ExtractionResult()
 
         # Period spans win over overlapping NER entities (issue #112).
         from .periods import extract_periods as _extract_periods
@@ -13,6 +13,9 @@ Usage:
     pytest -m slow                  # Only slow network tests
 """
 
+import http.server
+import threading
+
 import pytest
 import requests
 
@@ -25,6 +28,29 @@ NETWORK_SKIP_EXCEPTIONS = (
     OSError,
 )
 
+
+@pytest.fixture
+def local_server():
+    """Serve a request handler class on localhost for the test.
+
+    ``local_server(Handler)`` starts a threaded HTTP server on a free port
+    and returns its base URL; servers are shut down and their sockets
+    closed on teardown.
+    """
+    servers = []
+
+    def start(handler_class):
+        httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append(httpd)
+        return "http://127.0.0.1:{}".format(httpd.server_port)
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
 # Repository provider test files that contain network-dependent tests
 _PROVIDER_FILES = {
     "test_api_zenodo.py",
@@ -190,11 +190,11 @@ def test_generate_geojsonio_url_raise_on_error():
     fake_err = Exception("401 Requires authentication")
 
     # Default mode: swallow + return None (preserves legacy callers).
-    with patch("geoextent.lib.helpfunctions.geojsonio.make_url", side_effect=fake_err):
+    with patch("geojsonio.make_url", side_effect=fake_err):
         assert hf.generate_geojsonio_url(extent_output) is None
 
     # Opt-in mode: re-raise as GeojsonioUrlError carrying the underlying text.
-    with patch("geoextent.lib.helpfunctions.geojsonio.make_url", side_effect=fake_err):
+    with patch("geojsonio.make_url", side_effect=fake_err):
         with pytest.raises(hf.GeojsonioUrlError) as exc_info:
             hf.generate_geojsonio_url(extent_output, raise_on_error=True)
         assert "401" in str(exc_info.value)
@@ -236,9 +236,7 @@ def test_generate_geojsonio_url_gist_fallback_message(caplog):
     fake_err = Exception("401 Requires authentication")
 
     with caplog.at_level(logging.WARNING, logger="geoextent"):
-        with patch(
-            "geoextent.lib.helpfunctions.geojsonio.make_url", side_effect=fake_err
-        ):
+        with patch("geojsonio.make_url", side_effect=fake_err):
             with pytest.raises(hf.GeojsonioUrlError) as exc_info:
                 hf.generate_geojsonio_url(extent_output, raise_on_error=True)
 
@@ -272,8 +270,8 @@ def test_geojsonio_url_fragment_limit_matches_library():
     import geoextent.lib.helpfunctions as hf
     from geojsonio.geojsonio import MAX_URL_LEN as upstream
 
-    assert hf._GEOJSONIO_URL_FRAGMENT_LIMIT == int(upstream), (
-        f"helpfunctions threshold {hf._GEOJSONIO_URL_FRAGMENT_LIMIT} drifted "
+    assert hf._geojsonio_url_fragment_limit() == int(upstream), (
+        f"helpfunctions threshold {hf._geojsonio_url_fragment_limit()} drifted "
         f"from geojsonio.MAX_URL_LEN {upstream}"
     )
 
@@ -287,7 +285,7 @@ def test_generate_geojsonio_url_small_payload_no_gist_hint():
     extent_output = {"bbox": [40.7128, -74.0059, 40.7589, -73.9352], "crs": "4326"}
     fake_err = Exception("connection reset")
 
-    with patch("geoextent.lib.helpfunctions.geojsonio.make_url", side_effect=fake_err):
+    with patch("geojsonio.make_url", side_effect=fake_err):
         with pytest.raises(hf.GeojsonioUrlError) as exc_info:
             hf.generate_geojsonio_url(extent_output, raise_on_error=True)
 
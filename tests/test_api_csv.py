@@ -687,3 +687,165 @@ class TestCSVEdgeCases:
         """Test handling of empty CSV file"""
         result = extract_bbox_only(get_test_file("csv", "empty"))
         assert_empty_result(result)
+
+
+class TestCSVStreamingScan:
+    """Test the single streaming pass over CSV files"""
+
+    def test_scan_result_independent_of_chunk_size(self):
+        """Running min/max over small chunks match a single chunk"""
+        import geoextent.lib.handle_csv as handle_csv
+
+        path = "tests/testdata/csv/cities_NL_TIME_DATE.csv"
+        whole = handle_csv._scan_csv(path)
+        chunked = handle_csv._scan_csv(path, chunk_size=2)
+        assert chunked.lat_range == whole.lat_range
+        assert chunked.lon_range == whole.lon_range
+        assert chunked.crs_values == whole.crs_values == {"4326"}
+        assert [t.strftime("%Y-%m-%d") for t in chunked.time_range] == [
+            "2010-09-01",
+            "2019-09-30",
+        ]
+
+    def test_scan_skips_geocsv_headers(self):
+        """EarthScope GeoCSV header lines are skipped without a temporary copy"""
+        import geoextent.lib.handle_csv as handle_csv
+
+        scan = handle_csv._scan_csv(get_test_file("csv", "geocsv_earthscope"))
+        assert scan.lat_range == pytest.approx([51.434444, 53.217222])
+        assert scan.lon_range == pytest.approx([4.3175, 6.574722])
+
+    def test_short_rows_do_not_add_empty_crs(self, tmp_path):
+        """Missing CRS cells of short rows are ignored"""
+        import geoextent.lib.handle_csv as handle_csv
+
+        path = tmp_path / "ragged.csv"
+        path.write_text(
+            "station,lat,lon,crs\n" "a,51.5,7.1,4326\n" "b,52.5,7.9\n" "c,52.0,7.5,\n"
+        )
+        assert handle_csv.get_crs(str(path)) == "4326"
+
+    def test_time_columns_detected_after_empty_leading_chunk(self, tmp_path):
+        """Dates missing from the first chunk are found in later chunks"""
+        import geoextent.lib.handle_csv as handle_csv
+
+        path = tmp_path / "late_dates.csv"
+        path.write_text(
+            "station,lat,lon,date\n"
+            "a,51.5,7.1,\n"
+            "b,51.6,7.2,\n"
+            "c,51.7,7.3,2020-01-05\n"
+            "d,52.5,7.9,2021-03-01\n"
+        )
+        scan = handle_csv._scan_csv(str(path), chunk_size=2)
+        assert scan.has_time_columns
+        assert [t.strftime("%Y-%m-%d") for t in scan.time_range] == [
+            "2020-01-05",
+            "2021-03-01",
+        ]
+
+    def test_bbox_and_tbox_share_one_scan(self, monkeypatch, tmp_path):
+        """from_file reads a CSV once for bbox and tbox"""
+        import geoextent.lib.extent as geoextent
+        import geoextent.lib.handle_csv as handle_csv
+
+        # Column names GDAL's CSV driver does not detect
+        path = tmp_path / "stations.csv"
+        path.write_text(
+            "station,site_lat,site_lon,obs_date\n"
+            "a,51.5,7.1,2020-01-05\n"
+            "b,52.5,7.9,2021-03-01\n"
+        )
+        calls = []
+        scan_csv = handle_csv._scan_csv
+
+        def counting_scan(*args, **kwargs):
+            calls.append(args[0])
+            return scan_csv(*args, **kwargs)
+
+        monkeypatch.setattr(handle_csv, "_scan_csv", counting_scan)
+        result = geoextent.from_file(str(path), bbox=True, tbox=True)
+
+        assert result["bbox"] == pytest.approx([51.5, 7.1, 52.5, 7.9], abs=tolerance)
+        assert result["tbox"] == ["2020-01-05", "2021-03-01"]
+        assert calls == [str(path)]
+
+
+class TestCSVColumnClassifier:
+    """Test the header classification shared by all CSV extent passes"""
+
+    def test_classify_roles(self):
+        import geoextent.lib.handle_csv as handle_csv
+
+        header = ["id", "Latitude", "Longitude", "EPSG", "geom_type", "WKT", "Date"]
+        roles = handle_csv.column_classifier.classify(header)
+        assert roles.latitude == [1]
+        assert roles.longitude == [2]
+        assert roles.geometry == 5  # exact "wkt" beats the general "geom" match
+        assert roles.crs == [("EPSG", [3])]
+        assert roles.time == [("Date", [6])]
+        assert roles.columns == [1, 2, 3, 5, 6]
+
+    def test_classify_groups_columns_containing_the_match(self):
+        """Like hf.search_for_parameters, a match extends to columns containing its name"""
+        import geoextent.lib.handle_csv as handle_csv
+
+        roles = handle_csv.column_classifier.classify(["lat", "lat_min", "value"])
+        assert roles.latitude == [0, 1]
+
+    def test_header_classified_once(self):
+        import geoextent.lib.handle_csv as handle_csv
+
+        header = ["site", "x", "y", "timestamp"] + ["v{}".format(i) for i in range(300)]
+        first = handle_csv.column_classifier.classify(header)
+        assert handle_csv.column_classifier.classify(tuple(header)) is first
+        assert first.longitude == [1] and first.latitude == [2]
+        assert first.columns == [1, 2, 3]
+
+
+class TestCSVDataFrameExtent:
+    """Test the extent of in-memory tables (e.g. PANGAEA data) without a CSV file"""
+
+    def test_dataframe_extent_typed_columns(self):
+        import pandas as pd
+        import geoextent.lib.handle_csv as handle_csv
+
+        frame = pd.DataFrame(
+            {
+                "Event": ["A", "B", "C", "D"],
+                "Latitude": [54.1, 55.0, None, 53.2],
+                "Longitude": [7.5, 8.25, 9.0, 6.0],
+                "Date/Time": pd.to_datetime(
+                    ["2019-05-02 10:00", None, "2018-11-30 08:15", "2019-01-01 00:00"]
+                ),
+            }
+        )
+        extent = handle_csv.dataframe_extent(frame)
+        assert sorted(map(tuple, extent.hull.tolist())) == [
+            (6.0, 53.2),
+            (7.5, 54.1),
+            (8.25, 55.0),
+        ]
+        assert extent.time_range == [
+            pd.Timestamp("2018-11-30 08:15"),
+            pd.Timestamp("2019-05-02 10:00"),
+        ]
+
+    def test_dataframe_extent_string_times(self):
+        import pandas as pd
+        import geoextent.lib.handle_csv as handle_csv
+
+        frame = pd.DataFrame({"value": [1, 2], "date": ["2020-03-01", "2020-01-15"]})
+        extent = handle_csv.dataframe_extent(frame)
+        assert extent.hull is None
+        assert [t.strftime("%Y-%m-%d") for t in extent.time_range] == [
+            "2020-01-15",
+            "2020-03-01",
+        ]
+
+    def test_dataframe_without_extent(self):
+        import pandas as pd
+        import geoextent.lib.handle_csv as handle_csv
+
+        frame = pd.DataFrame({"depth": [1.0, 2.0], "value": [3.0, 4.0]})
+        assert handle_csv.dataframe_extent(frame) is None
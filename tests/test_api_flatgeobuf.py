@@ -56,3 +56,70 @@ def test_flatgeobuf_format_recognition():
     )
     assert result["format"] == "fgb"
     assert result["geoextent_handler"] == "handle_vector"
+
+
+def _write_timed_fgb(path):
+    from osgeo import ogr, osr
+
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    ds = ogr.GetDriverByName("FlatGeobuf").CreateDataSource(str(path))
+    layer = ds.CreateLayer("obs", srs, ogr.wkbPoint)
+    layer.CreateField(ogr.FieldDefn("observed_datetime", ogr.OFTDateTime))
+    layer.CreateField(ogr.FieldDefn("start_date", ogr.OFTString))
+    layer.CreateField(ogr.FieldDefn("name", ogr.OFTString))
+    rows = [
+        ("2019/03/01 10:00:00", "2018-05-04"),
+        (None, "2017-12-31"),
+        ("2021/07/15 00:00:00", None),
+    ]
+    for i, (observed, start) in enumerate(rows):
+        feature = ogr.Feature(layer.GetLayerDefn())
+        if observed is not None:
+            feature.SetField("observed_datetime", observed)
+        if start is not None:
+            feature.SetField("start_date", start)
+        feature.SetField("name", "point {}".format(i))
+        feature.SetGeometry(ogr.CreateGeometryFromWkt("POINT ({} 50)".format(i)))
+        layer.CreateFeature(feature)
+    ds = None
+    return str(path)
+
+
+def test_flatgeobuf_time_fields_read_in_one_pass(tmp_path, monkeypatch):
+    from geoextent.lib import handle_vector
+
+    path = _write_timed_fgb(tmp_path / "obs.fgb")
+
+    tbox = handle_vector.get_temporal_extent(path)
+    assert tbox == ["2017-12-31", "2021-07-15"]
+
+    # the feature-by-feature fallback gives the same extent
+    def no_arrow(layer, field_names):
+        raise RuntimeError("no Arrow stream")
+
+    monkeypatch.setattr(handle_vector, "_read_field_arrays", no_arrow)
+    assert handle_vector.get_temporal_extent(path) == tbox
+
+
+def test_flatgeobuf_streaming_convex_hull_matches_geos(monkeypatch):
+    from osgeo import ogr
+    from geoextent.lib import handle_vector
+    from geoextent.lib import helpfunctions as hf
+
+    path = "tests/testdata/flatgeobuf/countries.fgb"
+    datasource = ogr.Open(path)
+    layer = datasource.GetLayer(0)
+    collection = ogr.Geometry(ogr.wkbGeometryCollection)
+    for feature in layer:
+        collection.AddGeometry(feature.GetGeometryRef().Clone())
+    ring = collection.ConvexHull().GetGeometryRef(0)
+    expected = [list(point[:2]) for point in ring.GetPoints()]
+
+    # merge the running hull many times
+    monkeypatch.setattr(handle_vector, "HULL_BATCH_SIZE", 100)
+    coords = hf.convex_hull_ring(handle_vector._stream_layer_hull(layer))
+
+    assert len(coords) == len(expected)
+    for point, expected_point in zip(coords, expected):
+        assert point == pytest.approx(expected_point, abs=1e-9)
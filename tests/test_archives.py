@@ -0,0 +1,307 @@
+"""Tests for in-process archive reading (geoextent.lib.archives)."""
+
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+import geoextent.lib.extent as geoextent
+from geoextent.lib import archives, pointers
+from help_functions_test import tolerance
+
+MEMBERS = {
+    "dem.tif": b"II*\x00tiff",
+    "dem.tfw": b"1\n0\n0\n-1\n0\n0\n",
+    "table.csv": b"lat,lon\n1,2\n",
+    "sub/roads.shp": b"shp",
+    "sub/roads.dbf": b"dbf",
+    "sub/roads.prj": b"prj",
+    "sub/nested.zip": b"PK\x05\x06" + b"\x00" * 18,
+    "store.gdb/a0000001.gdbtable": b"gdb",
+}
+
+
+def _write_zip(path):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in MEMBERS.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+def _write_tar(path, mode):
+    with tarfile.open(path, mode) as tf:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+def _tree(folder):
+    found = []
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            found.append(os.path.relpath(os.path.join(root, name), folder))
+    return sorted(p.replace(os.sep, "/") for p in found)
+
+
+@pytest.mark.parametrize(
+    "name,mode,prefix",
+    [("data.zip", None, "/vsizip/"), ("data.tar.gz", "w:gz", "/vsitar/")],
+)
+def test_open_archive_reads_gdal_members_in_place(tmp_path, name, mode, prefix):
+    path = tmp_path / name
+    archive = _write_zip(path) if mode is None else _write_tar(path, mode)
+
+    folder = archives.open_archive(archive)
+
+    assert _tree(folder) == [
+        "dem.tif" + archives.POINTER_SUFFIX,
+        "store.gdb/a0000001.gdbtable",
+        "sub/nested.zip",
+        "sub/roads.shp" + archives.POINTER_SUFFIX,
+        "table.csv",
+    ]
+    record = archives.read_pointer(
+        os.path.join(folder, "sub", "roads.shp" + archives.POINTER_SUFFIX)
+    )
+    assert record["vsi"] == prefix + os.path.abspath(archive) + "/sub/roads.shp"
+    assert record["size"] == 3
+
+
+def test_archives_gdal_cannot_read_are_extracted(tmp_path):
+    archive = _write_tar(tmp_path / "data.tar.bz2", "w:bz2")
+
+    folder = archives.open_archive(archive)
+
+    assert _tree(folder) == sorted(MEMBERS)
+
+
+def test_unsafe_members_are_skipped(tmp_path):
+    path = tmp_path / "evil.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("../escape.csv", b"x")
+        zf.writestr("../escape.tif", b"x")
+        zf.writestr("ok.csv", b"x")
+
+    folder = archives.open_archive(str(path))
+
+    assert _tree(folder) == ["ok.csv"]
+    assert not (tmp_path / "escape.csv").exists()
+
+
+def test_member_pointer_in_place(tmp_path):
+    folder = archives.open_archive(_write_zip(tmp_path / "data.zip"))
+    pointer = os.path.join(folder, "dem.tif" + archives.POINTER_SUFFIX)
+    calls = []
+
+    def extract(path, **options):
+        calls.append(path)
+        return {"bbox": [1, 2, 3, 4], "format": "tif"}
+
+    result = archives.extract_member_pointer(pointer, extract, bbox=True)
+
+    assert calls == ["/vsizip/{}/dem.tif".format(tmp_path / "data.zip")]
+    assert result["file_size_bytes"] == len(MEMBERS["dem.tif"])
+    assert os.path.exists(pointer)
+
+
+@pytest.mark.parametrize(
+    "in_place",
+    [None, {"format": "shp"}, {"format": "shp", "bbox": None, "tbox": None}],
+    ids=["unread", "no-extent", "empty-extent"],
+)
+def test_member_pointer_falls_back_to_extraction(tmp_path, in_place):
+    folder = archives.open_archive(_write_zip(tmp_path / "data.zip"))
+    pointer = os.path.join(folder, "sub", "roads.shp" + archives.POINTER_SUFFIX)
+    assert pointers.pointer_kind(pointer) == pointers.MEMBER
+    local = []
+
+    result = archives.extract_member_pointer(
+        pointer,
+        lambda path, **options: in_place,
+        lambda path, **options: local.append(path) or {"bbox": [1, 2, 3, 4]},
+        bbox=True,
+    )
+
+    assert result == {"bbox": [1, 2, 3, 4]}
+    assert local == [os.path.join(folder, "sub", "roads.shp")]
+    # the shapefile is extracted with its sidecars
+    assert sorted(os.listdir(os.path.join(folder, "sub"))) == [
+        "nested.zip",
+        "roads.dbf",
+        "roads.prj",
+        "roads.shp",
+    ]
+
+
+def test_same_stem_members_of_other_formats_are_extracted(tmp_path):
+    path = tmp_path / "mixed.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in (
+            "data.tif",
+            "data.tfw",
+            "data.tif.aux.xml",
+            "data.csv",
+            "data.las",
+            "roads.shp",
+            "roads.shx",
+            "roads.dbf",
+            "roads.prj",
+            "roads.csv",
+            "2020.01.a.tif",
+            "2020.01.b.csv",
+            "scan.jpg",
+            "scan.jgw",
+        ):
+            zf.writestr(name, b"x")
+
+    folder = archives.open_archive(str(path))
+
+    assert _tree(folder) == [
+        "2020.01.a.tif" + archives.POINTER_SUFFIX,
+        "2020.01.b.csv",
+        "data.csv",
+        "data.las",
+        "data.tif" + archives.POINTER_SUFFIX,
+        "roads.csv",
+        "roads.shp" + archives.POINTER_SUFFIX,
+        "scan.jgw",
+        "scan.jpg",
+    ]
+
+    # a failed in-place read extracts the member with its own sidecars only
+    archives.extract_member_pointer(
+        os.path.join(folder, "data.tif" + archives.POINTER_SUFFIX),
+        lambda path, **options: None,
+        lambda path, **options: {},
+    )
+    assert "data.tfw" in _tree(folder)
+    assert "data.tif.aux.xml" in _tree(folder)
+    assert "roads.prj" not in _tree(folder)
+
+
+BUNDLE = [
+    ("data/points.csv", 100),
+    ("data/photo.jpg", 5000),
+    ("data/scan.png", 4000),
+    ("data/scan.pgw", 60),
+    ("docs/paper.pdf", 9000),
+    ("docs/notes.md", 50),
+    ("README", 40),
+    ("code/analysis.py", 300),
+    ("code/analysis.R", 300),
+    ("grid/dem.tif", 2000),
+    ("grid/dem.tfw", 60),
+    ("grid/dem.tif.aux.xml", 80),
+    ("roads.shp", 700),
+    ("roads.dbf", 300),
+    ("roads.cpg", 5),
+    ("model.h5", 1000),
+    ("store.zarr/.zattrs", 10),
+]
+
+
+def _names(members):
+    return sorted(name for name, _ in members)
+
+
+def test_select_members_skips_members_without_extent():
+    assert _names(archives.select_members(BUNDLE)) == [
+        "data/points.csv",
+        "data/scan.pgw",
+        "data/scan.png",
+        "docs/paper.pdf",
+        "grid/dem.tfw",
+        "grid/dem.tif",
+        "grid/dem.tif.aux.xml",
+        "model.h5",
+        "roads.cpg",
+        "roads.dbf",
+        "roads.shp",
+        "store.zarr/.zattrs",
+    ]
+
+
+def test_select_members_keeps_text_for_text_extraction():
+    selected = _names(archives.select_members(BUNDLE, text_method="ner"))
+    assert "docs/notes.md" in selected
+    assert "README" in selected
+    assert "code/analysis.py" not in selected
+
+
+def test_select_members_keeps_pdfs():
+    # GDAL's PDF driver reads the extent of GeoPDFs
+    members = [("maps/sheet.pdf", 9000), ("maps/sheet.docx", 9000)]
+    assert _names(archives.select_members(members)) == ["maps/sheet.pdf"]
+
+
+def test_select_members_skip_nogeo():
+    selected = archives.select_members(
+        BUNDLE, skip_nogeo=True, additional_extensions={"png"}
+    )
+    assert _names(selected) == [
+        "data/points.csv",
+        "data/scan.pgw",
+        "data/scan.png",
+        "grid/dem.tfw",
+        "grid/dem.tif",
+        "grid/dem.tif.aux.xml",
+        "model.h5",
+        "roads.cpg",
+        "roads.dbf",
+        "roads.shp",
+        "store.zarr/.zattrs",
+    ]
+    assert "data/scan.png" not in _names(
+        archives.select_members(BUNDLE, skip_nogeo=True)
+    )
+
+
+def test_select_members_size_limit_keeps_shapefiles_together():
+    selected = archives.select_members(BUNDLE, max_size=1100, method="smallest")
+    names = _names(selected)
+    assert sum(size for _, size in selected) <= 1100
+    assert "roads.shp" not in names
+    assert "roads.dbf" not in names
+
+
+def test_open_archive_does_not_extract_skipped_members(tmp_path):
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, size in BUNDLE:
+            zf.writestr(name, b"x" * size)
+
+    folder = archives.open_archive(str(path))
+
+    tree = _tree(folder)
+    assert "docs/paper.pdf" in tree
+    assert "data/photo.jpg" not in tree
+    assert "code/analysis.py" not in tree
+    assert "data/points.csv" in tree
+    assert "grid/dem.tif" + archives.POINTER_SUFFIX in tree
+
+
+@pytest.mark.parametrize("suffix", [".zip", ".tar.gz"])
+def test_from_directory_nested_folders(tmp_path, suffix):
+    source = "tests/testdata/folders/nested_folder"
+    archive = str(tmp_path / ("data" + suffix))
+    if suffix == ".zip":
+        with zipfile.ZipFile(archive, "w") as zf:
+            for root, _dirs, files in os.walk(source):
+                for name in files:
+                    path = os.path.join(root, name)
+                    zf.write(path, os.path.relpath(path, source))
+    else:
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(source, arcname="nested_folder")
+
+    result = geoextent.from_directory(archive, bbox=True, tbox=True)
+
+    assert result["bbox"] == pytest.approx(
+        [34.7, 7.601680, 51.974624, 142.0], abs=tolerance
+    )
+    assert result["crs"] == "4326"
+    assert result["tbox"] == ["2017-04-08", "2020-02-06"]
@@ -22,6 +22,15 @@ def test_help_text_no_args(script_runner):
     assert "geoextent [-h]" in ret.stdout, "usage instructions are printed to console"
 
 
+def test_help_text_shows_http_cache_ttl_default(script_runner):
+    from geoextent.lib import http_cache
+
+    ret = script_runner.run(["geoextent", "--help"])
+    assert ret.success, "process should return success"
+    help_text = " ".join(ret.stdout.split())
+    assert "(default: {};".format(http_cache.DEFAULT_TTL) in help_text
+
+
 def test_details_folder(script_runner):
     ret = script_runner.run(
         [
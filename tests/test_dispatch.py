@@ -0,0 +1,154 @@
+"""Tests for handler dispatch in from_file (geoextent.lib.dispatch)."""
+
+import pytest
+from osgeo import gdal
+
+import geoextent.lib.extent as geoextent
+from geoextent.lib import dispatch
+
+TIF = "tests/testdata/tif/wf_100m_klas.tif"
+GEOJSON = "tests/testdata/geojson/muenster_ring_zeit.geojson"
+GPKG = "tests/testdata/geopackage/nc.gpkg"
+FGB = "tests/testdata/flatgeobuf/countries.fgb"
+LAS = "tests/testdata/pointcloud/wgs84.las"
+CSV = "tests/testdata/csv/cities_NL.csv"
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        (TIF, "tiff"),
+        (GEOJSON, None),
+        (GPKG, "sqlite"),
+        (FGB, "flatgeobuf"),
+        (LAS, "las"),
+        (CSV, None),
+    ],
+)
+def test_sniff_format(path, expected):
+    assert dispatch.sniff_format(path) == expected
+
+
+def test_sniff_format_directory_and_missing_file(tmp_path):
+    assert dispatch.sniff_format(str(tmp_path)) is None
+    assert dispatch.sniff_format(str(tmp_path / "missing.tif")) is None
+
+
+def test_candidates_keep_handler_order():
+    names = [
+        name
+        for name, _ in dispatch.candidate_handlers(GEOJSON, geoextent.handle_modules)
+    ]
+    # CSV rejects .geojson and point clouds need .las/.laz
+    assert names == ["raster", "vector", "text"]
+
+
+def test_candidates_pruned_by_magic_bytes():
+    names = [
+        name for name, _ in dispatch.candidate_handlers(TIF, geoextent.handle_modules)
+    ]
+    assert names == ["raster"]
+    names = [
+        name for name, _ in dispatch.candidate_handlers(LAS, geoextent.handle_modules)
+    ]
+    assert names == ["pointcloud"]
+
+
+def test_unknown_binary_content_prunes_nothing(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"\x00\x01\x02 not a known format")
+    assert dispatch.sniff_format(str(path)) == "binary"
+    names = [
+        name
+        for name, _ in dispatch.candidate_handlers(str(path), geoextent.handle_modules)
+    ]
+    assert names == ["CSV", "raster", "vector", "text"]
+
+
+@pytest.mark.parametrize(
+    "path,handler",
+    [
+        (TIF, "handle_raster"),
+        (GEOJSON, "handle_vector"),
+        (GPKG, "handle_vector"),
+        (LAS, "handle_pointcloud"),
+        (CSV, "handle_csv"),
+    ],
+)
+def test_select_handler_matches_full_probe(path, handler):
+    selected = dispatch.select_handler(path, geoextent.handle_modules)
+    assert selected.get_handler_name() == handler
+
+    probed = next(
+        m for m in geoextent.handle_modules.values() if m.check_file_supported(path)
+    )
+    assert probed is selected
+
+
+def test_from_file_opens_geotiff_once(monkeypatch):
+    calls = []
+    open_ex = gdal.OpenEx
+    open_ = gdal.Open
+
+    def counting_open_ex(*args, **kwargs):
+        calls.append(("OpenEx", args[0]))
+        return open_ex(*args, **kwargs)
+
+    def counting_open(*args, **kwargs):
+        calls.append(("Open", args[0]))
+        return open_(*args, **kwargs)
+
+    monkeypatch.setattr(gdal, "OpenEx", counting_open_ex)
+    monkeypatch.setattr(gdal, "Open", counting_open)
+
+    result = geoextent.from_file(TIF, bbox=True, tbox=True)
+
+    assert result["geoextent_handler"] == "handle_raster"
+    assert [c for c in calls if c[1] == TIF] == [("OpenEx", TIF)]
+
+
+def test_from_file_results_unchanged_with_shared_handle():
+    result = geoextent.from_file(TIF, bbox=True)
+    assert result["bbox"] == pytest.approx(
+        [50.310251, 5.915300, 52.530775, 9.468398], abs=0.00001
+    )
+    assert result["crs"] == "4326"
+
+
+def test_vector_handler_with_and_without_shared_handle():
+    from geoextent.lib import handle_vector
+
+    handle = dispatch.DatasetHandle(GEOJSON)
+    try:
+        shared_bbox = handle_vector.get_bounding_box(GEOJSON, dataset_handle=handle)
+        shared_tbox = handle_vector.get_temporal_extent(GEOJSON, dataset_handle=handle)
+    finally:
+        handle.close()
+
+    assert shared_bbox == handle_vector.get_bounding_box(GEOJSON)
+    assert shared_tbox == handle_vector.get_temporal_extent(GEOJSON)
+
+
+def test_shared_values_computed_once(tmp_path):
+    handle = dispatch.DatasetHandle(str(tmp_path / "data.csv"))
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"scan": len(calls)}
+
+    assert handle.shared("scan", factory) is handle.shared("scan", factory)
+    assert calls == [1]
+
+    def failing():
+        calls.append(2)
+        raise ValueError("unreadable")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            handle.shared("broken", failing)
+    assert calls == [1, 2]
+
+    handle.close()
+    handle.shared("scan", factory)
+    assert calls == [1, 2, 1]
@@ -0,0 +1,191 @@
+"""Tests for the shared provider download engine (DoiProvider downloads)."""
+
+import http.server
+import os
+
+import pytest
+
+from geoextent.lib.content_providers import providers
+from geoextent.lib.content_providers.providers import DoiProvider
+from geoextent.lib.exceptions import DownloadSizeExceeded
+
+BODY = bytes(range(256)) * 4096  # 1 MiB
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves ``BODY`` at every path.
+
+    ``ranges`` toggles ``Range`` support; the first ``drop`` responses are
+    cut off after half of the requested bytes.
+    """
+
+    ranges = True
+    drop = 0
+    requests = []
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        type(self).requests.append(range_header)
+        start = 0
+        if range_header and self.ranges:
+            start = int(range_header.split("=", 1)[1].split("-")[0])
+            if start >= len(BODY):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                "bytes {}-{}/{}".format(start, len(BODY) - 1, len(BODY)),
+            )
+        else:
+            self.send_response(200)
+        chunk = BODY[start:]
+        self.send_header("Content-Length", str(len(chunk)))
+        self.end_headers()
+        if type(self).drop:
+            type(self).drop -= 1
+            self.wfile.write(chunk[: len(chunk) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(chunk)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server(local_server):
+    _Handler.ranges = True
+    _Handler.drop = 0
+    _Handler.requests = []
+    return local_server(_Handler)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_download_writes_complete_file(server, tmp_path):
+    target = str(tmp_path / "sub" / "data.bin")
+    size = DoiProvider()._download_file_optimized(server + "/data.bin", target)
+
+    assert size == len(BODY)
+    assert _read(target) == BODY
+    assert not os.path.exists(target + providers.PARTIAL_SUFFIX)
+    assert _Handler.requests == [None]
+
+
+def test_download_resumes_partial_file(server, tmp_path):
+    target = str(tmp_path / "data.bin")
+    with open(target + providers.PARTIAL_SUFFIX, "wb") as f:
+        f.write(BODY[:1000])
+
+    DoiProvider()._download_file_optimized(server + "/data.bin", target)
+
+    assert _read(target) == BODY
+    assert _Handler.requests == ["bytes=1000-"]
+
+
+def test_download_restarts_without_range_support(server, tmp_path):
+    _Handler.ranges = False
+    target = str(tmp_path / "data.bin")
+    with open(target + providers.PARTIAL_SUFFIX, "wb") as f:
+        f.write(b"stale")
+
+    DoiProvider()._download_file_optimized(server + "/data.bin", target)
+
+    assert _read(target) == BODY
+
+
+def test_interrupted_download_is_resumed(server, tmp_path):
+    _Handler.drop = 1
+    target = str(tmp_path / "data.bin")
+    chunks = []
+
+    DoiProvider()._download_file_optimized(
+        server + "/data.bin", target, chunk_size=4096, progress_hook=chunks.append
+    )
+
+    assert _read(target) == BODY
+    assert len(_Handler.requests) == 2
+    assert _Handler.requests[1] == "bytes={}-".format(len(BODY) // 2)
+    assert sum(chunks) == len(BODY)
+
+
+def test_failed_download_leaves_no_files(server, tmp_path):
+    _Handler.drop = providers.DOWNLOAD_ATTEMPTS
+    _Handler.ranges = False
+    target = str(tmp_path / "data.bin")
+
+    with pytest.raises(Exception):
+        DoiProvider()._download_file_optimized(server + "/data.bin", target)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_oversized_download_is_refused_before_transfer(server, tmp_path):
+    provider = DoiProvider()
+    provider._max_download_bytes = len(BODY) - 1
+    target = str(tmp_path / "data.bin")
+    chunks = []
+
+    with pytest.raises(DownloadSizeExceeded):
+        provider._download_file_optimized(
+            server + "/data.bin", target, progress_hook=chunks.append
+        )
+
+    assert chunks == []
+    assert os.listdir(tmp_path) == []
+
+
+def _two_files(server):
+    return [{"name": name, "url": server + "/" + name} for name in ("a.bin", "b.bin")]
+
+
+def test_batch_stops_at_size_limit(server, tmp_path):
+    provider = DoiProvider()
+    provider._max_download_bytes = len(BODY) * 3 // 2
+    results = provider._download_files_batch(
+        _two_files(server), str(tmp_path), show_progress=False, max_workers=1
+    )
+
+    assert [r["success"] for r in results] == [True, False]
+    assert os.listdir(tmp_path) == ["a.bin"]
+
+
+def test_batch_raises_size_limit_with_soft_limit(server, tmp_path):
+    provider = DoiProvider()
+    provider._max_download_bytes = len(BODY) * 3 // 2
+    provider._download_size_soft_limit = True
+
+    with pytest.raises(DownloadSizeExceeded) as excinfo:
+        provider._download_files_batch(
+            _two_files(server), str(tmp_path), show_progress=False, max_workers=1
+        )
+    assert excinfo.value.estimated_size == len(BODY) * 2
+
+
+def test_batch_keeps_target_paths(server, tmp_path):
+    files = [
+        {"name": "a/b/c.bin", "url": server + "/c.bin", "target_path": "a/b/c.bin"},
+        {"name": "d/e.bin", "url": server + "/e.bin"},
+        {"name": "evil.bin", "url": server + "/x", "target_path": "../evil.bin"},
+    ]
+    results = DoiProvider()._download_files_batch(
+        files, str(tmp_path), show_progress=False
+    )
+
+    assert sorted(os.path.relpath(r["task"][1], tmp_path) for r in results) == [
+        os.path.join("a", "b", "c.bin"),
+        "d_e.bin",
+    ]
+    assert all(r["success"] for r in results)
+    assert not (tmp_path.parent / "evil.bin").exists()
+
+
+def test_parallel_workers_are_capped_at_pool_size():
+    provider = DoiProvider()
+    provider._setup_parallel_manager(max_workers=providers.HTTP_POOL_MAXSIZE * 2)
+    assert provider.parallel_manager.max_workers == providers.HTTP_POOL_MAXSIZE
@@ -0,0 +1,126 @@
+"""Tests for overlapping downloads with extraction (geoextent.lib.download_pipeline)."""
+
+import os
+import threading
+from concurrent.futures import Future
+
+import geoextent.lib.extent as geoextent
+from geoextent.lib.content_providers.providers import DoiProvider
+from geoextent.lib.download_pipeline import ExtractionPipeline, group_files
+
+
+class RecordingExtract:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def __call__(self, path):
+        with self.lock:
+            self.calls.append(os.path.basename(path))
+        return {"bbox": [1.0, 2.0, 3.0, 4.0]}
+
+
+def _touch(directory, *names):
+    paths = []
+    for name in names:
+        path = os.path.join(str(directory), name)
+        with open(path, "w") as f:
+            f.write("x")
+        paths.append(path)
+    return paths
+
+
+def test_group_files(tmp_path):
+    names = ["roads.shp", "roads.shx", "roads.dbf", "roads.prj", "dem.tif"]
+    names += ["dem.tfw", "table.csv", "other.csv"]
+    groups = group_files([str(tmp_path / n) for n in names])
+    groups = sorted(sorted(os.path.basename(p) for p in g) for g in groups)
+    assert groups == [
+        ["dem.tfw", "dem.tif"],
+        ["other.csv"],
+        ["roads.dbf", "roads.prj", "roads.shp", "roads.shx"],
+        ["table.csv"],
+    ]
+
+
+def test_groups_are_released_together(tmp_path):
+    shp, shx, dbf, csv = _touch(tmp_path, "a.shp", "a.shx", "a.dbf", "b.csv")
+    extract = RecordingExtract()
+    with ExtractionPipeline(extract) as pipeline:
+        pipeline.expect([shp, shx, dbf, csv])
+        pipeline.finished(shp)
+        pipeline.finished(csv)
+        assert set(pipeline.results()) == {os.path.abspath(csv)}
+        pipeline.finished(shx)
+        pipeline.finished(dbf)
+        results = pipeline.results()
+        for future in results.values():
+            future.result()
+    assert set(results) == {os.path.abspath(p) for p in (shp, shx, dbf, csv)}
+    assert sorted(extract.calls) == ["a.dbf", "a.shp", "a.shx", "b.csv"]
+
+
+def test_failed_and_rejected_files_are_not_extracted(tmp_path):
+    good, archive = _touch(tmp_path, "good.csv", "data.zip")
+    extract = RecordingExtract()
+    with ExtractionPipeline(
+        extract, accept=lambda path: not path.endswith(".zip")
+    ) as pipeline:
+        pipeline.finished(os.path.join(str(tmp_path), "missing.csv"), success=False)
+        pipeline.finished(archive)
+        pipeline.finished(good)
+        assert list(pipeline.results()) == [os.path.abspath(good)]
+        pipeline.results()[os.path.abspath(good)].result()
+    assert extract.calls == ["good.csv"]
+
+
+def test_download_batch_notifies_listener(tmp_path, monkeypatch):
+    events = []
+
+    class Listener:
+        def expect(self, paths):
+            events.append(("expect", sorted(os.path.basename(p) for p in paths)))
+
+        def finished(self, path, success=True):
+            events.append(("finished", os.path.basename(path), success))
+
+    def fake_download(self, url, filepath, chunk_size=None, show_progress=False):
+        if url.endswith("broken.csv"):
+            raise OSError("connection reset")
+        with open(filepath, "wb") as f:
+            f.write(b"x")
+        return 1
+
+    monkeypatch.setattr(DoiProvider, "_download_file_optimized", fake_download)
+    provider = DoiProvider()
+    provider._download_listener = Listener()
+    files = [
+        {"url": "https://example.org/a.csv", "name": "a.csv", "size": 1},
+        {"url": "https://example.org/broken.csv", "name": "broken.csv", "size": 1},
+    ]
+    provider._download_files_batch(files, str(tmp_path), show_progress=False)
+
+    assert events[0] == ("expect", ["a.csv", "broken.csv"])
+    assert sorted(events[1:]) == [
+        ("finished", "a.csv", True),
+        ("finished", "broken.csv", False),
+    ]
+
+
+def test_from_directory_uses_prefetched_results(tmp_path, monkeypatch):
+    (path,) = _touch(tmp_path, "points.csv")
+    future = Future()
+    future.set_result({"bbox": [1.0, 2.0, 3.0, 4.0], "crs": "4326"})
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("from_file called for a prefetched file")
+
+    monkeypatch.setattr(geoextent, "from_file", fail)
+    result = geoextent.from_directory(
+        str(tmp_path),
+        bbox=True,
+        details=True,
+        show_progress=False,
+        _prefetched={os.path.abspath(path): future},
+    )
+    assert result["details"]["points.csv"]["bbox"] == [1.0, 2.0, 3.0, 4.0]
@@ -0,0 +1,193 @@
+"""Tests for the content-addressed download store (geoextent.lib.download_store)."""
+
+import hashlib
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from geoextent.lib import download_store
+from geoextent.lib.content_providers.providers import DoiProvider
+from geoextent.lib.download_store import (
+    ChecksumMismatch,
+    DownloadStore,
+    parse_checksum,
+    use_download_store,
+)
+
+CONTENT = b"shared geodata" * 1000
+MD5 = hashlib.md5(CONTENT).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("md5:" + MD5, "md5:" + MD5),
+        ("MD5:" + MD5.upper(), "md5:" + MD5),
+        (MD5, "md5:" + MD5),
+        ({"type": "MD5", "value": MD5}, "md5:" + MD5),
+        ({"type": "SHA-1", "value": "a" * 40}, "sha1:" + "a" * 40),
+        ("sha256:" + "0" * 64, "sha256:" + "0" * 64),
+        ("md5:xyz", None),
+        ("md5:" + "a" * 40, None),
+        ("crc32:1234abcd", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_checksum(value, expected):
+    assert parse_checksum(value) == expected
+
+
+def _writer(calls, content=CONTENT):
+    def download(path):
+        calls.append(path)
+        with open(path, "wb") as f:
+            f.write(content)
+        return len(content)
+
+    return download
+
+
+def test_fetch_downloads_once(tmp_path):
+    store = DownloadStore(str(tmp_path / "store"))
+    calls = []
+    checksum = "md5:" + MD5
+
+    for name in ("record1/a.tif", "record2/b.tif"):
+        size = store.fetch(checksum, str(tmp_path / name), _writer(calls))
+        assert size == len(CONTENT)
+        assert (tmp_path / name).read_bytes() == CONTENT
+
+    # downloaded once, to a temporary name next to the stored object
+    assert len(calls) == 1
+    assert calls[0].startswith(store.object_path(checksum) + ".")
+    assert checksum in store
+
+
+def test_targets_are_copies(tmp_path):
+    store = DownloadStore(str(tmp_path / "store"))
+    checksum = "md5:" + MD5
+    target = tmp_path / "a.tif"
+    store.fetch(checksum, str(target), _writer([]))
+
+    with open(target, "r+b") as f:
+        f.write(b"modified in place")
+
+    with open(store.object_path(checksum), "rb") as f:
+        assert f.read() == CONTENT
+
+
+def test_partial_download_is_resumed(tmp_path):
+    store = DownloadStore(str(tmp_path / "store"))
+    checksum = "md5:" + MD5
+    partial = store.object_path(checksum) + ".part"
+    os.makedirs(os.path.dirname(partial))
+    with open(partial, "wb") as f:
+        f.write(CONTENT[:100])
+
+    def fail(path):
+        with open(path + ".part", "ab") as f:
+            f.write(CONTENT[100:200])
+        raise ConnectionError("dropped")
+
+    resumed = []
+
+    def resume(path):
+        with open(path + ".part", "rb") as f:
+            resumed.append(f.read())
+        os.replace(path + ".part", path)
+        with open(path, "ab") as f:
+            f.write(CONTENT[200:])
+
+    with pytest.raises(ConnectionError):
+        store.fetch(checksum, str(tmp_path / "a.tif"), fail)
+    store.fetch(checksum, str(tmp_path / "a.tif"), resume)
+
+    assert resumed == [CONTENT[:200]]
+    assert (tmp_path / "a.tif").read_bytes() == CONTENT
+    assert sorted(os.listdir(os.path.dirname(partial))) == [MD5, MD5 + ".lock"]
+
+
+def _fetch_in_process(store_path, target, log_path):
+    def download(path):
+        with open(log_path, "a") as log:
+            log.write("x")
+        time.sleep(0.5)
+        with open(path, "wb") as f:
+            f.write(CONTENT)
+
+    DownloadStore(store_path).fetch("md5:" + MD5, target, download)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="needs the fork start method",
+)
+def test_processes_share_a_single_download(tmp_path):
+    context = multiprocessing.get_context("fork")
+    log_path = str(tmp_path / "downloads.log")
+    processes = [
+        context.Process(
+            target=_fetch_in_process,
+            args=(str(tmp_path / "store"), str(tmp_path / name), log_path),
+        )
+        for name in ("a.tif", "b.tif")
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+
+    assert [process.exitcode for process in processes] == [0, 0]
+    with open(log_path) as log:
+        assert log.read() == "x"
+    assert (tmp_path / "b.tif").read_bytes() == CONTENT
+
+
+def test_checksum_mismatch_is_not_stored(tmp_path):
+    store = DownloadStore(str(tmp_path / "store"))
+    checksum = "md5:" + MD5
+
+    with pytest.raises(ChecksumMismatch):
+        store.fetch(checksum, str(tmp_path / "a.tif"), _writer([], b"corrupt"))
+
+    assert checksum not in store
+    assert not (tmp_path / "a.tif").exists()
+
+
+def test_batch_uses_active_store(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_download(
+        self, url, filepath, chunk_size=None, show_progress=False, **kwargs
+    ):
+        calls.append((url, kwargs.get("keep_partial", False)))
+        with open(filepath, "wb") as f:
+            f.write(CONTENT)
+        return len(CONTENT)
+
+    monkeypatch.setattr(DoiProvider, "_download_file_optimized", fake_download)
+    files = [
+        {"url": "https://a.org/x.tif", "name": "x.tif", "checksum": "md5:" + MD5},
+        {"url": "https://b.org/y.tif", "name": "y.tif", "checksum": MD5},
+        {"url": "https://a.org/z.csv", "name": "z.csv"},
+    ]
+
+    with use_download_store(str(tmp_path / "store")) as store:
+        for run in ("run1", "run2"):
+            results = DoiProvider()._download_files_batch(
+                files, str(tmp_path / run), show_progress=False, max_workers=1
+            )
+            assert all(r["success"] for r in results)
+            assert (tmp_path / run / "y.tif").read_bytes() == CONTENT
+        assert "md5:" + MD5 in store
+
+    # the shared file is fetched once, the file without checksum every run
+    assert calls == [
+        ("https://a.org/x.tif", True),
+        ("https://a.org/z.csv", False),
+        ("https://a.org/z.csv", False),
+    ]
+    assert download_store.get_active_download_store() is None
@@ -0,0 +1,233 @@
+"""Tests for the persistent extraction cache (geoextent.lib.extraction_cache)."""
+
+import os
+import pickle
+import shutil
+
+import pytest
+
+import geoextent.lib.extent as geoextent
+from geoextent.lib import extraction_cache
+from geoextent.lib.extraction_cache import (
+    ExtractionCache,
+    cached_extract,
+    resolve_extraction_cache,
+)
+
+CSV = "tests/testdata/csv/cities_NL.csv"
+GEOJSON = "tests/testdata/geojson/muenster_ring_zeit.geojson"
+
+
+class CountingExtract:
+    """Stands in for from_file and counts real extractions."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, filepath, **options):
+        self.calls.append(filepath)
+        return {"bbox": [1.0, 2.0, 3.0, 4.0], "options": sorted(options)}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def datafile(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("lat,lon\n1,2\n", encoding="utf-8")
+    return str(path)
+
+
+def test_second_lookup_is_a_hit(cache, datafile):
+    extract = CountingExtract()
+    first = cached_extract(extract, datafile, cache, bbox=True, tbox=False)
+    second = cached_extract(extract, datafile, cache, bbox=True, tbox=False)
+    assert first == second
+    assert extract.calls == [datafile]
+
+
+def test_none_results_are_cached(cache, datafile):
+    calls = []
+
+    def unsupported(filepath, **_options):
+        calls.append(filepath)
+        return None
+
+    assert cached_extract(unsupported, datafile, cache, bbox=True) is None
+    assert cached_extract(unsupported, datafile, cache, bbox=True) is None
+    assert len(calls) == 1
+
+
+def test_results_with_swallowed_errors_are_not_cached(cache, datafile):
+    calls = []
+
+    def flaky(filepath, _errors=None, **_options):
+        calls.append(filepath)
+        if len(calls) == 1:
+            _errors.append("gazetteer lookup failed")
+            return {"bbox": None}
+        return {"bbox": [1.0, 2.0, 3.0, 4.0]}
+
+    assert cached_extract(flaky, datafile, cache, bbox=True) == {"bbox": None}
+    assert cached_extract(flaky, datafile, cache, bbox=True)["bbox"] is not None
+    assert cached_extract(flaky, datafile, cache, bbox=True)["bbox"] is not None
+    assert len(calls) == 2
+
+
+def test_options_are_part_of_the_key(cache, datafile):
+    extract = CountingExtract()
+    cached_extract(extract, datafile, cache, bbox=True, tbox=False)
+    cached_extract(extract, datafile, cache, bbox=True, tbox=True)
+    cached_extract(extract, datafile, cache, bbox=True, tbox=True, assume_wgs84=True)
+    assert len(extract.calls) == 3
+
+
+def test_progress_options_are_not_part_of_the_key(cache, datafile):
+    extract = CountingExtract()
+    cached_extract(extract, datafile, cache, bbox=True, show_progress=True)
+    cached_extract(extract, datafile, cache, bbox=True, show_progress=False)
+    assert len(extract.calls) == 1
+
+
+def test_modified_file_is_extracted_again(cache, datafile):
+    extract = CountingExtract()
+    cached_extract(extract, datafile, cache, bbox=True)
+    with open(datafile, "a", encoding="utf-8") as f:
+        f.write("3,4\n")
+    stat = os.stat(datafile)
+    os.utime(datafile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cached_extract(extract, datafile, cache, bbox=True)
+    assert len(extract.calls) == 2
+
+
+def test_content_keys_survive_a_move(cache, datafile, tmp_path):
+    content_cache = cache.with_key_mode("content")
+    extract = CountingExtract()
+    cached_extract(extract, datafile, content_cache, bbox=True)
+
+    moved_dir = tmp_path / "elsewhere"
+    moved_dir.mkdir()
+    moved = str(moved_dir / "data.csv")
+    shutil.copy(datafile, moved)
+    cached_extract(extract, moved, content_cache, bbox=True)
+    assert extract.calls == [datafile]
+
+    # stat keys depend on the path
+    cached_extract(extract, moved, cache, bbox=True)
+    assert len(extract.calls) == 2
+
+
+@pytest.mark.parametrize("key_mode", ["stat", "content"])
+def test_edited_sidecar_is_extracted_again(cache, tmp_path, key_mode):
+    cache = cache.with_key_mode(key_mode)
+    shp = tmp_path / "roads.shp"
+    shp.write_bytes(b"shape")
+    prj = tmp_path / "roads.prj"
+    prj.write_text('GEOGCS["WGS 84"]', encoding="utf-8")
+    (tmp_path / "other.prj").write_text("unrelated", encoding="utf-8")
+    extract = CountingExtract()
+    cached_extract(extract, str(shp), cache, bbox=True)
+    cached_extract(extract, str(shp), cache, bbox=True)
+    assert len(extract.calls) == 1
+
+    prj.write_text('PROJCS["ETRS89 / UTM zone 32N"]', encoding="utf-8")
+    stat = os.stat(prj)
+    os.utime(prj, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cached_extract(extract, str(shp), cache, bbox=True)
+    assert len(extract.calls) == 2
+
+    # Other files in the folder do not change the key
+    (tmp_path / "other.prj").write_text("changed", encoding="utf-8")
+    cached_extract(extract, str(shp), cache, bbox=True)
+    assert len(extract.calls) == 2
+
+
+def test_directories_are_not_cached(cache, tmp_path):
+    extract = CountingExtract()
+    cached_extract(extract, str(tmp_path), cache, bbox=True)
+    cached_extract(extract, str(tmp_path), cache, bbox=True)
+    assert len(extract.calls) == 2
+
+
+def test_cache_is_picklable(cache, datafile):
+    extract = CountingExtract()
+    cached_extract(extract, datafile, cache, bbox=True)
+    clone = pickle.loads(pickle.dumps(cache))
+    assert (clone.path, clone.key_mode) == (cache.path, cache.key_mode)
+    cached_extract(extract, datafile, clone, bbox=True)
+    assert len(extract.calls) == 1
+    clone.close()
+
+
+def test_resolve_extraction_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEOEXTENT_CACHE_DIR", str(tmp_path))
+    assert resolve_extraction_cache(None) is None
+    assert resolve_extraction_cache(False) is None
+    assert resolve_extraction_cache(True).path == os.path.join(
+        str(tmp_path), "extraction-cache.sqlite"
+    )
+    assert resolve_extraction_cache(tmp_path / "x.sqlite").path == str(
+        tmp_path / "x.sqlite"
+    )
+    assert resolve_extraction_cache(True, key_mode="content").key_mode == "content"
+    with pytest.raises(TypeError):
+        resolve_extraction_cache(42)
+    with pytest.raises(ValueError):
+        ExtractionCache(key_mode="inode")
+
+
+def test_from_directory_uses_cache(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    shutil.copy(CSV, data)
+    shutil.copy(GEOJSON, data)
+    db = str(tmp_path / "cache.sqlite")
+
+    first = geoextent.from_directory(
+        str(data), bbox=True, tbox=True, details=True, extraction_cache=db
+    )
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("from_file called despite cached result")
+
+    monkeypatch.setattr(geoextent, "from_file", fail)
+    second = geoextent.from_directory(
+        str(data), bbox=True, tbox=True, details=True, extraction_cache=db
+    )
+    assert second["bbox"] == pytest.approx(first["bbox"])
+    assert second["tbox"] == first["tbox"]
+    assert set(second["details"]) == set(first["details"])
+
+
+def test_from_directory_parallel_uses_cache(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    shutil.copy(CSV, data)
+    shutil.copy(GEOJSON, data)
+    db = str(tmp_path / "cache.sqlite")
+
+    geoextent.from_directory(str(data), bbox=True, extraction_cache=db)
+
+    calls = []
+    from_file = geoextent.from_file
+
+    def counting_from_file(*args, **kwargs):
+        calls.append(args[0])
+        return from_file(*args, **kwargs)
+
+    monkeypatch.setattr(geoextent, "from_file", counting_from_file)
+    geoextent.from_directory(str(data), bbox=True, workers=2, extraction_cache=db)
+    assert calls == []
+
+
+def test_default_cache_location(tmp_path, monkeypatch):
+    monkeypatch.delenv("GEOEXTENT_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert extraction_cache.default_cache_path() == os.path.join(
+        str(tmp_path), "geoextent", "extraction-cache.sqlite"
+    )
@@ -4,6 +4,7 @@ These tests require no network access and cover coordinate conversions,
 format validation, geometry utilities, and metadata creation.
 """
 
+import numpy as np
 import pytest
 from geoextent.lib import helpfunctions as hf
 from geoextent.lib.extent import _swap_coordinate_order, _is_auxiliary_file
@@ -268,6 +269,38 @@ class TestConvexHullCoords:
         assert hf.convex_hull_coords_to_geojson(None) is None
 
 
+class TestConvexHullPoints:
+    def test_square_with_interior_points(self):
+        points = [[0, 0], [2, 0], [2, 2], [0, 2], [1, 1], [0.5, 1.5], [1, 0]]
+        hull = hf.convex_hull_points(points)
+        assert hull.tolist() == [[0, 0], [2, 0], [2, 2], [0, 2]]
+
+    def test_degenerate(self):
+        assert hf.convex_hull_points([[1, 1], [1, 1]]).tolist() == [[1, 1]]
+        assert hf.convex_hull_points([[0, 0], [1, 1], [2, 2]]).tolist() == [
+            [0, 0],
+            [2, 2],
+        ]
+        assert len(hf.convex_hull_points([])) == 0
+
+    def test_running_hull_matches_full_hull(self):
+        import numpy as np
+
+        points = np.random.default_rng(42).normal(size=(5000, 2))
+        hull = None
+        for batch in np.array_split(points, 9):
+            if hull is not None:
+                batch = np.vstack([hull, batch])
+            hull = hf.convex_hull_points(batch)
+        assert np.array_equal(hull, hf.convex_hull_points(points))
+        # every point lies left of or on every hull edge
+        for a, b in zip(hull, np.roll(hull, -1, axis=0)):
+            cross = (b[0] - a[0]) * (points[:, 1] - a[1]) - (b[1] - a[1]) * (
+                points[:, 0] - a[0]
+            )
+            assert (cross >= -1e-12).all()
+
+
 # ---------------------------------------------------------------------------
 # convex_hull_coords_to_wkb
 # ---------------------------------------------------------------------------
@@ -436,7 +469,191 @@ class TestTransformArrayToWgs84:
         result = hf.transform_array_to_wgs84(4326, [[7.0, 51.0], [8.0, 52.0]])
         assert len(result) == 2
         assert result[0][0] == pytest.approx(7.0, abs=1e-6)
-        assert result[1][1] == pytest.approx(52.0, abs=1e-6)
+        assert result[1][1] == pytest.approx(52.0, abs=1e-7)
+
+
+# ---------------------------------------------------------------------------
+# get_wgs84_transformation / transform_points_to_wgs84
+# ---------------------------------------------------------------------------
+UTM32N_WKT = (
+    'PROJCS["WGS 84 / UTM zone 32N",GEOGCS["WGS 84",DATUM["WGS_1984",'
+    'SPHEROID["WGS 84",6378137,298.257223563]],PRIMEM["Greenwich",0],'
+    'UNIT["degree",0.0174532925199433]],PROJECTION["Transverse_Mercator"],'
+    'PARAMETER["latitude_of_origin",0],PARAMETER["central_meridian",9],'
+    'PARAMETER["scale_factor",0.9996],PARAMETER["false_easting",500000],'
+    'PARAMETER["false_northing",0],UNIT["metre",1]]'
+)
+
+
+class TestWgs84TransformationCache:
+    def test_cached_by_epsg(self):
+        first = hf.get_wgs84_transformation(crs="32632")
+        assert hf.get_wgs84_transformation(crs=32632) is first
+        assert hf.get_wgs84_transformation(crs=25832) is not first
+
+    def test_cached_by_wkt(self):
+        first = hf.get_wgs84_transformation(crs_wkt=UTM32N_WKT)
+        assert hf.get_wgs84_transformation(crs_wkt=UTM32N_WKT) is first
+
+    def test_not_shared_between_threads(self):
+        import threading
+
+        main = hf.get_wgs84_transformation(crs=32632)
+        other = []
+        t = threading.Thread(
+            target=lambda: other.append(hf.get_wgs84_transformation(crs=32632))
+        )
+        t.start()
+        t.join()
+        assert other[0] is not main
+
+    def test_requires_crs(self):
+        with pytest.raises(ValueError):
+            hf.get_wgs84_transformation()
+
+
+class TestTransformPointsToWgs84:
+    def test_web_mercator_reference_points(self):
+        # Spherical Mercator has a closed form; these are its published values
+        points = [
+            [1113194.9079327357, 6800125.454397307],
+            [-8235972.526340345, 4975242.477853834],
+            [0.0, 0.0],
+        ]
+        result = hf.transform_points_to_wgs84(points, crs=3857)
+        assert result[0] == pytest.approx([10.0, 52.0], abs=1e-9)
+        assert result[1] == pytest.approx([-73.985, 40.748], abs=1e-9)
+        assert result[2] == pytest.approx([0.0, 0.0], abs=1e-9)
+
+    def test_utm_reference_points(self):
+        # The central meridian of UTM zone 32 is 9 deg E, its false easting 500 km
+        result = hf.transform_points_to_wgs84(
+            [[500000, 0], [500000, 5761038.2125], [400000, 5700000]], crs=25832
+        )
+        assert result[0] == pytest.approx([9.0, 0.0], abs=1e-9)
+        assert result[1][0] == pytest.approx(9.0, abs=1e-9)
+        assert result[1][1] == pytest.approx(52.0, abs=1e-7)
+        assert result[2] == pytest.approx([7.5611232, 51.4423523], abs=1e-7)
+
+    def test_geographic_crs_keeps_lon_lat_order(self):
+        # EPSG:4326 and EPSG:4258 define latitude first; input and output
+        # stay in the traditional longitude/latitude order
+        points = [[7.6261, 51.9607], [-73.985, 40.748]]
+        for crs in (4326, 4258):
+            result = hf.transform_points_to_wgs84(points, crs=crs)
+            for point, transformed in zip(points, result):
+                assert transformed == pytest.approx(point, abs=1e-6)
+        assert hf.transform_to_wgs84(4326, [7.6261, 51.9607]) == pytest.approx(
+            [7.6261, 51.9607], abs=1e-9
+        )
+
+    def test_epsg_and_wkt_agree(self):
+        points = [[400000, 5700000], [420000, 5705000]]
+        by_epsg = hf.transform_points_to_wgs84(points, crs=32632)
+        by_wkt = hf.transform_points_to_wgs84(points, crs_wkt=UTM32N_WKT)
+        for a, b in zip(by_epsg, by_wkt):
+            assert a == pytest.approx(b, abs=1e-6)
+
+    def test_empty(self):
+        assert hf.transform_points_to_wgs84([], crs=32632) == []
+
+
+# ---------------------------------------------------------------------------
+# time format inference and time envelopes
+# ---------------------------------------------------------------------------
+class TestTimeEnvelope:
+    def test_envelope_of_column(self):
+        values = ["2019-05-01", "2018-01-31", "not a date", "2020-12-24"]
+        envelope = hf.time_envelope(values)
+        assert [t.strftime("%Y-%m-%d") for t in envelope] == [
+            "2018-01-31",
+            "2020-12-24",
+        ]
+
+    def test_no_recognizable_values(self):
+        assert hf.time_envelope(["abc", "def"]) is None
+        assert hf.time_envelope([]) is None
+
+    def test_envelope_of_datetime64_values_with_nat(self):
+        values = np.array(["2019-05-01", "NaT", "2018-01-31"], dtype="datetime64[ns]")
+        envelope = hf.time_envelope(values)
+        assert [t.strftime("%Y-%m-%d") for t in envelope] == [
+            "2018-01-31",
+            "2019-05-01",
+        ]
+
+    def test_merge(self):
+        assert hf.merge_time_envelopes(None, None) is None
+        assert hf.merge_time_envelopes([1, 5], None) == [1, 5]
+        assert hf.merge_time_envelopes(None, [1, 5]) == [1, 5]
+        assert hf.merge_time_envelopes([2, 5], [1, 3]) == [1, 5]
+
+    def test_date_parser_parses_once(self, monkeypatch):
+        calls = []
+        parse = hf.parse_datetimes
+
+        def counting(values, fmt):
+            calls.append(fmt)
+            return parse(values, fmt)
+
+        monkeypatch.setattr(hf, "parse_datetimes", counting)
+        parsed = hf.date_parser(["2019-05-01", "2018-01-31"])
+        assert len(calls) == 1
+        assert list(parsed.strftime("%Y-%m-%d")) == ["2019-05-01", "2018-01-31"]
+
+
+class TestTimeFormatCache:
+    def setup_method(self):
+        hf.clear_time_format_cache()
+
+    def teardown_method(self):
+        hf.clear_time_format_cache()
+
+    def test_column_signature_masks_digits_and_letters(self):
+        assert hf.time_column_signature("date", ["2017-04-08", "8 Apr 2017"]) == (
+            "date",
+            frozenset(["9999-99-99", "9 aaa 9999"]),
+        )
+
+    def test_format_reused_for_same_signature(self, monkeypatch):
+        calls = []
+        infer = hf._infer_time_format
+        monkeypatch.setattr(
+            hf, "_infer_time_format", lambda sample: calls.append(1) or infer(sample)
+        )
+
+        first = hf.get_time_format(["2017-04-08", "2018-01-01"], 30, column="date")
+        second = hf.get_time_format(["2019-12-31", "2020-02-29"], 30, column="date")
+        hf.get_time_format(["2019-12-31 10:00:00"], 30, column="date")
+        hf.get_time_format(["2019-12-31"], 30, column="time")
+
+        assert first == second == "flexible"
+        assert len(calls) == 3
+
+    def test_cached_format_checked_on_current_values(self):
+        day_first = ["31/12/2019", "15/01/2020"]
+        month_first = ["12/31/2019", "01/15/2020"]
+        key = hf.time_column_signature("date", month_first)
+        assert key == hf.time_column_signature("date", day_first)
+        hf._time_formats[key] = "%d/%m/%Y"
+
+        fmt = hf.get_time_format(month_first, 30, column="date")
+
+        assert fmt != "%d/%m/%Y"
+        assert hf.parse_datetimes(month_first, fmt).notna().all()
+        assert hf._time_formats[key] == fmt
+
+    def test_without_column_not_cached(self, monkeypatch):
+        calls = []
+        infer = hf._infer_time_format
+        monkeypatch.setattr(
+            hf, "_infer_time_format", lambda sample: calls.append(1) or infer(sample)
+        )
+
+        hf.get_time_format(["2017-04-08"], 30)
+        hf.get_time_format(["2017-04-08"], 30)
+
+        assert len(calls) == 2
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,138 @@
+"""Tests for the persistent HTTP cache of provider metadata requests."""
+
+import http.server
+
+import pytest
+
+from geoextent.lib import http_cache
+from geoextent.lib.content_providers.providers import create_session
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves a redirecting DOI and an ETag-versioned JSON record."""
+
+    requests = []
+    etag = '"v1"'
+    cache_control = None
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/doi":
+            self.send_response(302)
+            self.send_header("Location", "/record")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = '{{"etag": {}}}'.format(self.etag).encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        if self.cache_control:
+            self.send_header("Cache-Control", self.cache_control)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server(local_server):
+    _Handler.requests = []
+    _Handler.etag = '"v1"'
+    _Handler.cache_control = None
+    return local_server(_Handler)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("GEOEXTENT_HTTP_CACHE", raising=False)
+    cache = http_cache.HTTPCache(str(tmp_path / "http.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_no_active_cache_passes_through(server, cache):
+    session = create_session()
+    session.get(server + "/record")
+    session.get(server + "/record")
+    assert len(_Handler.requests) == 2
+
+
+def test_fresh_responses_and_redirects_are_served_from_cache(server, cache):
+    session = create_session()
+    with http_cache.use_http_cache(cache):
+        first = session.get(server + "/doi")
+        second = session.get(server + "/doi")
+
+    assert _Handler.requests == [("/doi", None), ("/record", None)]
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.json() == first.json() == {"etag": "v1"}
+    assert second.url == server + "/record"
+    assert len(second.history) == 1
+
+
+def test_stale_responses_are_revalidated(server, cache):
+    cache.ttl = 0
+    session = create_session()
+    with http_cache.use_http_cache(cache):
+        session.get(server + "/record")
+        revalidated = session.get(server + "/record")
+        assert revalidated.status_code == 200
+        assert revalidated.from_cache
+        assert revalidated.json() == {"etag": "v1"}
+
+        _Handler.etag = '"v2"'
+        changed = session.get(server + "/record")
+        assert not changed.from_cache
+        assert changed.json() == {"etag": "v2"}
+
+    assert _Handler.requests == [
+        ("/record", None),
+        ("/record", '"v1"'),
+        ("/record", '"v1"'),
+    ]
+
+
+def test_no_store_and_streamed_responses_are_not_cached(server, cache):
+    session = create_session()
+    with http_cache.use_http_cache(cache):
+        session.get(server + "/record", stream=True).close()
+        session.get(server + "/record", stream=True).close()
+        _Handler.cache_control = "no-store"
+        session.get(server + "/record")
+        session.get(server + "/record")
+    assert len(_Handler.requests) == 4
+
+
+def test_cache_is_persistent(server, cache):
+    with http_cache.use_http_cache(cache):
+        create_session().get(server + "/record")
+    reopened = http_cache.HTTPCache(cache.path)
+    with http_cache.use_http_cache(reopened):
+        assert create_session().get(server + "/record").from_cache
+    reopened.close()
+    assert len(_Handler.requests) == 1
+
+
+def test_environment_variable_enables_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEOEXTENT_HTTP_CACHE", str(tmp_path / "env.sqlite"))
+    assert http_cache.get_active_http_cache().path == str(tmp_path / "env.sqlite")
+    monkeypatch.setenv("GEOEXTENT_HTTP_CACHE", "0")
+    assert http_cache.get_active_http_cache() is None
+
+
+def test_resolve_http_cache(tmp_path):
+    assert http_cache.resolve_http_cache(None) is None
+    assert http_cache.resolve_http_cache(False) is None
+    assert http_cache.resolve_http_cache(tmp_path / "x.sqlite").path == str(
+        tmp_path / "x.sqlite"
+    )
+    with pytest.raises(TypeError):
+        http_cache.resolve_http_cache(3)
@@ -0,0 +1,97 @@
+"""Import-time budget: importing geoextent and starting the CLI stay light.
+
+geoextent is often run as a short-lived subprocess, where loading GDAL,
+pandas, the file handlers and the content providers dominates small jobs.
+These tests run in a fresh interpreter and fail when an eager import of a
+heavy module creeps back in. They check which modules are loaded rather
+than timing the import, which would be flaky on a busy machine.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must not be loaded by the imports below
+HEAVY_MODULES = (
+    "numpy",
+    "pandas",
+    "osgeo",
+    "requests",
+    "geojsonio",
+    "patoolib",
+    "geoextent.lib.extent",
+    "geoextent.lib.helpfunctions",
+    "geoextent.lib.handle_csv",
+    "geoextent.lib.handle_vector",
+    "geoextent.lib.handle_raster",
+    "geoextent.lib.handle_pointcloud",
+    "geoextent.lib.handle_text",
+    "geoextent.lib.content_providers.providers",
+    "geoextent.lib.content_providers.Zenodo",
+)
+
+# Dependencies the functions of helpfunctions import on first use
+HELPFUNCTIONS_DEPENDENCIES = (
+    "pandas",
+    "osgeo",
+    "geojsonio",
+    "humanfriendly",
+    "patoolib",
+)
+
+
+def _run(statement, modules=HEAVY_MODULES):
+    """Run *statement* in a fresh interpreter; return the *modules* it loaded."""
+    code = (
+        "import sys\n"
+        "{}\n"
+        "heavy = [m for m in {!r} if m in sys.modules\n"
+        "         and type(sys.modules[m]).__name__ != '_LazyModule']\n"
+        "print(' '.join(heavy))\n"
+    ).format(statement, modules)
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return out.split()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import geoextent",
+        "import geoextent.lib",
+        "import geoextent.lib.content_providers",
+        "from geoextent.lib.content_providers import manifest",
+        "import geoextent.__main__",
+    ],
+)
+def test_import_is_light(statement):
+    assert _run(statement) == []
+
+
+def test_version_does_not_load_extraction():
+    heavy = _run(
+        "import contextlib, io\n"
+        "sys.argv = ['geoextent', '--version']\n"
+        "from geoextent.__main__ import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        "        main()\n"
+        "    except SystemExit:\n"
+        "        pass"
+    )
+    assert heavy == []
+
+
+def test_helpfunctions_import_dependencies_on_use():
+    loaded = _run("import geoextent.lib.helpfunctions", HELPFUNCTIONS_DEPENDENCIES)
+    assert loaded == []
+
+
+def test_api_functions_load_on_access():
+    import geoextent
+    from geoextent.lib import extent
+
+    assert geoextent.from_file is extent.from_file
+    assert geoextent.lib.extent is extent
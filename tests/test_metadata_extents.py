@@ -0,0 +1,163 @@
+"""Tests for extents that providers take from repository metadata."""
+
+import json
+import os
+
+import geoextent.lib.extent as geoextent
+from geoextent.lib.content_providers.providers import ContentProvider
+
+POLYGON = {
+    "type": "Polygon",
+    "coordinates": [
+        [[5.0, 50.0], [10.0, 50.0], [10.0, 55.0], [5.0, 55.0], [5.0, 50.0]]
+    ],
+}
+
+
+class MetadataProvider(ContentProvider):
+    name = "Metadata"
+
+    @property
+    def supports_metadata_extraction(self):
+        return True
+
+    def download(self, folder, throttle=False, download_data=True, *args, **kwargs):
+        self._emit_metadata_extent(
+            folder, "record", POLYGON, ["2019-03-01", "2020-06-30"]
+        )
+
+
+def _remote_download(provider, tmp_path, **kwargs):
+    options = dict(
+        repository=provider,
+        tmp=str(tmp_path),
+        throttle=False,
+        download_data=False,
+        show_progress=False,
+        max_download_size=None,
+        max_download_method="ordered",
+        max_download_method_seed=None,
+        download_skip_nogeo=False,
+        download_skip_nogeo_exts=None,
+        max_download_workers=1,
+        bbox=True,
+        tbox=True,
+        convex_hull=False,
+        details=True,
+        timeout=None,
+        recursive=True,
+        include_geojsonio=False,
+        placename=None,
+        placename_escape=False,
+    )
+    options.update(kwargs)
+    return geoextent._process_remote_download(**options)
+
+
+def test_metadata_extent_is_written_without_collector(tmp_path):
+    provider = MetadataProvider()
+    path = provider._emit_metadata_extent(
+        str(tmp_path), "record", POLYGON, ["2019-03-01", None]
+    )
+    assert path == os.path.join(str(tmp_path), "record.geojson")
+    with open(path) as f:
+        feature = json.load(f)["features"][0]
+    assert feature["geometry"] == POLYGON
+    assert feature["properties"] == {"start_time": "2019-03-01"}
+
+
+def test_metadata_extent_is_collected_in_memory(tmp_path, monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("from_file called for a collected extent")
+
+    monkeypatch.setattr(geoextent, "from_file", fail)
+    provider = MetadataProvider()
+    result = _remote_download(provider, tmp_path)
+
+    assert os.listdir(str(tmp_path)) == []
+    assert provider._metadata_extents is None
+    details = result["details"]["record.geojson"]
+    assert details["bbox"] == [5.0, 50.0, 10.0, 55.0]
+    assert details["crs"] == "4326"
+    assert details["tbox"] == ["2019-03-01", "2020-06-30"]
+    assert result["tbox"] == ["2019-03-01", "2020-06-30"]
+
+
+class SubfolderProvider(MetadataProvider):
+    def download(self, folder, throttle=False, download_data=True, *args, **kwargs):
+        self._emit_metadata_extent(
+            os.path.join(folder, "record_1"),
+            "record",
+            POLYGON,
+            ["2019-03-01", "2020-06-30"],
+        )
+
+
+def test_collected_extent_is_nested_under_its_folder(tmp_path):
+    result = _remote_download(SubfolderProvider(), tmp_path)
+
+    assert os.listdir(str(tmp_path / "record_1")) == []
+    folder = result["details"]["record_1"]
+    assert folder["format"] == "folder"
+    assert folder["bbox"] == [5.0, 50.0, 10.0, 55.0]
+    assert folder["details"]["record.geojson"]["tbox"] == ["2019-03-01", "2020-06-30"]
+    assert result["bbox"] == [5.0, 50.0, 10.0, 55.0]
+
+
+def test_metadata_extent_is_written_when_files_are_kept(tmp_path):
+    provider = SubfolderProvider()
+    result = _remote_download(provider, tmp_path, keep_files=True)
+
+    assert os.listdir(str(tmp_path / "record_1")) == ["record.geojson"]
+    assert provider._metadata_extents is None
+    assert "record.geojson" in result["details"]["record_1"]["details"]
+
+
+def test_collected_extent_convex_hull(tmp_path):
+    result = geoextent._metadata_extent_result(
+        {"name": "record", "geometry": POLYGON, "tbox": None},
+        bbox=True,
+        tbox=True,
+        convex_hull=True,
+    )
+    assert result["convex_hull"] is True
+    assert result["bbox"][0] == result["bbox"][-1]
+    assert sorted(map(tuple, result["bbox"][:-1])) == [
+        (5.0, 50.0),
+        (5.0, 55.0),
+        (10.0, 50.0),
+        (10.0, 55.0),
+    ]
+    assert "tbox" not in result
+
+
+def test_pangaea_data_table_extent_is_collected():
+    import pandas as pd
+    from geoextent.lib.content_providers.Pangaea import Pangaea
+
+    provider = Pangaea()
+    provider.dataset_id = "123"
+    data = pd.DataFrame(
+        {
+            "Latitude": [70.5, 71.25, 70.0],
+            "Longitude": [-10.0, -8.5, -9.0],
+            "Date/Time": pd.to_datetime(
+                ["2015-07-01 12:00", "2015-07-03 06:30", "2015-06-28 00:00"]
+            ),
+            "Depth water [m]": [5.0, 10.0, 15.0],
+        }
+    )
+    assert provider._collect_data_extent(data) is False
+
+    provider._metadata_extents = []
+    assert provider._collect_data_extent(data) is True
+    (extent,) = provider._metadata_extents
+    assert extent["name"] == "pangaea_123.csv"
+
+    result = geoextent._metadata_extent_result(
+        extent, bbox=True, tbox=True, convex_hull=False
+    )
+    assert result["format"] == "csv"
+    assert result["geoextent_handler"] == "handle_csv"
+    assert result["bbox"] == [-10.0, 70.0, -8.5, 71.25]
+    assert result["tbox"] == ["2015-06-28", "2015-07-03"]
@@ -1,8 +1,11 @@
 """Tests for parallel file extraction (-p / --parallel, workers parameter)."""
 
+import multiprocessing
+import os
 import pytest
 import subprocess
 import sys
+import time
 
 from geoextent.lib import extent
 
@@ -131,3 +134,79 @@ class TestParallelCLI:
         )
         assert result.returncode == 0
         assert "FeatureCollection" in result.stdout
+
+
+class TestProcessExecutor:
+    """executor="process" runs files and subdirectories in a process pool."""
+
+    def test_process_matches_thread(self):
+        path = "tests/testdata/folders/folder_two_files"
+        threaded = extent.from_directory(path, bbox=True, tbox=True, workers=2)
+        processes = extent.from_directory(
+            path, bbox=True, tbox=True, workers=2, executor="process"
+        )
+        assert processes["bbox"] == _approx_bbox(FOLDER_TWO_FILES_BBOX)
+        assert processes["tbox"] == FOLDER_TWO_FILES_TBOX
+        assert processes["bbox"] == threaded["bbox"]
+
+    def test_process_nested_folder(self):
+        path = "tests/testdata/folders/nested_folder"
+        result = extent.from_directory(
+            path, bbox=True, tbox=True, details=True, workers=2, executor="process"
+        )
+        sequential = extent.from_directory(path, bbox=True, tbox=True, details=True)
+        assert result["bbox"] == _approx_bbox(NESTED_FOLDER_BBOX)
+        assert result["tbox"] == NESTED_FOLDER_TBOX
+        assert sorted(result["details"]) == sorted(sequential["details"])
+
+    def test_process_no_subdirs(self):
+        path = "tests/testdata/folders/nested_folder"
+        result = extent.from_directory(
+            path,
+            bbox=True,
+            details=True,
+            recursive=False,
+            workers=2,
+            executor="process",
+        )
+        sequential = extent.from_directory(
+            path, bbox=True, details=True, recursive=False
+        )
+        assert sorted(result["details"]) == sorted(sequential["details"])
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers inherit the patched extractor only when forked",
+    )
+    def test_process_timeout_stops_running_workers(self, tmp_path, monkeypatch):
+        for name in ("slow.geojson", "a.geojson", "b.geojson"):
+            (tmp_path / name).write_text("{}")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "slow_nested.geojson").write_text("{}")
+
+        def fake_from_file(filepath, *args, **kwargs):
+            if "slow" in os.path.basename(filepath):
+                time.sleep(60)
+            return {"format": "geojson", "tbox": ["2019-01-01", "2019-01-02"]}
+
+        monkeypatch.setattr(extent, "_from_file_cached", fake_from_file)
+        start = time.time()
+        result = extent.from_directory(
+            str(tmp_path),
+            tbox=True,
+            details=True,
+            workers=4,
+            executor="process",
+            timeout=3,
+        )
+        assert time.time() - start < 20
+        assert result["timeout"] == 3
+        assert "a.geojson" in result["details"]
+        assert "b.geojson" in result["details"]
+        assert "slow.geojson" not in result["details"]
+
+    def test_invalid_executor(self):
+        with pytest.raises(ValueError, match="executor"):
+            extent.from_directory(
+                "tests/testdata/folders/folder_one_file", bbox=True, executor="fiber"
+            )
@@ -0,0 +1,205 @@
+"""Offline provider selection: ProviderIndex and shared DOI resolution."""
+
+import pytest
+
+import importlib
+import inspect
+import pkgutil
+import re
+import subprocess
+import sys
+from urllib.parse import urlparse
+
+from geoextent.lib import content_providers, http_cache
+from geoextent.lib.content_providers import manifest, providers
+from geoextent.lib.content_providers.providers import (
+    ContentProvider,
+    DoiProvider,
+    ProviderIndex,
+    find_provider,
+    get_provider_index,
+)
+from geoextent.lib.extent import _get_content_providers
+
+
+def _names(classes):
+    return [cls.__name__ for cls in classes]
+
+
+@pytest.fixture(params=["manifest", "classes"])
+def index(request):
+    if request.param == "manifest":
+        return get_provider_index(manifest.PROVIDERS)
+    return get_provider_index(_get_content_providers())
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    """Fail on any DOI resolution and count requests."""
+    calls = []
+
+    def fake_request(self, url, throttle=False, **kwargs):
+        calls.append(url)
+        raise ConnectionError("network disabled in test")
+
+    monkeypatch.setattr(DoiProvider, "_request", fake_request)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "reference,expected",
+    [
+        ("10.5281/zenodo.820562", "Zenodo"),
+        ("https://doi.org/10.5281/zenodo.820562", "Zenodo"),
+        ("10.1594/PANGAEA.734969", "Pangaea"),
+        ("10.6084/m9.figshare.12345", "Figshare"),
+        ("10.5061/DRYAD.0k6djhb7x", "Dryad"),
+    ],
+)
+def test_doi_prefix_candidates(index, reference, expected):
+    assert _names(index.doi_candidates(reference))[0] == expected
+
+
+@pytest.mark.parametrize(
+    "reference,expected",
+    [
+        ("https://zenodo.org/records/820562", "Zenodo"),
+        ("https://springernature.figshare.com/articles/dataset/x/123", "Figshare"),
+        ("https://github.com/nuest/geoextent", "GitHub"),
+        ("https://www.wikidata.org/wiki/Q64", "Wikidata"),
+    ],
+)
+def test_host_candidates(index, reference, expected):
+    assert _names(index.host_candidates(reference)) == [expected]
+
+
+def test_unknown_references_have_no_candidates(index):
+    assert index.doi_candidates("10.9999/unknown.1") == []
+    assert index.host_candidates("https://example.org/data/1") == []
+    assert index.host_candidates("Q64") == []
+
+
+def test_index_is_cached():
+    assert get_provider_index(_get_content_providers()) is get_provider_index(
+        _get_content_providers()
+    )
+
+
+def test_known_url_selects_provider_without_network(no_network):
+    provider = find_provider(
+        "https://zenodo.org/records/820562", _get_content_providers()
+    )
+    assert type(provider).__name__ == "Zenodo"
+    assert no_network == []
+
+
+def test_candidates_do_not_create_sessions(monkeypatch):
+    created = []
+    monkeypatch.setattr(
+        providers, "create_session", lambda: created.append(1) or object()
+    )
+    find_provider("https://zenodo.org/records/820562", _get_content_providers())
+    assert created == []
+
+
+def test_unknown_doi_is_resolved_once(no_network):
+    find_provider("10.9999/unknown.1", _get_content_providers())
+    assert no_network == ["https://doi.org/10.9999/unknown.1"]
+
+
+def test_resolved_doi_is_persisted(tmp_path, monkeypatch):
+    calls = []
+
+    class Response:
+        url = "https://zenodo.org/records/820562"
+
+        def raise_for_status(self):
+            pass
+
+    def fake_request(self, url, throttle=False, **kwargs):
+        calls.append(url)
+        return Response()
+
+    monkeypatch.setattr(DoiProvider, "_request", fake_request)
+    cache = http_cache.HTTPCache(str(tmp_path / "http.sqlite"))
+    with http_cache.use_http_cache(cache):
+        for _ in range(2):
+            provider = DoiProvider()
+            provider.reference = "10.5281/zenodo.820562"
+            assert provider.get_url == Response.url
+    assert calls == ["https://doi.org/10.5281/zenodo.820562"]
+    assert cache.get_doi_url("10.5281/ZENODO.820562") == Response.url
+    cache.close()
+
+
+@pytest.mark.parametrize("entry", manifest.PROVIDERS, ids=lambda e: e.class_name)
+def test_manifest_matches_provider_classes(entry):
+    doi_prefixes, hosts = ProviderIndex.claims(entry.load())
+    assert (entry.doi_prefixes, entry.hosts) == (doi_prefixes, hosts)
+
+
+def _provider_classes():
+    """Import every provider module and return its provider classes by name.
+
+    Provider classes are the ContentProvider subclasses that define their own
+    ``provider_info``; base classes such as DoiProvider do not.
+    """
+    classes = {}
+    for module_info in pkgutil.walk_packages(
+        content_providers.__path__, content_providers.__name__ + "."
+    ):
+        module = importlib.import_module(module_info.name)
+        for cls in vars(module).values():
+            if (
+                inspect.isclass(cls)
+                and issubclass(cls, ContentProvider)
+                and cls is not ContentProvider
+                and cls.__module__ == module.__name__
+                and "provider_info" in vars(cls)
+            ):
+                classes[cls.__name__] = cls
+    return classes
+
+
+def test_manifest_lists_every_provider_class():
+    classes = _provider_classes()
+    assert sorted(entry.class_name for entry in manifest.PROVIDERS) == sorted(classes)
+    for entry in manifest.PROVIDERS:
+        assert entry.load() is classes[entry.class_name]
+
+
+@pytest.mark.parametrize("entry", manifest.PROVIDERS, ids=lambda e: e.class_name)
+def test_manifest_claims_the_class_identifiers(entry):
+    cls = _provider_classes()[entry.class_name]
+    for prefix in getattr(cls, "doi_prefixes", ()) or ():
+        if prefix.startswith("10."):
+            assert prefix.lower() in entry.doi_prefixes
+    for template in cls.provider_info().get("supported_identifiers", ()):
+        literal = template.split("{", 1)[0].split("<", 1)[0]
+        doi = re.search(r"10\.\d+/", literal)
+        if doi:
+            # DOI templates, also as resolver URLs, claim their DOI prefix
+            assert literal[doi.start() :].lower() in entry.doi_prefixes
+        elif literal.startswith("http") and "{" not in template.split("/")[2]:
+            host = urlparse(template).hostname
+            if host not in ("doi.org", "dx.doi.org"):
+                assert host in entry.hosts
+
+
+def test_known_url_imports_only_its_provider():
+    code = (
+        "import sys\n"
+        "from geoextent.lib.content_providers import manifest\n"
+        "from geoextent.lib.content_providers.providers import find_provider\n"
+        "provider = find_provider('https://zenodo.org/records/820562', manifest.PROVIDERS)\n"
+        "print(type(provider).__name__)\n"
+        "print(' '.join(sorted(m.rsplit('.', 1)[-1] for m in sys.modules\n"
+        "    if m.startswith('geoextent.lib.content_providers.'))))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split("\n")
+    assert out[0] == "Zenodo"
+    loaded = set(out[1].split())
+    # Zenodo is an InvenioRDM subclass; no other provider is imported
+    assert loaded == {"InvenioRDM", "Zenodo", "manifest", "providers"}
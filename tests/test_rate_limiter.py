@@ -0,0 +1,165 @@
+"""Tests for the per-host token-bucket rate limiter of the providers."""
+
+import http.server
+import threading
+import time
+
+import pytest
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from geoextent.lib.content_providers import providers
+from geoextent.lib.content_providers.providers import (
+    DoiProvider,
+    RateLimiter,
+    TokenBucket,
+)
+
+
+def _response(status_code=200, **headers):
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(
+        {name.replace("_", "-"): str(value) for name, value in headers.items()}
+    )
+    return response
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = RateLimiter()
+    monkeypatch.setattr(providers, "_rate_limiter", limiter)
+    return limiter
+
+
+def test_bucket_spaces_requests_at_its_rate():
+    bucket = TokenBucket(rate=4, burst=1)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.25, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+
+
+def test_threads_share_the_budget():
+    bucket = TokenBucket(rate=10, burst=1)
+    delays = []
+    threads = [
+        threading.Thread(target=lambda: delays.append(bucket.reserve()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(delays) == pytest.approx([0, 0.1, 0.2, 0.3], abs=0.02)
+
+
+def test_bucket_follows_the_server_quota():
+    bucket = TokenBucket(rate=1)
+    bucket.observe(remaining=5, reset=60)
+    assert [bucket.reserve() for _ in range(5)] == [0] * 5
+    bucket.observe(remaining=0, reset=30)
+    assert bucket.reserve() == pytest.approx(30, abs=0.1)
+
+
+def test_server_quota_never_raises_the_configured_rate():
+    bucket = TokenBucket(rate=0.5, burst=1)
+    bucket.observe(remaining=1000, reset=60)
+    assert bucket.rate == 0.5
+    bucket.observe(remaining=6, reset=60)
+    assert bucket.rate == pytest.approx(0.1)
+    bucket.observe(remaining=1000, reset=60)
+    assert bucket.rate == 0.5
+
+
+def test_slow_rate_allows_a_fallback_burst():
+    # Software Heritage without rate-limit headers: 120 requests per hour
+    bucket = TokenBucket(rate=120 / 3600)
+    burst = providers.RATE_LIMIT_FALLBACK_BURST
+    assert [bucket.reserve() for _ in range(burst)] == [0] * burst
+    assert bucket.reserve() == pytest.approx(30, abs=0.1)
+
+
+def test_429_is_not_retried_by_urllib3():
+    assert 429 not in providers._default_retry().status_forcelist
+
+
+def test_unlimited_bucket_honours_pauses():
+    bucket = TokenBucket()
+    assert [bucket.reserve() for _ in range(10)] == [0] * 10
+    bucket.pause(5)
+    assert bucket.reserve() == pytest.approx(5, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    "prefix, epoch",
+    [
+        # Zenodo: epoch timestamp
+        ("x_ratelimit", True),
+        # Dryad / IETF draft: seconds
+        ("ratelimit", False),
+    ],
+)
+def test_rate_limit_headers_pause_the_host(limiter, prefix, epoch):
+    url = "https://zenodo.org/api/records/1"
+    reset = int(time.time()) + 20 if epoch else 20
+    headers = {prefix + "_remaining": 0, prefix + "_reset": reset}
+    limiter.update(url, _response(**headers))
+    assert limiter.bucket(url).reserve() == pytest.approx(20, abs=1.1)
+    assert limiter.bucket("https://datadryad.org/").reserve() == 0
+
+
+def test_429_uses_retry_after_or_fallback(limiter):
+    limiter.update("https://a.org/", _response(429, retry_after=7))
+    limiter.update("https://b.org/", _response(429))
+    assert limiter.bucket("https://a.org/").reserve() == pytest.approx(7, abs=0.1)
+    assert limiter.bucket("https://b.org/").reserve() == pytest.approx(
+        providers.RATE_LIMIT_FALLBACK_WAIT, abs=0.1
+    )
+
+
+def test_configured_rate_overrides_provider_default(limiter):
+    limiter.configure("Zenodo.org", rate=5, burst=2)
+    bucket = limiter.bucket("https://zenodo.org/api/records/1", default_rate=1)
+    assert (bucket.rate, bucket.burst) == (5, 2)
+    assert limiter.bucket("https://datadryad.org/", default_rate=0.5).rate == 0.5
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Answers the first request with 429, later ones with a quota header."""
+
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        if self.requests == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        else:
+            self.send_response(200)
+            self.send_header("X-RateLimit-Remaining", "0")
+            self.send_header("X-RateLimit-Reset", str(int(time.time()) + 30))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server(local_server):
+    _Handler.requests = 0
+    return local_server(_Handler)
+
+
+def test_request_retries_429_and_feeds_the_limiter(server, limiter, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(providers.time, "sleep", sleeps.append)
+    provider = DoiProvider()
+    provider.session.registry = providers.SessionRegistry(max_retries=0)
+
+    assert provider._request(server + "/record").status_code == 200
+    assert _Handler.requests == 2
+    assert sleeps == []
+
+    provider._request(server + "/record", throttle=True)
+    assert sleeps == [pytest.approx(30, abs=1.1)]
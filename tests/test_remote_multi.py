@@ -2,6 +2,9 @@
 Tests for bulk remote extraction functionality
 """
 
+import re
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 from geoextent.lib import extent
@@ -157,5 +160,107 @@ class TestMultiRemoteExtraction(unittest.TestCase):
         self.assertEqual(call_kwargs["max_download_workers"], 8)
 
 
+class TestConcurrentRemoteExtraction(unittest.TestCase):
+    """from_remote(..., remote_workers > 1) schedules resources concurrently"""
+
+    def _tracking_extract(self, delays):
+        lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+
+        def fake_extract(identifier, **kwargs):
+            host = extent._identifier_host(identifier)
+            with lock:
+                self.active[host] = self.active.get(host, 0) + 1
+                self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+                self.peak_total = max(self.peak_total, sum(self.active.values()))
+            time.sleep(delays.get(identifier, 0.02))
+            with lock:
+                self.active[host] -= 1
+            if identifier.endswith("broken"):
+                raise ValueError("broken record")
+            n = float(re.search(r"(\d+)$", identifier).group(1))
+            return {"bbox": [n, n, n + 1, n + 1], "crs": "4326"}
+
+        return fake_extract
+
+    def test_identifier_host(self):
+        self.assertEqual(extent._identifier_host("10.5281/zenodo.1"), "doi:10.5281")
+        self.assertEqual(
+            extent._identifier_host("https://doi.org/10.1594/PANGAEA.2"),
+            "doi:10.1594",
+        )
+        self.assertEqual(
+            extent._identifier_host("https://Zenodo.org/records/3"), "zenodo.org"
+        )
+
+    def test_order_and_limits(self):
+        identifiers = [
+            "10.5281/zenodo.1",
+            "10.5281/zenodo.2",
+            "10.5281/zenodo.3",
+            "10.5281/zenodo.4",
+            "10.1594/PANGAEA.5",
+            "10.1594/PANGAEA.6",
+            "https://data.4tu.nl/datasets/7",
+            "10.5281/zenodo.broken",
+        ]
+        # Make the first resources finish last
+        delays = {identifiers[0]: 0.2, identifiers[1]: 0.15}
+        with patch(
+            "geoextent.lib.extent._extract_from_remote",
+            side_effect=self._tracking_extract(delays),
+        ):
+            result = extent.from_remote(
+                identifiers, bbox=True, remote_workers=4, max_per_host=2
+            )
+
+        self.assertEqual(list(result["details"]), identifiers)
+        self.assertEqual(result["extraction_metadata"]["successful"], 7)
+        self.assertEqual(result["extraction_metadata"]["failed"], 1)
+        self.assertIn("error", result["details"]["10.5281/zenodo.broken"])
+        self.assertLessEqual(self.peak["doi:10.5281"], 2)
+        self.assertLessEqual(self.peak_total, 4)
+        # A busy host does not block the others
+        self.assertGreater(self.peak_total, 2)
+
+    def test_same_result_as_sequential(self):
+        identifiers = ["10.5281/zenodo.1", "10.1594/PANGAEA.2", "10.5281/zenodo.3"]
+        results = []
+        for remote_workers in (1, 3):
+            with patch(
+                "geoextent.lib.extent._extract_from_remote",
+                side_effect=self._tracking_extract({}),
+            ):
+                result = extent.from_remote(
+                    identifiers, bbox=True, remote_workers=remote_workers
+                )
+            results.append(result)
+        self.assertEqual(results[0], results[1])
+
+    @patch("geoextent.lib.extent.external_metadata.get_external_metadata")
+    def test_external_metadata_lookups_concurrent(self, mock_metadata):
+        mock_metadata.side_effect = lambda identifier, method: [{"doi": identifier}]
+        identifiers = ["10.5281/zenodo.1", "10.1594/PANGAEA.2", "10.5281/zenodo.3"]
+        with patch(
+            "geoextent.lib.extent._extract_from_remote",
+            side_effect=self._tracking_extract({}),
+        ):
+            result = extent.from_remote(
+                identifiers, bbox=True, ext_metadata=True, remote_workers=3
+            )
+        for identifier in identifiers:
+            self.assertEqual(
+                result["details"][identifier]["external_metadata"],
+                [{"doi": identifier}],
+            )
+        self.assertEqual(mock_metadata.call_count, 3)
+
+    def test_invalid_worker_counts(self):
+        with self.assertRaises(ValueError):
+            extent.from_remote(["10.5281/zenodo.1"], bbox=True, remote_workers=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,249 @@
+"""Tests for remote-open extraction (geoextent.lib.remote_open)."""
+
+import http.server
+import os
+import shutil
+
+import pytest
+
+import geoextent.lib.extent as geoextent
+from geoextent.lib import pointers, remote_open
+from geoextent.lib.content_providers.providers import DoiProvider
+
+POINTCLOUD_DIR = "tests/testdata/pointcloud"
+TIF = "tests/testdata/tif/wf_100m_klas.tif"
+
+
+class _RangeHandler(http.server.BaseHTTPRequestHandler):
+    """Serves files of ``root``, honouring ``Range`` only if ``ranges`` is set."""
+
+    root = None
+    ranges = True
+    requests = []
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def _serve(self, head):
+        path = os.path.join(self.root, self.path.lstrip("/"))
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        range_header = self.headers.get("Range")
+        self.requests.append((self.command, self.path, range_header))
+        if range_header and self.ranges:
+            start, end = range_header.split("=", 1)[1].split("-")
+            start = int(start)
+            end = min(int(end) if end else len(body) - 1, len(body) - 1)
+            chunk = body[start : end + 1]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", "bytes {}-{}/{}".format(start, end, len(body))
+            )
+        else:
+            chunk = body
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes" if self.ranges else "none")
+        self.send_header("Content-Length", str(len(chunk)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(chunk)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, local_server):
+    root = tmp_path / "served"
+    root.mkdir()
+    _RangeHandler.root = str(root)
+    _RangeHandler.ranges = True
+    _RangeHandler.requests = []
+    return root, local_server(_RangeHandler)
+
+
+class CountingExtract:
+    """Stands in for from_file; reports an extent only for chosen paths."""
+
+    def __init__(self, succeed):
+        self.succeed = succeed
+        self.calls = []
+
+    def __call__(self, path, **options):
+        self.calls.append(path)
+        if self.succeed(path):
+            return {"bbox": [1.0, 2.0, 3.0, 4.0], "format": "x"}
+        return {}
+
+
+def test_remote_candidates():
+    assert remote_open.is_remote_candidate("dem.tif", 50 * 1024**3)
+    assert remote_open.is_remote_candidate("cloud.LAZ", 0)
+    assert remote_open.is_remote_candidate("roads.fgb")
+    assert not remote_open.is_remote_candidate("small.tif", 1024)
+    assert not remote_open.is_remote_candidate("table.csv", 50 * 1024**3)
+    assert not remote_open.is_remote_candidate("data.zip", 50 * 1024**3)
+
+
+def test_pointer_round_trip(tmp_path):
+    target = str(tmp_path / "dem.tif")
+    pointer = remote_open.write_pointer(target, "https://example.org/dem.tif", 123)
+    assert pointers.pointer_kind(pointer) == pointers.REMOTE
+    assert pointers.original_name(os.path.basename(pointer)) == "dem.tif"
+    assert remote_open.read_pointer(pointer) == {
+        "url": "https://example.org/dem.tif",
+        "size": 123,
+    }
+
+
+@pytest.mark.parametrize("name", ["wgs84.las", "utm32n.las", "wgs84.laz"])
+def test_las_header_copy(server, tmp_path, name):
+    root, base = server
+    shutil.copy(os.path.join(POINTCLOUD_DIR, name), root)
+    original = (root / name).read_bytes()
+
+    local = str(tmp_path / name)
+    remote_open.fetch_las_header("{}/{}".format(base, name), local)
+
+    with open(local, "rb") as f:
+        copy = f.read()
+    assert len(copy) == len(original)
+    assert copy[:227] == original[:227]
+    assert all(r[2] is not None for r in _RangeHandler.requests)
+
+
+def test_range_requests_are_required(server, tmp_path):
+    root, base = server
+    shutil.copy(os.path.join(POINTCLOUD_DIR, "wgs84.las"), root)
+    _RangeHandler.ranges = False
+    with pytest.raises(remote_open.RangeNotSupported):
+        remote_open.fetch_las_header(base + "/wgs84.las", str(tmp_path / "wgs84.las"))
+
+
+def test_remote_extent_skips_download(server, tmp_path):
+    root, base = server
+    shutil.copy(TIF, root / "dem.tif")
+    pointer = remote_open.write_pointer(
+        str(tmp_path / "dem.tif"), base + "/dem.tif", 10 * 1024**2
+    )
+
+    extract = CountingExtract(lambda path: path.startswith("/vsicurl/"))
+    result = remote_open.extract_pointer(pointer, extract, bbox=True)
+
+    assert extract.calls == ["/vsicurl/{}/dem.tif".format(base)]
+    assert result["remote_open"] is True
+    assert result["format"] == "tif"
+    assert result["file_size_bytes"] == 10 * 1024**2
+    assert not os.path.exists(str(tmp_path / "dem.tif"))
+
+
+def test_download_fallback(server, tmp_path):
+    root, base = server
+    shutil.copy(TIF, root / "dem.tif")
+    local = str(tmp_path / "dem.tif")
+    pointer = remote_open.write_pointer(local, base + "/dem.tif")
+
+    extract = CountingExtract(lambda path: path == local)
+    downloaded = []
+    result = remote_open.extract_pointer(
+        pointer,
+        extract,
+        lambda path, **options: downloaded.append(path) or extract(path, **options),
+        bbox=True,
+    )
+
+    assert result["bbox"] == [1.0, 2.0, 3.0, 4.0]
+    assert "remote_open" not in result
+    assert downloaded == [local]
+    assert not os.path.exists(pointer)
+    with open(local, "rb") as f, open(TIF, "rb") as g:
+        assert f.read() == g.read()
+
+
+def test_download_batch_writes_pointers(tmp_path, monkeypatch):
+    downloads = []
+
+    def fake_download(self, url, filepath, chunk_size=None, show_progress=False):
+        downloads.append(url)
+        with open(filepath, "wb") as f:
+            f.write(b"x")
+        return 1
+
+    monkeypatch.setattr(DoiProvider, "_download_file_optimized", fake_download)
+    provider = DoiProvider()
+    provider._remote_open = True
+    files = [
+        {"url": "https://example.org/dem.tif", "name": "dem.tif", "size": 5 * 1024**3},
+        {"url": "https://example.org/small.tif", "name": "small.tif", "size": 10},
+        {"url": "https://example.org/table.csv", "name": "table.csv", "size": 10},
+    ]
+    provider._download_files_batch(files, str(tmp_path), show_progress=False)
+
+    assert sorted(downloads) == [
+        "https://example.org/small.tif",
+        "https://example.org/table.csv",
+    ]
+    assert sorted(os.listdir(tmp_path)) == [
+        "dem.tif" + remote_open.POINTER_SUFFIX,
+        "small.tif",
+        "table.csv",
+    ]
+
+
+def test_fallback_uses_the_provider_download_path(server, tmp_path):
+    root, base = server
+    shutil.copy(TIF, root / "dem.tif")
+    provider = DoiProvider()
+    provider._remote_open = True
+    files = [{"url": base + "/dem.tif", "name": "dem.tif", "size": 10 * 1024**2}]
+    assert (
+        provider._download_files_batch(
+            files, str(tmp_path), show_progress=False, throttle=True
+        )
+        == []
+    )
+
+    calls = []
+    original = DoiProvider._download_file_optimized
+
+    def recording_download(self, url, filepath, *args, **kwargs):
+        calls.append((url, kwargs.get("throttle")))
+        return original(self, url, filepath, *args, **kwargs)
+
+    local = str(tmp_path / "dem.tif")
+    extract = CountingExtract(lambda path: path == local)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DoiProvider, "_download_file_optimized", recording_download)
+        result = remote_open.extract_pointer(
+            local + remote_open.POINTER_SUFFIX, extract, bbox=True
+        )
+
+    assert result["bbox"] == [1.0, 2.0, 3.0, 4.0]
+    assert calls == [(base + "/dem.tif", True)]
+    with open(local, "rb") as f, open(TIF, "rb") as g:
+        assert f.read() == g.read()
+
+
+def test_from_directory_reports_remote_files_by_name(server, tmp_path):
+    root, base = server
+    shutil.copy(TIF, root / "dem.tif")
+    data = tmp_path / "data"
+    data.mkdir()
+    remote_open.write_pointer(str(data / "dem.tif"), base + "/dem.tif", 10 * 1024**2)
+
+    remote = geoextent.from_directory(
+        str(data), bbox=True, details=True, show_progress=False
+    )
+    local = geoextent.from_file(TIF, bbox=True, tbox=False, show_progress=False)
+
+    assert list(remote["details"]) == ["dem.tif"]
+    assert remote["bbox"] == pytest.approx(local["bbox"])
+    # header read with range requests, no full download
+    assert all(r[2] is not None for r in _RangeHandler.requests if r[0] == "GET")
+    assert not (data / "dem.tif").exists()
@@ -0,0 +1,110 @@
+"""Tests for the process-wide connection pools shared by provider sessions."""
+
+import http.server
+
+import pytest
+from requests.exceptions import InvalidSchema
+
+from geoextent.lib.content_providers import providers
+from geoextent.lib.content_providers.providers import (
+    DoiProvider,
+    SessionRegistry,
+    create_session,
+)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive server recording the client port and headers of each request."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.client_address[1], dict(self.headers)))
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server(local_server):
+    _Handler.requests = []
+    return local_server(_Handler)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = SessionRegistry()
+    monkeypatch.setattr(providers, "_session_registry", registry)
+    yield registry
+    registry.close()
+
+
+def test_provider_instances_share_connections(server, registry):
+    for _ in range(3):
+        DoiProvider().session.get(server + "/record").close()
+    ports = {port for port, _headers in _Handler.requests}
+    assert len(_Handler.requests) == 3
+    assert len(ports) == 1
+    assert len(registry.hosts()) == 1
+
+
+def test_headers_stay_with_the_session(server, registry):
+    first = create_session()
+    first.headers["Authorization"] = "Bearer secret"
+    second = create_session()
+    first.get(server + "/a").close()
+    second.get(server + "/b").close()
+    assert _Handler.requests[0][1]["Authorization"] == "Bearer secret"
+    assert "Authorization" not in _Handler.requests[1][1]
+
+
+def test_closing_a_session_keeps_the_pool(server, registry):
+    session = create_session()
+    session.get(server + "/a").close()
+    session.close()
+    create_session().get(server + "/b").close()
+    assert len({port for port, _headers in _Handler.requests}) == 1
+
+
+def test_pools_are_keyed_by_host(registry):
+    adapter = registry.adapter("https://zenodo.org/records/1")
+    assert registry.adapter("https://ZENODO.org/api") is adapter
+    assert registry.adapter("https://zenodo.org:8443/api") is not adapter
+    assert registry.adapter("http://zenodo.org/api") is not adapter
+    assert registry.adapter("https://figshare.com/") is not adapter
+
+
+def test_configure_applies_settings(registry):
+    before = registry.adapter("https://zenodo.org/")
+    registry.configure(pool_maxsize=4, max_retries=1, timeout=7)
+    adapter = registry.adapter("https://zenodo.org/")
+    assert adapter is not before
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 1
+    assert adapter.default_timeout == 7
+
+
+def test_explicit_mounts_take_precedence(registry):
+    session = create_session()
+    mounted = providers.CachingHTTPAdapter()
+    session.mount("https://zenodo.org/", mounted)
+    assert session.get_adapter("https://zenodo.org/records/1") is mounted
+    assert session.get_adapter("https://figshare.com/") is registry.adapter(
+        "https://figshare.com/"
+    )
+    with pytest.raises(InvalidSchema):
+        session.get_adapter("ftp://example.org/")
+
+
+def test_parallel_downloads_are_capped_at_pool_size(registry):
+    registry.configure(pool_maxsize=3)
+    provider = DoiProvider()
+    provider._setup_parallel_manager(max_workers=8)
+    assert provider.parallel_manager.max_workers == 3
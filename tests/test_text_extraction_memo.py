@@ -0,0 +1,220 @@
+"""The text handler runs NER once per file, shared by the bbox and tbox threads."""
+
+import threading
+
+import pytest
+
+from _text_ner_helpers import install_fake_gazetteer
+from geoextent.lib import extent, handle_text
+from geoextent.lib.text_extraction import _REGISTRY, register_extractor
+from geoextent.lib.text_extraction.base import (
+    DateMention,
+    ExtractionResult,
+    PlaceMention,
+    TextExtractor,
+)
+
+
+class CountingExtractor(TextExtractor):
+    """Deterministic stand-in for spaCy that records every extract() call."""
+
+    calls = []
+    _lock = threading.Lock()
+
+    def __init__(self, **_config):
+        pass
+
+    @property
+    def model_name(self):
+        return "counting"
+
+    def extract(self, text):
+        with self._lock:
+            self.calls.append(text)
+        result = ExtractionResult()
+        start = text.find("Berlin")
+        if start >= 0:
+            result.places.append(
+                PlaceMention(
+                    name="Berlin", label="GPE", char_start=start, char_end=start + 6
+                )
+            )
+        start = text.find("2019")
+        if start >= 0:
+            result.dates.append(
+                DateMention(
+                    text="2019", label="DATE", char_start=start, char_end=start + 4
+                )
+            )
+        return result
+
+
+@pytest.fixture
+def counting_method(monkeypatch):
+    install_fake_gazetteer(monkeypatch)
+    monkeypatch.setattr(handle_text, "_SPACY_AVAILABLE", True)
+    monkeypatch.setitem(_REGISTRY, "counting", CountingExtractor)
+    CountingExtractor.calls = []
+    handle_text._clear_extraction_memo()
+    yield "counting"
+    handle_text._clear_extraction_memo()
+
+
+def test_from_file_runs_extractor_once(tmp_path, counting_method):
+    path = tmp_path / "abstract.txt"
+    path.write_text("Field work took place in Berlin in 2019.\n", encoding="utf-8")
+
+    result = extent.from_file(
+        str(path),
+        bbox=True,
+        tbox=True,
+        text_method=counting_method,
+        ner_gazetteer="nominatim",
+    )
+
+    assert result["geoextent_handler"] == "handle_text"
+    assert "bbox" in result
+    assert result["tbox"][0].startswith("2019")
+    assert len(CountingExtractor.calls) == 1
+
+
+def test_edited_file_is_extracted_again(tmp_path, counting_method):
+    path = tmp_path / "abstract.txt"
+    path.write_text("Berlin in 2019.\n", encoding="utf-8")
+    kwargs = {"text_method": counting_method}
+
+    handle_text.get_temporal_extent(str(path), **kwargs)
+    handle_text.get_temporal_extent(str(path), **kwargs)
+    assert len(CountingExtractor.calls) == 1
+
+    path.write_text("Berlin in 2019, revisited.\n", encoding="utf-8")
+    handle_text.get_temporal_extent(str(path), **kwargs)
+    assert len(CountingExtractor.calls) == 2
+
+
+def test_memo_is_keyed_by_extractor_configuration(tmp_path, counting_method):
+    path = tmp_path / "abstract.txt"
+    path.write_text("Berlin in 2019.\n", encoding="utf-8")
+
+    handle_text.get_temporal_extent(str(path), text_method=counting_method)
+    handle_text.get_temporal_extent(
+        str(path), text_method=counting_method, period_resolution=False
+    )
+    assert len(CountingExtractor.calls) == 2
+
+
+def test_bom_and_nfd_text_share_one_pass(tmp_path, counting_method):
+    path = tmp_path / "umlaut.txt"
+    path.write_text("\ufeffBerlin und Mu\u0308nchen 2019\n", encoding="utf-8")
+    kwargs = {"text_method": counting_method}
+
+    handle_text.get_temporal_extent(str(path), **kwargs)
+    handle_text.get_bounding_box(str(path), ner_gazetteer="nominatim", **kwargs)
+
+    assert CountingExtractor.calls == ["Berlin und M\u00fcnchen 2019\n"]
+
+
+class BatchingExtractor(CountingExtractor):
+    """Records extract_many() batches separately from single extract() calls."""
+
+    batches = []
+
+    def extract_many(self, texts, batch_size=None, n_process=1):
+        batch = []
+        self.batches.append((batch, batch_size, n_process))
+        for text in texts:
+            batch.append(text)
+            yield CountingExtractor.extract(self, text)
+
+
+@pytest.fixture
+def batching_method(counting_method, monkeypatch):
+    monkeypatch.setitem(_REGISTRY, "batching", BatchingExtractor)
+    BatchingExtractor.batches = []
+    return "batching"
+
+
+def test_from_directory_batches_text_files(tmp_path, batching_method):
+    (tmp_path / "a.txt").write_text("Berlin in 2019.\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("Paris in 2020.\n", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("Nothing to see here.\n", encoding="utf-8")
+
+    result = extent.from_directory(
+        str(tmp_path),
+        bbox=True,
+        tbox=True,
+        details=True,
+        text_method=batching_method,
+        ner_gazetteer="nominatim",
+        ner_batch_size=2,
+        legacy=True,
+    )
+
+    assert len(BatchingExtractor.batches) == 1
+    texts, batch_size, n_process = BatchingExtractor.batches[0]
+    assert sorted(texts) == sorted(
+        ["Berlin in 2019.\n", "Paris in 2020.\n", "Nothing to see here.\n"]
+    )
+    assert (batch_size, n_process) == (2, 1)
+    # The per-file from_file calls were served from the batch.
+    assert len(CountingExtractor.calls) == 3
+    assert result["details"]["a.txt"]["tbox"][0].startswith("2019")
+    assert result["tbox"][0].startswith("2019")
+    # Batch results are only held for the duration of the directory call.
+    assert handle_text._EXTRACTION_PINNED == {}
+
+
+def test_batch_extraction_matches_per_file(tmp_path, counting_method):
+    paths = []
+    for i, text in enumerate(["Berlin in 2019.\n", "Paris.\n"]):
+        path = tmp_path / "f{}.txt".format(i)
+        path.write_text(text, encoding="utf-8")
+        paths.append(str(path))
+
+    expected = [
+        handle_text.get_temporal_extent(p, text_method=counting_method) for p in paths
+    ]
+    handle_text._clear_extraction_memo()
+    CountingExtractor.calls = []
+
+    with handle_text.batch_extraction(paths, text_method=counting_method) as n:
+        assert n == 2
+        batched = [
+            handle_text.get_temporal_extent(p, text_method=counting_method)
+            for p in paths
+        ]
+    assert batched == expected
+    assert len(CountingExtractor.calls) == 2
+
+
+class StreamingExtractor(CountingExtractor):
+    """Checks that texts arrive lazily and results are pinned as they arrive."""
+
+    pinned_before = []
+
+    def extract_many(self, texts, batch_size=None, n_process=1):
+        assert not isinstance(texts, (list, tuple))
+        for text in texts:
+            self.pinned_before.append(len(handle_text._EXTRACTION_PINNED))
+            yield CountingExtractor.extract(self, text)
+
+
+def test_batch_extraction_streams_texts(tmp_path, counting_method, monkeypatch):
+    monkeypatch.setitem(_REGISTRY, "streaming", StreamingExtractor)
+    StreamingExtractor.pinned_before = []
+    paths = []
+    for i in range(3):
+        path = tmp_path / "f{}.txt".format(i)
+        path.write_text("Berlin in 2019, part {}.\n".format(i), encoding="utf-8")
+        paths.append(str(path))
+
+    with handle_text.batch_extraction(paths, text_method="streaming") as n:
+        assert n == 3
+        # Pinned results do not keep the texts in memory
+        assert all(
+            entry.value[0] is None for entry in handle_text._EXTRACTION_PINNED.values()
+        )
+        result = handle_text.get_temporal_extent(paths[2], text_method="streaming")
+    assert StreamingExtractor.pinned_before == [0, 1, 2]
+    assert result[0].startswith("2019")
+    assert len(CountingExtractor.calls) == 3
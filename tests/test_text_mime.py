@@ -16,6 +16,7 @@ import pytest
 
 from geoextent.lib.text_extraction.mime import (
     TEXT_EXTENSIONS,
+    has_text_name,
     is_text_file,
     _sniff_text_content,
 )
@@ -50,7 +51,7 @@ def test_structured_data_extensions_not_text(tmp_path, ext):
 @pytest.mark.parametrize("ext", [".py", ".js", ".ts", ".sh", ".rb", ".go", ".rs"])
 def test_source_code_not_treated_as_text(tmp_path, ext):
     """stdlib ``mimetypes`` labels these ``text/*``, but running NER on
-    source code is almost never what the user wants. ``_EXCLUDE_EXTENSIONS``
+    source code is almost never what the user wants. ``EXCLUDE_EXTENSIONS``
     short-circuits before the mimetypes path."""
     path = _write(tmp_path, f"script{ext}", b"def f():\n    return 'Berlin'")
     assert is_text_file(path) is False
@@ -179,3 +180,20 @@ def test_missing_file_returns_false(tmp_path):
 def test_sniff_short_circuit_on_null_byte(tmp_path):
     path = _write(tmp_path, "x", b"hello\x00world" + b"a" * 8000)
     assert _sniff_text_content(path) is False
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("notes.md", True),
+        ("docs/README", True),
+        ("license", True),
+        ("README.csv", False),
+        ("data.csv", False),
+        ("script.py", False),
+        ("Makefile", False),
+    ],
+)
+def test_has_text_name(name, expected):
+    """Name-only check shared with archive member selection (no file I/O)."""
+    assert has_text_name(name) is expected